@@ -116,10 +116,7 @@ async def run_prompt_mode(prompt: str, provider: str = "openai", model: str = No
         print("🔌 Initializing MCP servers...")
         enabled_servers = config.get_enabled_mcp_servers()
 
-        for server_config in enabled_servers:
-            await mcp_registry.register_server(server_config)
-
-        await mcp_registry.connect_all()
+        await mcp_registry.register_servers(enabled_servers)
         connected_count = len(mcp_registry.get_connected_servers())
         print(f"✅ Connected to {connected_count} MCP server(s)")
 
@@ -0,0 +1,280 @@
+"""
+Asynchronous batch completions.
+
+Implements the OpenAI Batch API flow: a JSONL input file of
+`{"custom_id", "method", "url", "body"}` lines is uploaded, a batch is
+created from it, and a background worker runs every request through the
+regular chat completion pipeline with bounded concurrency and per-provider
+rate limits. Results are written to an output JSONL file (and failures to an
+error file) that clients download through the files API.
+"""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.application.services.rate_limiting import KeyedRateLimiter
+from src.infrastructure.repositories.batch_repository import BatchRepository
+
+# Runs one chat completion request body, returning (status_code, response_body)
+BatchExecutor = Callable[[Dict[str, Any]], Awaitable[Tuple[int, Dict[str, Any]]]]
+
+SUPPORTED_ENDPOINTS = ("/v1/chat/completions",)
+
+
+class BatchValidationError(ValueError):
+    """Raised when a batch input file or request is invalid."""
+
+
+@dataclass
+class BatchConfig:
+    """Settings for batch execution."""
+    storage_dir: str = ".cache/batches"
+    max_concurrency: int = 4
+    requests_per_minute: float = 60.0  # Per provider; 0 disables rate limiting
+    provider_requests_per_minute: Dict[str, float] = field(default_factory=dict)
+    max_requests_per_batch: int = 50000
+
+
+class BatchService:
+    """Stores batches and executes them in a background worker."""
+
+    def __init__(
+        self,
+        config: BatchConfig,
+        executor: BatchExecutor,
+        rate_limit_key: Callable[[Dict[str, Any]], str] = lambda body: "default",
+        repository: Optional[BatchRepository] = None
+    ):
+        self.config = config
+        self.executor = executor
+        self.rate_limit_key = rate_limit_key
+        self._repository = repository
+        self.logger = logging.getLogger("BatchService")
+        self.rate_limiter = KeyedRateLimiter(
+            config.requests_per_minute / 60.0,
+            rates={provider: rpm / 60.0 for provider, rpm in config.provider_requests_per_minute.items()}
+        )
+        self._semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._cancelled: set = set()
+
+    @property
+    def repository(self) -> BatchRepository:
+        """Batch storage, opened on first use."""
+        if self._repository is None:
+            self._repository = BatchRepository(self.config.storage_dir)
+        return self._repository
+
+    # Files
+
+    async def create_file(self, content: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        """Store an uploaded file; batch input files are validated on upload."""
+        if purpose == "batch":
+            parse_batch_input(content, self.config.max_requests_per_batch)
+        return _file_object(await self.repository.create_file(content, filename, purpose))
+
+    async def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        record = await self.repository.get_file(file_id)
+        return _file_object(record) if record else None
+
+    async def get_file_content(self, file_id: str) -> Optional[bytes]:
+        if await self.repository.get_file(file_id) is None:
+            return None
+        return await self.repository.read_file(file_id)
+
+    # Batches
+
+    async def create_batch(
+        self,
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str = "24h",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Create a batch from an uploaded input file and queue it."""
+        if endpoint not in SUPPORTED_ENDPOINTS:
+            raise BatchValidationError(f"Unsupported batch endpoint: {endpoint}")
+
+        input_file = await self.repository.get_file(input_file_id)
+        if input_file is None:
+            raise BatchValidationError(f"No such file: {input_file_id}")
+        if input_file["purpose"] != "batch":
+            raise BatchValidationError(f"File {input_file_id} does not have purpose 'batch'")
+
+        requests = parse_batch_input(await self.repository.read_file(input_file_id), self.config.max_requests_per_batch)
+        for request in requests:
+            if request["url"] != endpoint:
+                raise BatchValidationError(f"Request {request['custom_id']} targets {request['url']}, expected {endpoint}")
+
+        batch_id = await self.repository.create_batch(input_file_id, endpoint, completion_window, requests, metadata)
+        self.logger.info(f"📦 Created batch {batch_id} with {len(requests)} requests")
+        self._wakeup.set()
+        return await self.repository.get_batch(batch_id)
+
+    async def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        return await self.repository.get_batch(batch_id)
+
+    async def list_batches(self, limit: int = 20, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await self.repository.list_batches(limit, after)
+
+    async def cancel_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Stop starting new requests for a batch; finished results are still written."""
+        batch = await self.repository.get_batch(batch_id)
+        if batch is None:
+            return None
+        if batch["status"] in ("validating", "in_progress"):
+            self._cancelled.add(batch_id)
+            await self.repository.set_status(batch_id, "cancelling")
+            self._wakeup.set()
+        return await self.repository.get_batch(batch_id)
+
+    # Worker
+
+    def start(self):
+        """Start the background worker (resumes batches left unfinished by a restart)."""
+        if self._worker is None or self._worker.done():
+            # Created here so they belong to the running event loop
+            self._semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+            self._wakeup = asyncio.Event()
+            self._wakeup.set()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            for batch_id in await self.repository.active_batch_ids():
+                try:
+                    await self.process_batch(batch_id)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.logger.error(f"❌ Batch {batch_id} failed: {e}")
+                    await self.repository.set_status(
+                        batch_id, "failed", errors=json.dumps([{"code": "batch_failed", "message": str(e)}])
+                    )
+
+    async def process_batch(self, batch_id: str):
+        """Run a batch's pending requests, then write its output files."""
+        batch = await self.repository.get_batch(batch_id)
+        if batch is None:
+            return
+
+        if batch["status"] == "cancelling":
+            self._cancelled.add(batch_id)
+        elif batch["status"] in ("validating", "in_progress"):
+            await self.repository.reset_running_requests(batch_id)
+            if batch["status"] == "validating":
+                await self.repository.set_status(batch_id, "in_progress")
+            self.logger.info(f"🚀 Processing batch {batch_id}")
+            pending = await self.repository.pending_requests(batch_id)
+            await asyncio.gather(*(self._run_request(batch_id, request) for request in pending))
+
+        await self._finalize(batch_id)
+
+    async def _run_request(self, batch_id: str, request: Dict[str, Any]):
+        async with self._semaphore:
+            if batch_id in self._cancelled:
+                return
+            await self.rate_limiter.acquire(self.rate_limit_key(request["body"]))
+            if batch_id in self._cancelled:
+                return
+
+            await self.repository.mark_request(batch_id, request["line"], "running")
+            try:
+                status_code, body = await self.executor(dict(request["body"]))
+            except Exception as e:
+                self.logger.warning(f"⚠️ Batch request {request['custom_id']} raised: {e}")
+                status_code, body = 500, {"error": {"message": str(e), "type": "batch_execution_error"}}
+
+            if status_code < 400:
+                await self.repository.mark_request(batch_id, request["line"], "completed", status_code, response=body)
+            else:
+                await self.repository.mark_request(
+                    batch_id, request["line"], "failed", status_code, response=body, error=body.get("error")
+                )
+
+    async def _finalize(self, batch_id: str):
+        cancelled = batch_id in self._cancelled
+        if not cancelled:
+            await self.repository.set_status(batch_id, "finalizing")
+
+        output_lines, error_lines = [], []
+        for result in await self.repository.finished_requests(batch_id):
+            line = {
+                "id": f"{batch_id}_req_{result['line']}",
+                "custom_id": result["custom_id"],
+                "response": {"status_code": result["status_code"], "body": result["response"]},
+                "error": result["error"]
+            }
+            (output_lines if result["status"] == "completed" else error_lines).append(line)
+
+        fields: Dict[str, Any] = {}
+        if output_lines:
+            fields["output_file_id"] = (await self.repository.create_file(
+                _to_jsonl(output_lines), f"{batch_id}_output.jsonl", "batch_output"
+            ))["id"]
+        if error_lines:
+            fields["error_file_id"] = (await self.repository.create_file(
+                _to_jsonl(error_lines), f"{batch_id}_error.jsonl", "batch_output"
+            ))["id"]
+
+        await self.repository.set_status(batch_id, "cancelled" if cancelled else "completed", **fields)
+        self._cancelled.discard(batch_id)
+        self.logger.info(
+            f"✅ Batch {batch_id} {'cancelled' if cancelled else 'completed'}: "
+            f"{len(output_lines)} succeeded, {len(error_lines)} failed"
+        )
+
+
+def parse_batch_input(content: bytes, max_requests: int) -> List[Dict[str, Any]]:
+    """Parse and validate a batch input JSONL file."""
+    requests: List[Dict[str, Any]] = []
+    custom_ids = set()
+
+    for number, raw_line in enumerate(content.decode("utf-8").splitlines(), start=1):
+        if not raw_line.strip():
+            continue
+        try:
+            request = json.loads(raw_line)
+        except json.JSONDecodeError as e:
+            raise BatchValidationError(f"Line {number}: invalid JSON ({e.msg})")
+
+        if not isinstance(request, dict) or not isinstance(request.get("body"), dict):
+            raise BatchValidationError(f"Line {number}: expected an object with a 'body' object")
+        custom_id = request.get("custom_id")
+        if not custom_id:
+            raise BatchValidationError(f"Line {number}: missing custom_id")
+        if custom_id in custom_ids:
+            raise BatchValidationError(f"Line {number}: duplicate custom_id {custom_id}")
+        if request.get("method", "POST").upper() != "POST":
+            raise BatchValidationError(f"Line {number}: only POST requests are supported")
+
+        custom_ids.add(custom_id)
+        requests.append({"custom_id": custom_id, "url": request.get("url", "/v1/chat/completions"), "body": request["body"]})
+
+    if not requests:
+        raise BatchValidationError("Batch input file contains no requests")
+    if len(requests) > max_requests:
+        raise BatchValidationError(f"Batch input file has {len(requests)} requests (limit {max_requests})")
+    return requests
+
+
+def _to_jsonl(lines: List[Dict[str, Any]]) -> bytes:
+    return "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+
+
+def _file_object(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {"object": "file", **record}
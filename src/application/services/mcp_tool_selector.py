@@ -8,14 +8,19 @@ preprocessing, reasoning, and postprocessing pipeline.
 import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass
+import hashlib
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, FrozenSet, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime
 
 from src.infrastructure.mcp.tool_registry import MCPUnifiedToolRegistry, ToolExecutionResult
 from src.infrastructure.mcp.registry import MCPServerRegistry
 from src.infrastructure.mcp.discovery import MCPToolDiscovery
+from src.infrastructure.mcp.deadline import budget_timeout, deadline_expired
+from src.application.services.tool_index import ToolEmbeddingIndex, split_identifier
+from src.application.services.tool_argument_synthesizer import ToolArgumentSynthesizer
 
 
 class ProcessingPhase(Enum):
@@ -34,18 +39,34 @@ class ToolSelectionStrategy(Enum):
     RULE_BASED = "rule_based"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolCapability:
-    """Represents a tool's capabilities for matching."""
+    """
+    Represents a tool's capabilities for matching.
+
+    Capabilities are shared by all concurrent requests and never change once
+    analyzed; per-request scores live in `ToolSelectionContext.tool_scores`.
+    """
     name: str
     description: str
     input_schema: Dict[str, Any]
-    domains: Set[str]
+    domains: FrozenSet[str]
     complexity_level: str  # simple, moderate, complex
-    processing_phases: Set[ProcessingPhase]
-    keywords: Set[str]
+    processing_phases: FrozenSet[ProcessingPhase]
+    keywords: FrozenSet[str]
     server_name: str
-    confidence_score: float = 0.0
+
+    def __post_init__(self):
+        for name in ("domains", "processing_phases", "keywords"):
+            object.__setattr__(self, name, frozenset(getattr(self, name)))
+
+
+@dataclass(frozen=True)
+class CapabilityCatalog:
+    """Analyzed capabilities for one tool catalog version, grouped by processing phase."""
+    version: Optional[int]
+    capabilities: Tuple[ToolCapability, ...] = ()
+    by_phase: Dict[ProcessingPhase, Tuple[ToolCapability, ...]] = field(default_factory=dict)
 
 
 @dataclass
@@ -58,6 +79,7 @@ class ToolSelectionContext:
     selected_tools: List[str] = None
     execution_results: List[ToolExecutionResult] = None
     metadata: Dict[str, Any] = None
+    tool_scores: Dict[str, float] = field(default_factory=dict)  # tool name -> score for this request
 
 
 @dataclass
@@ -96,10 +118,26 @@ class MCPToolSelector:
         self._enable_fallback = True
         self._enable_caching = True
 
-        # Tool capability cache
-        self._capability_cache: Dict[str, ToolCapability] = {}
-        self._cache_timestamp: Optional[datetime] = None
-        self._cache_ttl_seconds = 300  # 5 minutes
+        # Tool capabilities, rebuilt only when the discovery catalog changes
+        self._capability_catalog = CapabilityCatalog(version=None)
+        self._capability_rebuilds = 0
+
+        # Tool call arguments synthesized from input schemas
+        self._argument_synthesizer = ToolArgumentSynthesizer()
+
+        # Embedding index of the tool catalog for capability matching
+        self._tool_index = ToolEmbeddingIndex()
+        self._min_similarity = 0.1
+
+        # LLM-guided selection: one long-lived agent, compact per-tool prompt lines
+        # rebuilt when the tool catalog changes, and reusable selection decisions
+        self._selection_agent = None
+        self._catalog_fingerprint = ""
+        self._catalog_prompt_lines: Dict[str, str] = {}
+        self._decision_cache: "OrderedDict[str, Tuple[float, List[str], float]]" = OrderedDict()
+        self._decision_cache_size = 512
+        self._decision_cache_ttl_seconds = 600  # 10 minutes
+        self._decision_stats = {"hits": 0, "misses": 0}
 
         # Domain keywords for matching
         self._domain_keywords = {
@@ -111,6 +149,8 @@ class MCPToolSelector:
             "deployment": {"deploy", "deployment", "production", "release", "staging"}
         }
 
+        self.tool_discovery.add_catalog_listener(self._on_catalog_changed)
+
     def set_selection_strategy(self, strategy: ToolSelectionStrategy):
         """Set the tool selection strategy."""
         self._selection_strategy = strategy
@@ -120,51 +160,22 @@ class MCPToolSelector:
         """
         Analyze available MCP tools and extract their capabilities.
 
+        Capabilities are analyzed once per discovery catalog change (the
+        discovery catalog listener rebuilds them as tools change), so this is
+        normally a lookup.
+
         Returns:
             Dictionary with capability analysis results
         """
         try:
-            self.logger.debug("Analyzing MCP tool capabilities...")
-
-            # Check cache first
-            if self._is_cache_valid():
-                return {
-                    "status": "success",
-                    "capabilities": list(self._capability_cache.values()),
-                    "cached": True,
-                    "cache_age": (datetime.now() - self._cache_timestamp).total_seconds()
-                }
-
-            # Get all available tools
-            tool_infos = self.tool_discovery.get_all_tools()
-            # Convert MCPToolInfo objects to dict format expected by the rest of the code
-            tools = []
-            for tool_info in tool_infos:
-                tools.append({
-                    "name": tool_info.name,
-                    "server_name": tool_info.server_name,
-                    "description": tool_info.description,
-                    "input_schema": tool_info.input_schema
-                })
-
-            capabilities = []
-
-            for tool_info in tools:
-                capability = await self._analyze_single_tool_capability(tool_info)
-                if capability:
-                    capabilities.append(capability)
-                    self._capability_cache[capability.name] = capability
-
-            # Update cache timestamp
-            self._cache_timestamp = datetime.now()
-
-            self.logger.info(f"Analyzed {len(capabilities)} tool capabilities")
-
+            cached = self._capability_catalog.version is not None
+            catalog = self._get_capability_catalog()
             return {
                 "status": "success",
-                "capabilities": capabilities,
-                "cached": False,
-                "total_tools": len(capabilities)
+                "capabilities": list(catalog.capabilities),
+                "cached": cached,
+                "total_tools": len(catalog.capabilities),
+                "catalog_version": catalog.version
             }
 
         except Exception as e:
@@ -175,7 +186,61 @@ class MCPToolSelector:
                 "capabilities": []
             }
 
-    async def _analyze_single_tool_capability(self, tool_info: Dict[str, Any]) -> Optional[ToolCapability]:
+    def _on_catalog_changed(self, catalog_version: int):
+        """Discovery catalog listener: rebuild everything derived from the new catalog."""
+        self._rebuild_catalog_state()
+
+    def _get_capability_catalog(self) -> CapabilityCatalog:
+        """Current capability catalog, built on first use when discovery has not notified yet."""
+        catalog = self._capability_catalog
+        if catalog.version is None:
+            catalog = self._rebuild_catalog_state()
+        return catalog
+
+    def _rebuild_catalog_state(self) -> CapabilityCatalog:
+        """Rebuild the capabilities, the tool index and the selection prompt lines from the discovered tools."""
+        tools = self.tool_discovery.get_all_tools()
+        catalog = self._rebuild_capability_catalog(tools)
+        self._tool_index.sync(tools)
+        self._refresh_prompt_catalog(tools)
+        return catalog
+
+    def _rebuild_capability_catalog(self, tools: List[Any]) -> CapabilityCatalog:
+        """Analyze the discovered tools, reusing capabilities of unchanged tools, and publish them at once."""
+        version = self.tool_discovery.catalog_version
+        previous = {capability.name: capability for capability in self._capability_catalog.capabilities}
+
+        capabilities = []
+        for tool_info in tools:
+            capability = previous.get(tool_info.name)
+            if (
+                capability is None
+                or capability.server_name != tool_info.server_name
+                or capability.description != tool_info.description
+                or capability.input_schema != tool_info.input_schema
+            ):
+                capability = self._analyze_single_tool_capability({
+                    "name": tool_info.name,
+                    "server_name": tool_info.server_name,
+                    "description": tool_info.description,
+                    "input_schema": tool_info.input_schema
+                })
+            if capability:
+                capabilities.append(capability)
+
+        by_phase = {
+            phase: tuple(capability for capability in capabilities if phase in capability.processing_phases)
+            for phase in ProcessingPhase
+        }
+        # Readers keep whichever catalog they already hold; the swap is a single assignment
+        catalog = CapabilityCatalog(version=version, capabilities=tuple(capabilities), by_phase=by_phase)
+        self._capability_catalog = catalog
+        self._capability_rebuilds += 1
+
+        self.logger.info(f"Analyzed {len(capabilities)} tool capabilities for catalog version {version}")
+        return catalog
+
+    def _analyze_single_tool_capability(self, tool_info: Dict[str, Any]) -> Optional[ToolCapability]:
         """Analyze a single tool's capabilities."""
         try:
             tool_name = tool_info.get("name")
@@ -207,8 +272,7 @@ class MCPToolSelector:
                 complexity_level=complexity,
                 processing_phases=processing_phases,
                 keywords=keywords,
-                server_name=server_name,
-                confidence_score=0.0  # Will be calculated during matching
+                server_name=server_name
             )
 
         except Exception as e:
@@ -268,22 +332,18 @@ class MCPToolSelector:
         try:
             self.logger.debug(f"Selecting tools for {context.processing_phase.value} phase")
 
-            # Ensure capabilities are analyzed
-            capability_result = await self.analyze_tool_capabilities()
-            if capability_result.get("status") != "success":
+            # Capabilities are pre-analyzed and grouped by phase per catalog version
+            try:
+                catalog = self._get_capability_catalog()
+            except Exception as e:
+                self.logger.error(f"Error analyzing tool capabilities: {e}")
                 return {
                     "status": "error",
                     "error": "Failed to analyze tool capabilities",
                     "selected_tools": []
                 }
 
-            capabilities = capability_result["capabilities"]
-
-            # Filter tools by processing phase
-            phase_tools = [
-                cap for cap in capabilities
-                if context.processing_phase in cap.processing_phases
-            ]
+            phase_tools = catalog.by_phase.get(context.processing_phase, ())
 
             if not phase_tools:
                 return {
@@ -313,6 +373,7 @@ class MCPToolSelector:
                 "status": "success",
                 "selected_tools": [tool.name for tool in selected],
                 "tool_details": selected,
+                "tool_scores": {tool.name: context.tool_scores.get(tool.name, 0.0) for tool in selected},
                 "selection_strategy": self._selection_strategy.value,
                 "processing_phase": context.processing_phase.value
             }
@@ -328,63 +389,147 @@ class MCPToolSelector:
     async def _select_by_capability_match(self,
                                          context: ToolSelectionContext,
                                          available_tools: List[ToolCapability]) -> List[ToolCapability]:
-        """Select tools based on capability matching."""
-        # Extract keywords from request
-        request_text = self._extract_request_text(context.request_data)
-        request_keywords = set(request_text.lower().split())
-
-        # Score tools based on keyword overlap and domain match
+        """Select tools by embedding similarity to the request, boosted by domain and complexity match."""
+        # The index follows the discovery catalog through _on_catalog_changed
+        candidates = {tool.name: tool for tool in available_tools}
+        intent_info = context.intent_analysis or {}
+        query_text = " ".join([
+            self._extract_request_text(context.request_data),
+            *intent_info.get("target_tools", []),
+            *(split_identifier(domain) for domain in intent_info.get("domains", []))
+        ])
+        matches = self._tool_index.search(
+            query_text,
+            top_k=self._max_tools_per_phase * 2,
+            min_score=self._min_similarity,
+            names=candidates
+        )
+
+        # Score tools based on similarity and domain match
         scored_tools = []
+        intent_domains = set(intent_info.get("domains", []))
+        request_complexity = intent_info.get("complexity", "simple")
 
-        for tool in available_tools:
-            score = 0.0
-
-            # Keyword matching
-            keyword_overlap = tool.keywords.intersection(request_keywords)
-            score += len(keyword_overlap) * 2.0
+        for tool_name, similarity in matches:
+            tool = candidates[tool_name]
+            score = similarity * 10.0
 
             # Domain matching from intent analysis
-            if context.intent_analysis:
-                intent_domains = set(context.intent_analysis.get("domains", []))
-                domain_overlap = tool.domains.intersection(intent_domains)
-                score += len(domain_overlap) * 3.0
+            score += len(tool.domains.intersection(intent_domains)) * 3.0
 
             # Complexity matching
-            if context.intent_analysis:
-                request_complexity = context.intent_analysis.get("complexity", "simple")
-                if tool.complexity_level == request_complexity:
-                    score += 1.0
+            if context.intent_analysis and tool.complexity_level == request_complexity:
+                score += 1.0
 
-            tool.confidence_score = score
-            if score > 0:
-                scored_tools.append(tool)
+            context.tool_scores[tool_name] = score
+            scored_tools.append((score, tool))
 
         # Sort by score and return top tools
-        scored_tools.sort(key=lambda x: x.confidence_score, reverse=True)
-        return scored_tools
+        scored_tools.sort(key=lambda scored: scored[0], reverse=True)
+        return [tool for _, tool in scored_tools]
+
+    def _refresh_prompt_catalog(self, tools: List[Any]):
+        """Drop prompt lines and re-fingerprint the catalog for decision keys."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for tool in sorted(tools, key=lambda t: (t.server_name, t.name)):
+            hasher.update(json.dumps(
+                [tool.server_name, tool.name, tool.description, tool.input_schema], sort_keys=True, default=str
+            ).encode("utf-8"))
+        self._catalog_fingerprint = hasher.hexdigest()
+        self._catalog_prompt_lines.clear()
+
+    def _tool_prompt_line(self, tool: ToolCapability) -> str:
+        """Compact one-line description of a tool for the selection prompt."""
+        line = self._catalog_prompt_lines.get(tool.name)
+        if line is None:
+            description = " ".join(tool.description.split())
+            if len(description) > 200:
+                description = description[:197] + "..."
+            domains = ", ".join(sorted(tool.domains)) or "general"
+            line = f"- {tool.name} ({domains}; {tool.complexity_level}): {description}"
+            self._catalog_prompt_lines[tool.name] = line
+        return line
+
+    def _decision_key(self, context: ToolSelectionContext, available_tools: List[ToolCapability]) -> str:
+        """Key a selection decision by normalised request features, candidates and catalog."""
+        intent_info = context.intent_analysis or {}
+        features = {
+            "phase": context.processing_phase.value,
+            "intent_type": intent_info.get("intent_type"),
+            "complexity": intent_info.get("complexity"),
+            "domains": sorted(intent_info.get("domains", [])),
+            "target_tools": sorted(intent_info.get("target_tools", [])),
+            "action_verbs": sorted(intent_info.get("action_verbs", [])),
+            "candidates": sorted(tool.name for tool in available_tools),
+            "catalog": self._catalog_fingerprint
+        }
+        return hashlib.blake2b(json.dumps(features, sort_keys=True).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_decision(self, key: str) -> Optional[Tuple[List[str], float]]:
+        entry = self._decision_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self._decision_cache_ttl_seconds:
+            del self._decision_cache[key]
+            entry = None
+        if entry is None:
+            self._decision_stats["misses"] += 1
+            return None
+        self._decision_cache.move_to_end(key)
+        self._decision_stats["hits"] += 1
+        return entry[1], entry[2]
+
+    def _store_decision(self, key: str, selected_tool_names: List[str], confidence: float):
+        self._decision_cache[key] = (time.monotonic(), list(selected_tool_names), confidence)
+        self._decision_cache.move_to_end(key)
+        while len(self._decision_cache) > self._decision_cache_size:
+            self._decision_cache.popitem(last=False)
+
+    def _get_selection_agent(self):
+        """The LLM agent used for tool selection, created on first use."""
+        if self._selection_agent is None:
+            from google.adk.agents import Agent
+
+            self._selection_agent = Agent(
+                name="tool_selector_llm",
+                model="gemini-2.0-flash-thinking",  # Use thinking model for better reasoning
+                instruction="You are an expert at selecting the most appropriate MCP tools based on request context and requirements."
+            )
+        return self._selection_agent
+
+    @staticmethod
+    def _apply_selection(context: ToolSelectionContext,
+                         available_tools: List[ToolCapability],
+                         selected_tool_names: List[str],
+                         confidence: float) -> List[ToolCapability]:
+        """Filter available tools to an LLM selection."""
+        selected_tools = []
+        for tool in available_tools:
+            if tool.name in selected_tool_names:
+                context.tool_scores[tool.name] = confidence
+                selected_tools.append(tool)
+        return selected_tools
 
     async def _select_by_llm_guidance(self,
                                      context: ToolSelectionContext,
                                      available_tools: List[ToolCapability]) -> List[ToolCapability]:
-        """Select tools using LLM guidance."""
+        """Select tools using LLM guidance, reusing earlier decisions for the same features and catalog."""
+        if deadline_expired():
+            self.logger.warning("Request deadline exceeded, skipping LLM tool selection")
+            return await self._select_by_capability_match(context, available_tools)
+
+        decision_key = self._decision_key(context, available_tools)
+        cached_decision = self._get_cached_decision(decision_key)
+        if cached_decision is not None:
+            selected_tool_names, confidence = cached_decision
+            self.logger.debug(f"Reusing LLM tool selection: {selected_tool_names}")
+            return self._apply_selection(context, available_tools, selected_tool_names, confidence)
+
         try:
-            from google.adk.agents import Agent
+            tool_selection_agent = self._get_selection_agent()
 
             # Create LLM-guided tool selection prompt
             request_text = self._extract_request_text(context.request_data)
             intent_info = context.intent_analysis or {}
-
-            # Prepare tool information for LLM
-            tool_descriptions = []
-            for tool in available_tools:
-                tool_info = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "domains": list(tool.domains),
-                    "complexity": tool.complexity_level,
-                    "keywords": list(tool.keywords)
-                }
-                tool_descriptions.append(tool_info)
+            tool_lines = "\n".join(self._tool_prompt_line(tool) for tool in available_tools)
 
             # Create LLM prompt for tool selection
             selection_prompt = f"""
@@ -397,8 +542,8 @@ REQUEST ANALYSIS:
 - Domains: {intent_info.get('domains', [])}
 - Processing Phase: {context.processing_phase.value}
 
-AVAILABLE TOOLS:
-{json.dumps(tool_descriptions, indent=2)}
+AVAILABLE TOOLS (name (domains; complexity): description):
+{tool_lines}
 
 SELECTION CRITERIA:
 1. Tools should match the request domain and complexity
@@ -415,20 +560,16 @@ Please respond with a JSON object containing:
 }}
 """
 
-            # Create a simple LLM agent for tool selection
-            tool_selection_agent = Agent(
-                name="tool_selector_llm",
-                model="gemini-2.0-flash-thinking",  # Use thinking model for better reasoning
-                instruction="You are an expert at selecting the most appropriate MCP tools based on request context and requirements."
-            )
-
             # Get LLM guidance
             try:
-                # Use the correct ADK Agent API with async generator
-                async_gen = tool_selection_agent.run_async(selection_prompt)
-                llm_response = ""
-                async for chunk in async_gen:
-                    llm_response += chunk
+                # Use the correct ADK Agent API with async generator, bounded by the request deadline
+                async def collect_response() -> str:
+                    response = ""
+                    async for chunk in tool_selection_agent.run_async(selection_prompt):
+                        response += chunk
+                    return response
+
+                llm_response = await asyncio.wait_for(collect_response(), timeout=budget_timeout())
 
                 # Parse LLM response
                 if llm_response and isinstance(llm_response, str):
@@ -442,11 +583,8 @@ Please respond with a JSON object containing:
                         confidence = selection_data.get("confidence", 0.5)
 
                         # Filter available tools based on LLM selection
-                        selected_tools = []
-                        for tool in available_tools:
-                            if tool.name in selected_tool_names:
-                                tool.confidence_score = confidence
-                                selected_tools.append(tool)
+                        selected_tools = self._apply_selection(context, available_tools, selected_tool_names, confidence)
+                        self._store_decision(decision_key, [tool.name for tool in selected_tools], confidence)
 
                         self.logger.info(f"LLM guided selection: {len(selected_tools)} tools selected with confidence {confidence}")
                         self.logger.debug(f"LLM reasoning: {reasoning}")
@@ -586,35 +724,10 @@ Please respond with a JSON object containing:
             results = []
             errors = []
 
-            self.logger.info(f"Executing {len(plan.tools)} tools")
-
-            # Execute tools in order (TODO: implement parallel execution)
-            for tool_name in plan.execution_order:
-                try:
-                    # Prepare arguments based on context
-                    arguments = self._prepare_tool_arguments(tool_name, context)
-
-                    # Execute tool
-                    result = await self.tool_registry.execute_tool(
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        timeout=plan.timeout_ms / 1000.0  # Convert to seconds
-                    )
-
-                    results.append(result)
-
-                    if result.success:
-                        self.logger.debug(f"Tool {tool_name} executed successfully")
-                    else:
-                        self.logger.warning(f"Tool {tool_name} execution failed: {result.error_message}")
-                        errors.append(f"{tool_name}: {result.error_message}")
-
-                        # TODO: Implement fallback tool execution
-
-                except Exception as e:
-                    error_msg = f"Error executing tool {tool_name}: {str(e)}"
-                    self.logger.error(error_msg)
-                    errors.append(error_msg)
+            async for result in self.iter_tool_plan(plan, context):
+                results.append(result)
+                if not result.success:
+                    errors.append(f"{result.tool_name}: {result.error_message}")
 
             success_count = sum(1 for r in results if r.success)
 
@@ -637,31 +750,75 @@ Please respond with a JSON object containing:
                 "results": []
             }
 
-    def _prepare_tool_arguments(self, tool_name: str, context: ToolSelectionContext) -> Dict[str, Any]:
-        """Prepare arguments for tool execution based on context."""
-        # Basic argument preparation - this would be enhanced based on specific tool requirements
-        arguments = {}
-
-        # Tool-specific argument preparation
-        if tool_name == "find_assigned_tickets":
-            # YouTrack find_assigned_tickets expects 'state' and 'project' parameters
-            arguments["state"] = "Open"  # Default to open tickets
-            # Don't add 'query' or 'intent' parameters as they're not expected by this tool
-        elif tool_name == "get_user_details":
-            # get_user_details typically doesn't need additional parameters
-            pass
-        else:
-            # Common arguments that many tools might use
-            request_text = self._extract_request_text(context.request_data)
-            if request_text:
-                arguments["query"] = request_text
-                arguments["text"] = request_text
+    async def iter_tool_plan(self, plan: ToolExecutionPlan, context: ToolSelectionContext) -> AsyncIterator[ToolExecutionResult]:
+        """
+        Execute the tool execution plan, yielding each tool's result as soon as it completes.
+
+        Failures (invalid arguments, execution errors) are yielded as unsuccessful
+        results. Tools not yet started when the consumer stops iterating are not
+        executed, so callers can cut the plan short once they have enough context.
+
+        Args:
+            plan: Tool execution plan
+            context: Tool selection context
+
+        Yields:
+            ToolExecutionResult per tool, in execution order
+        """
+        if not plan or not plan.tools:
+            return
 
-            # Add intent analysis for tools that might use it
-            if context.intent_analysis:
-                arguments["intent"] = context.intent_analysis
+        self.logger.info(f"Executing {len(plan.tools)} tools")
 
-        return arguments
+        # Execute tools in order (TODO: implement parallel execution)
+        for tool_name in plan.execution_order:
+            try:
+                # Synthesize arguments from the tool schema; invalid calls are not sent
+                synthesis = self._synthesize_tool_arguments(tool_name, context)
+                if synthesis["status"] != "success":
+                    error_msg = f"Invalid arguments: {synthesis['error']}"
+                    self.logger.warning(f"Tool {tool_name} not executed: {error_msg}")
+                    yield ToolExecutionResult(success=False, error_message=error_msg, tool_name=tool_name)
+                    continue
+
+                # Execute tool
+                result = await self.tool_registry.execute_tool(
+                    tool_name=tool_name,
+                    arguments=synthesis["arguments"],
+                    timeout=plan.timeout_ms / 1000.0  # Convert to seconds
+                )
+
+            except Exception as e:
+                self.logger.error(f"Error executing tool {tool_name}: {e}")
+                result = ToolExecutionResult(success=False, error_message=str(e), tool_name=tool_name)
+
+            if result.success:
+                self.logger.debug(f"Tool {tool_name} executed successfully")
+            else:
+                self.logger.warning(f"Tool {tool_name} execution failed: {result.error_message}")
+
+                # TODO: Implement fallback tool execution
+
+            yield result
+
+    def prepare_tool_calls(self, tool_names: List[str], context: ToolSelectionContext) -> List[Tuple[str, Dict[str, Any]]]:
+        """Pair each tool with the arguments execute_tool_plan would call it with."""
+        return [(tool_name, self._prepare_tool_arguments(tool_name, context)) for tool_name in tool_names]
+
+    def _prepare_tool_arguments(self, tool_name: str, context: ToolSelectionContext) -> Dict[str, Any]:
+        """Prepare arguments for tool execution based on context."""
+        return self._synthesize_tool_arguments(tool_name, context)["arguments"]
+
+    def _synthesize_tool_arguments(self, tool_name: str, context: ToolSelectionContext) -> Dict[str, Any]:
+        """Synthesize and validate arguments for a tool from its input schema."""
+        tool_info = self.tool_discovery.get_tool(tool_name)
+        input_schema = getattr(tool_info, "input_schema", None)
+        return self._argument_synthesizer.synthesize(
+            tool_name,
+            input_schema if isinstance(input_schema, dict) else None,
+            self._extract_request_text(context.request_data),
+            context.intent_analysis
+        )
 
     def _extract_request_text(self, request_data: Dict[str, Any]) -> str:
         """Extract text content from request data."""
@@ -676,28 +833,29 @@ Please respond with a JSON object containing:
 
         return ""
 
-    def _is_cache_valid(self) -> bool:
-        """Check if capability cache is still valid."""
-        if not self._cache_timestamp or not self._capability_cache:
-            return False
-
-        age = (datetime.now() - self._cache_timestamp).total_seconds()
-        return age < self._cache_ttl_seconds
-
     def get_selection_stats(self) -> Dict[str, Any]:
         """Get tool selection statistics."""
         return {
             "strategy": self._selection_strategy.value,
             "max_tools_per_phase": self._max_tools_per_phase,
             "tool_timeout_ms": self._tool_timeout_ms,
-            "cached_capabilities": len(self._capability_cache),
-            "cache_valid": self._is_cache_valid(),
+            "cached_capabilities": len(self._capability_catalog.capabilities),
+            "capability_catalog_version": self._capability_catalog.version,
+            "capability_rebuilds": self._capability_rebuilds,
+            "tool_index": self._tool_index.get_stats(),
+            "argument_synthesis": self._argument_synthesizer.get_stats(),
+            "llm_decisions": {
+                "cached": len(self._decision_cache),
+                "hits": self._decision_stats["hits"],
+                "misses": self._decision_stats["misses"],
+                "catalog_fingerprint": self._catalog_fingerprint
+            },
             "available_domains": list(self._domain_keywords.keys()),
             "processing_phases": [phase.value for phase in ProcessingPhase]
         }
 
     def clear_cache(self):
         """Clear capability cache."""
-        self._capability_cache.clear()
-        self._cache_timestamp = None
+        self._capability_catalog = CapabilityCatalog(version=None)
+        self._decision_cache.clear()
         self.logger.info("Tool selection cache cleared")
\ No newline at end of file
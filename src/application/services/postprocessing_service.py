@@ -1,4 +1,3 @@
-import json
 import logging
 import time
 import asyncio
@@ -275,8 +274,8 @@ def log_interaction(request_metadata: Dict[str, Any], response_metadata: Dict[st
             }
         }
 
-        # Log to appropriate destination (file, database, etc.)
-        logger.info(f"Interaction logged: {json.dumps(interaction_log, indent=2)}")
+        # Log as structured fields; formatted (compactly) by the log writer, not here
+        logger.info("Interaction logged", extra={"interaction": interaction_log})
 
         return {
             "status": "success",
@@ -0,0 +1,336 @@
+"""
+Rate limiting and admission control.
+
+`TokenBucket` and `KeyedRateLimiter` are the rate limiting primitives.
+`AdmissionController` puts them in front of chat completions: each API key
+gets buckets for requests and estimated tokens, over-limit requests are
+rejected immediately with a retry delay, and admitted requests wait in a
+bounded priority queue for one of a fixed number of execution slots so
+interactive traffic is served ahead of batch work.
+"""
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens per second up to `capacity`.
+
+    A rate of 0 or less means unlimited.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate <= 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def idle(self) -> bool:
+        """Full and without waiters, so indistinguishable from a new bucket."""
+        return not self._lock.locked() and self.available >= self.capacity
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        if self.unlimited:
+            return float("inf")
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available right now."""
+        if self.unlimited:
+            return True
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` can be taken (0 if available now)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        missing = min(tokens, self.capacity) - self._tokens
+        return max(0.0, missing / self.rate)
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until tokens are available and take them (FIFO among waiters)."""
+        if self.unlimited:
+            return
+        async with self._lock:
+            while not self.try_acquire(min(tokens, self.capacity)):
+                await asyncio.sleep(self.time_until_available(tokens))
+
+
+class KeyedRateLimiter:
+    """
+    One token bucket per key (for example per provider), created on first use.
+
+    Once more than `max_buckets` exist, idle buckets are evicted least recently
+    used first. An idle bucket is full, so dropping it loses no state.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        rates: Optional[Dict[str, float]] = None,
+        max_buckets: int = 10000
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.rates = rates or {}
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._evict_above = max_buckets
+
+    def bucket(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+
+        if len(self._buckets) >= self._evict_above:
+            self._evict_idle()
+        bucket = TokenBucket(self.rates.get(key, self.rate), self.capacity)
+        self._buckets[key] = bucket
+        return bucket
+
+    def _evict_idle(self):
+        for key in [key for key, bucket in self._buckets.items() if bucket.idle]:
+            del self._buckets[key]
+            if len(self._buckets) < self.max_buckets:
+                break
+        # Busy buckets are kept; if too many remain, sweep again only once the map has doubled
+        self._evict_above = self.max_buckets if len(self._buckets) < self.max_buckets else 2 * len(self._buckets)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def acquire(self, key: str, tokens: float = 1.0):
+        await self.bucket(key).acquire(tokens)
+
+
+class RequestPriority(IntEnum):
+    """Scheduling priority; lower values are served first."""
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request is not admitted; `retry_after` is in seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class AdmissionConfig:
+    """Settings for admission control."""
+    enabled: bool = False
+    requests_per_minute: float = 60.0  # Per API key; 0 disables
+    tokens_per_minute: float = 100000.0  # Estimated prompt + completion tokens per API key; 0 disables
+    max_concurrent_requests: int = 32
+    max_queue_size: int = 100
+    max_queue_wait_seconds: float = 30.0
+
+
+# Upper bounds of the queue wait histogram, in seconds
+QUEUE_WAIT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class AdmissionTicket:
+    """An execution slot held by an admitted request; release it exactly once when done."""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self._released = False
+
+    def release(self):
+        if not self._released:
+            self._released = True
+            self._controller._release()
+
+
+class AdmissionController:
+    """Per-key rate limits plus a bounded priority queue in front of request execution."""
+
+    def __init__(self, config: Optional[AdmissionConfig] = None):
+        self.config = config or AdmissionConfig()
+        self.logger = logging.getLogger("AdmissionController")
+        self.request_limits = KeyedRateLimiter(
+            self.config.requests_per_minute / 60.0, capacity=max(self.config.requests_per_minute, 1.0)
+        )
+        self.token_limits = KeyedRateLimiter(
+            self.config.tokens_per_minute / 60.0, capacity=max(self.config.tokens_per_minute, 1.0)
+        )
+        self._active = 0
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        # Statistics
+        self._admitted = 0
+        self._rejected: Dict[str, int] = {"requests": 0, "tokens": 0, "queue_full": 0, "queue_timeout": 0}
+        self._wait_counts = {priority: [0] * (len(QUEUE_WAIT_BUCKETS) + 1) for priority in RequestPriority}
+        self._wait_sums = {priority: 0.0 for priority in RequestPriority}
+
+    @staticmethod
+    def estimate_tokens(request_data: Dict[str, Any]) -> int:
+        """Rough token estimate: ~4 characters per prompt token plus the requested completion size."""
+        prompt_chars = len(json.dumps(request_data.get("messages", []), ensure_ascii=False))
+        return prompt_chars // 4 + int(request_data.get("max_tokens") or 256)
+
+    @staticmethod
+    def limit_key(api_key: str) -> str:
+        """Bucket key for an API key; raw credentials are never kept in memory."""
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def check_rate(self, api_key: str, request_data: Dict[str, Any]):
+        """Take request and token budget for an API key, or raise RateLimitExceeded without waiting."""
+        key = self.limit_key(api_key)
+        request_bucket = self.request_limits.bucket(key)
+        token_bucket = self.token_limits.bucket(key)
+        tokens = min(self.estimate_tokens(request_data), token_bucket.capacity)
+
+        if request_bucket.available < 1:
+            self._rejected["requests"] += 1
+            raise RateLimitExceeded("Request rate limit exceeded", request_bucket.time_until_available())
+        if token_bucket.available < tokens:
+            self._rejected["tokens"] += 1
+            raise RateLimitExceeded("Token rate limit exceeded", token_bucket.time_until_available(tokens))
+
+        request_bucket.try_acquire()
+        token_bucket.try_acquire(tokens)
+
+    async def acquire_slot(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> AdmissionTicket:
+        """
+        Wait for an execution slot, serving higher priorities first.
+
+        Raises:
+            RateLimitExceeded: If the queue is full or the wait exceeds max_queue_wait_seconds
+        """
+        started = time.monotonic()
+        if self._active < self.config.max_concurrent_requests and not self._queue:
+            self._active += 1
+            return self._admit(priority, started)
+
+        if len(self._queue) >= self.config.max_queue_size:
+            self._rejected["queue_full"] += 1
+            raise RateLimitExceeded("Request queue is full", 1.0)
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (int(priority), next(self._sequence), waiter))
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.config.max_queue_wait_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self._release()
+            else:
+                waiter.cancel()
+                self._queue = [entry for entry in self._queue if entry[2] is not waiter]
+                heapq.heapify(self._queue)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._rejected["queue_timeout"] += 1
+            raise RateLimitExceeded("Timed out waiting in the request queue", self.config.max_queue_wait_seconds)
+        return self._admit(priority, started)
+
+    def _admit(self, priority: RequestPriority, started: float) -> AdmissionTicket:
+        waited = time.monotonic() - started
+        self._admitted += 1
+        self._wait_sums[priority] += waited
+        for index, bound in enumerate(QUEUE_WAIT_BUCKETS):
+            if waited <= bound:
+                self._wait_counts[priority][index] += 1
+                break
+        else:
+            self._wait_counts[priority][-1] += 1
+        return AdmissionTicket(self)
+
+    def _release(self):
+        # Hand the slot straight to the next live waiter, otherwise free it
+        while self._queue:
+            _, _, waiter = heapq.heappop(self._queue)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    async def admit(
+        self,
+        api_key: str,
+        request_data: Dict[str, Any],
+        priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> Optional[AdmissionTicket]:
+        """Apply rate limits and wait for a slot; returns None when admission control is disabled."""
+        if not self.config.enabled:
+            return None
+        self.check_rate(api_key, request_data)
+        ticket = await self.acquire_slot(priority)
+        queued = len(self._queue)
+        if queued:
+            self.logger.debug(f"🚦 Admitted {priority.name.lower()} request ({queued} still queued)")
+        return ticket
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics."""
+        return {
+            "enabled": self.config.enabled,
+            "active": self._active,
+            "queued": len(self._queue),
+            "admitted": self._admitted,
+            "tracked_keys": len(self.request_limits),
+            "rejected": dict(self._rejected),
+            "queue_wait_seconds_total": {
+                priority.name.lower(): round(total, 6) for priority, total in self._wait_sums.items()
+            }
+        }
+
+    def render_prometheus(self) -> str:
+        """Render admission metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP admission_queue_wait_seconds Time requests waited for an execution slot",
+            "# TYPE admission_queue_wait_seconds histogram"
+        ]
+        for priority in RequestPriority:
+            label = priority.name.lower()
+            cumulative = 0
+            for bound, count in zip(QUEUE_WAIT_BUCKETS + (float("inf"),), self._wait_counts[priority]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else bound
+                lines.append(f'admission_queue_wait_seconds_bucket{{priority="{label}",le="{le}"}} {cumulative}')
+            lines.append(f'admission_queue_wait_seconds_sum{{priority="{label}"}} {self._wait_sums[priority]}')
+            lines.append(f'admission_queue_wait_seconds_count{{priority="{label}"}} {cumulative}')
+
+        lines.append("# HELP admission_rejected_total Requests rejected by admission control")
+        lines.append("# TYPE admission_rejected_total counter")
+        for reason, count in sorted(self._rejected.items()):
+            lines.append(f'admission_rejected_total{{reason="{reason}"}} {count}')
+        lines.append("# HELP admission_queue_depth Requests waiting for an execution slot")
+        lines.append("# TYPE admission_queue_depth gauge")
+        lines.append(f"admission_queue_depth {len(self._queue)}")
+        return "\n".join(lines) + "\n"
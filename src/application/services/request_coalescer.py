@@ -0,0 +1,197 @@
+"""
+Single-flight coalescing of identical streaming completions.
+
+When a deterministic request (temperature 0, or explicitly marked by the
+client) arrives while an identical one is already streaming, the new client
+subscribes to the running stream instead of starting another pipeline and
+upstream request. Chunks are kept in a broadcast buffer so late joiners first
+replay everything sent so far and then follow the live stream.
+"""
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, List, Mapping, Optional, Union
+
+from src.application.services.response_cache_service import build_request_keys
+
+Chunk = Union[str, bytes]
+
+COALESCE_HEADER = "x-coalesce"
+
+
+@dataclass
+class RequestCoalescerConfig:
+    """Settings for request coalescing."""
+    enabled: bool = False
+    max_buffer_bytes: int = 8 * 1024 * 1024  # Streams past this size stop accepting new subscribers
+
+
+class _SubscriberSlot:
+    """One subscriber's hold on a broadcast, released exactly once."""
+
+    def __init__(self, broadcast: "BroadcastStream"):
+        self._broadcast = broadcast
+        self._held = True
+
+    def release(self):
+        if self._held:
+            self._held = False
+            self._broadcast._unsubscribe()
+
+
+class BroadcastStream:
+    """
+    Runs one source stream and fans its chunks out to any number of subscribers.
+
+    The source is consumed by a background task into a buffer; each subscriber
+    reads the buffer from the start at its own pace. The source is cancelled if
+    every subscriber leaves before it finishes.
+    """
+
+    def __init__(self, source: AsyncIterator[Chunk], max_buffer_bytes: int):
+        self.max_buffer_bytes = max_buffer_bytes
+        self._chunks: List[Chunk] = []
+        self._buffer_bytes = 0
+        self._changed = asyncio.Condition()
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._subscribers = 0
+        self.total_subscribers = 0
+        self._task = asyncio.create_task(self._pump(source))
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def joinable(self) -> bool:
+        """Whether a new subscriber can still replay the full stream."""
+        return not self._done and self._buffer_bytes <= self.max_buffer_bytes
+
+    async def _pump(self, source: AsyncIterator[Chunk]):
+        try:
+            async for chunk in source:
+                self._chunks.append(chunk)
+                self._buffer_bytes += len(chunk)
+                async with self._changed:
+                    self._changed.notify_all()
+        except asyncio.CancelledError:
+            self._error = asyncio.CancelledError()
+        except Exception as e:
+            self._error = e
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            self._done = True
+            async with self._changed:
+                self._changed.notify_all()
+
+    def add_done_callback(self, callback: Callable[[], None]):
+        """Call `callback` once the source stream has finished."""
+        self._task.add_done_callback(lambda _task: callback())
+
+    def subscribe(self) -> AsyncGenerator[Chunk, None]:
+        """Replay buffered chunks, then follow the live stream until it ends."""
+        # Counted right away so the source survives until this subscriber starts reading
+        self._subscribers += 1
+        self.total_subscribers += 1
+        slot = _SubscriberSlot(self)
+        subscription = self._follow(slot)
+        # A subscription closed or dropped before its first read never runs _follow's finally
+        weakref.finalize(subscription, slot.release).atexit = False
+        return subscription
+
+    def _unsubscribe(self):
+        self._subscribers -= 1
+        if self._subscribers == 0 and not self._done:
+            self._task.cancel()
+
+    async def _follow(self, slot: _SubscriberSlot) -> AsyncGenerator[Chunk, None]:
+        position = 0
+        try:
+            while True:
+                while position < len(self._chunks):
+                    yield self._chunks[position]
+                    position += 1
+
+                if self._done:
+                    if self._error is not None and not isinstance(self._error, asyncio.CancelledError):
+                        raise self._error
+                    return
+
+                async with self._changed:
+                    if position >= len(self._chunks) and not self._done:
+                        await self._changed.wait()
+        finally:
+            slot.release()
+
+
+class RequestCoalescer:
+    """Coalesces identical in-flight streaming requests onto one upstream stream."""
+
+    def __init__(self, config: Optional[RequestCoalescerConfig] = None):
+        self.config = config or RequestCoalescerConfig()
+        self.logger = logging.getLogger("RequestCoalescer")
+        self._in_flight: Dict[str, BroadcastStream] = {}
+
+        # Statistics
+        self._flights = 0
+        self._coalesced = 0
+
+    def should_coalesce(self, request_data: Dict[str, Any], headers: Optional[Mapping[str, str]] = None) -> bool:
+        """
+        Whether a request is eligible for coalescing.
+
+        Only deterministic requests qualify: temperature 0, or the client sent
+        `X-Coalesce: true` to accept sharing a sampled response.
+        """
+        if not self.config.enabled:
+            return False
+
+        header = (headers or {}).get(COALESCE_HEADER, "")
+        if header.lower() in ("false", "0", "no"):
+            return False
+        return request_data.get("temperature") == 0 or header.lower() in ("true", "1", "yes")
+
+    def stream(
+        self,
+        request_data: Dict[str, Any],
+        source_factory: Callable[[], AsyncIterator[Chunk]],
+        tenant: str = ""
+    ) -> AsyncGenerator[Chunk, None]:
+        """
+        Subscribe to the in-flight stream for an identical request, or start one.
+
+        Args:
+            request_data: Chat completion request (keyed like the response cache)
+            source_factory: Creates the upstream stream when no flight is running
+            tenant: Caller of the request; only requests of the same tenant share a stream
+        """
+        key = build_request_keys(request_data, tenant)[0]
+        flight = self._in_flight.get(key)
+
+        if flight is not None and flight.joinable:
+            self._coalesced += 1
+            self.logger.info(f"🔗 Coalescing request onto in-flight stream ({flight.total_subscribers} subscribers)")
+        else:
+            flight = BroadcastStream(source_factory(), self.config.max_buffer_bytes)
+            self._in_flight[key] = flight
+            self._flights += 1
+            flight.add_done_callback(lambda key=key, flight=flight: self._finish(key, flight))
+
+        return flight.subscribe()
+
+    def _finish(self, key: str, flight: BroadcastStream):
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            "enabled": self.config.enabled,
+            "in_flight": len(self._in_flight),
+            "flights": self._flights,
+            "coalesced_requests": self._coalesced
+        }
@@ -0,0 +1,338 @@
+"""
+Response cache for the chat completions endpoint.
+
+Two tiers, both opt-in:
+
+- Exact: keyed by a hash of the normalized messages, the model and the
+  sampling parameters. Whitespace differences do not cause misses.
+- Semantic: for requests whose context (model, parameters and every message
+  but the last user message) matches, the last user message is compared by
+  embedding similarity against cached requests in a local vector index.
+  Embedding similarity cannot tell "ticket PROJ-12" from "ticket PROJ-13" or
+  "assigned to me" from "not assigned to me", so a semantic hit also requires
+  the numbers, identifiers, quoted strings and negations of both messages to
+  be identical. The tier stays off by default: the bundled hashing embedder
+  only matches near-verbatim rephrasings, and anything looser needs a real
+  embedding model with a threshold well above the default.
+
+Both tiers are scoped by tenant (the caller's API key or address), so one
+caller never receives a completion cached for another.
+
+Hits are replayed as OpenAI SSE chunks so streaming clients cannot tell them
+apart from a live completion. Entries expire after a per-model TTL and the
+least recently used entries are evicted to stay within the memory budget.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+
+from src.application.services.text_embedding import EmbeddingFunction, HashingTextEmbedder, VectorIndex
+
+# Request fields that change the completion and therefore belong in the key
+SAMPLING_PARAMS = ("temperature", "top_p", "max_tokens", "frequency_penalty", "presence_penalty", "stop", "seed", "n")
+
+# Fixed overhead per entry (keys, bookkeeping) used in memory accounting
+_ENTRY_OVERHEAD_BYTES = 512
+
+_WHITESPACE = re.compile(r"\s+")
+_REPLAY_TOKEN = re.compile(r"\s*\S+")
+
+# Parts of a message that change its meaning without moving its embedding much
+_QUOTED = re.compile(r'"([^"]*)"|`([^`]*)`|(?<![\w\'])\'([^\']*)\'(?![\w\'])')
+_WORD = re.compile(r"[A-Za-z0-9_]+(?:[-./:#][A-Za-z0-9_]+)*(?:'t)?")
+_NEGATIONS = frozenset({"not", "no", "never", "none", "nothing", "nobody", "neither", "nor", "without", "cannot", "except", "excluding"})
+
+
+@dataclass
+class ResponseCacheConfig:
+    """Settings for the response cache."""
+    enabled: bool = False
+    semantic_enabled: bool = False
+    similarity_threshold: float = 0.95  # Minimum cosine similarity for a semantic hit; raise it with a real embedding model
+    default_ttl_seconds: float = 300.0
+    model_ttl_seconds: Dict[str, float] = field(default_factory=dict)  # Per-model TTL overrides (0 disables caching)
+    max_memory_bytes: int = 64 * 1024 * 1024
+    replay_tokens_per_chunk: int = 3  # Words per replayed SSE chunk
+    replay_chunk_delay_ms: float = 0.0  # Pause between replayed chunks
+
+
+@dataclass
+class CachedResponse:
+    """A cached completion."""
+    key: str
+    scope: str  # Hash of everything but the last user message (semantic tier scope)
+    model: str
+    content: str
+    created_at: float
+    expires_at: float
+    size_bytes: int
+    hits: int = 0
+    salient_tokens: Tuple[str, ...] = ()  # Must match exactly for a semantic hit
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, list):
+        content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return _WHITESPACE.sub(" ", str(content or "")).strip()
+
+
+def _hash(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def salient_tokens(text: str) -> Tuple[str, ...]:
+    """
+    Tokens of a message that must match exactly for a semantic cache hit.
+
+    These are the quoted strings, followed by the numbers, identifiers (words
+    with digits, underscores or separators, and all-caps words) and each
+    negation together with the word it negates, in message order.
+    """
+    tokens = []
+    for match in _QUOTED.finditer(text):
+        quoted = next(group for group in match.groups() if group is not None)
+        tokens.append('"' + quoted.strip().lower() + '"')
+    text = _QUOTED.sub(" ", text)
+
+    words = _WORD.findall(text)
+    for i, word in enumerate(words):
+        lowered = word.lower()
+        if lowered in _NEGATIONS or lowered.endswith("n't"):
+            following = words[i + 1].lower() if i + 1 < len(words) else ""
+            tokens.append(f"not {following}".strip())
+        elif any(c.isdigit() or c in "_-./:#" for c in word) or (len(word) > 1 and word.isupper()):
+            tokens.append(lowered)
+    return tuple(tokens)
+
+
+def build_request_keys(request_data: Dict[str, Any], tenant: str = "") -> Tuple[str, str, str]:
+    """
+    Compute the cache keys of a chat completion request.
+
+    Args:
+        request_data: Chat completion request
+        tenant: Caller the entry belongs to (API key or client address)
+
+    Returns:
+        (exact key, semantic scope, last user message text)
+    """
+    messages = [
+        (message.get("role", "user"), _message_text(message.get("content")))
+        for message in request_data.get("messages", [])
+    ]
+    params = {name: request_data.get(name) for name in SAMPLING_PARAMS if request_data.get(name) is not None}
+    model = request_data.get("model", "")
+
+    last_user_index = max((i for i, (role, _) in enumerate(messages) if role == "user"), default=-1)
+    last_user_text = messages[last_user_index][1] if last_user_index >= 0 else ""
+    context = [message for i, message in enumerate(messages) if i != last_user_index]
+
+    exact_key = _hash({"tenant": tenant, "model": model, "params": params, "messages": messages})
+    scope = _hash({"tenant": tenant, "model": model, "params": params, "context": context, "position": last_user_index})
+    return exact_key, scope, last_user_text
+
+
+class ResponseCacheService:
+    """Exact and semantic response cache with SSE replay."""
+
+    def __init__(self, config: Optional[ResponseCacheConfig] = None, embedder: Optional[EmbeddingFunction] = None):
+        self.config = config or ResponseCacheConfig()
+        self.logger = logging.getLogger("ResponseCacheService")
+        self._embed = embedder or HashingTextEmbedder()
+
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._scope_indexes: Dict[str, VectorIndex[str]] = {}
+        self._memory_bytes = 0
+
+        # Statistics
+        self._exact_hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def ttl_for_model(self, model: str) -> float:
+        """TTL for a model's entries, in seconds."""
+        return self.config.model_ttl_seconds.get(model, self.config.default_ttl_seconds)
+
+    def build_keys(self, request_data: Dict[str, Any], tenant: str = "") -> Tuple[str, str, str]:
+        """Compute the cache keys of a request (see build_request_keys)."""
+        return build_request_keys(request_data, tenant)
+
+    def lookup(self, request_data: Dict[str, Any], tenant: str = "") -> Optional[CachedResponse]:
+        """Find a cached response for a tenant's request, or None on a miss."""
+        if not self.config.enabled:
+            return None
+
+        exact_key, scope, last_user_text = self.build_keys(request_data, tenant)
+        now = time.time()
+
+        entry = self._get_live_entry(exact_key, now)
+        if entry is not None:
+            self._exact_hits += 1
+            return self._record_hit(entry)
+
+        if self.config.semantic_enabled and last_user_text and scope in self._scope_indexes:
+            matches = self._scope_indexes[scope].search(
+                self._embed(last_user_text), top_k=3, min_score=self.config.similarity_threshold
+            )
+            tokens = salient_tokens(last_user_text)
+            for key, score in matches:
+                entry = self._get_live_entry(key, now)
+                if entry is not None and entry.salient_tokens == tokens:
+                    self._semantic_hits += 1
+                    self.logger.debug(f"🎯 Semantic cache hit (similarity {score:.3f})")
+                    return self._record_hit(entry)
+
+        self._misses += 1
+        return None
+
+    def store(self, request_data: Dict[str, Any], content: str, tenant: str = "") -> bool:
+        """
+        Cache the completion of a tenant's request.
+
+        Returns:
+            True if the response was cached
+        """
+        if not self.config.enabled or not content:
+            return False
+
+        model = request_data.get("model", "")
+        ttl = self.ttl_for_model(model)
+        if ttl <= 0:
+            return False
+
+        exact_key, scope, last_user_text = self.build_keys(request_data, tenant)
+        size_bytes = len(content.encode("utf-8")) + _ENTRY_OVERHEAD_BYTES
+        if size_bytes > self.config.max_memory_bytes:
+            return False
+
+        self._remove(exact_key)
+        now = time.time()
+        self._entries[exact_key] = CachedResponse(
+            key=exact_key, scope=scope, model=model, content=content,
+            created_at=now, expires_at=now + ttl, size_bytes=size_bytes,
+            salient_tokens=salient_tokens(last_user_text)
+        )
+        self._memory_bytes += size_bytes
+
+        if self.config.semantic_enabled and last_user_text:
+            vector = self._embed(last_user_text)
+            self._scope_indexes.setdefault(scope, VectorIndex()).add(exact_key, vector)
+            self._entries[exact_key].size_bytes += len(vector) * 8
+            self._memory_bytes += len(vector) * 8
+
+        self._evict_to_budget()
+        return True
+
+    def to_completion(self, entry: CachedResponse, model: Optional[str] = None) -> Dict[str, Any]:
+        """Build a non-streaming chat.completion object from a cached response."""
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model or entry.model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": entry.content},
+                "finish_reason": "stop"
+            }]
+        }
+
+    async def replay(self, entry: CachedResponse, model: Optional[str] = None) -> AsyncGenerator[str, None]:
+        """Replay a cached response as OpenAI chat.completion.chunk SSE events."""
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        model = model or entry.model
+        delay = self.config.replay_chunk_delay_ms / 1000.0
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        yield chunk({"role": "assistant", "content": ""})
+
+        tokens = _REPLAY_TOKEN.findall(entry.content)
+        trailing = entry.content[sum(len(token) for token in tokens):]
+        step = max(1, self.config.replay_tokens_per_chunk)
+        for i in range(0, len(tokens), step):
+            text = "".join(tokens[i:i + step])
+            if i + step >= len(tokens):
+                text += trailing
+            yield chunk({"content": text})
+            if delay:
+                await asyncio.sleep(delay)
+
+        yield chunk({}, finish_reason="stop")
+        yield "data: [DONE]\n\n"
+
+    def _get_live_entry(self, key: str, now: float) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            return None
+        return entry
+
+    def _record_hit(self, entry: CachedResponse) -> CachedResponse:
+        entry.hits += 1
+        self._entries.move_to_end(entry.key)
+        return entry
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        self._memory_bytes -= entry.size_bytes
+        index = self._scope_indexes.get(entry.scope)
+        if index is not None:
+            index.remove(key)
+            if not len(index):
+                del self._scope_indexes[entry.scope]
+
+    def _evict_to_budget(self):
+        while self._memory_bytes > self.config.max_memory_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._scope_indexes.clear()
+        self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._exact_hits + self._semantic_hits + self._misses
+        return {
+            "enabled": self.config.enabled,
+            "semantic_enabled": self.config.semantic_enabled,
+            "entries": len(self._entries),
+            "memory_bytes": self._memory_bytes,
+            "max_memory_bytes": self.config.max_memory_bytes,
+            "exact_hits": self._exact_hits,
+            "semantic_hits": self._semantic_hits,
+            "misses": self._misses,
+            "hit_rate": (self._exact_hits + self._semantic_hits) / lookups if lookups else 0.0,
+            "evictions": self._evictions
+        }
@@ -0,0 +1,78 @@
+"""
+Opt-in visual pacing of reasoning steps.
+
+Reasoning workflows emit their steps as soon as they are ready. Clients that
+prefer steps to appear at a steady rhythm can enable
+`reasoning.stream_cadence_ms`: the response stream is then read ahead by a
+background task, so reasoning, tool calls and the upstream LLM request run
+at full speed, and only the delivery of reasoning-step chunks to the client
+is spaced out.
+"""
+import asyncio
+import time
+from typing import AsyncGenerator, AsyncIterator, Union
+
+Chunk = Union[str, bytes]
+
+# Model names used by the chunks that reasoning workflows stream as chat content
+REASONING_CHUNK_MARKERS = ('"model": "reasoning-engine"', '"model": "enhanced-reasoning-engine"')
+
+_END = object()
+
+
+def is_reasoning_chunk(chunk: Chunk) -> bool:
+    """Whether a chunk is a reasoning step (upstream LLM chunks are bytes)."""
+    return isinstance(chunk, str) and any(marker in chunk for marker in REASONING_CHUNK_MARKERS)
+
+
+async def pace_reasoning_steps(source: AsyncIterator[Chunk], cadence_ms: float) -> AsyncGenerator[Chunk, None]:
+    """
+    Deliver reasoning-step chunks at least `cadence_ms` apart without slowing the source.
+
+    Other chunks keep their order and are delivered as soon as everything before
+    them has been.
+    """
+    if cadence_ms <= 0:
+        async for chunk in source:
+            yield chunk
+        return
+
+    buffer: asyncio.Queue = asyncio.Queue()
+
+    async def read_ahead():
+        try:
+            async for chunk in source:
+                await buffer.put(chunk)
+        except Exception as e:
+            await buffer.put(e)
+        finally:
+            await buffer.put(_END)
+
+    reader = asyncio.create_task(read_ahead())
+    interval = cadence_ms / 1000.0
+    last_step = None
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+
+            if is_reasoning_chunk(item):
+                if last_step is not None:
+                    remaining = interval - (time.monotonic() - last_step)
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+                last_step = time.monotonic()
+            yield item
+    finally:
+        if not reader.done():
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+        aclose = getattr(source, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,201 @@
+"""
+Local text embeddings and an in-process vector index.
+
+The embedder uses feature hashing over word tokens and character trigrams, so
+it needs no model download or native dependencies and is stable across
+processes. It is good at catching near-identical phrasings (reordered words,
+typos, punctuation), which is what the semantic cache tiers need; callers that
+want real semantic embeddings can pass any `embed(text) -> List[float]`
+function instead.
+"""
+import hashlib
+import heapq
+import math
+import re
+from typing import Callable, Collection, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+EmbeddingFunction = Callable[[str], List[float]]
+SparseVector = Dict[int, float]
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+K = TypeVar("K", bound=Hashable)
+
+
+class HashingTextEmbedder:
+    """Feature-hashing embedder over word tokens and character trigrams."""
+
+    def __init__(self, dimensions: int = 256, trigram_weight: float = 0.5):
+        self.dimensions = dimensions
+        self.trigram_weight = trigram_weight
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        sign = 1.0 if value & 1 else -1.0
+        return (value >> 1) % self.dimensions, sign
+
+    def _features(self, text: str) -> SparseVector:
+        features: SparseVector = {}
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            index, sign = self._bucket(token)
+            features[index] = features.get(index, 0.0) + sign
+
+            padded = f" {token} "
+            for i in range(len(padded) - 2):
+                index, sign = self._bucket(padded[i:i + 3])
+                features[index] = features.get(index, 0.0) + sign * self.trigram_weight
+        return features
+
+    def embed(self, text: str) -> List[float]:
+        """Embed text as an L2-normalized vector."""
+        vector = [0.0] * self.dimensions
+        for index, value in self._features(text).items():
+            vector[index] = value
+        return normalize(vector)
+
+    def embed_sparse(self, text: str) -> SparseVector:
+        """Embed text as an L2-normalized sparse vector (dimension -> value, zeros omitted)."""
+        features = {index: value for index, value in self._features(text).items() if value != 0.0}
+        norm = math.sqrt(sum(value * value for value in features.values()))
+        if norm == 0.0:
+            return features
+        return {index: value / norm for index, value in features.items()}
+
+    __call__ = embed
+
+
+def normalize(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length (zero vectors are returned unchanged)."""
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0.0:
+        return vector
+    return [value / norm for value in vector]
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity of two L2-normalized vectors."""
+    return sum(x * y for x, y in zip(a, b))
+
+
+class VectorIndex(Generic[K]):
+    """
+    Brute-force in-process vector index over normalized vectors.
+
+    Sized for hundreds to a few thousand entries (cache entries, tools), where
+    a linear scan is cheaper than maintaining an approximate index.
+    """
+
+    def __init__(self):
+        self._vectors: Dict[K, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._vectors
+
+    def add(self, key: K, vector: List[float]):
+        """Add or replace the vector for a key."""
+        self._vectors[key] = vector
+
+    def remove(self, key: K):
+        """Remove a key if present."""
+        self._vectors.pop(key, None)
+
+    def clear(self):
+        self._vectors.clear()
+
+    def search(self, vector: List[float], top_k: int = 1, min_score: Optional[float] = None) -> List[Tuple[K, float]]:
+        """
+        Find the most similar entries.
+
+        Args:
+            vector: Normalized query vector
+            top_k: Maximum number of results
+            min_score: Drop results below this cosine similarity
+
+        Returns:
+            (key, score) pairs, most similar first
+        """
+        results = []
+        for key, candidate in self._vectors.items():
+            score = cosine_similarity(vector, candidate)
+            if min_score is None or score >= min_score:
+                results.append((key, score))
+
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results[:top_k]
+
+
+class SparseVectorIndex(Generic[K]):
+    """
+    Inverted index over sparse normalized vectors.
+
+    Each dimension keeps a posting list of the entries that use it, so a
+    search only visits entries sharing at least one dimension with the query
+    instead of scanning the whole index. Suited to larger collections embedded
+    with `HashingTextEmbedder.embed_sparse` and many dimensions.
+    """
+
+    def __init__(self):
+        self._vectors: Dict[K, SparseVector] = {}
+        self._postings: Dict[int, Dict[K, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._vectors
+
+    def add(self, key: K, vector: SparseVector):
+        """Add or replace the vector for a key."""
+        self.remove(key)
+        self._vectors[key] = vector
+        for index, value in vector.items():
+            self._postings.setdefault(index, {})[key] = value
+
+    def remove(self, key: K):
+        """Remove a key if present."""
+        vector = self._vectors.pop(key, None)
+        if vector is None:
+            return
+        for index in vector:
+            posting = self._postings[index]
+            del posting[key]
+            if not posting:
+                del self._postings[index]
+
+    def clear(self):
+        self._vectors.clear()
+        self._postings.clear()
+
+    def search(
+        self,
+        vector: SparseVector,
+        top_k: int = 1,
+        min_score: Optional[float] = None,
+        keys: Optional[Collection[K]] = None
+    ) -> List[Tuple[K, float]]:
+        """
+        Find the most similar entries.
+
+        Args:
+            vector: Normalized sparse query vector
+            top_k: Maximum number of results
+            min_score: Drop results below this cosine similarity
+            keys: Only consider these entries
+
+        Returns:
+            (key, score) pairs, most similar first
+        """
+        scores: Dict[K, float] = {}
+        for index, query_value in vector.items():
+            for key, value in self._postings.get(index, {}).items():
+                scores[key] = scores.get(key, 0.0) + query_value * value
+
+        results = [
+            (key, score) for key, score in scores.items()
+            if (min_score is None or score >= min_score) and (keys is None or key in keys)
+        ]
+        return heapq.nlargest(top_k, results, key=lambda item: item[1])
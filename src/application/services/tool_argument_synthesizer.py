@@ -0,0 +1,166 @@
+"""
+Schema-driven argument synthesis for MCP tool calls.
+
+Arguments are derived from each tool's `input_schema`: only declared
+properties are filled, from the request text, the intent analysis or the
+enum value the request mentions, then canonicalised and validated. Calls
+with a required argument that cannot be filled are reported instead of
+being sent. Identical requests therefore produce identical arguments, which
+keeps the registry result cache effective.
+
+How each property is filled depends only on the schema, so that mapping is
+computed once per tool schema and cached.
+"""
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.mcp.argument_schema import canonicalize_arguments, schema_properties, validate_arguments
+
+# Properties that take the user's request as free text
+TEXT_PROPERTIES = frozenset({
+    "query", "q", "search", "search_query", "text", "prompt", "question", "input", "message", "content", "keywords"
+})
+
+# Properties that take the intent analysis
+INTENT_PROPERTIES = frozenset({"intent", "intent_analysis"})
+
+# Intent fields passed to tools; the rest of the analysis is request-specific noise
+INTENT_FIELDS = ("intent_type", "target_tools", "action_verbs", "entities", "domains")
+
+# Values for properties the request rarely states explicitly (YouTrack ticket queries default to open tickets)
+PROPERTY_FALLBACKS = {"state": "Open"}
+
+# How a property is filled
+TEXT_SOURCE = "text"
+INTENT_SOURCE = "intent"
+ENUM_SOURCE = "enum"
+FALLBACK_SOURCE = "fallback"
+
+# (property name, source) for every declared property
+ArgumentPlan = List[Tuple[str, Optional[str]]]
+
+
+class ToolArgumentSynthesizer:
+    """Builds validated, canonical tool arguments from input schemas."""
+
+    def __init__(self, max_plans: int = 512):
+        self.logger = logging.getLogger("ToolArgumentSynthesizer")
+        self._plans: "OrderedDict[str, ArgumentPlan]" = OrderedDict()
+        self._max_plans = max_plans
+
+        # Statistics
+        self._stats = {"plan_hits": 0, "plan_misses": 0, "invalid": 0}
+
+    def synthesize(
+        self,
+        tool_name: str,
+        input_schema: Optional[Dict[str, Any]],
+        request_text: str = "",
+        intent_analysis: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Synthesize arguments for a tool call.
+
+        Args:
+            tool_name: Tool to call
+            input_schema: The tool's JSON Schema input schema; without one no arguments are sent
+            request_text: The user's request
+            intent_analysis: Intent analysis of the request
+
+        Returns:
+            Dictionary with status, arguments and, when invalid, the validation errors
+        """
+        if not input_schema:
+            return {"status": "success", "arguments": {}}
+
+        properties = schema_properties(input_schema)
+        request_words = set(re.findall(r"\w+", request_text.lower()))
+        arguments = {}
+
+        for name, source in self._get_plan(tool_name, input_schema):
+            value = self._resolve(name, source, properties[name], request_text, request_words, intent_analysis)
+            if value is not None:
+                arguments[name] = value
+
+        arguments = canonicalize_arguments(arguments, input_schema)
+        errors = validate_arguments(arguments, input_schema)
+        if errors:
+            self._stats["invalid"] += 1
+            self.logger.debug(f"Cannot synthesize arguments for {tool_name}: {'; '.join(errors)}")
+            return {"status": "error", "error": "; ".join(errors), "errors": errors, "arguments": arguments}
+
+        return {"status": "success", "arguments": arguments}
+
+    def _get_plan(self, tool_name: str, input_schema: Dict[str, Any]) -> ArgumentPlan:
+        """How each declared property is filled, cached per tool schema."""
+        key = tool_name + ":" + hashlib.blake2b(
+            json.dumps(input_schema, sort_keys=True, default=str).encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            self._stats["plan_hits"] += 1
+            return plan
+
+        self._stats["plan_misses"] += 1
+        plan = [(name, self._source_for(name, spec)) for name, spec in schema_properties(input_schema).items()]
+
+        self._plans[key] = plan
+        if len(self._plans) > self._max_plans:
+            self._plans.popitem(last=False)
+        return plan
+
+    @staticmethod
+    def _source_for(name: str, spec: Dict[str, Any]) -> Optional[str]:
+        """Pick the source of a property's value from its name and schema."""
+        lowered = name.lower()
+        types = spec.get("type")
+        types = [types] if isinstance(types, str) else list(types or [])
+
+        if lowered in INTENT_PROPERTIES and (not types or "object" in types):
+            return INTENT_SOURCE
+        if spec.get("enum"):
+            return ENUM_SOURCE
+        if lowered in PROPERTY_FALLBACKS:
+            return FALLBACK_SOURCE
+        if lowered in TEXT_PROPERTIES and (not types or "string" in types):
+            return TEXT_SOURCE
+        return None
+
+    @staticmethod
+    def _resolve(
+        name: str,
+        source: Optional[str],
+        spec: Dict[str, Any],
+        request_text: str,
+        request_words: set,
+        intent_analysis: Optional[Dict[str, Any]]
+    ) -> Any:
+        if source == TEXT_SOURCE:
+            return request_text.strip() or None
+        if source == INTENT_SOURCE:
+            if not intent_analysis:
+                return None
+            return {field: intent_analysis[field] for field in INTENT_FIELDS if field in intent_analysis}
+        # Fallbacks only stand in for a server-side default the schema does not declare
+        fallback = PROPERTY_FALLBACKS.get(name.lower()) if "default" not in spec else None
+        if source == ENUM_SOURCE:
+            # The enum value the request mentions, e.g. "closed tickets" -> state=Closed
+            for option in spec["enum"]:
+                if str(option).lower() in request_words:
+                    return option
+            if fallback is not None and fallback.lower() in (str(option).lower() for option in spec["enum"]):
+                return fallback
+            return None
+        if source == FALLBACK_SOURCE:
+            return fallback
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get synthesis statistics."""
+        return {"cached_plans": len(self._plans), **self._stats}
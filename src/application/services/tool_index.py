@@ -0,0 +1,127 @@
+"""
+Embedding index over the MCP tool catalog.
+
+Every tool is embedded once from its name, description and input schema
+(parameter names and descriptions) into a sparse hashed vector and stored in
+an inverted index. Selecting tools for a request embeds the request once and
+ranks only the tools that share features with it, instead of scoring every
+tool against fixed keyword buckets. The index follows `MCPToolDiscovery`
+incrementally: when the catalog version changes, only tools that were added,
+changed or removed are re-embedded or dropped.
+"""
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+from src.application.services.text_embedding import HashingTextEmbedder, SparseVectorIndex
+
+_NAME_SEPARATORS = re.compile(r"[_\-.\s]+")
+_CAMEL_CASE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Function words shared by most requests and descriptions; they only add noise to similarity
+STOP_WORDS = frozenset(
+    "a an and are as at be by can do for from has have how i in is it its me my of on or "
+    "our please show that the their this to was what when where which who will with you your".split()
+)
+
+
+def content_words(text: str) -> str:
+    """Lower-cased words of `text` without stop words."""
+    return " ".join(word for word in _WORD.findall(text.lower()) if word not in STOP_WORDS)
+
+
+def split_identifier(identifier: str) -> str:
+    """Split snake_case, kebab-case, dotted and camelCase identifiers into words."""
+    return " ".join(_NAME_SEPARATORS.split(_CAMEL_CASE.sub(" ", identifier))).strip()
+
+
+def tool_text(name: str, description: str, input_schema: Optional[Dict[str, Any]]) -> str:
+    """The text a tool is embedded from; the name is repeated to weigh it above the description."""
+    words = split_identifier(name)
+    parts = [words, words, description or ""]
+    for parameter, spec in ((input_schema or {}).get("properties") or {}).items():
+        parts.append(split_identifier(parameter))
+        if isinstance(spec, dict) and spec.get("description"):
+            parts.append(str(spec["description"]))
+    return content_words("\n".join(parts))
+
+
+class ToolEmbeddingIndex:
+    """Sparse embedding index of MCP tools with incremental refresh."""
+
+    def __init__(self, embedder: Optional[HashingTextEmbedder] = None):
+        # Many dimensions keep vectors sparse, so posting lists stay short
+        self.embedder = embedder or HashingTextEmbedder(dimensions=4096)
+        self.logger = logging.getLogger("ToolEmbeddingIndex")
+        self._index: SparseVectorIndex[str] = SparseVectorIndex()
+        self._signatures: Dict[str, str] = {}
+
+        # Statistics
+        self._embedded = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    @staticmethod
+    def _signature(name: str, description: str, input_schema: Optional[Dict[str, Any]]) -> str:
+        encoded = json.dumps([name, description, input_schema], sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def upsert(self, name: str, description: str, input_schema: Optional[Dict[str, Any]] = None) -> bool:
+        """Index a tool; returns False when it is already indexed unchanged."""
+        signature = self._signature(name, description, input_schema)
+        if self._signatures.get(name) == signature:
+            return False
+        self._index.add(name, self.embedder.embed_sparse(tool_text(name, description, input_schema)))
+        self._signatures[name] = signature
+        self._embedded += 1
+        return True
+
+    def remove(self, name: str):
+        self._index.remove(name)
+        self._signatures.pop(name, None)
+
+    def sync(self, tools: Iterable[Any]) -> Tuple[int, int]:
+        """
+        Bring the index in line with a tool catalog (objects with name, description, input_schema).
+
+        Returns:
+            (tools re-embedded, tools removed)
+        """
+        seen = set()
+        updated = 0
+        for tool in tools:
+            seen.add(tool.name)
+            if self.upsert(tool.name, tool.description, tool.input_schema):
+                updated += 1
+
+        stale = [name for name in self._signatures if name not in seen]
+        for name in stale:
+            self.remove(name)
+
+        if updated or stale:
+            self.logger.debug(f"Tool index refreshed: {updated} embedded, {len(stale)} removed, {len(self)} tools")
+        return updated, len(stale)
+
+    def search(
+        self,
+        text: str,
+        top_k: int = 5,
+        min_score: Optional[float] = None,
+        names: Optional[Collection[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """Tools most similar to `text` as (name, cosine similarity), best first."""
+        query = self.embedder.embed_sparse(content_words(text))
+        return self._index.search(query, top_k=top_k, min_score=min_score, keys=names)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "indexed_tools": len(self),
+            "embedded_total": self._embedded
+        }
@@ -14,7 +14,6 @@ Each reasoning step involves LLM calls for intelligent decision making.
 import logging
 import json
 import time
-import asyncio
 from typing import Dict, List, Any, Optional, AsyncGenerator
 
 from .llm_reasoning_agents import (
@@ -137,8 +136,6 @@ class EnhancedReasoningOrchestrator:
                 yield await self._stream_error(f"Intent analysis failed: {intent_result.get('error')}")
                 return
 
-            await asyncio.sleep(0.2)  # Visual delay for streaming
-
             # Phase 2: LLM-Powered Plan Generation
             yield await self._stream_phase("Plan Generation", "Creating detailed execution plan with LLM...")
 
@@ -170,8 +167,6 @@ class EnhancedReasoningOrchestrator:
                 yield await self._stream_error(f"Plan generation failed: {plan_result.get('error')}")
                 return
 
-            await asyncio.sleep(0.2)
-
             # Phase 3: LLM-Powered Recursive Plan Execution
             yield await self._stream_phase("Plan Execution", "Executing plan with LLM guidance and MCP tools...")
 
@@ -261,8 +256,6 @@ class EnhancedReasoningOrchestrator:
                 yield await self._stream_error(f"Plan execution failed: {execution_result.get('error')}")
                 return
 
-            await asyncio.sleep(0.2)
-
             # Phase 4: LLM-Powered Context Sufficiency Evaluation
             yield await self._stream_phase("Context Evaluation", "Evaluating context sufficiency with LLM...")
 
@@ -290,8 +283,6 @@ class EnhancedReasoningOrchestrator:
                     # Here we could implement recursion back to plan execution
                     # For now, we'll proceed to completion
 
-            await asyncio.sleep(0.2)
-
             # Phase 5: Completion
             context.current_phase = ReasoningPhase.COMPLETION
             yield await self._stream_completion(context)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Compiled keyword matcher for intent analysis.
+
+Keyword tables are compiled once into an Aho–Corasick automaton, so a
+single pass over the text finds every keyword of every table, with cost
+proportional to the text length (plus matches) no matter how many
+keywords the tables hold. Matching is case-insensitive substring matching,
+the same semantics as `keyword in text.lower()`.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
+
+# category -> label -> keywords
+KeywordTables = Mapping[str, Mapping[str, Iterable[str]]]
+
+
+@dataclass
+class KeywordMatches:
+    """Keywords found in a text, grouped by table category and label."""
+    keywords: Set[str] = field(default_factory=set)
+    labels: Dict[str, List[str]] = field(default_factory=dict)
+
+    def has(self, category: str, label: str) -> bool:
+        """Whether any keyword of `label` in `category` occurs in the text."""
+        return label in self.labels.get(category, ())
+
+    def get(self, category: str) -> List[str]:
+        """Labels of a category that matched, in table order."""
+        return self.labels.get(category, [])
+
+
+class KeywordMatcher:
+    """Finds all keywords of a set of labelled keyword tables in one pass."""
+
+    def __init__(self, tables: KeywordTables):
+        # Label order per category, so results follow the table definitions
+        self._label_order: Dict[str, List[str]] = {category: list(labels) for category, labels in tables.items()}
+        self._keyword_labels: Dict[str, Set[Tuple[str, str]]] = {}
+        for category, labels in tables.items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    self._keyword_labels.setdefault(keyword.lower(), set()).add((category, label))
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[FrozenSet[str]] = [frozenset()]
+        self._build(self._keyword_labels)
+
+    def _build(self, keywords: Iterable[str]):
+        outputs: List[Set[str]] = [set()]
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(keyword)
+
+        # Breadth-first failure links; each state also reports its fallbacks' keywords
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._outputs = [frozenset(output) for output in outputs]
+
+    def find_keywords(self, text: str) -> Set[str]:
+        """All keywords occurring in `text` (case-insensitive)."""
+        found: Set[str] = set()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+    def match(self, text: str) -> KeywordMatches:
+        """Find all keywords and report which labels of each category they hit."""
+        keywords = self.find_keywords(text)
+        hits: Set[Tuple[str, str]] = set()
+        for keyword in keywords:
+            hits |= self._keyword_labels[keyword]
+
+        labels = {
+            category: [label for label in order if (category, label) in hits]
+            for category, order in self._label_order.items()
+        }
+        return KeywordMatches(keywords=keywords, labels={category: found for category, found in labels.items() if found})
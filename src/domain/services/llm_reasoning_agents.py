@@ -20,6 +20,7 @@ from enum import Enum
 from src.application.services.mcp_tool_selector import (
     ToolExecutionPlan, ToolSelectionContext, ProcessingPhase
 )
+from src.infrastructure.mcp.deadline import budget_timeout, deadline_expired
 
 try:
     from google.adk.agents import LlmAgent
@@ -475,11 +476,21 @@ Always provide clear reasoning for your decisions."""
 
             steps = plan.get("steps", [])
             execution_results = []
+            budget_exhausted = False
 
             for step in steps:
-                step_result = await self._execute_step_with_llm_guidance(
-                    step, context, mcp_tool_executor, execution_results
-                )
+                # Stop at the request deadline and keep the results gathered so far
+                if deadline_expired():
+                    budget_exhausted = True
+                    break
+                try:
+                    step_result = await asyncio.wait_for(
+                        self._execute_step_with_llm_guidance(step, context, mcp_tool_executor, execution_results),
+                        timeout=budget_timeout()
+                    )
+                except asyncio.TimeoutError:
+                    budget_exhausted = True
+                    break
                 execution_results.append(step_result)
 
                 # Check if we should continue
@@ -491,10 +502,14 @@ Always provide clear reasoning for your decisions."""
                     logger.info("🧠 Plan Execution: LLM determined execution should stop")
                     break
 
+            if budget_exhausted:
+                logger.warning(f"⏱️ Plan Execution: Request deadline reached after {len(execution_results)}/{len(steps)} steps")
+
             return {
                 "status": "success",
                 "execution_results": execution_results,
                 "steps_completed": len(execution_results),
+                "budget_exhausted": budget_exhausted,
                 "llm_powered": True
             }
 
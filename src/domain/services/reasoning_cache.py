@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Per-conversation reasoning memo.
+
+Chat clients resend the whole history on every turn. Conversations are
+identified by a hash of their opening messages, and each turn by a chained
+hash of the message prefix through its last user message, so:
+
+- intent analysis is reused when a turn is resent unchanged (retries,
+  regenerated answers, or the second reasoning pass of a non-streaming
+  request);
+- tool discovery and MCP tool results from earlier turns of the same
+  conversation are reused while still fresh, when the new turn needs the
+  same tools with the same arguments.
+
+Only what the new message changes is recomputed.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class ReasoningCacheConfig:
+    """Settings for the reasoning memo."""
+    enabled: bool = True
+    max_conversations: int = 1000
+    max_turns_per_conversation: int = 32
+    insights_ttl_seconds: float = 60.0  # How long MCP tool results and tool selections stay reusable
+
+
+@dataclass
+class ConversationMemo:
+    """Memoized reasoning for one conversation."""
+    intents: "OrderedDict[str, Dict[str, Any]]" = field(default_factory=OrderedDict)
+    tool_selections: Dict[str, Tuple[float, Dict[str, Any]]] = field(default_factory=dict)
+    insights: Dict[str, Tuple[float, Dict[str, Any]]] = field(default_factory=dict)
+
+
+def _message_digest(previous: bytes, message: Dict[str, Any]) -> bytes:
+    content = message.get("content", "")
+    if not isinstance(content, str):
+        content = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    hasher = hashlib.blake2b(previous, digest_size=16)
+    hasher.update(str(message.get("role", "")).encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update(content.encode("utf-8"))
+    return hasher.digest()
+
+
+def conversation_keys(messages: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Key a request's conversation and its current turn.
+
+    Returns:
+        (conversation_key, turn_key): the hash of the messages through the first
+        user message, and the hash of the messages through the last user message.
+        Both are None when there is no user message.
+    """
+    digest = b""
+    conversation_key = turn_key = None
+    for message in messages:
+        digest = _message_digest(digest, message)
+        if message.get("role") == "user":
+            if conversation_key is None:
+                conversation_key = digest.hex()
+            turn_key = digest.hex()
+    return conversation_key, turn_key
+
+
+def fingerprint(value: Any) -> str:
+    """Stable hash of a JSON-compatible value."""
+    encoded = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ReasoningCache:
+    """Conversation-keyed memo of intent analysis, tool selection and MCP insights."""
+
+    def __init__(self, config: Optional[ReasoningCacheConfig] = None):
+        self.config = config or ReasoningCacheConfig()
+        self.logger = logging.getLogger("ReasoningCache")
+        self._conversations: "OrderedDict[str, ConversationMemo]" = OrderedDict()
+
+        # Statistics
+        self._hits = {"intent": 0, "tool_selection": 0, "insights": 0}
+        self._misses = {"intent": 0, "tool_selection": 0, "insights": 0}
+
+    def _memo(self, conversation_key: Optional[str], create: bool) -> Optional[ConversationMemo]:
+        if not self.config.enabled or conversation_key is None:
+            return None
+        memo = self._conversations.get(conversation_key)
+        if memo is not None:
+            self._conversations.move_to_end(conversation_key)
+        elif create:
+            memo = self._conversations[conversation_key] = ConversationMemo()
+            while len(self._conversations) > self.config.max_conversations:
+                self._conversations.popitem(last=False)
+        return memo
+
+    def _record(self, kind: str, hit: bool):
+        (self._hits if hit else self._misses)[kind] += 1
+
+    # Intent analysis, reused for an identical turn
+
+    def get_intent(self, messages: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        conversation_key, turn_key = conversation_keys(messages)
+        memo = self._memo(conversation_key, create=False)
+        result = memo.intents.get(turn_key) if memo else None
+        if self.config.enabled:
+            self._record("intent", result is not None)
+        return copy.deepcopy(result) if result is not None else None
+
+    def store_intent(self, messages: List[Dict[str, Any]], result: Dict[str, Any]):
+        conversation_key, turn_key = conversation_keys(messages)
+        memo = self._memo(conversation_key, create=True)
+        if memo is None:
+            return
+        memo.intents[turn_key] = copy.deepcopy(result)
+        while len(memo.intents) > self.config.max_turns_per_conversation:
+            memo.intents.popitem(last=False)
+
+    # Fresh results reused across turns of a conversation
+
+    def _get_fresh(self, kind: str, entries_name: str, messages: List[Dict[str, Any]], key: str) -> Optional[Dict[str, Any]]:
+        memo = self._memo(conversation_keys(messages)[0], create=False)
+        entry = getattr(memo, entries_name).get(key) if memo else None
+        if entry is not None and time.monotonic() - entry[0] > self.config.insights_ttl_seconds:
+            del getattr(memo, entries_name)[key]
+            entry = None
+        if self.config.enabled:
+            self._record(kind, entry is not None)
+        return copy.deepcopy(entry[1]) if entry is not None else None
+
+    def _store_fresh(self, entries_name: str, messages: List[Dict[str, Any]], key: str, result: Dict[str, Any]):
+        memo = self._memo(conversation_keys(messages)[0], create=True)
+        if memo is not None:
+            getattr(memo, entries_name)[key] = (time.monotonic(), copy.deepcopy(result))
+
+    def get_tool_selection(self, messages: List[Dict[str, Any]], key: str) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("tool_selection", "tool_selections", messages, key)
+
+    def store_tool_selection(self, messages: List[Dict[str, Any]], key: str, result: Dict[str, Any]):
+        self._store_fresh("tool_selections", messages, key, result)
+
+    def get_insights(self, messages: List[Dict[str, Any]], key: str) -> Optional[Dict[str, Any]]:
+        return self._get_fresh("insights", "insights", messages, key)
+
+    def store_insights(self, messages: List[Dict[str, Any]], key: str, result: Dict[str, Any]):
+        self._store_fresh("insights", messages, key, result)
+
+    def clear(self):
+        self._conversations.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memo statistics."""
+        return {
+            "enabled": self.config.enabled,
+            "conversations": len(self._conversations),
+            "hits": dict(self._hits),
+            "misses": dict(self._misses)
+        }
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Fast path for conversational requests.
+
+Small talk and plain questions carry no tool-worthy intent: intent analysis
+finds no action verbs, no task, repository or file intent and no domain that
+MCP tools serve, so the execution plan would be empty. Such requests skip the reasoning workflow,
+MCP discovery and tool selection entirely and go to the LLM with a static
+system-prompt enhancement. The share of bypassed requests is tracked.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# System-prompt enhancement used for every bypassed request
+CONVERSATIONAL_REASONING_PROMPT = "\n".join([
+    "# Internal Reasoning Context",
+    "This is a conversational message that needs no external tools or data.",
+    "Respond directly and naturally."
+])
+
+# Domains whose requests MCP tools can answer ("What are my open issues?" has no action verb but needs them)
+TOOL_BACKED_DOMAINS = frozenset({
+    "programming", "creation", "project_management", "data_retrieval", "analysis", "version_control"
+})
+
+
+@dataclass
+class ReasoningFastPathConfig:
+    """Settings for the conversational fast path."""
+    enabled: bool = True
+
+
+def is_conversational(intent_analysis: Dict[str, Any]) -> bool:
+    """Whether an intent analysis shows nothing for MCP tools to act on."""
+    return (
+        intent_analysis.get("intent_type") == "conversation"
+        and not intent_analysis.get("target_tools")
+        and not intent_analysis.get("action_verbs")
+        and not TOOL_BACKED_DOMAINS.intersection(intent_analysis.get("domains") or ())
+    )
+
+
+class ReasoningFastPath:
+    """Routes conversational requests around the reasoning workflow and counts them."""
+
+    def __init__(self, config: Optional[ReasoningFastPathConfig] = None):
+        self.config = config or ReasoningFastPathConfig()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._requests = 0
+        self._bypassed = 0
+
+    def should_bypass(self, intent_result: Dict[str, Any]) -> bool:
+        """Whether a request with this intent analysis result can skip reasoning."""
+        return (
+            self.config.enabled
+            and intent_result.get("status") == "success"
+            and is_conversational(intent_result.get("intent_analysis", {}))
+        )
+
+    def record(self, bypassed: bool):
+        """Count one reasoned request (call once per request)."""
+        with self._lock:
+            self._requests += 1
+            if bypassed:
+                self._bypassed += 1
+
+    @property
+    def bypass_ratio(self) -> float:
+        return self._bypassed / self._requests if self._requests else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fast path statistics."""
+        return {
+            "enabled": self.config.enabled,
+            "requests": self._requests,
+            "bypassed": self._bypassed,
+            "bypass_ratio": round(self.bypass_ratio, 4)
+        }
+
+    def render_prometheus(self) -> str:
+        """Render fast path metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP reasoning_requests_total Requests that went through reasoning, by path",
+            "# TYPE reasoning_requests_total counter",
+            f'reasoning_requests_total{{path="fast"}} {self._bypassed}',
+            f'reasoning_requests_total{{path="full"}} {self._requests - self._bypassed}',
+            "# HELP reasoning_bypass_ratio Share of requests that skipped the reasoning workflow",
+            "# TYPE reasoning_bypass_ratio gauge",
+            f"reasoning_bypass_ratio {self.bypass_ratio}"
+        ]
+        return "\n".join(lines) + "\n"
@@ -10,9 +10,10 @@ import json
 import time
 import asyncio
 import importlib
+import inspect
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional, AsyncGenerator
+from typing import Dict, List, Any, Optional, AsyncGenerator, Callable
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext
 from src.application.services.mcp_tool_selector import (
@@ -21,10 +22,69 @@ from src.application.services.mcp_tool_selector import (
 from src.infrastructure.mcp.registry import mcp_registry
 from src.infrastructure.mcp.tool_registry import MCPUnifiedToolRegistry
 from src.infrastructure.mcp.discovery import MCPToolDiscovery
+from src.infrastructure.mcp.capability_snapshot import MCPCapabilitySnapshot
+from src.infrastructure.mcp.deadline import (
+    Deadline, budget_timeout, current_deadline, deadline_expired, deadline_scope, run_within_deadline
+)
 from src.infrastructure.config.config import config
+from src.domain.services.intent_matcher import KeywordMatcher
+from src.domain.services.reasoning_cache import ReasoningCache, ReasoningCacheConfig, fingerprint
+from src.domain.services.reasoning_fast_path import (
+    CONVERSATIONAL_REASONING_PROMPT, ReasoningFastPath, ReasoningFastPathConfig
+)
 
 logger = logging.getLogger(__name__)
 
+# Keyword tables for intent analysis, compiled into one matcher at import
+INTENT_KEYWORDS = {
+    "request": {
+        "request": ["please", "can you", "help", "create", "make", "build", "show", "get", "find", "list"]
+    },
+    # Enhanced domain detection with specific patterns
+    "domain": {
+        "programming": ["code", "programming", "function", "api", "script", "debug", "compile", "repository", "commit", "branch"],
+        "explanation": ["explain", "what", "how", "why", "describe", "tell me", "show me how"],
+        "creation": ["create", "generate", "build", "make", "develop", "implement", "design"],
+        "project_management": ["ticket", "tickets", "task", "tasks", "epic", "epics", "issue", "issues", "project", "assigned", "assign", "milestone", "sprint"],
+        "data_retrieval": ["show", "get", "fetch", "find", "list", "display", "retrieve", "search"],
+        "analysis": ["analyze", "report", "metrics", "statistics", "performance", "status"],
+        "version_control": ["git", "gitlab", "github", "commit", "merge", "branch", "repository", "repo", "pull request", "pr"]
+    },
+    # Intent types, checked in this order; the first hit wins
+    "intent": {
+        "task_management": ["ticket", "tickets", "assigned", "task", "epic"],
+        "version_control": ["repository", "repo", "commit", "branch", "gitlab", "git"],
+        "file_management": ["file", "files", "directory", "folder", "filesystem"]
+    },
+    # Specific YouTrack actions
+    "task_action": {
+        "find_assigned": ["assigned to me", "my tickets", "my tasks"],
+        "create_ticket": ["create"]
+    },
+    # Specific GitLab actions
+    "repository_action": {
+        "analyze_repository": ["analyze", "metrics", "statistics"],
+        "list_repositories": ["list", "show"]
+    },
+    # Action verbs for general understanding
+    "action_verb": {
+        verb: [verb] for verb in ["show", "get", "find", "list", "create", "update", "delete", "search", "analyze"]
+    }
+}
+
+INTENT_TARGET_TOOLS = {
+    "task_management": "youtrack",
+    "version_control": "gitlab",
+    "file_management": "filesystem"
+}
+
+intent_matcher = KeywordMatcher(INTENT_KEYWORDS)
+
+# Tool descriptions that suggest a tool is useful while reasoning
+reasoning_tool_matcher = KeywordMatcher({
+    "reasoning": {"reasoning": ["analyze", "understand", "interpret", "reason", "think", "find", "search", "list", "get"]}
+})
+
 # Workflow callback cache
 _workflow_callback = None
 
@@ -77,6 +137,15 @@ def load_workflow_callback():
         logger.info("⚠️  Falling back to default workflow")
         return None
 
+# Conversation-keyed memo of intent analysis, tool selection and MCP insights
+reasoning_cache = ReasoningCache(ReasoningCacheConfig(
+    enabled=config.REASONING_CACHE_ENABLED,
+    insights_ttl_seconds=config.REASONING_CACHE_TTL_SECONDS
+))
+
+# Conversational requests skip the reasoning workflow
+reasoning_fast_path = ReasoningFastPath(ReasoningFastPathConfig(enabled=config.REASONING_FAST_PATH_ENABLED))
+
 # Global MCP integration components for reasoning
 _reasoning_mcp_discovery = None
 _reasoning_mcp_tool_registry = None
@@ -96,17 +165,25 @@ def analyze_request_intent(request_data: Dict[str, Any]) -> Dict[str, Any]:
         if not user_messages:
             return {"status": "error", "error": "No user messages found"}
 
+        # An unchanged turn (retry, regenerate) reuses its earlier analysis
+        cached_result = reasoning_cache.get_intent(messages)
+        if cached_result is not None:
+            logger.debug("🧠 REASONING: Reusing memoized intent analysis")
+            return cached_result
+
         last_message = user_messages[-1].get("content", "")
-        message_lower = last_message.lower()
+        # One pass over the message finds every keyword of every table
+        matches = intent_matcher.match(last_message)
+        word_count = len(last_message.split())
 
         # Enhanced intent analysis
         intent_analysis = {
             "message_length": len(last_message),
-            "word_count": len(last_message.split()),
+            "word_count": word_count,
             "contains_question": "?" in last_message,
-            "contains_request": any(word in message_lower for word in ["please", "can you", "help", "create", "make", "build", "show", "get", "find", "list"]),
-            "complexity": "simple" if len(last_message.split()) < 10 else "complex",
-            "domains": [],
+            "contains_request": matches.has("request", "request"),
+            "complexity": "simple" if word_count < 10 else "complex",
+            "domains": list(matches.get("domain")),
             "needs_context": len(messages) > 2,
             "intent_type": "unknown",
             "target_tools": [],
@@ -114,52 +191,29 @@ def analyze_request_intent(request_data: Dict[str, Any]) -> Dict[str, Any]:
             "entities": []
         }
 
-        # Enhanced domain detection with specific patterns
-        domain_patterns = {
-            "programming": ["code", "programming", "function", "api", "script", "debug", "compile", "repository", "commit", "branch"],
-            "explanation": ["explain", "what", "how", "why", "describe", "tell me", "show me how"],
-            "creation": ["create", "generate", "build", "make", "develop", "implement", "design"],
-            "project_management": ["ticket", "tickets", "task", "tasks", "epic", "epics", "issue", "issues", "project", "assigned", "assign", "milestone", "sprint"],
-            "data_retrieval": ["show", "get", "fetch", "find", "list", "display", "retrieve", "search"],
-            "analysis": ["analyze", "report", "metrics", "statistics", "performance", "status"],
-            "version_control": ["git", "gitlab", "github", "commit", "merge", "branch", "repository", "repo", "pull request", "pr"]
-        }
-
-        # Detect domains and extract entities
-        for domain, keywords in domain_patterns.items():
-            if any(keyword in message_lower for keyword in keywords):
-                intent_analysis["domains"].append(domain)
-
         # Detect intent types and target tools
-        if any(word in message_lower for word in ["ticket", "tickets", "assigned", "task", "epic"]):
-            intent_analysis["intent_type"] = "task_management"
-            intent_analysis["target_tools"].append("youtrack")
-
-            # Detect specific YouTrack actions
-            if any(phrase in message_lower for phrase in ["assigned to me", "my tickets", "my tasks"]):
-                intent_analysis["action_verbs"].append("find_assigned")
-                intent_analysis["entities"].append("current_user")
-            elif "create" in message_lower:
-                intent_analysis["action_verbs"].append("create_ticket")
-
-        elif any(word in message_lower for word in ["repository", "repo", "commit", "branch", "gitlab", "git"]):
-            intent_analysis["intent_type"] = "version_control"
-            intent_analysis["target_tools"].append("gitlab")
-
-            # Detect specific GitLab actions
-            if any(word in message_lower for word in ["analyze", "metrics", "statistics"]):
-                intent_analysis["action_verbs"].append("analyze_repository")
-            elif "list" in message_lower or "show" in message_lower:
-                intent_analysis["action_verbs"].append("list_repositories")
-
-        elif any(word in message_lower for word in ["file", "files", "directory", "folder", "filesystem"]):
-            intent_analysis["intent_type"] = "file_management"
-            intent_analysis["target_tools"].append("filesystem")
+        intent_types = matches.get("intent")
+        if intent_types:
+            intent_type = intent_types[0]
+            intent_analysis["intent_type"] = intent_type
+            intent_analysis["target_tools"].append(INTENT_TARGET_TOOLS[intent_type])
+
+            if intent_type == "task_management":
+                # Detect specific YouTrack actions
+                if matches.has("task_action", "find_assigned"):
+                    intent_analysis["action_verbs"].append("find_assigned")
+                    intent_analysis["entities"].append("current_user")
+                elif matches.has("task_action", "create_ticket"):
+                    intent_analysis["action_verbs"].append("create_ticket")
+            elif intent_type == "version_control":
+                # Detect specific GitLab actions
+                repository_actions = matches.get("repository_action")
+                if repository_actions:
+                    intent_analysis["action_verbs"].append(repository_actions[0])
 
         # Extract action verbs for general understanding
-        action_verbs = ["show", "get", "find", "list", "create", "update", "delete", "search", "analyze"]
-        for verb in action_verbs:
-            if verb in message_lower and verb not in intent_analysis["action_verbs"]:
+        for verb in matches.get("action_verb"):
+            if verb not in intent_analysis["action_verbs"]:
                 intent_analysis["action_verbs"].append(verb)
 
         # Set default intent type if not detected
@@ -169,13 +223,15 @@ def analyze_request_intent(request_data: Dict[str, Any]) -> Dict[str, Any]:
             else:
                 intent_analysis["intent_type"] = "conversation"
 
-        logger.debug(f"🧠 Enhanced intent analysis: {intent_analysis}")
+        logger.debug("🧠 Enhanced intent analysis: %s", intent_analysis)
 
-        return {
+        result = {
             "status": "success",
             "intent_analysis": intent_analysis,
             "original_message": last_message
         }
+        reasoning_cache.store_intent(messages, result)
+        return result
 
     except Exception as e:
         logger.error(f"❌ Error analyzing request intent: {e}")
@@ -247,10 +303,17 @@ def _initialize_reasoning_mcp_components():
     try:
         if not _reasoning_mcp_discovery:
             _reasoning_mcp_discovery = MCPToolDiscovery(mcp_registry)
+            if config.MCP_CAPABILITY_SNAPSHOT_PATH:
+                _reasoning_mcp_discovery.enable_capability_snapshot(
+                    MCPCapabilitySnapshot(config.MCP_CAPABILITY_SNAPSHOT_PATH)
+                )
             logger.info("MCP Discovery initialized for reasoning")
 
         if not _reasoning_mcp_tool_registry:
             _reasoning_mcp_tool_registry = MCPUnifiedToolRegistry(mcp_registry, _reasoning_mcp_discovery)
+            _reasoning_mcp_tool_registry.configure_circuit_breakers(config.MCP_ENABLE_CIRCUIT_BREAKERS)
+            _reasoning_mcp_tool_registry.configure_concurrency_limits(config.MCP_ENABLE_ADAPTIVE_CONCURRENCY)
+            _reasoning_mcp_tool_registry.enable_hedging(config.MCP_ENABLE_HEDGED_REQUESTS)
             logger.info("MCP Tool Registry initialized for reasoning")
 
         if not _reasoning_mcp_tool_selector:
@@ -267,14 +330,18 @@ async def _ensure_mcp_discovery_populated():
 
     try:
         if _reasoning_mcp_discovery:
-            # Check if we already have tools discovered
+            # Discover servers that connected since the last request; tools
+            # preloaded from the capability snapshot are replaced as they arrive.
+            # A late server is picked up by a later request rather than waited for
+            # past the reasoning deadline.
+            try:
+                results = await asyncio.wait_for(_reasoning_mcp_discovery.discover_new_servers(), timeout=budget_timeout())
+            except asyncio.TimeoutError:
+                logger.warning("⏱️ REASONING: Deadline reached during MCP discovery, using tools discovered so far")
+                results = {}
             all_tools = _reasoning_mcp_discovery.get_all_tools()
-            if not all_tools:
-                logger.info("🔍 REASONING: Running MCP tool discovery to populate tools")
-                await _reasoning_mcp_discovery.discover_all_capabilities()
 
-                # Check results
-                all_tools = _reasoning_mcp_discovery.get_all_tools()
+            if results:
                 logger.info(f"🔍 REASONING: Discovery complete - found {len(all_tools)} tools")
 
                 for tool in all_tools:
@@ -320,6 +387,18 @@ async def discover_reasoning_tools(request_data: Dict[str, Any], intent_analysis
 
         logger.debug(f"🧠 Intent-based targeting: type={intent_type}, tools={target_tools}, actions={action_verbs}")
 
+        # Earlier turns with the same intent over the same tool catalog reuse their selection;
+        # the catalog version changes whenever a server's tools change, even if the count does not
+        messages = request_data.get("messages", [])
+        selection_key = fingerprint({
+            "intent": {key: intent_analysis.get(key) for key in ("intent_type", "target_tools", "action_verbs", "entities", "domains")},
+            "catalog_version": _reasoning_mcp_discovery.catalog_version if _reasoning_mcp_discovery else 0
+        })
+        cached_selection = reasoning_cache.get_tool_selection(messages, selection_key)
+        if cached_selection is not None:
+            logger.debug("🧠 REASONING: Reusing memoized tool selection")
+            return cached_selection
+
         # Create tool selection context for reasoning phase
         context = ToolSelectionContext(
             request_data=request_data,
@@ -355,7 +434,7 @@ async def discover_reasoning_tools(request_data: Dict[str, Any], intent_analysis
                             break
 
                 # Include tools that match general reasoning criteria
-                if any(keyword in tool_description for keyword in ["analyze", "understand", "interpret", "reason", "think", "find", "search", "list", "get"]):
+                if reasoning_tool_matcher.match(tool_description).has("reasoning", "reasoning"):
                     if tool_name not in preferred_tools:
                         reasoning_tools.append(tool_name)
 
@@ -372,7 +451,7 @@ async def discover_reasoning_tools(request_data: Dict[str, Any], intent_analysis
 
             logger.info(f"🧠 Tool selection: {len(preferred_tools)} preferred + {len(reasoning_tools)} general = {len(unique_tools)} total")
 
-            return {
+            discovery_result = {
                 "status": "success",
                 "reasoning_tools": unique_tools,
                 "preferred_tools": preferred_tools,
@@ -385,6 +464,8 @@ async def discover_reasoning_tools(request_data: Dict[str, Any], intent_analysis
                     "action_verbs": action_verbs
                 }
             }
+            reasoning_cache.store_tool_selection(messages, selection_key, discovery_result)
+            return discovery_result
         else:
             logger.warning(f"🧠 Reasoning tool discovery failed: {selection_result.get('error', 'Unknown error')}")
             return selection_result
@@ -556,17 +637,73 @@ async def execute_reasoning_tools(request_data: Dict[str, Any], reasoning_tools:
     Returns:
         Dictionary with reasoning tool execution results
     """
+    execution_summary = {"status": "error", "error": "Reasoning tool execution produced no result", "reasoning_insights": {}, "execution_plan": None}
+    async for event in stream_reasoning_tools(request_data, reasoning_tools, intent_analysis):
+        if event["event"] == "completed":
+            execution_summary = {key: value for key, value in event.items() if key != "event"}
+    return execution_summary
+
+
+def _build_tool_insight(result: Any, execution_plan: Dict[str, Any], intent_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Reasoning insight for one successful tool result, with plan context."""
+    insight_value = {
+        "result": result.result,
+        "tool_name": result.tool_name,
+        "execution_time_ms": result.execution_time_ms,
+        "plan_context": {
+            "intent_type": execution_plan["intent_type"],
+            "expected_output": execution_plan["expected_output"],
+            "reasoning": execution_plan["reasoning"]
+        }
+    }
+
+    # Add specific formatting based on intent type
+    if execution_plan["intent_type"] == "task_management":
+        if "find_assigned" in intent_analysis.get("action_verbs", []):
+            insight_value["formatted_for"] = "ticket_list_display"
+    elif execution_plan["intent_type"] == "version_control":
+        insight_value["formatted_for"] = "repository_analysis"
+
+    return insight_value
+
+
+async def stream_reasoning_tools(
+    request_data: Dict[str, Any],
+    reasoning_tools: List[str],
+    intent_analysis: Dict[str, Any],
+    enough_context: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Execute reasoning tools like execute_reasoning_tools, reporting each tool as it completes.
+
+    Yields a "tool_result" event per executed tool (tool_name, success, error,
+    insight_key and insight for successful results, completed/total counts),
+    then one "completed" event carrying the execute_reasoning_tools result.
+    Remaining tools are skipped once `enough_context(insights so far)` returns
+    True or the request deadline has expired; only complete runs are memoized.
+
+    Args:
+        request_data: The request data
+        reasoning_tools: List of selected reasoning tool names
+        intent_analysis: Intent analysis results
+        enough_context: Optional predicate over the insights gathered so far
+
+    Yields:
+        Tool execution events
+    """
     try:
         logger.debug(f"🧠 REASONING: Executing {len(reasoning_tools)} reasoning tools with intelligent orchestration")
 
         if not reasoning_tools or not _reasoning_mcp_tool_selector:
-            return {
+            yield {
+                "event": "completed",
                 "status": "success",
                 "reasoning_insights": {},
                 "tools_executed": [],
                 "execution_plan": None,
                 "reason": "No reasoning tools to execute"
             }
+            return
 
         # Generate intelligent execution plan
         plan_generation_result = await generate_execution_plan(request_data, intent_analysis, reasoning_tools)
@@ -597,95 +734,115 @@ async def execute_reasoning_tools(request_data: Dict[str, Any], reasoning_tools:
         tools_to_execute = execution_plan["tool_sequence"] if execution_plan["tool_sequence"] else reasoning_tools
 
         if not tools_to_execute:
-            return {
+            yield {
+                "event": "completed",
                 "status": "success",
                 "reasoning_insights": {},
                 "tools_executed": [],
                 "execution_plan": execution_plan,
                 "reason": "No tools selected for execution based on plan"
             }
+            return
+
+        # Identical tool calls made recently in this conversation reuse their results
+        messages = request_data.get("messages", [])
+        insights_key = fingerprint(_reasoning_mcp_tool_selector.prepare_tool_calls(tools_to_execute, context))
+        cached_execution = reasoning_cache.get_insights(messages, insights_key)
+        if cached_execution is not None:
+            logger.info(f"🧠 Reusing memoized results of {len(cached_execution.get('tools_executed', []))} reasoning tools")
+            yield {"event": "completed", **cached_execution}
+            return
 
         # Create MCP execution plan
         mcp_plan_result = await _reasoning_mcp_tool_selector.create_execution_plan(tools_to_execute, context)
 
         if mcp_plan_result.get("status") != "success":
-            return {
+            yield {
+                "event": "completed",
                 "status": "error",
                 "error": f"Failed to create MCP execution plan: {mcp_plan_result.get('error')}",
                 "reasoning_insights": {},
                 "execution_plan": execution_plan
             }
+            return
 
         mcp_execution_plan = mcp_plan_result.get("execution_plan")
         if not mcp_execution_plan:
-            return {
+            yield {
+                "event": "completed",
                 "status": "success",
                 "reasoning_insights": {},
                 "tools_executed": [],
                 "execution_plan": execution_plan,
                 "reason": "No MCP execution plan created"
             }
+            return
 
-        # Execute reasoning tools according to plan
-        execution_result = await _reasoning_mcp_tool_selector.execute_tool_plan(mcp_execution_plan, context)
-
-        if execution_result.get("status") != "success":
-            return {
-                "status": "error",
-                "error": f"Reasoning tool execution failed: {execution_result.get('error')}",
-                "reasoning_insights": {},
-                "execution_plan": execution_plan
-            }
-
-        # Process results to extract reasoning insights with plan context
+        # Execute reasoning tools according to plan, building insights as each tool completes
         reasoning_insights = {}
         tools_executed = []
-        plan_context = {
-            "intent_type": execution_plan["intent_type"],
-            "expected_output": execution_plan["expected_output"],
-            "reasoning": execution_plan["reasoning"]
-        }
+        success_count = 0
+        completed = 0
+        execution_time_ms = 0.0
+        total = len(mcp_execution_plan.execution_order)
+        cut_off = False
 
-        for result in execution_result.get("results", []):
-            if result.success and result.result:
-                tools_executed.append(result.tool_name)
-
-                # Enhanced insight processing with plan context
-                insight_key = f"{result.tool_name}_insight"
-                insight_value = {
-                    "result": result.result,
+        tool_results = _reasoning_mcp_tool_selector.iter_tool_plan(mcp_execution_plan, context)
+        try:
+            async for result in tool_results:
+                completed += 1
+                execution_time_ms += result.execution_time_ms or 0
+                event = {
+                    "event": "tool_result",
                     "tool_name": result.tool_name,
-                    "execution_time_ms": result.execution_time_ms,
-                    "plan_context": plan_context
+                    "success": result.success,
+                    "error": result.error_message,
+                    "completed": completed,
+                    "total": total
                 }
 
-                # Add specific formatting based on intent type
-                if execution_plan["intent_type"] == "task_management":
-                    if "find_assigned" in intent_analysis.get("action_verbs", []):
-                        insight_value["formatted_for"] = "ticket_list_display"
-                elif execution_plan["intent_type"] == "version_control":
-                    insight_value["formatted_for"] = "repository_analysis"
+                if result.success:
+                    success_count += 1
+                if result.success and result.result:
+                    tools_executed.append(result.tool_name)
+                    insight_key = f"{result.tool_name}_insight"
+                    reasoning_insights[insight_key] = _build_tool_insight(result, execution_plan, intent_analysis)
+                    event["insight_key"] = insight_key
+                    event["insight"] = reasoning_insights[insight_key]
 
-                reasoning_insights[insight_key] = insight_value
+                yield event
+
+                if completed < total and (deadline_expired() or (enough_context and enough_context(reasoning_insights))):
+                    logger.info(f"🧠 Stopping reasoning tools early after {completed}/{total} tools")
+                    cut_off = True
+                    break
+        finally:
+            await tool_results.aclose()
 
         logger.info(f"🧠 Intelligent execution completed: {len(tools_executed)} tools, plan type: {execution_plan['intent_type']}")
 
-        return {
+        execution_summary = {
             "status": "success",
             "reasoning_insights": reasoning_insights,
             "tools_executed": tools_executed,
             "execution_plan": execution_plan,
             "execution_stats": {
-                "success_count": execution_result.get("success_count", 0),
-                "total_count": execution_result.get("total_count", 0),
-                "execution_time_ms": execution_result.get("execution_time_ms", 0),
-                "plan_based": True
+                "success_count": success_count,
+                "total_count": completed,
+                "execution_time_ms": execution_time_ms,
+                "plan_based": True,
+                "cut_off": cut_off
             }
         }
+        # Only complete runs are reused; partial failures and early cut-offs are retried next turn
+        if not cut_off and success_count == completed:
+            reasoning_cache.store_insights(messages, insights_key, execution_summary)
+        yield {"event": "completed", **execution_summary}
 
     except Exception as e:
         logger.error(f"❌ Error executing reasoning tools: {e}")
-        return {
+        yield {
+            "event": "completed",
             "status": "error",
             "error": str(e),
             "reasoning_insights": {},
@@ -952,6 +1109,17 @@ async def stream_reasoning_step(step_name: str, step_data: Dict[str, Any], enhan
             enhanced_messages_text = f"\n\n```\nEnhanced Request to LLM:\n{chr(10).join(messages_preview)}\n```\n\n"
 
         content = f"🧠 **Reasoning**: Analysis complete, sending to LLM...{enhanced_messages_text}---\n\n"
+    elif step_data.get("status") == "bypassed":
+        content = "🧠 **Reasoning**: Conversational request, no tools needed - sending to LLM...\n\n---\n\n"
+    elif step_data.get("status") == "tool completed":
+        progress = f"({step_data.get('completed', 0)}/{step_data.get('total', 0)})"
+        if step_data.get("success"):
+            content = f"🧠 **Tool**: {step_data.get('tool_name')} completed {progress}\n"
+        else:
+            content = f"🧠 **Tool**: {step_data.get('tool_name')} failed {progress}: {step_data.get('error')}\n"
+    elif step_data.get("status") == "budget exhausted":
+        budget_ms = step_data.get("budget_ms", 0)
+        content = f"🧠 **Reasoning**: Time budget of {budget_ms:.0f}ms reached, continuing with the insights gathered so far...\n"
     elif step_data.get("status") == "completed":
         if step_name == "intent_analysis":
             complexity = step_data.get("complexity", "unknown")
@@ -1010,29 +1178,97 @@ async def stream_reasoning_step(step_name: str, step_data: Dict[str, Any], enhan
     }
     return f"data: {json.dumps(reasoning_chunk)}\n\n"
 
-async def reasoning_pipeline(request_data: Dict[str, Any], enhanced_request: Dict[str, Any] = None) -> AsyncGenerator[str, None]:
+def new_reasoning_deadline() -> Optional[Deadline]:
+    """Start the reasoning budget of a request (None when reasoning.budget_ms is unlimited)."""
+    return Deadline.from_ms(config.REASONING_BUDGET_MS)
+
+
+async def _run_workflow_within_deadline(workflow: AsyncGenerator[str, None], deadline: Optional[Deadline]) -> AsyncGenerator[str, None]:
+    """
+    Yield workflow chunks until the workflow finishes or the deadline expires.
+
+    Each step runs with the deadline bound, so tool calls inside it are clamped
+    to the time left; a step still running at the deadline is cancelled and a
+    final step reports that reasoning continues with what is ready.
+    """
+    try:
+        while True:
+            try:
+                chunk = await run_within_deadline(workflow.__anext__(), deadline)
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                if deadline is None or not deadline.expired:
+                    raise
+                logger.warning(f"⏱️ REASONING: Budget of {deadline.budget_seconds * 1000:.0f}ms exhausted, cancelling outstanding reasoning work")
+                yield await stream_reasoning_step("reasoning_budget", {
+                    "status": "budget exhausted",
+                    "budget_ms": deadline.budget_seconds * 1000
+                }, None)
+                return
+            yield chunk
+    finally:
+        await workflow.aclose()
+
+
+def _start_workflow(workflow_callback: Callable[..., AsyncGenerator[str, None]], request_data: Dict[str, Any]) -> AsyncGenerator[str, None]:
+    """
+    Call a workflow callback with the pipeline helpers.
+
+    The seven positional helpers are the workflow contract; stream_reasoning_tools
+    is passed as a keyword only to callbacks that declare it, so workflows written
+    against the original signature keep working.
+    """
+    kwargs = {}
+    try:
+        parameters = inspect.signature(workflow_callback).parameters
+    except (TypeError, ValueError):
+        parameters = {}
+    if "stream_reasoning_tools" in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    ):
+        kwargs["stream_reasoning_tools"] = stream_reasoning_tools
+
+    return workflow_callback(
+        request_data,
+        analyze_request_intent,
+        generate_reasoning_context,
+        enhance_messages_with_reasoning,
+        discover_reasoning_tools,
+        execute_reasoning_tools,
+        stream_reasoning_step,
+        **kwargs
+    )
+
+
+async def reasoning_pipeline(
+    request_data: Dict[str, Any],
+    enhanced_request: Dict[str, Any] = None,
+    deadline: Optional[Deadline] = None
+) -> AsyncGenerator[str, None]:
     """
     Execute reasoning pipeline using configured workflow callback.
 
     Workflows are loaded from the path specified in config.REASONING_WORKFLOW.
+    The pipeline stops at `deadline` (by default a new reasoning budget) and
+    the request proceeds with the insights gathered by then.
     """
     try:
         logger.info("🧠 REASONING: Starting reasoning pipeline")
 
+        # Conversational requests go straight to the LLM
+        if reasoning_fast_path.should_bypass(analyze_request_intent(request_data)):
+            yield await stream_reasoning_step("fast_path", {"status": "bypassed"}, None)
+            return
+
+        deadline = deadline or current_deadline() or new_reasoning_deadline()
+
         # Load and use workflow callback
         workflow_callback = load_workflow_callback()
         if workflow_callback:
             logger.info("🔄 Using workflow callback")
             try:
-                async for chunk in workflow_callback(
-                    request_data,
-                    analyze_request_intent,
-                    generate_reasoning_context,
-                    enhance_messages_with_reasoning,
-                    discover_reasoning_tools,
-                    execute_reasoning_tools,
-                    stream_reasoning_step
-                ):
+                async for chunk in _run_workflow_within_deadline(_start_workflow(workflow_callback, request_data), deadline):
                     yield chunk
                 return
             except Exception as e:
@@ -1051,10 +1287,51 @@ async def apply_reasoning_to_request(request_data: Dict[str, Any]) -> Dict[str,
     """
     Apply reasoning enhancements to the request data.
     This is the non-streaming version (consumes workflow chunks without streaming them).
+
+    Runs within the deadline bound by the caller, or a new reasoning budget.
+    Once it expires, MCP tools return only results that are already cached and
+    the request is enhanced with the insights gathered so far.
     """
+    with deadline_scope(current_deadline() or new_reasoning_deadline()) as deadline:
+        return await _apply_reasoning_within_deadline(request_data, deadline)
+
+
+def _apply_fast_path(request_data: Dict[str, Any], intent_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Enhance a conversational request with the static prompt only."""
+    messages = request_data.get("messages", [])
+    enhancement_result = enhance_messages_with_reasoning(messages, CONVERSATIONAL_REASONING_PROMPT)
+    if enhancement_result.get("status") != "success":
+        return {"status": "error", "error": f"Message enhancement failed: {enhancement_result.get('error')}"}
+
+    enhanced_request = request_data.copy()
+    enhanced_request["messages"] = enhancement_result["enhanced_messages"]
+    return {
+        "status": "success",
+        "enhanced_request": enhanced_request,
+        "reasoning_metadata": {
+            "intent_analysis": intent_result["intent_analysis"],
+            "reasoning_context": [],
+            "reasoning_insights": {},
+            "original_message_count": len(messages),
+            "enhanced_message_count": len(enhancement_result["enhanced_messages"]),
+            "mcp_tools_used": 0,
+            "fast_path": True
+        }
+    }
+
+
+async def _apply_reasoning_within_deadline(request_data: Dict[str, Any], deadline: Optional[Deadline]) -> Dict[str, Any]:
     try:
         logger.debug("🧠 REASONING: Applying reasoning to request (non-streaming)")
 
+        # Conversational requests skip the workflow, MCP discovery and tool selection
+        intent_result = analyze_request_intent(request_data)
+        bypass = reasoning_fast_path.should_bypass(intent_result)
+        reasoning_fast_path.record(bypass)
+        if bypass:
+            logger.debug("⚡ REASONING: Conversational request, bypassing the reasoning workflow")
+            return _apply_fast_path(request_data, intent_result)
+
         # Load workflow callback
         workflow_callback = load_workflow_callback()
         if not workflow_callback:
@@ -1063,15 +1340,7 @@ async def apply_reasoning_to_request(request_data: Dict[str, Any]) -> Dict[str,
 
         # Run workflow pipeline (consume all chunks but don't yield)
         try:
-            async for chunk in workflow_callback(
-                request_data,
-                analyze_request_intent,
-                generate_reasoning_context,
-                enhance_messages_with_reasoning,
-                discover_reasoning_tools,
-                execute_reasoning_tools,
-                stream_reasoning_step
-            ):
+            async for chunk in _run_workflow_within_deadline(_start_workflow(workflow_callback, request_data), deadline):
                 pass  # Consume all chunks
 
             # Extract enhanced request from the workflow
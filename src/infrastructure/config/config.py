@@ -83,6 +83,85 @@ class Config:
             yaml_config.get("providers", {}).get("deepseek", {}).get("default_model", "deepseek-chat")
         )
 
+        # Model Routing Configuration
+        routing_config = yaml_config.get("routing") or {}
+        self.MODEL_ROUTES: Dict[str, List[Dict[str, Any]]] = routing_config.get("models") or {}
+        self.ROUTING_FAILURE_COOLDOWN: float = float(os.getenv(
+            "ROUTING_FAILURE_COOLDOWN", str(routing_config.get("failure_cooldown_seconds", 5.0))
+        ))
+        self.ROUTING_MAX_ATTEMPTS: int = int(os.getenv(
+            "ROUTING_MAX_ATTEMPTS", str(routing_config.get("max_attempts", 3))
+        ))
+
+        # Upstream HTTP Connection Pool Configuration
+        http_config = yaml_config.get("http") or {}
+
+        def http_setting(env_name: str, key: str, default: Any) -> str:
+            return os.getenv(env_name, str(http_config.get(key, default)))
+
+        self.HTTP_MAX_CONNECTIONS: int = int(http_setting("HTTP_MAX_CONNECTIONS", "max_connections", 100))
+        self.HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(http_setting(
+            "HTTP_MAX_KEEPALIVE_CONNECTIONS", "max_keepalive_connections", 20
+        ))
+        self.HTTP_KEEPALIVE_EXPIRY: float = float(http_setting("HTTP_KEEPALIVE_EXPIRY", "keepalive_expiry", 30.0))
+        self.HTTP_CONNECT_TIMEOUT: float = float(http_setting("HTTP_CONNECT_TIMEOUT", "connect_timeout", 5.0))
+        self.HTTP_READ_TIMEOUT: float = float(http_setting("HTTP_READ_TIMEOUT", "read_timeout", 60.0))
+        self.HTTP_WRITE_TIMEOUT: float = float(http_setting("HTTP_WRITE_TIMEOUT", "write_timeout", 10.0))
+        self.HTTP_POOL_TIMEOUT: float = float(http_setting("HTTP_POOL_TIMEOUT", "pool_timeout", 5.0))
+        self.HTTP_ENABLE_HTTP2: bool = http_setting("HTTP_ENABLE_HTTP2", "http2", True).lower() == "true"
+        self.HTTP_DNS_CACHE_TTL: float = float(http_setting("HTTP_DNS_CACHE_TTL", "dns_cache_ttl", 300.0))
+        self.HTTP_PREWARM: bool = http_setting("HTTP_PREWARM", "prewarm", True).lower() == "true"
+
+        # Response Cache Configuration (opt-in)
+        cache_config = yaml_config.get("response_cache") or {}
+        self.RESPONSE_CACHE_ENABLED: bool = os.getenv(
+            "RESPONSE_CACHE_ENABLED", str(cache_config.get("enabled", False))
+        ).lower() == "true"
+        self.RESPONSE_CACHE_SEMANTIC: bool = os.getenv(
+            "RESPONSE_CACHE_SEMANTIC", str(cache_config.get("semantic", False))
+        ).lower() == "true"
+        self.RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = float(cache_config.get("similarity_threshold", 0.95))
+        self.RESPONSE_CACHE_TTL_SECONDS: float = float(os.getenv(
+            "RESPONSE_CACHE_TTL_SECONDS", str(cache_config.get("ttl_seconds", 300))
+        ))
+        self.RESPONSE_CACHE_MODEL_TTLS: Dict[str, float] = cache_config.get("model_ttl_seconds") or {}
+        self.RESPONSE_CACHE_MAX_MEMORY_MB: float = float(os.getenv(
+            "RESPONSE_CACHE_MAX_MEMORY_MB", str(cache_config.get("max_memory_mb", 64))
+        ))
+
+        # Request Coalescing Configuration (opt-in)
+        self.REQUEST_COALESCING_ENABLED: bool = os.getenv(
+            "REQUEST_COALESCING_ENABLED", str((yaml_config.get("request_coalescing") or {}).get("enabled", False))
+        ).lower() == "true"
+
+        # Admission Control Configuration (opt-in)
+        admission_config = yaml_config.get("admission") or {}
+        self.ADMISSION_ENABLED: bool = os.getenv(
+            "ADMISSION_ENABLED", str(admission_config.get("enabled", False))
+        ).lower() == "true"
+        self.ADMISSION_REQUESTS_PER_MINUTE: float = float(os.getenv(
+            "ADMISSION_REQUESTS_PER_MINUTE", str(admission_config.get("requests_per_minute", 60))
+        ))
+        self.ADMISSION_TOKENS_PER_MINUTE: float = float(os.getenv(
+            "ADMISSION_TOKENS_PER_MINUTE", str(admission_config.get("tokens_per_minute", 100000))
+        ))
+        self.ADMISSION_MAX_CONCURRENT: int = int(os.getenv(
+            "ADMISSION_MAX_CONCURRENT", str(admission_config.get("max_concurrent_requests", 32))
+        ))
+        self.ADMISSION_MAX_QUEUE_SIZE: int = int(admission_config.get("max_queue_size", 100))
+        self.ADMISSION_MAX_QUEUE_WAIT: float = float(admission_config.get("max_queue_wait_seconds", 30.0))
+
+        # Batch Completions Configuration
+        batch_config = yaml_config.get("batches") or {}
+        self.BATCH_STORAGE_DIR: str = os.getenv("BATCH_STORAGE_DIR", batch_config.get("storage_dir", ".cache/batches"))
+        self.BATCH_MAX_CONCURRENCY: int = int(os.getenv(
+            "BATCH_MAX_CONCURRENCY", str(batch_config.get("max_concurrency", 4))
+        ))
+        self.BATCH_REQUESTS_PER_MINUTE: float = float(os.getenv(
+            "BATCH_REQUESTS_PER_MINUTE", str(batch_config.get("requests_per_minute", 60))
+        ))
+        self.BATCH_PROVIDER_REQUESTS_PER_MINUTE: Dict[str, float] = batch_config.get("provider_requests_per_minute") or {}
+
         # ADK Configuration
         self.GOOGLE_GENAI_USE_VERTEXAI: bool = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "FALSE").upper() == "TRUE"
         self.GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
@@ -99,7 +178,13 @@ class Config:
 
         # Postprocessing Configuration
         self.ENABLE_RESPONSE_ANALYTICS: bool = os.getenv("ENABLE_RESPONSE_ANALYTICS", "true").lower() == "true"
-        self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+        logging_config = yaml_config.get("logging") or {}
+        self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", logging_config.get("level", "INFO"))
+        self.LOG_FORMAT: str = os.getenv("LOG_FORMAT", logging_config.get("format", "text"))
+        self.LOG_ASYNC: bool = os.getenv("LOG_ASYNC", str(logging_config.get("async", True))).lower() == "true"
+        self.LOG_ACCESS_SAMPLE_RATE: float = float(os.getenv(
+            "LOG_ACCESS_SAMPLE_RATE", str(logging_config.get("access_log_sample_rate", 1.0))
+        ))
 
         # MCP Configuration
         self.ENABLE_MCP: bool = os.getenv("ENABLE_MCP", "true").lower() == "true"
@@ -107,10 +192,39 @@ class Config:
         self.MCP_HEALTH_CHECK_INTERVAL: float = float(os.getenv("MCP_HEALTH_CHECK_INTERVAL", "60.0"))
         self.MCP_CONNECTION_TIMEOUT: float = float(os.getenv("MCP_CONNECTION_TIMEOUT", "30.0"))
         self.MCP_MAX_RETRY_ATTEMPTS: int = int(os.getenv("MCP_MAX_RETRY_ATTEMPTS", "3"))
+        self.MCP_ENABLE_CIRCUIT_BREAKERS: bool = os.getenv("MCP_ENABLE_CIRCUIT_BREAKERS", "true").lower() == "true"
+        self.MCP_ENABLE_ADAPTIVE_CONCURRENCY: bool = os.getenv("MCP_ENABLE_ADAPTIVE_CONCURRENCY", "true").lower() == "true"
+        self.MCP_ENABLE_HEDGED_REQUESTS: bool = os.getenv("MCP_ENABLE_HEDGED_REQUESTS", "false").lower() == "true"
+        self.MCP_OUT_OF_BAND_THRESHOLD_BYTES: int = int(os.getenv(
+            "MCP_OUT_OF_BAND_THRESHOLD_BYTES",
+            str(yaml_config.get("mcp", {}).get("out_of_band_threshold_bytes", 0))
+        ))
+        self.MCP_CAPABILITY_SNAPSHOT_PATH: str = os.getenv(
+            "MCP_CAPABILITY_SNAPSHOT_PATH",
+            yaml_config.get("mcp", {}).get("capability_snapshot_path", ".cache/mcp_capabilities.json")
+        )
 
         # Processing Configuration
         self.REASONING_WORKFLOW: str = yaml_config.get("processing", {}).get("reasoning_workflow", "workflows/default")
 
+        # Reasoning Configuration
+        reasoning_config = yaml_config.get("reasoning") or {}
+        self.REASONING_CACHE_ENABLED: bool = os.getenv(
+            "REASONING_CACHE_ENABLED", str(reasoning_config.get("cache_enabled", True))
+        ).lower() == "true"
+        self.REASONING_CACHE_TTL_SECONDS: float = float(os.getenv(
+            "REASONING_CACHE_TTL_SECONDS", str(reasoning_config.get("cache_ttl_seconds", 60.0))
+        ))
+        self.REASONING_FAST_PATH_ENABLED: bool = os.getenv(
+            "REASONING_FAST_PATH_ENABLED", str(reasoning_config.get("fast_path_enabled", True))
+        ).lower() == "true"
+        self.REASONING_BUDGET_MS: float = float(os.getenv(
+            "REASONING_BUDGET_MS", str(reasoning_config.get("budget_ms", 0))
+        ))
+        self.REASONING_STREAM_CADENCE_MS: float = float(os.getenv(
+            "REASONING_STREAM_CADENCE_MS", str(reasoning_config.get("stream_cadence_ms", 0))
+        ))
+
         # Load MCP servers from configuration
         self._load_mcp_servers()
     
@@ -192,6 +306,9 @@ class Config:
                 server_config.retry_attempts = server_data.get("retry_attempts", self.MCP_MAX_RETRY_ATTEMPTS)
                 server_config.retry_delay = server_data.get("retry_delay", 1.0)
                 server_config.health_check_interval = server_data.get("health_check_interval", self.MCP_HEALTH_CHECK_INTERVAL)
+                server_config.out_of_band_threshold = server_data.get(
+                    "out_of_band_threshold_bytes", self.MCP_OUT_OF_BAND_THRESHOLD_BYTES
+                )
 
                 # Validate configuration
                 server_config.validate()
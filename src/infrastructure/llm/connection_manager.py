@@ -0,0 +1,417 @@
+"""
+Shared upstream HTTP connection pool for LLM providers.
+
+All provider adapters (and the legacy OpenAI proxy helpers) send requests
+through one `httpx.AsyncClient` owned by the ProviderConnectionManager:
+
+- Explicit pool limits and separate connect/read/write/pool timeouts.
+- HTTP/2 multiplexing when the `h2` package is installed (HTTP/1.1 otherwise).
+- A TTL cache in front of DNS resolution, so new connections to the same
+  provider host skip the resolver.
+- Pre-warming: connections to the configured providers are opened at startup.
+- Metrics: pool-wait time, new vs reused connections and DNS cache hits, per
+  origin, exported by the `/metrics` endpoint.
+
+Auth headers are sent per request by the adapters, never frozen into the client.
+"""
+import asyncio
+import importlib.util
+import logging
+import socket
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type
+
+import certifi
+import httpcore
+import httpx
+
+
+@dataclass
+class ConnectionPoolConfig:
+    """Settings for the shared provider connection pool."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 5.0
+    read_timeout_seconds: float = 60.0  # Also bounds the gap between streamed chunks
+    write_timeout_seconds: float = 10.0
+    pool_timeout_seconds: float = 5.0  # Wait for a free connection before failing
+    http2: bool = True  # Used only when the h2 package is installed
+    dns_cache_ttl_seconds: float = 300.0  # 0 disables DNS caching
+    prewarm: bool = True
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches resolved addresses for a TTL."""
+
+    def __init__(self, ttl_seconds: float, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        self.ttl_seconds = ttl_seconds
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._cache: Dict[Tuple[str, int], Tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(self, host: str, port: int) -> str:
+        """Resolve a host to an address, using the cache when fresh."""
+        key = (host, port)
+        cached = self._cache.get(key)
+        now = time.monotonic()
+        if cached is not None and cached[1] > now:
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        addresses = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = addresses[0][4][0]
+        self._cache[key] = (address, now + self.ttl_seconds)
+        return address
+
+    def invalidate(self, host: str, port: int):
+        self._cache.pop((host, port), None)
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None
+    ) -> httpcore.AsyncNetworkStream:
+        # TLS still verifies and sends SNI for the original host name
+        address = await self.resolve(host, port)
+        try:
+            return await self._backend.connect_tcp(
+                address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+            )
+        except (httpcore.ConnectError, httpcore.ConnectTimeout):
+            self.invalidate(host, port)
+            raise
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+# httpcore errors and the httpx errors callers handle, most specific first
+_HTTPCORE_ERRORS: List[Tuple[Type[Exception], Type[Exception]]] = [
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError)
+]
+
+
+def _to_httpx_error(error: Exception, request: httpx.Request) -> Exception:
+    for httpcore_error, httpx_error in _HTTPCORE_ERRORS:
+        if isinstance(error, httpcore_error):
+            return httpx_error(str(error), request=request)
+    return error
+
+
+class _PoolResponseStream(httpx.AsyncByteStream):
+    """Response body of a pooled connection, with httpcore errors raised as httpx errors."""
+
+    def __init__(self, stream: AsyncIterator[bytes], request: httpx.Request):
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as e:
+            mapped = _to_httpx_error(e, self._request)
+            if mapped is e:
+                raise
+            raise mapped from e
+
+    async def aclose(self):
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class _ConnectionPoolTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport over an `httpcore.AsyncConnectionPool` built by the manager.
+
+    httpx.AsyncHTTPTransport does not accept a network backend, so the pool is
+    constructed here with the caching DNS backend and wrapped through httpx's
+    public transport interface.
+    """
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions
+        )
+        try:
+            response = await self._pool.handle_async_request(core_request)
+        except Exception as e:
+            mapped = _to_httpx_error(e, request)
+            if mapped is e:
+                raise
+            raise mapped from e
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_PoolResponseStream(response.stream, request),
+            extensions=response.extensions
+        )
+
+    async def aclose(self):
+        await self._pool.aclose()
+
+
+@dataclass
+class OriginMetrics:
+    """Connection statistics for one upstream origin."""
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    pool_wait_ms_total: float = 0.0
+    pool_wait_ms_max: float = 0.0
+    connect_ms_total: float = 0.0
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Records pool-wait time and connection reuse using httpcore trace events.
+
+    A request that starts a TCP connect opened a new connection; one that goes
+    straight to sending headers reused a pooled connection. Pool wait is the
+    time from dispatch until either of those happens.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: Dict[str, OriginMetrics]):
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin = f"{request.url.scheme}://{request.url.host}:{request.url.port or ''}".rstrip(":")
+        metrics = self._metrics.setdefault(origin, OriginMetrics())
+        started = time.perf_counter()
+        state: Dict[str, float] = {}
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            now = time.perf_counter()
+            if event_name == "connection.connect_tcp.started" and "acquired" not in state:
+                state["acquired"] = now
+                state["connecting"] = now
+            elif event_name.endswith("send_request_headers.started") and "sent" not in state:
+                state["sent"] = now
+                state.setdefault("acquired", now)
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            metrics.requests += 1
+            if "acquired" in state:
+                wait_ms = (state["acquired"] - started) * 1000
+                metrics.pool_wait_ms_total += wait_ms
+                metrics.pool_wait_ms_max = max(metrics.pool_wait_ms_max, wait_ms)
+            if "connecting" in state:
+                metrics.new_connections += 1
+                metrics.connect_ms_total += (state.get("sent", time.perf_counter()) - state["connecting"]) * 1000
+            elif "sent" in state:
+                metrics.reused_connections += 1
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class ProviderConnectionManager:
+    """Owns the single pooled HTTP client used for all upstream provider traffic."""
+
+    def __init__(self, config: Optional[ConnectionPoolConfig] = None):
+        self.config = config or ConnectionPoolConfig()
+        self.logger = logging.getLogger("ProviderConnectionManager")
+        self.http2_enabled = self.config.http2 and importlib.util.find_spec("h2") is not None
+        self.dns_backend = (
+            CachingDNSBackend(self.config.dns_cache_ttl_seconds) if self.config.dns_cache_ttl_seconds > 0 else None
+        )
+        self._metrics: Dict[str, OriginMetrics] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+        if self.config.http2 and not self.http2_enabled:
+            self.logger.info("ℹ️ h2 package not installed, upstream connections use HTTP/1.1")
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.config.connect_timeout_seconds,
+            read=self.config.read_timeout_seconds,
+            write=self.config.write_timeout_seconds,
+            pool=self.config.pool_timeout_seconds
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry_seconds
+        )
+
+    def _create_transport(self) -> httpx.AsyncBaseTransport:
+        if self.dns_backend is None:
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(http2=self.http2_enabled, limits=self.limits)
+        else:
+            # The caching resolver sits under a pool we build, since httpx's own transport takes no network backend
+            transport = _ConnectionPoolTransport(httpcore.AsyncConnectionPool(
+                ssl_context=ssl.create_default_context(cafile=certifi.where()),
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry_seconds,
+                http1=True,
+                http2=self.http2_enabled,
+                network_backend=self.dns_backend
+            ))
+        return _InstrumentedTransport(transport, self._metrics)
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """Get the shared pooled client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(transport=self._create_transport(), timeout=self.timeout)
+        return self._client
+
+    async def prewarm(self, base_urls: Iterable[str], timeout_seconds: float = 5.0):
+        """
+        Open connections to provider origins ahead of the first request.
+
+        Each origin gets a HEAD request; the response status does not matter,
+        only that DNS is resolved and the TCP/TLS connection is pooled.
+        """
+        client = await self.get_client()
+        origins = sorted({str(httpx.URL(url).copy_with(path="/", query=None)) for url in base_urls if url})
+
+        async def warm(origin: str):
+            try:
+                await client.head(origin, timeout=timeout_seconds)
+                return True
+            except httpx.HTTPError as e:
+                self.logger.debug(f"Pre-warm of {origin} failed: {e}")
+                return False
+
+        results = await asyncio.gather(*(warm(origin) for origin in origins))
+        self.logger.info(f"🔥 Pre-warmed {sum(results)}/{len(origins)} provider connections")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool configuration and per-origin connection metrics."""
+        return {
+            "http2": self.http2_enabled,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "dns_cache": {
+                "enabled": self.dns_backend is not None,
+                "hits": self.dns_backend.hits if self.dns_backend else 0,
+                "misses": self.dns_backend.misses if self.dns_backend else 0
+            },
+            "origins": {
+                origin: {
+                    "requests": metrics.requests,
+                    "new_connections": metrics.new_connections,
+                    "reused_connections": metrics.reused_connections,
+                    "pool_wait_ms_avg": metrics.pool_wait_ms_total / metrics.requests if metrics.requests else 0.0,
+                    "pool_wait_ms_max": metrics.pool_wait_ms_max,
+                    "connect_ms_avg": (
+                        metrics.connect_ms_total / metrics.new_connections if metrics.new_connections else 0.0
+                    )
+                }
+                for origin, metrics in self._metrics.items()
+            }
+        }
+
+    def render_prometheus(self) -> str:
+        """Render connection metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def metric(name: str, metric_type: str, help_text: str, samples: List[Tuple[str, float]]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{name}{labels} {value}")
+
+        def per_origin(attribute: str) -> List[Tuple[str, float]]:
+            return [
+                (f'{{origin="{origin}"}}', getattr(metrics, attribute))
+                for origin, metrics in sorted(self._metrics.items())
+            ]
+
+        metric("upstream_requests_total", "counter", "Requests sent to the upstream origin", per_origin("requests"))
+        metric("upstream_connections_opened_total", "counter", "New upstream connections", per_origin("new_connections"))
+        metric("upstream_connections_reused_total", "counter", "Requests sent on a pooled connection",
+               per_origin("reused_connections"))
+        metric("upstream_pool_wait_seconds_sum", "counter", "Total time spent waiting for a pooled connection",
+               [(labels, value / 1000) for labels, value in per_origin("pool_wait_ms_total")])
+        metric("upstream_pool_wait_seconds_max", "gauge", "Longest wait for a pooled connection",
+               [(labels, value / 1000) for labels, value in per_origin("pool_wait_ms_max")])
+        metric("upstream_connect_seconds_sum", "counter", "Total time spent opening connections",
+               [(labels, value / 1000) for labels, value in per_origin("connect_ms_total")])
+
+        if self.dns_backend is not None:
+            metric("upstream_dns_cache_hits_total", "counter", "DNS cache hits", [("", self.dns_backend.hits)])
+            metric("upstream_dns_cache_misses_total", "counter", "DNS cache misses", [("", self.dns_backend.misses)])
+
+        return "\n".join(lines) + "\n"
+
+    async def close(self):
+        """Close the shared client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global connection manager, configured from config on first import
+def _create_default_manager() -> ProviderConnectionManager:
+    from src.infrastructure.config.config import config
+    return ProviderConnectionManager(ConnectionPoolConfig(
+        max_connections=config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry_seconds=config.HTTP_KEEPALIVE_EXPIRY,
+        connect_timeout_seconds=config.HTTP_CONNECT_TIMEOUT,
+        read_timeout_seconds=config.HTTP_READ_TIMEOUT,
+        write_timeout_seconds=config.HTTP_WRITE_TIMEOUT,
+        pool_timeout_seconds=config.HTTP_POOL_TIMEOUT,
+        http2=config.HTTP_ENABLE_HTTP2,
+        dns_cache_ttl_seconds=config.HTTP_DNS_CACHE_TTL,
+        prewarm=config.HTTP_PREWARM
+    ))
+
+
+provider_connections = _create_default_manager()
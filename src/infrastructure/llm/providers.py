@@ -0,0 +1,393 @@
+"""
+LLM provider adapters.
+
+Adapters send requests through the shared ProviderConnectionManager pool
+(or a client of their own when created without one) and stream chat
+completions as OpenAI-format SSE bytes, so the proxy can serve every provider
+through the same passthrough path:
+
+- OpenAI and DeepSeek speak the OpenAI protocol and are forwarded as-is.
+- Ollama's native NDJSON stream (`/api/chat`) is translated to OpenAI SSE chunks.
+"""
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+import httpx
+
+from src.infrastructure.llm.connection_manager import ProviderConnectionManager
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderError(Exception):
+    """Upstream provider rejected a request before any response bytes were streamed."""
+
+    def __init__(
+        self,
+        provider: str,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
+        self.retry_after = retry_after  # Seconds from a Retry-After header, if any
+
+    @property
+    def is_retryable(self) -> bool:
+        """Whether another endpoint may succeed (throttling or upstream server error)."""
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
+class ProviderAdapter(ABC):
+    """Base class for provider adapters; subclasses implement both completion methods."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        api_key: str = "",
+        default_model: str = "",
+        connection_manager: Optional[ProviderConnectionManager] = None
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.default_model = default_model
+        self.connection_manager = connection_manager
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _headers(self) -> Dict[str, str]:
+        """Per-request headers (sent with every request so key changes take effect)."""
+        return {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client: the shared pool if configured, otherwise one owned by this adapter."""
+        if self._client is not None:
+            return self._client
+        if self.connection_manager is not None:
+            return await self.connection_manager.get_client()
+
+        self._client = httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0))
+        return self._client
+
+    async def close(self):
+        """Close the adapter's own client (the shared pool is closed by its manager)."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _raise_for_status(self, response: httpx.Response):
+        """Raise ProviderError for a non-200 upstream response."""
+        if response.status_code == 200:
+            return
+
+        await response.aread()
+        retry_after = None
+        try:
+            retry_after = float(response.headers.get("retry-after", ""))
+        except ValueError:
+            pass
+
+        raise ProviderError(
+            self.name,
+            f"{self.name} API error: {response.status_code}",
+            status_code=response.status_code,
+            retry_after=retry_after
+        )
+
+    @abstractmethod
+    def stream_chat_completion(self, request_data: Dict[str, Any]) -> AsyncGenerator[bytes, None]:
+        """
+        Stream a chat completion as OpenAI-format SSE bytes.
+
+        Raises ProviderError before yielding anything if the upstream rejects the request.
+        """
+
+    @abstractmethod
+    async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a non-streaming chat completion and return an OpenAI chat.completion object.
+
+        Raises ProviderError if the upstream rejects the request.
+        """
+
+
+class OpenAICompatibleAdapter(ProviderAdapter):
+    """Adapter for providers exposing the OpenAI `/chat/completions` endpoint (OpenAI, DeepSeek)."""
+
+    async def stream_chat_completion(self, request_data: Dict[str, Any]) -> AsyncGenerator[bytes, None]:
+        payload = dict(request_data)
+        payload["stream"] = True
+        if not payload.get("model"):
+            payload["model"] = self.default_model
+
+        client = await self.get_client()
+        async with client.stream(
+            "POST", self._url("/chat/completions"), json=payload, headers=self._headers()
+        ) as response:
+            await self._raise_for_status(response)
+
+            async for chunk in response.aiter_bytes():
+                yield chunk
+
+    async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        payload = dict(request_data)
+        payload["stream"] = False
+        if not payload.get("model"):
+            payload["model"] = self.default_model
+
+        client = await self.get_client()
+        response = await client.post(self._url("/chat/completions"), json=payload, headers=self._headers())
+        await self._raise_for_status(response)
+        return response.json()
+
+
+class OllamaAdapter(ProviderAdapter):
+    """Adapter for Ollama's native `/api/chat` NDJSON streaming API."""
+
+    # OpenAI sampling parameters and their Ollama option names
+    _OPTION_NAMES = {
+        "temperature": "temperature",
+        "top_p": "top_p",
+        "max_tokens": "num_predict",
+        "stop": "stop",
+        "seed": "seed",
+        "presence_penalty": "presence_penalty",
+        "frequency_penalty": "frequency_penalty"
+    }
+
+    def build_request(self, request_data: Dict[str, Any], stream: bool = True) -> Dict[str, Any]:
+        """Translate an OpenAI chat completion request to an Ollama chat request."""
+        options = {
+            ollama_name: request_data[openai_name]
+            for openai_name, ollama_name in self._OPTION_NAMES.items()
+            if request_data.get(openai_name) is not None
+        }
+
+        ollama_request = {
+            "model": request_data.get("model") or self.default_model,
+            "messages": [
+                {"role": message.get("role", "user"), "content": _message_text(message.get("content"))}
+                for message in request_data.get("messages", [])
+            ],
+            "stream": stream
+        }
+        if options:
+            ollama_request["options"] = options
+        return ollama_request
+
+    async def stream_chat_completion(self, request_data: Dict[str, Any]) -> AsyncGenerator[bytes, None]:
+        ollama_request = self.build_request(request_data)
+        translator = OllamaStreamTranslator(ollama_request["model"])
+
+        client = await self.get_client()
+        async with client.stream(
+            "POST", self._url("/api/chat"), json=ollama_request, headers=self._headers()
+        ) as response:
+            await self._raise_for_status(response)
+
+            async for line in response.aiter_lines():
+                for event in translator.translate_line(line):
+                    yield event
+
+        for event in translator.finish():
+            yield event
+
+    async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        ollama_request = self.build_request(request_data, stream=False)
+
+        client = await self.get_client()
+        response = await client.post(self._url("/api/chat"), json=ollama_request, headers=self._headers())
+        await self._raise_for_status(response)
+
+        result = response.json()
+        if "error" in result:
+            raise ProviderError(self.name, f"{self.name} error: {result['error']}")
+
+        completion = {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": ollama_request["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": (result.get("message") or {}).get("content", "")},
+                "finish_reason": _finish_reason(result.get("done_reason"))
+            }]
+        }
+        usage = _usage(result)
+        if usage:
+            completion["usage"] = usage
+        return completion
+
+
+class OllamaStreamTranslator:
+    """Translates Ollama NDJSON chat messages into OpenAI chat.completion.chunk SSE events."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        self.created = int(time.time())
+        self._sent_role = False
+        self._finished = False
+
+    def translate_line(self, line: str) -> List[bytes]:
+        """Translate one NDJSON line into zero or more SSE events."""
+        line = line.strip()
+        if not line or self._finished:
+            return []
+
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed Ollama stream line: {line[:100]}")
+            return []
+
+        if "error" in message:
+            self._finished = True
+            error_event = {"error": {"message": str(message["error"]), "type": "ollama_error"}}
+            return [_sse(error_event), b"data: [DONE]\n\n"]
+
+        events = []
+        content = (message.get("message") or {}).get("content", "")
+        if content or not self._sent_role:
+            delta = {"content": content}
+            if not self._sent_role:
+                delta["role"] = "assistant"
+                self._sent_role = True
+            events.append(_sse(self._chunk(delta)))
+
+        if message.get("done"):
+            final_chunk = self._chunk({}, finish_reason=_finish_reason(message.get("done_reason")))
+            usage = _usage(message)
+            if usage:
+                final_chunk["usage"] = usage
+            events.append(_sse(final_chunk))
+            events.append(b"data: [DONE]\n\n")
+            self._finished = True
+
+        return events
+
+    def finish(self) -> List[bytes]:
+        """Terminate the stream if Ollama closed it without a done message."""
+        if self._finished:
+            return []
+        self._finished = True
+        return [_sse(self._chunk({}, finish_reason="stop")), b"data: [DONE]\n\n"]
+
+    def _chunk(self, delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "id": self.completion_id,
+            "object": "chat.completion.chunk",
+            "created": self.created,
+            "model": self.model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+        }
+
+
+def _sse(payload: Dict[str, Any]) -> bytes:
+    return f"data: {json.dumps(payload, separators=(',', ':'))}\n\n".encode("utf-8")
+
+
+def _finish_reason(done_reason: Optional[str]) -> str:
+    return "length" if done_reason == "length" else "stop"
+
+
+def _usage(message: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """OpenAI usage block from Ollama's token counts."""
+    if "eval_count" not in message and "prompt_eval_count" not in message:
+        return None
+    prompt_tokens = message.get("prompt_eval_count", 0)
+    completion_tokens = message.get("eval_count", 0)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens
+    }
+
+
+def _message_text(content: Any) -> str:
+    """Flatten OpenAI message content (string or list of parts) to text."""
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+def create_provider_adapter(
+    provider: str,
+    base_url: str,
+    api_key: str = "",
+    default_model: str = "",
+    name: Optional[str] = None,
+    connection_manager: Optional[ProviderConnectionManager] = None
+) -> ProviderAdapter:
+    """
+    Create an adapter for a provider type.
+
+    Args:
+        provider: Provider type ("openai", "deepseek", "ollama"; any other
+            OpenAI-compatible gateway can use "openai")
+        base_url: Endpoint base URL
+        api_key: API key sent as a Bearer token
+        default_model: Model used when the request does not name one
+        name: Adapter name used in logs and errors (defaults to the provider type)
+        connection_manager: Shared connection pool (the adapter owns a client if None)
+    """
+    provider = provider.lower()
+    if provider not in ("openai", "deepseek", "ollama"):
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    adapter_class = OllamaAdapter if provider == "ollama" else OpenAICompatibleAdapter
+    return adapter_class(name or provider, base_url, api_key, default_model, connection_manager)
+
+
+class ProviderRegistry:
+    """Creates provider adapters from configuration, one per provider."""
+
+    def __init__(self, app_config, connection_manager: Optional[ProviderConnectionManager] = None):
+        self.config = app_config
+        self.connection_manager = connection_manager
+        self._adapters: Dict[str, ProviderAdapter] = {}
+
+    def _create_adapter(self, name: str) -> Optional[ProviderAdapter]:
+        if name == "openai":
+            return create_provider_adapter(
+                "openai", self.config.OPENAI_BASE_URL, self.config.OPENAI_API_KEY, self.config.OPENAI_DEFAULT_MODEL,
+                connection_manager=self.connection_manager
+            )
+        if name == "deepseek":
+            return create_provider_adapter(
+                "deepseek", self.config.DEEPSEEK_BASE_URL, self.config.DEEPSEEK_API_KEY, self.config.DEEPSEEK_DEFAULT_MODEL,
+                connection_manager=self.connection_manager
+            )
+        if name == "ollama":
+            return create_provider_adapter(
+                "ollama", self.config.OLLAMA_BASE_URL, default_model=self.config.OLLAMA_DEFAULT_MODEL,
+                connection_manager=self.connection_manager
+            )
+        return None
+
+    def get(self, name: str) -> Optional[ProviderAdapter]:
+        """Get the adapter for a provider, or None if the provider is not supported."""
+        name = name.lower()
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            adapter = self._create_adapter(name)
+            if adapter is not None:
+                self._adapters[name] = adapter
+        return adapter
+
+    async def close_all(self):
+        """Close the adapters' own clients."""
+        for adapter in self._adapters.values():
+            await adapter.close()
+        self._adapters.clear()
@@ -0,0 +1,228 @@
+"""
+Per-request model routing across provider endpoints.
+
+The routing table maps the request's `model` field to one or more weighted
+endpoints (OpenAI-compatible gateways, DeepSeek, Ollama hosts). Each request
+goes to the endpoint with the fewest in-flight requests relative to its
+weight; if that endpoint answers 429/5xx or cannot be reached before any
+bytes have been streamed, the request fails over to the next endpoint.
+Models without a route go to the configured default provider.
+"""
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+import httpx
+
+from src.infrastructure.llm.providers import ProviderAdapter, ProviderError, ProviderRegistry, create_provider_adapter
+
+
+@dataclass
+class RouteEndpoint:
+    """A provider endpoint serving a routed model."""
+    adapter: ProviderAdapter
+    weight: float = 1.0
+    model: Optional[str] = None  # Upstream model name, if different from the requested one
+    in_flight: int = 0
+    cooldown_until: float = 0.0
+    total_requests: int = 0
+    failed_requests: int = 0
+
+    @property
+    def name(self) -> str:
+        return self.adapter.name
+
+    def is_cooling_down(self, now: float) -> bool:
+        return now < self.cooldown_until
+
+    def load_score(self) -> float:
+        """In-flight requests relative to weight, counting the request being placed."""
+        return (self.in_flight + 1) / max(self.weight, 0.001)
+
+
+@dataclass
+class RouterConfig:
+    """Settings for model routing."""
+    failure_cooldown_seconds: float = 5.0  # Deprioritize an endpoint after a 429/5xx
+    max_attempts: int = 3  # Endpoints tried per request
+    routes: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+
+class ModelRouter:
+    """Routes chat completions to provider endpoints by requested model."""
+
+    def __init__(self, provider_registry: ProviderRegistry, default_provider: str, config: Optional[RouterConfig] = None):
+        self.provider_registry = provider_registry
+        self.default_provider = default_provider
+        self.config = config or RouterConfig()
+        self.logger = logging.getLogger("ModelRouter")
+
+        self._default_endpoints: Optional[List[RouteEndpoint]] = None
+        self._routes: Dict[str, List[RouteEndpoint]] = {}
+        for model, endpoints in self.config.routes.items():
+            self._routes[model] = [self._create_endpoint(model, index, data) for index, data in enumerate(endpoints)]
+
+    def _create_endpoint(self, model: str, index: int, data: Dict[str, Any]) -> RouteEndpoint:
+        provider = data.get("provider", "openai")
+        adapter = create_provider_adapter(
+            provider,
+            data["base_url"],
+            api_key=data.get("api_key") or os.getenv(data.get("api_key_env", ""), ""),
+            default_model=data.get("model", model),
+            name=data.get("name", f"{model}/{provider}-{index}"),
+            connection_manager=self.provider_registry.connection_manager
+        )
+        return RouteEndpoint(adapter=adapter, weight=float(data.get("weight", 1.0)), model=data.get("model"))
+
+    @property
+    def routed_models(self) -> List[str]:
+        """Models with an explicit route."""
+        return list(self._routes.keys())
+
+    def get_endpoints(self, model: Optional[str]) -> List[RouteEndpoint]:
+        """Get the endpoints serving a model, falling back to the default provider."""
+        if model and model in self._routes:
+            return self._routes[model]
+
+        if self._default_endpoints is None:
+            adapter = self.provider_registry.get(self.default_provider)
+            self._default_endpoints = [RouteEndpoint(adapter=adapter)] if adapter else []
+        return self._default_endpoints
+
+    def get_base_urls(self) -> List[str]:
+        """Base URLs of the default provider and every routed endpoint."""
+        endpoints = self.get_endpoints(None) + [endpoint for route in self._routes.values() for endpoint in route]
+        return [endpoint.adapter.base_url for endpoint in endpoints]
+
+    def has_route(self, model: Optional[str]) -> bool:
+        """Whether a request for this model can be served."""
+        return bool(self.get_endpoints(model))
+
+    def select_endpoints(self, model: Optional[str]) -> List[RouteEndpoint]:
+        """
+        Order a model's endpoints for one request.
+
+        Endpoints outside their failure cooldown come first, least loaded
+        relative to weight first; ties are broken randomly.
+        """
+        now = time.monotonic()
+        endpoints = list(self.get_endpoints(model))
+        random.shuffle(endpoints)
+        endpoints.sort(key=lambda endpoint: (endpoint.is_cooling_down(now), endpoint.load_score()))
+        return endpoints[:self.config.max_attempts]
+
+    async def chat_completion(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a non-streaming chat completion, failing over on retryable errors.
+
+        Raises:
+            ProviderError: If no endpoint is configured or every attempt failed
+        """
+        endpoints = self._endpoints_for_request(request_data)
+        last_error: Optional[ProviderError] = None
+
+        for endpoint in endpoints:
+            endpoint.in_flight += 1
+            endpoint.total_requests += 1
+            try:
+                return await endpoint.adapter.chat_completion(self._payload_for(endpoint, request_data))
+            except (ProviderError, httpx.TransportError) as e:
+                last_error = self._handle_attempt_error(endpoint, e)
+            finally:
+                endpoint.in_flight -= 1
+
+        raise last_error
+
+    async def stream_chat_completion(self, request_data: Dict[str, Any]) -> AsyncGenerator[bytes, None]:
+        """
+        Stream a chat completion from the best available endpoint.
+
+        Fails over to the next endpoint on retryable errors raised before the
+        first chunk; once bytes have been yielded the stream is committed.
+
+        Raises:
+            ProviderError: If no endpoint is configured or every attempt failed
+        """
+        endpoints = self._endpoints_for_request(request_data)
+        last_error: Optional[ProviderError] = None
+
+        for endpoint in endpoints:
+            endpoint.in_flight += 1
+            endpoint.total_requests += 1
+            stream = endpoint.adapter.stream_chat_completion(self._payload_for(endpoint, request_data))
+            try:
+                try:
+                    first_chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    return
+                except (ProviderError, httpx.TransportError) as e:
+                    last_error = self._handle_attempt_error(endpoint, e)
+                    continue
+
+                yield first_chunk
+                async for chunk in stream:
+                    yield chunk
+                return
+            finally:
+                endpoint.in_flight -= 1
+                await stream.aclose()
+
+        raise last_error
+
+    def _endpoints_for_request(self, request_data: Dict[str, Any]) -> List[RouteEndpoint]:
+        model = request_data.get("model")
+        endpoints = self.select_endpoints(model)
+        if not endpoints:
+            raise ProviderError(self.default_provider, f"No provider endpoint for model: {model}")
+        return endpoints
+
+    def _payload_for(self, endpoint: RouteEndpoint, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        payload = dict(request_data)
+        if endpoint.model:
+            payload["model"] = endpoint.model
+        return payload
+
+    def _handle_attempt_error(self, endpoint: RouteEndpoint, e: Exception) -> ProviderError:
+        """Record a failed attempt; re-raise errors that another endpoint would not fix."""
+        error = e if isinstance(e, ProviderError) else ProviderError(endpoint.name, f"{endpoint.name} unreachable: {e}")
+        if not error.is_retryable:
+            raise error
+        self._record_failure(endpoint, error)
+        return error
+
+    def _record_failure(self, endpoint: RouteEndpoint, error: ProviderError):
+        endpoint.failed_requests += 1
+        cooldown = error.retry_after if error.retry_after is not None else self.config.failure_cooldown_seconds
+        endpoint.cooldown_until = time.monotonic() + cooldown
+        self.logger.warning(f"⚠️ Endpoint {endpoint.name} failed ({error}), failing over")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-endpoint routing statistics."""
+        now = time.monotonic()
+        routes = dict(self._routes)
+        if self._default_endpoints:
+            routes["default"] = self._default_endpoints
+
+        return {
+            model: [
+                {
+                    "endpoint": endpoint.name,
+                    "weight": endpoint.weight,
+                    "in_flight": endpoint.in_flight,
+                    "total_requests": endpoint.total_requests,
+                    "failed_requests": endpoint.failed_requests,
+                    "cooling_down": endpoint.is_cooling_down(now)
+                }
+                for endpoint in endpoints
+            ]
+            for model, endpoints in routes.items()
+        }
+
+    async def close(self):
+        """Close clients owned by routed endpoints (the default provider adapter belongs to the registry)."""
+        for endpoints in self._routes.values():
+            for endpoint in endpoints:
+                await endpoint.adapter.close()
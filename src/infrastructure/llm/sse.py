@@ -0,0 +1,124 @@
+"""
+Server-Sent Events passthrough for upstream LLM streams.
+
+Upstream SSE events are forwarded to the client byte-for-byte; the only work
+done per event is locating the `data:` payload and pulling out the delta text
+so the full response can be post-processed once the stream ends.
+"""
+import json
+import re
+from typing import Iterator, List, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator
+    orjson = None
+
+# An event ends at the first blank line (LF or CRLF line endings)
+_EVENT_END = re.compile(rb"\r?\n\r?\n")
+
+_DONE = b"[DONE]"
+_CONTENT_KEY = '"content"'
+_scan_json_string = json.decoder.scanstring
+
+
+class SSEEvent(NamedTuple):
+    """A complete SSE event as received from upstream."""
+    raw: bytes  # Event bytes including the terminating blank line
+    data: Optional[bytes]  # Joined `data:` payload, or None for comments/other fields
+
+    @property
+    def is_done(self) -> bool:
+        """Whether this is the OpenAI end-of-stream sentinel."""
+        return self.data is not None and self.data.strip() == _DONE
+
+
+class SSEPassthroughParser:
+    """
+    Incremental SSE splitter.
+
+    Feed it raw byte chunks from `response.aiter_bytes()`; it yields complete
+    events without decoding or re-encoding them.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> Iterator[SSEEvent]:
+        """Add a chunk and yield every event it completes."""
+        self._buffer += chunk
+        start = 0
+
+        while True:
+            match = _EVENT_END.search(self._buffer, start)
+            if match is None:
+                break
+            raw = bytes(self._buffer[start:match.end()])
+            start = match.end()
+            yield SSEEvent(raw=raw, data=_event_data(raw))
+
+        if start:
+            del self._buffer[:start]
+
+    def flush(self) -> Optional[SSEEvent]:
+        """Return a trailing event that was not terminated by a blank line."""
+        if not self._buffer.strip():
+            self._buffer.clear()
+            return None
+
+        raw = bytes(self._buffer) + b"\n\n"
+        self._buffer.clear()
+        return SSEEvent(raw=raw, data=_event_data(raw))
+
+
+def _event_data(raw: bytes) -> Optional[bytes]:
+    """Extract the `data:` payload of an event."""
+    data_lines: List[bytes] = []
+    for line in raw.splitlines():
+        if line.startswith(b"data:"):
+            value = line[5:]
+            data_lines.append(value[1:] if value.startswith(b" ") else value)
+
+    if not data_lines:
+        return None
+    return data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+
+
+def extract_delta_content(data: bytes) -> Optional[str]:
+    """
+    Extract `choices[0].delta.content` from an OpenAI chat completion chunk.
+
+    Uses orjson when installed; otherwise scans for the `"content"` key after
+    `"delta"` and decodes just that JSON string instead of parsing the chunk.
+    """
+    if orjson is not None:
+        try:
+            choices = orjson.loads(data).get("choices")
+            if choices:
+                return (choices[0].get("delta") or {}).get("content")
+        except (orjson.JSONDecodeError, AttributeError, TypeError):
+            pass
+        return None
+
+    text = data.decode("utf-8", "replace")
+    delta_index = text.find('"delta"')
+    if delta_index < 0:
+        return None
+
+    key_index = text.find(_CONTENT_KEY, delta_index)
+    if key_index < 0:
+        return None
+
+    index = key_index + len(_CONTENT_KEY)
+    length = len(text)
+    while index < length and text[index] in " \t\r\n:":
+        index += 1
+
+    if index >= length or text[index] != '"':
+        return None  # null or missing content
+
+    try:
+        content, _ = _scan_json_string(text, index + 1)
+    except ValueError:
+        return None
+    return content
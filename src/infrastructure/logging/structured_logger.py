@@ -0,0 +1,211 @@
+"""
+Structured, low-overhead logging.
+
+Log records are handed to a bounded in-memory queue by a `QueueHandler`
+(with only the message rendered) and formatted and written by a background
+`QueueListener` thread, so request handlers never block on terminal or file
+I/O. Records carry the current request context (request id, method, path)
+from a context variable, can be rendered as JSON lines, and per-request
+access logs are sampled.
+"""
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Fields describing the request being handled by the current task
+_request_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("request_context", default={})
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "context"}
+
+
+@dataclass
+class LoggingConfig:
+    """Settings for application logging."""
+    level: str = "INFO"
+    format: str = "text"  # "text" or "json" (one JSON object per line)
+    async_output: bool = True  # Format and write records on a background thread
+    queue_size: int = 10000  # Records beyond this are dropped rather than blocking
+    access_log_sample_rate: float = 1.0  # Fraction of successful requests given an access log line
+
+
+def bind_request_context(**fields: Any) -> contextvars.Token:
+    """Attach fields to every record logged by the current task; reset with the returned token."""
+    return _request_context.set({**_request_context.get(), **fields})
+
+
+def reset_request_context(token: contextvars.Token):
+    _request_context.reset(token)
+
+
+def get_request_context() -> Dict[str, Any]:
+    return _request_context.get()
+
+
+class RequestContextFilter(logging.Filter):
+    """Copies the current request context onto each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = _request_context.get()
+        return True
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES}
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update(getattr(record, "context", None) or {})
+        entry.update(_extra_fields(record))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """The classic text format, followed by the request id and any structured fields."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        request_id = (getattr(record, "context", None) or {}).get("request_id")
+        if request_id:
+            line += f" [request_id={request_id}]"
+        fields = _extra_fields(record)
+        if fields:
+            line += " " + json.dumps(fields, ensure_ascii=False, default=str, separators=(",", ":"))
+        return line
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records with their message rendered and drops records when the queue is full.
+
+    Like the standard QueueHandler, `msg % args` is rendered in the calling
+    thread, since the arguments of any library's log call may be mutated once
+    it returns; only records that passed the level check pay for it. JSON and
+    text formatting and the write itself stay on the listener thread.
+    """
+
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers of the logger still see the original record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            # Tracebacks reference frames that may change; render them now
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class AccessLogSampler:
+    """Decides which requests get an access log line; failures are always logged."""
+
+    def __init__(self, sample_rate: float = 1.0):
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self._credit = 0.0
+        self._lock = threading.Lock()
+
+    def should_log(self, status_code: int = 200) -> bool:
+        if status_code >= 400 or self.sample_rate >= 1.0:
+            return True
+        # Spread sampled requests evenly: log whenever accumulated credit reaches one
+        with self._lock:
+            self._credit += self.sample_rate
+            if self._credit >= 1.0:
+                self._credit -= 1.0
+                return True
+        return False
+
+
+class StructuredLogging:
+    """Installs the logging pipeline on the root logger."""
+
+    def __init__(self, config: Optional[LoggingConfig] = None):
+        self.config = config or LoggingConfig()
+        self.sampler = AccessLogSampler(self.config.access_log_sample_rate)
+        self.queue_handler: Optional[NonBlockingQueueHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+
+    def configure(self, stream=None):
+        """Replace the root logger's handlers with the structured pipeline."""
+        formatter = JSONFormatter() if self.config.format == "json" else TextFormatter()
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(formatter)
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.setLevel(getattr(logging, self.config.level.upper(), logging.INFO))
+
+        if self.config.async_output:
+            self.queue_handler = NonBlockingQueueHandler(queue.Queue(self.config.queue_size))
+            self.queue_handler.addFilter(RequestContextFilter())
+            self._listener = logging.handlers.QueueListener(self.queue_handler.queue, output)
+            self._listener.start()
+            root.addHandler(self.queue_handler)
+        else:
+            output.addFilter(RequestContextFilter())
+            root.addHandler(output)
+
+    def stop(self):
+        """Flush queued records and stop the background writer."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def log_access(
+        self,
+        logger: logging.Logger,
+        method: str,
+        path: str,
+        status_code: int,
+        started: float
+    ):
+        """Log one sampled access line for a finished request."""
+        if not self.sampler.should_log(status_code):
+            return
+        level = logging.WARNING if status_code >= 500 else logging.INFO
+        if logger.isEnabledFor(level):
+            logger.log(
+                level, "%s %s %s", method, path, status_code,
+                extra={"status_code": status_code, "duration_ms": round((time.perf_counter() - started) * 1000, 2)}
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "format": self.config.format,
+            "async_output": self.config.async_output,
+            "access_log_sample_rate": self.sampler.sample_rate,
+            "dropped_records": self.queue_handler.dropped if self.queue_handler else 0
+        }
@@ -10,12 +10,17 @@ from .client import MCPClient, MCPServerConfig as ClientConfig, MCPTransportType
 from .registry import MCPServerRegistry, MCPServerStatus, MCPServerInfo, mcp_registry
 from .discovery import MCPToolDiscovery, MCPToolInfo, MCPResourceInfo, MCPPromptInfo, ToolAvailabilityStatus
 from .tool_registry import MCPUnifiedToolRegistry, ToolExecutionStrategy, ToolExecutionResult
+from .capability_snapshot import MCPCapabilitySnapshot, compute_schema_hash
+from .argument_schema import canonicalize_arguments, validate_arguments
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState, LatencyTracker
+from .concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitConfig
 from .introspection import (
     MCPAvailabilityTracker, MCPCapabilityIntrospector,
     ToolIntrospectionResult, ToolCompatibilityInfo,
     ToolCategory, SchemaComplexity
 )
 from .server_base import MCPServerBase, mcp_tool, mcp_resource, mcp_prompt
+from .result_channel import OutOfBandResult, resolve_out_of_band_content, write_result_file
 
 __all__ = [
     # Client
@@ -35,11 +40,25 @@ __all__ = [
     "MCPResourceInfo",
     "MCPPromptInfo",
     "ToolAvailabilityStatus",
+    "MCPCapabilitySnapshot",
+    "compute_schema_hash",
 
     # Unified tool registry
     "MCPUnifiedToolRegistry",
     "ToolExecutionStrategy",
     "ToolExecutionResult",
+    "canonicalize_arguments",
+    "validate_arguments",
+
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitState",
+    "LatencyTracker",
+
+    # Adaptive concurrency limits
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimitConfig",
 
     # Introspection and availability tracking
     "MCPAvailabilityTracker",
@@ -53,5 +72,10 @@ __all__ = [
     "MCPServerBase",
     "mcp_tool",
     "mcp_resource",
-    "mcp_prompt"
+    "mcp_prompt",
+
+    # Out-of-band result channel
+    "OutOfBandResult",
+    "resolve_out_of_band_content",
+    "write_result_file"
 ]
\ No newline at end of file
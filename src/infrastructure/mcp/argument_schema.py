@@ -0,0 +1,179 @@
+"""
+Tool argument canonicalisation and validation against MCP input schemas.
+
+Arguments are checked against the tool's JSON Schema `input_schema` before a
+call is dispatched, so calls a server would reject never reach its transport.
+Canonicalisation only repairs values that fail their declared type or enum
+(enum values in their declared spelling, numeric and boolean strings coerced
+where a string is not allowed); a value that is already valid is sent as is,
+so `"0012"` stays a string when the schema allows strings. Values equal to the
+schema default are dropped only for the result cache key, so equivalent calls
+share a cache entry while servers still receive what the caller sent.
+Only the subset of JSON Schema that MCP tools use in practice is covered:
+type, enum, required, properties, items and additionalProperties.
+"""
+from typing import Any, Dict, List, Optional
+
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None)
+}
+
+_TRUE_STRINGS = {"true", "yes", "1"}
+_FALSE_STRINGS = {"false", "no", "0"}
+
+
+def schema_properties(input_schema: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Declared properties of an input schema."""
+    properties = (input_schema or {}).get("properties") or {}
+    return {name: spec if isinstance(spec, dict) else {} for name, spec in properties.items()}
+
+
+def _declared_types(spec: Dict[str, Any]) -> List[str]:
+    declared = spec.get("type")
+    if declared is None:
+        return []
+    return [declared] if isinstance(declared, str) else list(declared)
+
+
+def _matches_type(value: Any, type_name: str) -> bool:
+    expected = _JSON_TYPES.get(type_name)
+    if expected is None:
+        return True  # Unknown type keywords are not enforced
+    if isinstance(value, bool) and type_name in ("integer", "number"):
+        return False
+    return isinstance(value, expected)
+
+
+def canonicalize_value(value: Any, spec: Dict[str, Any], drop_defaults: bool = False) -> Any:
+    """Repair a value that fails its property schema; valid and unconvertible values are returned as is."""
+    types = _declared_types(spec)
+    enum = spec.get("enum")
+
+    if isinstance(value, str):
+        if enum and value not in enum:
+            stripped = value.strip().lower()
+            for option in enum:
+                if isinstance(option, str) and option.lower() == stripped:
+                    return option
+        if not types or any(_matches_type(value, type_name) for type_name in types):
+            return value
+        stripped = value.strip()
+        if "integer" in types and stripped.lstrip("-").isdigit():
+            return int(stripped)
+        if "number" in types:
+            try:
+                return float(stripped)
+            except ValueError:
+                pass
+        if "boolean" in types and stripped.lower() in _TRUE_STRINGS | _FALSE_STRINGS:
+            return stripped.lower() in _TRUE_STRINGS
+        return value
+
+    if isinstance(value, float) and "integer" in types and "number" not in types and value.is_integer():
+        return int(value)
+
+    if isinstance(value, list) and isinstance(spec.get("items"), dict):
+        return [canonicalize_value(item, spec["items"], drop_defaults) for item in value]
+
+    if isinstance(value, dict) and "properties" in spec:
+        return canonicalize_arguments(value, spec, drop_defaults)
+
+    return value
+
+
+def canonicalize_arguments(
+    arguments: Dict[str, Any],
+    input_schema: Optional[Dict[str, Any]],
+    drop_defaults: bool = False
+) -> Dict[str, Any]:
+    """
+    Canonical form of tool arguments for an input schema.
+
+    Optional arguments that are None where the schema does not allow null are
+    dropped; arguments without a declared property are kept unchanged.
+
+    Args:
+        arguments: Tool arguments
+        input_schema: The tool's JSON Schema input schema
+        drop_defaults: Also drop optional arguments equal to their schema default.
+            Only for cache keys: the server may not apply the declared default.
+    """
+    properties = schema_properties(input_schema)
+    required = set((input_schema or {}).get("required") or [])
+    canonical = {}
+
+    for name, value in arguments.items():
+        spec = properties.get(name)
+        if spec is None:
+            canonical[name] = value
+            continue
+
+        value = canonicalize_value(value, spec, drop_defaults)
+        if name not in required:
+            if value is None and "null" not in _declared_types(spec):
+                continue
+            if drop_defaults and "default" in spec and value == spec["default"]:
+                continue
+        canonical[name] = value
+
+    return canonical
+
+
+def validate_arguments(arguments: Dict[str, Any], input_schema: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    Validate tool arguments against an input schema.
+
+    Returns:
+        List of validation errors (empty when the arguments are valid)
+    """
+    if not input_schema:
+        return []
+
+    errors = []
+    properties = schema_properties(input_schema)
+
+    for name in input_schema.get("required") or []:
+        if name not in arguments:
+            errors.append(f"missing required argument '{name}'")
+
+    if input_schema.get("additionalProperties") is False:
+        for name in arguments:
+            if name not in properties:
+                errors.append(f"unexpected argument '{name}'")
+
+    for name, value in arguments.items():
+        spec = properties.get(name)
+        if spec:
+            errors.extend(_validate_value(value, spec, name))
+
+    return errors
+
+
+def _validate_value(value: Any, spec: Dict[str, Any], path: str) -> List[str]:
+    types = _declared_types(spec)
+    if types and not any(_matches_type(value, type_name) for type_name in types):
+        return [f"argument '{path}' must be of type {' or '.join(types)}"]
+
+    enum = spec.get("enum")
+    if enum and value not in enum:
+        return [f"argument '{path}' must be one of {enum}"]
+
+    if isinstance(value, list) and isinstance(spec.get("items"), dict):
+        errors = []
+        for index, item in enumerate(value):
+            errors.extend(_validate_value(item, spec["items"], f"{path}[{index}]"))
+        return errors
+
+    if isinstance(value, dict) and "properties" in spec:
+        return [
+            error.replace("argument '", f"argument '{path}.", 1)
+            for error in validate_arguments(value, spec)
+        ]
+
+    return []
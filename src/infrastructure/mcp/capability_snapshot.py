@@ -0,0 +1,102 @@
+"""
+Persisted MCP capability snapshot.
+
+Stores the tool list and a schema hash per server so that tool selection can
+work from the last known capabilities while servers are still spawning. The
+snapshot is replaced by live discovery results as soon as a server connects.
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def compute_schema_hash(tools: List[Dict[str, Any]]) -> str:
+    """
+    Compute a stable hash over a server's tool definitions.
+
+    Args:
+        tools: Tool definitions with 'name', 'description' and 'input_schema' keys
+
+    Returns:
+        Hex digest that changes whenever a tool is added, removed or its schema changes
+    """
+    canonical = sorted(
+        (
+            {
+                "name": tool.get("name", ""),
+                "description": tool.get("description", "") or "",
+                "input_schema": tool.get("input_schema", {}) or {}
+            }
+            for tool in tools
+        ),
+        key=lambda tool: tool["name"]
+    )
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MCPCapabilitySnapshot:
+    """JSON file store for per-server tool lists and schema hashes."""
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.logger = logging.getLogger("MCPCapabilitySnapshot")
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the snapshot from disk.
+
+        Returns:
+            Mapping of server name to {"schema_hash", "saved_at", "tools"}; empty if
+            the file is missing, unreadable or written by another snapshot version
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable capability snapshot {self.path}: {e}")
+            return {}
+
+        if data.get("version") != self.VERSION:
+            return {}
+
+        return data.get("servers", {})
+
+    def save(self, servers: Dict[str, List[Dict[str, Any]]]):
+        """
+        Persist tool lists for the given servers, keeping entries for other servers.
+
+        Args:
+            servers: Mapping of server name to tool definitions
+        """
+        snapshot = self.load()
+        saved_at = datetime.now().isoformat()
+        for server_name, tools in servers.items():
+            snapshot[server_name] = {
+                "schema_hash": compute_schema_hash(tools),
+                "saved_at": saved_at,
+                "tools": tools
+            }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "servers": snapshot}, f, default=str)
+            # Atomic replace so readers never see a partial file
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write capability snapshot {self.path}: {e}")
+
+    def get_schema_hash(self, server_name: str) -> Optional[str]:
+        """Get the persisted schema hash for a server."""
+        return self.load().get(server_name, {}).get("schema_hash")
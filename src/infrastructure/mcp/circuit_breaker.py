@@ -0,0 +1,187 @@
+"""
+Circuit breakers and latency tracking for MCP tool calls.
+
+Breakers are driven by the outcome of real tool calls: when the recent error
+rate or slow-call rate of a server (or of a single tool on a server) crosses
+its threshold, the breaker opens and calls are rejected immediately instead of
+waiting for the plan timeout. After a cool-down the breaker lets a limited
+number of trial calls through (half-open) and closes again once they succeed.
+"""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are rejected until the cool-down expires
+    HALF_OPEN = "half_open"  # A limited number of trial calls are allowed
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds for a circuit breaker."""
+    window_size: int = 20  # Number of recent calls considered
+    min_calls: int = 5  # Minimum calls in window before the breaker may trip
+    failure_rate_threshold: float = 0.5  # Trip when this share of calls failed
+    slow_call_threshold_ms: float = 10000.0  # Calls slower than this count as slow
+    slow_call_rate_threshold: float = 0.8  # Trip when this share of calls was slow
+    open_duration_seconds: float = 30.0  # Cool-down before half-open trial calls
+    half_open_max_calls: int = 1  # Concurrent trial calls while half-open
+
+
+class LatencyTracker:
+    """Keeps a bounded window of latency samples and answers percentile queries."""
+
+    def __init__(self, max_samples: int = 100):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def record(self, latency_ms: float):
+        """Record a latency sample in milliseconds."""
+        self._samples.append(latency_ms)
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of recorded latencies."""
+        if not self._samples:
+            return None
+
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * len(ordered))) - 1))
+        return ordered[index]
+
+
+class CircuitBreaker:
+    """
+    Sliding-window circuit breaker.
+
+    Outcomes are recorded with `record_success` / `record_failure`; callers ask
+    `allow_request` before dispatching and must record the outcome (or call
+    `release`) for every permitted call.
+    """
+
+    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self.logger = logging.getLogger(f"CircuitBreaker.{name}")
+
+        # Each entry is (failed, slow)
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=self.config.window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = 0
+
+        # Statistics
+        self._times_opened = 0
+        self._rejected_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from OPEN to HALF_OPEN once the cool-down expired."""
+        if (self._state == CircuitState.OPEN and self._opened_at is not None and
+                time.monotonic() - self._opened_at >= self.config.open_duration_seconds):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def is_call_permitted(self) -> bool:
+        """Check whether a call would be permitted, without reserving a trial slot."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            return self._half_open_in_flight < self.config.half_open_max_calls
+        return False
+
+    def allow_request(self) -> bool:
+        """Reserve permission for a call. Returns False if the call must be rejected."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN and self._half_open_in_flight < self.config.half_open_max_calls:
+            self._half_open_in_flight += 1
+            return True
+
+        self._rejected_calls += 1
+        return False
+
+    def release(self):
+        """Release a reserved call without recording an outcome (e.g. on cancellation)."""
+        if self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def record_success(self, latency_ms: Optional[float] = None):
+        """Record a successful call."""
+        slow = latency_ms is not None and latency_ms >= self.config.slow_call_threshold_ms
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self, latency_ms: Optional[float] = None):
+        """Record a failed call."""
+        slow = latency_ms is not None and latency_ms >= self.config.slow_call_threshold_ms
+        self._record(failed=True, slow=slow)
+
+    def _record(self, failed: bool, slow: bool):
+        state = self.state
+
+        if state == CircuitState.HALF_OPEN:
+            self.release()
+            if failed or slow:
+                self._trip()
+            elif self._half_open_in_flight == 0:
+                # Trial call went through - start over with a clean window
+                self._window.clear()
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if state == CircuitState.OPEN:
+            # Late result from a call dispatched before the breaker opened
+            return
+
+        self._window.append((failed, slow))
+        if len(self._window) < self.config.min_calls:
+            return
+
+        failure_rate = sum(1 for f, _ in self._window if f) / len(self._window)
+        slow_rate = sum(1 for _, s in self._window if s) / len(self._window)
+
+        if (failure_rate >= self.config.failure_rate_threshold or
+                slow_rate >= self.config.slow_call_rate_threshold):
+            self._trip()
+
+    def _trip(self):
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+        self._times_opened += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, new_state: CircuitState):
+        if new_state != self._state:
+            self.logger.info(f"Circuit {self.name}: {self._state.value} -> {new_state.value}")
+            self._state = new_state
+
+    def reset(self):
+        """Force the breaker back to CLOSED with an empty window."""
+        self._window.clear()
+        self._opened_at = None
+        self._half_open_in_flight = 0
+        self._transition(CircuitState.CLOSED)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker statistics."""
+        calls = len(self._window)
+        return {
+            "state": self.state.value,
+            "window_calls": calls,
+            "failure_rate": sum(1 for f, _ in self._window if f) / calls if calls else 0.0,
+            "slow_call_rate": sum(1 for _, s in self._window if s) / calls if calls else 0.0,
+            "times_opened": self._times_opened,
+            "rejected_calls": self._rejected_calls
+        }
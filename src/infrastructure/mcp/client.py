@@ -11,7 +11,10 @@ try:
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.stdio import stdio_client
     from mcp.client.sse import sse_client
-    from mcp.types import Tool, Resource, Prompt
+    from mcp.types import (
+        Tool, Resource, Prompt,
+        ToolListChangedNotification, ResourceListChangedNotification, PromptListChangedNotification
+    )
 except ImportError as e:
     logging.warning(f"MCP library not available: {e}")
     # Define minimal interfaces for development
@@ -38,6 +41,19 @@ except ImportError as e:
             self.description = description
             self.arguments = arguments or []
 
+    class ToolListChangedNotification:
+        pass
+    class ResourceListChangedNotification:
+        pass
+    class PromptListChangedNotification:
+        pass
+
+from .capability_snapshot import compute_schema_hash
+from .result_channel import (
+    OUT_OF_BAND_DIR_ENV, OUT_OF_BAND_THRESHOLD_ENV,
+    default_result_directory, resolve_out_of_band_content
+)
+
 
 class MCPTransportType(Enum):
     """Supported MCP transport types."""
@@ -93,6 +109,12 @@ class MCPClient:
         self._stdio_context = None  # For managing stdio connection context
         self._session_context = None  # For managing ClientSession context
         self._connection_task = None  # For managing the connection task
+        self._refresh_task: Optional[asyncio.Task] = None  # Pending list_changed refresh
+        self.tools_hash: Optional[str] = None  # Schema hash of the current tool list
+        self.capabilities_version = 0  # Incremented whenever the tool list changes
+        self.on_capabilities_changed = None  # Optional callback invoked after a change
+        self._out_of_band_threshold = int(getattr(config, 'out_of_band_threshold', 0) or 0)
+        self._out_of_band_dir = default_result_directory()
         self.logger = logging.getLogger(f"MCPClient.{config.name}")
 
     async def connect(self) -> bool:
@@ -124,10 +146,16 @@ class MCPClient:
     async def _connect_stdio(self) -> bool:
         """Connect via stdio transport."""
         try:
+            env = dict(self.config.env)
+            if self._out_of_band_threshold > 0:
+                # Let the local server hand large results over through result files
+                env.setdefault(OUT_OF_BAND_THRESHOLD_ENV, str(self._out_of_band_threshold))
+                env.setdefault(OUT_OF_BAND_DIR_ENV, str(self._out_of_band_dir))
+
             server_params = StdioServerParameters(
                 command=self.config.command,
                 args=self.config.args,
-                env=self.config.env
+                env=env
             )
 
             # Create and enter stdio context
@@ -135,7 +163,11 @@ class MCPClient:
             read_stream, write_stream = await self._stdio_context.__aenter__()
 
             # Create and enter ClientSession context
-            self._session_context = ClientSession(read_stream, write_stream)
+            self._session_context = ClientSession(
+                read_stream,
+                write_stream,
+                message_handler=self._handle_server_message
+            )
             self.session = await self._session_context.__aenter__()
 
             self.is_connected = True
@@ -189,32 +221,101 @@ class MCPClient:
         if not self.session:
             return
 
+        # Issue all three listings concurrently; each one fails independently
+        tools, self._resources, self._prompts = await asyncio.gather(
+            self._discover_tools(),
+            self._discover_resources(),
+            self._discover_prompts()
+        )
+        self._set_tools(tools)
+
+    def _set_tools(self, tools: List[Tool]):
+        """Replace the tool list, bumping the version if the schema hash changed."""
+        self._tools = tools
+        tools_hash = compute_schema_hash([
+            {
+                "name": tool.name,
+                "description": getattr(tool, 'description', ''),
+                "input_schema": getattr(tool, 'inputSchema', {})
+            }
+            for tool in tools
+        ])
+
+        if tools_hash != self.tools_hash:
+            self.tools_hash = tools_hash
+            self.capabilities_version += 1
+            if self.on_capabilities_changed:
+                self.on_capabilities_changed()
+
+    async def _handle_server_message(self, message: Any):
+        """Handle server notifications; re-fetch lists only when the server says they changed."""
+        notification = getattr(message, 'root', None)
+
+        if isinstance(notification, ToolListChangedNotification):
+            # Listing from inside the receive loop would deadlock, so refresh in a task
+            self._schedule_refresh(self.refresh_tools)
+        elif isinstance(notification, ResourceListChangedNotification):
+            self._schedule_refresh(self._refresh_resources)
+        elif isinstance(notification, PromptListChangedNotification):
+            self._schedule_refresh(self._refresh_prompts)
+
+    def _schedule_refresh(self, refresh):
+        self._refresh_task = asyncio.create_task(refresh())
+
+    async def refresh_tools(self) -> bool:
+        """
+        Re-fetch the tool list from the server.
+
+        Returns:
+            bool: True if the tool list changed
+        """
+        if not self.is_connected or not self.session:
+            return False
+
+        version = self.capabilities_version
+        self._set_tools(await self._discover_tools())
+        return self.capabilities_version != version
+
+    async def _refresh_resources(self):
+        if self.is_connected and self.session:
+            self._resources = await self._discover_resources()
+
+    async def _refresh_prompts(self):
+        if self.is_connected and self.session:
+            self._prompts = await self._discover_prompts()
+
+    async def _discover_tools(self) -> List[Tool]:
+        """List available tools."""
         try:
-            # List available tools
             tools_result = await self.session.list_tools()
-            self._tools = tools_result.tools if hasattr(tools_result, 'tools') else []
-            self.logger.info(f"Discovered {len(self._tools)} tools")
+            tools = tools_result.tools if hasattr(tools_result, 'tools') else []
+            self.logger.info(f"Discovered {len(tools)} tools")
+            return tools
         except Exception as e:
             self.logger.warning(f"Failed to discover tools: {e}")
-            self._tools = []
+            return []
 
+    async def _discover_resources(self) -> List[Resource]:
+        """List available resources."""
         try:
-            # List available resources
             resources_result = await self.session.list_resources()
-            self._resources = resources_result.resources if hasattr(resources_result, 'resources') else []
-            self.logger.info(f"Discovered {len(self._resources)} resources")
+            resources = resources_result.resources if hasattr(resources_result, 'resources') else []
+            self.logger.info(f"Discovered {len(resources)} resources")
+            return resources
         except Exception as e:
             self.logger.debug(f"Failed to discover resources (optional): {e}")
-            self._resources = []
+            return []
 
+    async def _discover_prompts(self) -> List[Prompt]:
+        """List available prompts."""
         try:
-            # List available prompts
             prompts_result = await self.session.list_prompts()
-            self._prompts = prompts_result.prompts if hasattr(prompts_result, 'prompts') else []
-            self.logger.info(f"Discovered {len(self._prompts)} prompts")
+            prompts = prompts_result.prompts if hasattr(prompts_result, 'prompts') else []
+            self.logger.info(f"Discovered {len(prompts)} prompts")
+            return prompts
         except Exception as e:
             self.logger.debug(f"Failed to discover prompts (optional): {e}")
-            self._prompts = []
+            return []
 
     async def _cleanup_contexts(self):
         """Clean up async contexts safely."""
@@ -256,6 +357,9 @@ class MCPClient:
 
         self.is_connected = False
 
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+
         # Properly clean up async contexts
         await self._cleanup_contexts()
 
@@ -279,7 +383,11 @@ class MCPClient:
         try:
             result = await self.session.call_tool(tool_name, arguments)
             self.logger.debug(f"Tool {tool_name} executed successfully")
-            return result.content if hasattr(result, 'content') else result
+            if not hasattr(result, 'content'):
+                return result
+            if self._out_of_band_threshold > 0:
+                return resolve_out_of_band_content(result.content, self._out_of_band_dir)
+            return result.content
 
         except Exception as e:
             self.logger.error(f"Failed to call tool {tool_name}: {e}")
@@ -350,7 +458,10 @@ class MCPClient:
 
     async def health_check(self) -> bool:
         """
-        Perform a health check on the MCP server connection.
+        Perform a liveness check on the MCP server connection.
+
+        Uses the protocol ping so health traffic stays small; tool lists are
+        only re-fetched on list_changed notifications.
 
         Returns:
             bool: True if healthy, False otherwise
@@ -359,8 +470,7 @@ class MCPClient:
             return False
 
         try:
-            # Try to list tools as a simple health check
-            await self.session.list_tools()
+            await self.session.send_ping()
             return True
         except Exception as e:
             self.logger.warning(f"Health check failed: {e}")
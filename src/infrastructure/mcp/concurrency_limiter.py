@@ -0,0 +1,165 @@
+"""
+Adaptive concurrency limiting for MCP servers.
+
+Each server gets an AIMD limiter driven by observed call latency: the limit
+grows by one while calls complete near the server's usual latency and the
+limit is actually used, and shrinks multiplicatively when latency rises well
+above that baseline or calls time out. Calls beyond the limit wait in a
+bounded queue and are rejected when the queue is full or the wait times out.
+"""
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+
+@dataclass
+class ConcurrencyLimitConfig:
+    """Settings for an adaptive concurrency limiter."""
+    initial_limit: int = 4  # Starting number of concurrent calls
+    min_limit: int = 1  # Limit never drops below this
+    max_limit: int = 32  # Limit never grows above this
+    backoff_ratio: float = 0.9  # Multiplicative decrease on overload
+    latency_tolerance: float = 2.0  # Overloaded when latency exceeds baseline by this factor
+    smoothing: float = 0.1  # EWMA weight of new samples in the latency baseline
+    max_queue_size: int = 50  # Calls allowed to wait for a slot
+    queue_timeout_seconds: float = 10.0  # Maximum wait for a slot
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter with a bounded FIFO wait queue.
+
+    Callers `acquire` a slot before dispatching and must `release` it with the
+    observed latency (or None if the call was cancelled) afterwards.
+    """
+
+    def __init__(self, name: str, config: Optional[ConcurrencyLimitConfig] = None):
+        self.name = name
+        self.config = config or ConcurrencyLimitConfig()
+        self.logger = logging.getLogger(f"AdaptiveConcurrencyLimiter.{name}")
+
+        self._limit = float(self.config.initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._baseline_latency_ms: Optional[float] = None
+
+        # Statistics
+        self._rejected_calls = 0
+        self._queued_calls = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return max(self.config.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> bool:
+        """
+        Acquire a slot, waiting in the queue if the limit is reached.
+
+        Returns:
+            bool: True if a slot was acquired, False if the call was rejected
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return True
+
+        if len(self._waiters) >= self.config.max_queue_size:
+            self._rejected_calls += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queued_calls += 1
+
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=self.config.queue_timeout_seconds)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        if done:
+            return True
+
+        self._abandon(waiter)
+        self._rejected_calls += 1
+        return False
+
+    def _abandon(self, waiter: asyncio.Future):
+        """Remove a waiter that gave up, returning its slot if one was granted meanwhile."""
+        if waiter.done() and not waiter.cancelled():
+            self.release(None)
+            return
+
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, latency_ms: Optional[float], dropped: bool = False):
+        """
+        Release a slot and adapt the limit.
+
+        Args:
+            latency_ms: Observed call latency, or None to release without a sample
+            dropped: The call timed out or was otherwise lost to overload
+        """
+        utilized = self._in_flight >= self.limit / 2
+        self._in_flight = max(0, self._in_flight - 1)
+
+        if dropped:
+            self._decrease()
+        elif latency_ms is not None:
+            self._on_sample(latency_ms, utilized)
+
+        self._wake_waiters()
+
+    def _on_sample(self, latency_ms: float, utilized: bool):
+        baseline = self._baseline_latency_ms
+        if baseline is None:
+            self._baseline_latency_ms = latency_ms
+            return
+
+        if latency_ms > baseline * self.config.latency_tolerance:
+            self._decrease()
+        elif utilized:
+            self._limit = min(float(self.config.max_limit), self._limit + 1)
+
+        # Slow samples move the baseline too, so sustained slowness settles into a new normal
+        self._baseline_latency_ms = (1 - self.config.smoothing) * baseline + self.config.smoothing * latency_ms
+
+    def _decrease(self):
+        previous = self.limit
+        self._limit = max(float(self.config.min_limit), self._limit * self.config.backoff_ratio)
+        if self.limit != previous:
+            self.logger.debug(f"Concurrency limit for {self.name}: {previous} -> {self.limit}")
+
+    def _wake_waiters(self):
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "queued_calls": self._queued_calls,
+            "rejected_calls": self._rejected_calls,
+            "baseline_latency_ms": self._baseline_latency_ms
+        }
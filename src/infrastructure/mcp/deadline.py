@@ -0,0 +1,94 @@
+"""
+Request deadlines for reasoning work.
+
+A `Deadline` bounds the total time a request may spend on reasoning (tool
+discovery, tool selection, planning and MCP tool calls). The deadline is
+carried in a context variable, so it reaches nested calls and the tasks they
+spawn without every signature passing it along: tool timeouts are clamped to
+the time left, expensive optional steps are skipped once it has run out, and
+`run_within_deadline` cancels work still outstanding when it expires.
+"""
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current_deadline: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar("deadline", default=None)
+
+
+class Deadline:
+    """A point in time by which work must finish."""
+
+    def __init__(self, budget_seconds: float):
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+
+    @classmethod
+    def from_ms(cls, budget_ms: float) -> Optional["Deadline"]:
+        """A deadline `budget_ms` from now, or None when the budget is unlimited (<= 0)."""
+        return cls(budget_ms / 1000.0) if budget_ms > 0 else None
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def clamp(self, timeout: Optional[float]) -> float:
+        """The smaller of `timeout` (None means unbounded) and the time left."""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline bound to the current task, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Bind `deadline` for the enclosed block; an earlier enclosing deadline still wins."""
+    enclosing = _current_deadline.get()
+    if deadline is None or (enclosing is not None and enclosing.expires_at <= deadline.expires_at):
+        yield enclosing
+        return
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def budget_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    """Clamp `timeout` to the current deadline; unchanged when no deadline is bound."""
+    deadline = _current_deadline.get()
+    return deadline.clamp(timeout) if deadline is not None else timeout
+
+
+def deadline_expired() -> bool:
+    """Whether the current deadline has run out."""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired
+
+
+async def run_within_deadline(awaitable: Awaitable[T], deadline: Optional[Deadline]) -> T:
+    """
+    Await `awaitable` with `deadline` bound, cancelling it when the deadline expires.
+
+    Raises:
+        asyncio.TimeoutError: The deadline expired first.
+    """
+    if deadline is None:
+        return await awaitable
+
+    async def bound() -> T:
+        # Runs in its own task, so binding here does not leak into the caller
+        with deadline_scope(deadline):
+            return await awaitable
+
+    return await asyncio.wait_for(bound(), timeout=deadline.remaining())
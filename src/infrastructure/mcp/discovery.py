@@ -6,7 +6,7 @@ including enumeration, caching, and capability introspection.
 """
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set, NamedTuple
+from typing import Callable, Dict, List, Optional, Any, Set, NamedTuple, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, field
@@ -35,6 +35,7 @@ except ImportError:
             self.arguments = arguments or []
 
 from .registry import MCPServerRegistry, MCPServerStatus
+from .capability_snapshot import MCPCapabilitySnapshot, compute_schema_hash
 
 
 class ToolAvailabilityStatus(Enum):
@@ -166,6 +167,9 @@ class MCPToolDiscovery:
         self._resource_servers: Dict[str, Set[str]] = {}  # uri -> set of server_names
         self._prompt_servers: Dict[str, Set[str]] = {}  # prompt_name -> set of server_names
 
+        # Bumped whenever the tool catalog changes, so consumers can rebuild derived data
+        self._catalog_version = 0
+
         # Caching
         self._cache_ttl = timedelta(minutes=5)
         self._last_discovery: Dict[str, datetime] = {}  # server_name -> last_discovery_time
@@ -174,6 +178,53 @@ class MCPToolDiscovery:
         self._discovery_task: Optional[asyncio.Task] = None
         self._auto_discovery_interval = 300.0  # 5 minutes
 
+        # Persisted capability snapshot
+        self._snapshot: Optional[MCPCapabilitySnapshot] = None
+        self._schema_hashes: Dict[str, str] = {}  # server_name -> schema hash of its tools
+        self._snapshot_servers: Set[str] = set()  # servers still served from the snapshot
+
+        # Listeners notified of real tool call outcomes
+        self._outcome_listeners: List[Callable[[str, Optional[str], bool, Optional[float], Optional[str]], None]] = []
+
+        # Listeners notified with the new catalog version when the tool catalog changes
+        self._catalog_listeners: List[Callable[[int], None]] = []
+
+    def enable_capability_snapshot(self, snapshot: MCPCapabilitySnapshot) -> int:
+        """
+        Persist discovered tools to a snapshot and preload the last known tools.
+
+        Preloaded tools are marked UNKNOWN until their server connects and live
+        discovery replaces them, so tool selection can start immediately.
+
+        Returns:
+            Number of tools loaded from the snapshot
+        """
+        self._snapshot = snapshot
+        loaded = 0
+
+        for server_name, entry in snapshot.load().items():
+            if server_name in self._last_discovery:
+                continue  # Live data already available
+
+            self._clear_server_capabilities(server_name)
+            for tool_data in entry.get("tools", []):
+                self._register_tool(MCPToolInfo(
+                    name=tool_data["name"],
+                    server_name=server_name,
+                    description=tool_data.get("description", ""),
+                    input_schema=tool_data.get("input_schema", {}),
+                    availability_status=ToolAvailabilityStatus.UNKNOWN
+                ))
+                loaded += 1
+
+            self._schema_hashes[server_name] = entry.get("schema_hash", "")
+            self._snapshot_servers.add(server_name)
+
+        if loaded:
+            self.logger.info(f"Loaded {loaded} tools from capability snapshot for {len(self._snapshot_servers)} servers")
+            self._notify_catalog_changed()
+        return loaded
+
     async def start_auto_discovery(self, interval: float = 300.0):
         """Start automatic tool discovery."""
         if self._discovery_task and not self._discovery_task.done():
@@ -222,23 +273,76 @@ class MCPToolDiscovery:
 
         results = await asyncio.gather(*discovery_tasks, return_exceptions=True)
 
-        # Process results
+        successful_results = await self._process_discovery_results(results)
+
+        self.logger.info(
+            f"Capability discovery complete: {len(successful_results)} servers processed, "
+            f"{len(self._tools)} tools, {len(self._resources)} resources, {len(self._prompts)} prompts"
+        )
+
+        return successful_results
+
+    async def discover_new_servers(self) -> List[DiscoveryResult]:
+        """
+        Discover capabilities only for connected servers that are new or changed.
+
+        A server counts as changed when its client's tool schema hash differs
+        from the one last discovered (after a list_changed refresh or reconnect).
+        """
+        new_servers = {
+            name: info for name, info in self.registry.get_connected_servers().items()
+            if name not in self._last_discovery or self._has_schema_changed(name, info.client)
+        }
+        if not new_servers:
+            return []
+
+        results = await asyncio.gather(
+            *(self._discover_server_capabilities(name, info) for name, info in new_servers.items()),
+            return_exceptions=True
+        )
+        successful_results = await self._process_discovery_results(results)
+
+        self.logger.info(f"Discovered capabilities for {len(successful_results)} newly connected servers")
+        return successful_results
+
+    async def _process_discovery_results(self, results: List[Any]) -> List[DiscoveryResult]:
+        """Apply discovery results to the registries and persist changed tool lists."""
         successful_results = []
+        changed_servers: Dict[str, List[Dict[str, Any]]] = {}
+
         for result in results:
             if isinstance(result, DiscoveryResult):
                 successful_results.append(result)
                 if result.success:
+                    # Capture tool definitions before registration may qualify names
+                    tool_defs = [
+                        {"name": tool.name, "description": tool.description, "input_schema": tool.input_schema}
+                        for tool in result.tools
+                    ]
+                    schema_hash = compute_schema_hash(tool_defs)
+                    if self._schema_hashes.get(result.server_name) != schema_hash:
+                        changed_servers[result.server_name] = tool_defs
+                    self._schema_hashes[result.server_name] = schema_hash
+                    self._snapshot_servers.discard(result.server_name)
+
                     await self._process_discovery_result(result)
             elif isinstance(result, Exception):
                 self.logger.error(f"Discovery task failed: {result}")
 
-        self.logger.info(
-            f"Capability discovery complete: {len(successful_results)} servers processed, "
-            f"{len(self._tools)} tools, {len(self._resources)} resources, {len(self._prompts)} prompts"
-        )
+        if self._snapshot and changed_servers:
+            self._snapshot.save(changed_servers)
 
         return successful_results
 
+    def _has_schema_changed(self, server_name: str, client) -> bool:
+        """Check whether a client's tool list differs from the discovered one."""
+        client_hash = getattr(client, 'tools_hash', None)
+        return isinstance(client_hash, str) and client_hash != self._schema_hashes.get(server_name)
+
+    def get_schema_hash(self, server_name: str) -> Optional[str]:
+        """Get the schema hash of the tools last discovered for a server."""
+        return self._schema_hashes.get(server_name)
+
     async def _discover_server_capabilities(self, server_name: str, server_info) -> DiscoveryResult:
         """Discover capabilities from a specific server."""
         start_time = datetime.now()
@@ -256,7 +360,7 @@ class MCPToolDiscovery:
                 )
 
             # Check cache validity
-            if self._is_cache_valid(server_name):
+            if self._is_cache_valid(server_name, server_info.client):
                 self.logger.debug(f"Using cached capabilities for server: {server_name}")
                 return self._get_cached_result(server_name, start_time)
 
@@ -340,12 +444,15 @@ class MCPToolDiscovery:
                 error_message=str(e)
             )
 
-    def _is_cache_valid(self, server_name: str) -> bool:
+    def _is_cache_valid(self, server_name: str, client=None) -> bool:
         """Check if cached capabilities are still valid."""
         last_discovery = self._last_discovery.get(server_name)
         if not last_discovery:
             return False
 
+        if client is not None and self._has_schema_changed(server_name, client):
+            return False
+
         return datetime.now() - last_discovery < self._cache_ttl
 
     def _get_cached_result(self, server_name: str, discovery_time: datetime) -> DiscoveryResult:
@@ -367,6 +474,8 @@ class MCPToolDiscovery:
     async def _process_discovery_result(self, result: DiscoveryResult):
         """Process discovery result and update registries."""
         server_name = result.server_name
+        version_before = self._catalog_version
+        tools_before = self._server_tool_definitions(server_name)
 
         # Clear existing entries for this server
         self._clear_server_capabilities(server_name)
@@ -388,6 +497,28 @@ class MCPToolDiscovery:
             f"{len(result.tools)} tools, {len(result.resources)} resources, {len(result.prompts)} prompts"
         )
 
+        if self._server_tool_definitions(server_name) == tools_before:
+            # Re-registered the same tools: the catalog is unchanged, so keep its version
+            self._catalog_version = version_before
+        else:
+            self._notify_catalog_changed()
+
+    def _server_tool_definitions(self, server_name: str) -> List[Tuple[str, str, str]]:
+        """Sorted (name, description, input schema) of the tools registered for a server."""
+        return sorted(
+            (tool.name, tool.description, json.dumps(tool.input_schema, sort_keys=True, default=str))
+            for tool in self._tools.values()
+            if tool.server_name == server_name
+        )
+
+    def _notify_catalog_changed(self):
+        """Notify catalog listeners of the current catalog version."""
+        for listener in self._catalog_listeners:
+            try:
+                listener(self._catalog_version)
+            except Exception as e:
+                self.logger.error(f"Tool catalog listener failed: {e}")
+
     def _clear_server_capabilities(self, server_name: str):
         """Clear all capabilities for a specific server."""
         # Remove tools
@@ -417,6 +548,7 @@ class MCPToolDiscovery:
                 self.logger.warning(f"Tool name conflict resolved: {tool.name}")
 
         self._tools[tool.name] = tool
+        self._catalog_version += 1
 
         # Update server mapping
         if tool.name not in self._tool_servers:
@@ -457,6 +589,7 @@ class MCPToolDiscovery:
                 # No more servers provide this tool
                 self._tools.pop(tool_name, None)
                 del self._tool_servers[tool_name]
+                self._catalog_version += 1
 
     def _unregister_resource(self, uri: str, server_name: str):
         """Unregister a resource from a specific server."""
@@ -478,6 +611,11 @@ class MCPToolDiscovery:
 
     # Public API methods
 
+    @property
+    def catalog_version(self) -> int:
+        """Counter that changes whenever tools are added, replaced or removed."""
+        return self._catalog_version
+
     def get_all_tools(self) -> List[MCPToolInfo]:
         """Get all available tools from all servers."""
         return list(self._tools.values())
@@ -541,6 +679,7 @@ class MCPToolDiscovery:
             "total_resources": len(self._resources),
             "total_prompts": len(self._prompts),
             "servers_discovered": len(self._last_discovery),
+            "servers_from_snapshot": sorted(self._snapshot_servers),
             "tools_by_server": {
                 server: len(self.find_tools_by_server(server))
                 for server in self._last_discovery.keys()
@@ -597,6 +736,41 @@ class MCPToolDiscovery:
             if response_time_ms is not None:
                 tool.response_time_ms = response_time_ms
 
+    def record_tool_outcome(
+        self,
+        tool_name: str,
+        success: bool,
+        response_time_ms: Optional[float] = None,
+        error_message: Optional[str] = None,
+        server_name: Optional[str] = None
+    ):
+        """
+        Record the outcome of a real tool call.
+
+        Tool availability is derived from these outcomes rather than synthetic
+        probes; registered outcome listeners (e.g. availability tracking) are notified.
+        """
+        tool = self.get_tool(tool_name)
+        if tool:
+            tool.availability_status = ToolAvailabilityStatus.AVAILABLE if success else ToolAvailabilityStatus.ERROR
+            tool.error_message = None if success else error_message
+            tool.last_checked = datetime.now()
+            server_name = server_name or tool.server_name
+
+        for listener in self._outcome_listeners:
+            try:
+                listener(tool_name, server_name, success, response_time_ms, error_message)
+            except Exception as e:
+                self.logger.error(f"Tool outcome listener failed: {e}")
+
+    def add_outcome_listener(self, listener: Callable[[str, Optional[str], bool, Optional[float], Optional[str]], None]):
+        """Register a callback invoked with (tool_name, server_name, success, response_time_ms, error_message)."""
+        self._outcome_listeners.append(listener)
+
+    def add_catalog_listener(self, listener: Callable[[int], None]):
+        """Register a callback invoked with the new catalog version whenever tools are added, changed or removed."""
+        self._catalog_listeners.append(listener)
+
     def get_usage_statistics(self) -> Dict[str, Any]:
         """Get usage statistics for all tools."""
         stats = {
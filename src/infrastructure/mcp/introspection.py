@@ -89,6 +89,9 @@ class MCPAvailabilityTracker:
         # Performance tracking
         self._performance_metrics: Dict[str, Dict[str, Any]] = defaultdict(dict)
 
+        # Availability is derived from real tool call outcomes
+        self.discovery.add_outcome_listener(self.record_call_outcome)
+
     async def start_tracking(self, interval: float = 60.0):
         """Start availability tracking."""
         if self._tracking_task and not self._tracking_task.done():
@@ -122,53 +125,72 @@ class MCPAvailabilityTracker:
                 await asyncio.sleep(10)
 
     async def _update_availability_status(self):
-        """Update availability status for all tools."""
-        all_tools = self.discovery.get_all_tools()
-
-        for tool in all_tools:
-            await self._check_tool_availability(tool)
-
-    async def _check_tool_availability(self, tool: MCPToolInfo):
-        """Check and record availability for a specific tool."""
-        timestamp = datetime.now()
+        """
+        Record unavailability for tools whose server is down.
 
-        try:
-            # Get server info
+        No per-tool probes are sent: tools on healthy servers are tracked from
+        real call outcomes reported through record_call_outcome.
+        """
+        for tool in self.discovery.get_all_tools():
             server_info = self.registry.get_server_info(tool.server_name)
             if not server_info or not server_info.is_healthy:
-                status = ToolAvailabilityStatus.UNAVAILABLE
-                error_msg = "Server not healthy"
-                response_time = None
-            else:
-                # Test tool availability
-                start_time = datetime.now()
-                is_available = await self.discovery.update_tool_availability(tool.name)
-                response_time = (datetime.now() - start_time).total_seconds() * 1000
-
-                status = ToolAvailabilityStatus.AVAILABLE if is_available else ToolAvailabilityStatus.UNAVAILABLE
-                error_msg = tool.error_message if not is_available else None
-
-            # Record availability
-            availability_record = {
-                "timestamp": timestamp.isoformat(),
-                "status": status.value,
-                "response_time_ms": response_time,
-                "error_message": error_msg,
-                "server_status": server_info.status.value if server_info else "unknown"
-            }
-
-            self._availability_history[tool.name].append(availability_record)
-
-            # Limit history size
-            if len(self._availability_history[tool.name]) > self._max_history_entries:
-                self._availability_history[tool.name].pop(0)
+                self._record_availability(
+                    tool.name,
+                    ToolAvailabilityStatus.UNAVAILABLE,
+                    response_time=None,
+                    error_msg="Server not healthy",
+                    server_status=server_info.status.value if server_info else "unknown"
+                )
+
+    def record_call_outcome(
+        self,
+        tool_name: str,
+        server_name: Optional[str],
+        success: bool,
+        response_time_ms: Optional[float] = None,
+        error_message: Optional[str] = None
+    ):
+        """Record availability and performance from a real tool call."""
+        try:
+            server_info = self.registry.get_server_info(server_name) if server_name else None
+            self._record_availability(
+                tool_name,
+                ToolAvailabilityStatus.AVAILABLE if success else ToolAvailabilityStatus.ERROR,
+                response_time=response_time_ms,
+                error_msg=None if success else error_message,
+                server_status=server_info.status.value if server_info else "unknown"
+            )
 
             # Update performance metrics
-            if response_time is not None:
-                self._update_performance_metrics(tool.name, response_time)
+            if success and response_time_ms is not None:
+                self._update_performance_metrics(tool_name, response_time_ms)
 
         except Exception as e:
-            self.logger.error(f"Error checking availability for {tool.name}: {e}")
+            self.logger.error(f"Error recording call outcome for {tool_name}: {e}")
+
+    def _record_availability(
+        self,
+        tool_name: str,
+        status: ToolAvailabilityStatus,
+        response_time: Optional[float],
+        error_msg: Optional[str],
+        server_status: str
+    ):
+        """Append an availability record for a tool."""
+        availability_record = {
+            "timestamp": datetime.now().isoformat(),
+            "status": status.value,
+            "response_time_ms": response_time,
+            "error_message": error_msg,
+            "server_status": server_status
+        }
+
+        history = self._availability_history[tool_name]
+        history.append(availability_record)
+
+        # Limit history size
+        if len(history) > self._max_history_entries:
+            history.pop(0)
 
     def _update_performance_metrics(self, tool_name: str, response_time: float):
         """Update performance metrics for a tool."""
@@ -79,12 +79,14 @@ class MCPServerRegistry:
         self._health_check_interval = 60.0
         self._shutdown = False
 
-    async def register_server(self, config: MCPServerConfig) -> bool:
+    async def register_server(self, config: MCPServerConfig, connect: bool = True) -> bool:
         """
         Register a new MCP server configuration.
 
         Args:
             config: Server configuration
+            connect: Connect immediately; pass False to register several servers
+                and connect them in parallel with connect_all()
 
         Returns:
             bool: True if registration successful
@@ -105,7 +107,7 @@ class MCPServerRegistry:
             self._servers[config.name] = server_info
 
             # Try to connect if enabled
-            if config.enabled:
+            if config.enabled and connect:
                 await self._connect_server(config.name)
 
             return True
@@ -114,6 +116,28 @@ class MCPServerRegistry:
             self.logger.error(f"Failed to register MCP server {config.name}: {e}")
             return False
 
+    async def register_servers(self, configs: List[MCPServerConfig], connect: bool = True) -> Dict[str, bool]:
+        """
+        Register several MCP servers and connect them in parallel.
+
+        Cold start is bounded by the slowest server rather than the sum of all.
+
+        Args:
+            configs: Server configurations
+            connect: Connect the enabled servers after registration
+
+        Returns:
+            Mapping of server name to registration success
+        """
+        results = {}
+        for config in configs:
+            results[config.name] = await self.register_server(config, connect=False)
+
+        if connect:
+            await self.connect_all()
+
+        return results
+
     async def unregister_server(self, name: str) -> bool:
         """
         Unregister and disconnect an MCP server.
@@ -183,8 +207,9 @@ class MCPServerRegistry:
             server_info.last_connection_attempt = datetime.now()
             server_info.connection_attempts += 1
 
-            # Create client
+            # Create client; keep capability counts in sync with list_changed refreshes
             server_info.client = MCPClient(server_info.config)
+            server_info.client.on_capabilities_changed = server_info.update_capabilities
 
             # Attempt connection
             success = await server_info.client.connect()
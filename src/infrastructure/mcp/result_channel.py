@@ -0,0 +1,174 @@
+"""
+Out-of-band transport for large MCP tool results.
+
+Local stdio servers can write large results to a file in a shared directory
+and return a `resource_link` content block pointing at it instead of pushing
+megabytes of JSON text through the stdio pipe. The client memory-maps the file,
+unlinks it right away (the mapping stays valid) and exposes the bytes without
+copying; text is only decoded when a consumer actually asks for it, after
+which the mapping is released.
+
+The channel is opt-in: the proxy passes the threshold and directory to the
+servers it spawns through environment variables.
+"""
+import json
+import logging
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+logger = logging.getLogger(__name__)
+
+# Environment variables passed from the proxy to the stdio servers it spawns
+OUT_OF_BAND_THRESHOLD_ENV = "MCP_OUT_OF_BAND_THRESHOLD_BYTES"
+OUT_OF_BAND_DIR_ENV = "MCP_OUT_OF_BAND_DIR"
+
+RESULT_FILE_PREFIX = "mcp-result-"
+RESULT_MIME_TYPE = "application/json"
+
+
+def default_result_directory() -> Path:
+    """Directory shared by the proxy and its local servers for result files."""
+    return Path(tempfile.gettempdir()) / "adk-mcp-results"
+
+
+def write_result_file(payload: bytes, directory: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Write a serialized result to a result file.
+
+    Args:
+        payload: Serialized result bytes
+        directory: Result directory (defaults to default_result_directory())
+
+    Returns:
+        MCP `resource_link` content block referencing the file
+    """
+    directory = Path(directory or default_result_directory())
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    fd, path = tempfile.mkstemp(prefix=RESULT_FILE_PREFIX, suffix=".json", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload)
+
+    return {
+        "type": "resource_link",
+        "uri": Path(path).as_uri(),
+        "name": Path(path).name,
+        "mimeType": RESULT_MIME_TYPE,
+        "size": len(payload)
+    }
+
+
+class OutOfBandResult:
+    """
+    Memory-mapped tool result received through the out-of-band channel.
+
+    Exposes `buffer` as a zero-copy memoryview over the mapping until the
+    result is decoded. `text` and `json()` decode on first access, so
+    existing consumers that read `.text` keep working, and the mapping is
+    released right after decoding rather than staying pinned for as long as
+    the result cache holds the object.
+    """
+
+    type = "text"
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        # The mapping keeps the data alive; nothing is left behind on disk
+        os.unlink(path)
+        self.size = size
+        self._text: Optional[str] = None
+
+    @property
+    def buffer(self) -> memoryview:
+        """View of the result bytes (zero-copy while the mapping is open)."""
+        if self._mmap is not None:
+            return memoryview(self._mmap)
+        return memoryview(self._text.encode("utf-8") if self._text is not None else b"")
+
+    @property
+    def text(self) -> str:
+        """Result decoded as UTF-8 text (decoded once, on first access, then the mapping is released)."""
+        if self._text is None:
+            with self.buffer as view:
+                self._text = str(view, "utf-8")
+            self.close()
+        return self._text
+
+    def json(self) -> Any:
+        """Parse the result as JSON."""
+        return json.loads(self.text)
+
+    def close(self):
+        """Release the mapping; a mapping with live buffer views is released once they are gone."""
+        if self._mmap is None:
+            return
+        try:
+            self._mmap.close()
+        except BufferError:
+            return
+        self._mmap = None
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"OutOfBandResult(size={self.size})"
+
+
+def resolve_out_of_band_content(content: List[Any], directory: Optional[Path] = None) -> List[Any]:
+    """
+    Replace result-file links in tool content with memory-mapped results.
+
+    Only links to result files inside the shared result directory are resolved,
+    so a server cannot make the client read or delete arbitrary files.
+
+    Args:
+        content: Content blocks returned by the MCP server
+        directory: Expected result directory
+
+    Returns:
+        Content list with out-of-band links replaced by OutOfBandResult objects
+    """
+    if not isinstance(content, list):
+        return content
+
+    allowed_dir = Path(directory or default_result_directory()).resolve()
+    resolved = []
+
+    for item in content:
+        path = _result_file_path(item, allowed_dir)
+        if path is None:
+            resolved.append(item)
+            continue
+
+        try:
+            resolved.append(OutOfBandResult(path))
+        except OSError as e:
+            logger.warning(f"Failed to read out-of-band result {path}: {e}")
+            resolved.append(item)
+
+    return resolved
+
+
+def _result_file_path(item: Any, allowed_dir: Path) -> Optional[Path]:
+    """Return the local path of a result-file link, or None for other content."""
+    if getattr(item, "type", None) != "resource_link":
+        return None
+
+    uri = urlparse(str(getattr(item, "uri", "")))
+    if uri.scheme != "file":
+        return None
+
+    path = Path(unquote(uri.path)).resolve()
+    if path.parent != allowed_dir or not path.name.startswith(RESULT_FILE_PREFIX):
+        return None
+
+    return path
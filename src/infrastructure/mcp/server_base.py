@@ -7,9 +7,16 @@ Provides base functionality for MCP server implementations.
 import asyncio
 import json
 import logging
+import os
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 from functools import wraps
 
+from .result_channel import (
+    OUT_OF_BAND_DIR_ENV, OUT_OF_BAND_THRESHOLD_ENV,
+    default_result_directory, write_result_file
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,6 +70,11 @@ class MCPServerBase:
         self._tools = {}
         self._resources = {}
         self._prompts = {}
+
+        # Out-of-band channel for large results (enabled by the proxy via environment)
+        self._out_of_band_threshold = int(os.getenv(OUT_OF_BAND_THRESHOLD_ENV, "0") or 0)
+        self._out_of_band_dir = Path(os.getenv(OUT_OF_BAND_DIR_ENV) or default_result_directory())
+
         self._register_handlers()
 
     def _register_handlers(self):
@@ -165,11 +177,30 @@ class MCPServerBase:
         try:
             handler = self._tools[name]
             result = await handler(**arguments) if asyncio.iscoroutinefunction(handler) else handler(**arguments)
-            return {"content": [{"type": "text", "text": json.dumps(result)}]}
+            return {"content": [self._result_content(result)]}
         except Exception as e:
             self.logger.error(f"Error calling tool {name}: {e}")
             return {"error": str(e)}
 
+    def _result_content(self, result: Any) -> Dict[str, Any]:
+        """Build the content block for a tool result.
+
+        Results are serialized once (strings, usually JSON already, are passed
+        through as-is). Results above the out-of-band threshold are written to a
+        result file and returned as a resource link instead of inline text.
+        """
+        text = result if isinstance(result, str) else json.dumps(result)
+
+        if self._out_of_band_threshold > 0:
+            payload = text.encode("utf-8")
+            if len(payload) >= self._out_of_band_threshold:
+                try:
+                    return write_result_file(payload, self._out_of_band_dir)
+                except OSError as e:
+                    self.logger.warning(f"Out-of-band write failed, sending result inline: {e}")
+
+        return {"type": "text", "text": text}
+
     async def list_resources(self) -> Dict[str, Any]:
         """List available resources."""
         resources = []
@@ -12,9 +12,14 @@ from enum import Enum
 from dataclasses import dataclass
 import json
 import hashlib
+import time
 
 from .discovery import MCPToolDiscovery, MCPToolInfo, MCPResourceInfo, MCPPromptInfo, ToolAvailabilityStatus
 from .registry import MCPServerRegistry
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, LatencyTracker
+from .concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitConfig
+from .deadline import Deadline, current_deadline
+from .argument_schema import canonicalize_arguments, validate_arguments
 
 
 class ToolExecutionStrategy(Enum):
@@ -81,6 +86,34 @@ class MCPUnifiedToolRegistry:
         # Tool execution filters
         self._tool_filters: List[Callable[[str, Dict[str, Any]], bool]] = []
 
+        # Arguments are canonicalised and validated against the tool's input schema before dispatch
+        self._enable_argument_validation = True
+        self._rejected_calls = 0
+
+        # Circuit breakers (per server and per server/tool pair)
+        self._enable_circuit_breakers = True
+        self._server_breaker_config = CircuitBreakerConfig()
+        self._tool_breaker_config = CircuitBreakerConfig()
+        self._server_breakers: Dict[str, CircuitBreaker] = {}  # server_name -> breaker
+        self._tool_breakers: Dict[str, CircuitBreaker] = {}  # "server:tool" -> breaker
+
+        # Latency tracking per server/tool pair (drives hedging delays)
+        self._latency_trackers: Dict[str, LatencyTracker] = {}  # "server:tool" -> tracker
+
+        # Hedged requests for idempotent read tools on replicated servers
+        self._enable_hedging = False
+        self._hedge_percentile = 95.0
+        self._hedge_default_delay_ms = 1000.0  # Used until enough latency samples exist
+        self._hedge_min_samples = 10
+        self._idempotent_tools: Set[str] = set()
+        self._idempotent_prefixes = ("get_", "list_", "find_", "search_", "read_", "fetch_", "describe_", "show_")
+        self._hedge_stats = {"launched": 0, "won": 0}
+
+        # Adaptive per-server concurrency limits
+        self._enable_concurrency_limits = True
+        self._concurrency_config = ConcurrencyLimitConfig()
+        self._concurrency_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}  # server_name -> limiter
+
     def set_execution_strategy(self, strategy: ToolExecutionStrategy):
         """Set the tool execution strategy."""
         self._execution_strategy = strategy
@@ -96,6 +129,74 @@ class MCPUnifiedToolRegistry:
 
         self.logger.info(f"Result caching {'enabled' if enabled else 'disabled'}")
 
+    def enable_argument_validation(self, enabled: bool = True):
+        """Enable or disable argument canonicalisation and validation against tool input schemas."""
+        self._enable_argument_validation = enabled
+        self.logger.info(f"Argument validation {'enabled' if enabled else 'disabled'}")
+
+    def configure_circuit_breakers(
+        self,
+        enabled: bool = True,
+        server_config: Optional[CircuitBreakerConfig] = None,
+        tool_config: Optional[CircuitBreakerConfig] = None
+    ):
+        """Enable or disable circuit breakers and set their thresholds."""
+        self._enable_circuit_breakers = enabled
+        if server_config:
+            self._server_breaker_config = server_config
+        if tool_config:
+            self._tool_breaker_config = tool_config
+
+        # Breakers are recreated lazily with the new thresholds
+        self._server_breakers.clear()
+        self._tool_breakers.clear()
+
+        self.logger.info(f"Circuit breakers {'enabled' if enabled else 'disabled'}")
+
+    def configure_concurrency_limits(
+        self,
+        enabled: bool = True,
+        limit_config: Optional[ConcurrencyLimitConfig] = None
+    ):
+        """Enable or disable adaptive per-server concurrency limits."""
+        self._enable_concurrency_limits = enabled
+        if limit_config:
+            self._concurrency_config = limit_config
+
+        # Limiters are recreated lazily with the new settings
+        self._concurrency_limiters.clear()
+
+        self.logger.info(f"Adaptive concurrency limits {'enabled' if enabled else 'disabled'}")
+
+    def enable_hedging(
+        self,
+        enabled: bool = True,
+        idempotent_tools: Optional[Set[str]] = None,
+        percentile: float = 95.0,
+        default_delay_ms: float = 1000.0
+    ):
+        """
+        Enable or disable hedged requests for idempotent tools.
+
+        When a tool is served by more than one healthy server, a second request
+        is sent to the next server if the first has not answered within the
+        given latency percentile; the first successful answer wins.
+
+        Args:
+            enabled: Whether hedging is enabled
+            idempotent_tools: Tool names that are safe to hedge; when omitted,
+                read-style tool names (get_, list_, find_, ...) are treated as idempotent
+            percentile: Latency percentile used as hedge delay
+            default_delay_ms: Delay used until enough latency samples exist
+        """
+        self._enable_hedging = enabled
+        if idempotent_tools is not None:
+            self._idempotent_tools = set(idempotent_tools)
+        self._hedge_percentile = percentile
+        self._hedge_default_delay_ms = default_delay_ms
+
+        self.logger.info(f"Hedged requests {'enabled' if enabled else 'disabled'}")
+
     def add_tool_filter(self, filter_func: Callable[[str, Dict[str, Any]], bool]):
         """
         Add a filter function for tool execution.
@@ -110,7 +211,8 @@ class MCPUnifiedToolRegistry:
         arguments: Dict[str, Any],
         server_name: Optional[str] = None,
         cache_ttl: Optional[int] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        deadline: Optional[Deadline] = None
     ) -> ToolExecutionResult:
         """
         Execute a tool with intelligent server selection and caching.
@@ -121,6 +223,9 @@ class MCPUnifiedToolRegistry:
             server_name: Specific server to use (optional)
             cache_ttl: Cache TTL in seconds (optional)
             timeout: Execution timeout (optional)
+            deadline: Request deadline (optional, defaults to the one bound to the current task).
+                The timeout is clamped to the time left; once it has expired only cached
+                results are returned.
 
         Returns:
             ToolExecutionResult with execution details
@@ -136,9 +241,27 @@ class MCPUnifiedToolRegistry:
                     tool_name=tool_name
                 )
 
+            # Reject calls the server would refuse before they reach its transport
+            cache_arguments = arguments
+            if self._enable_argument_validation:
+                input_schema = getattr(self.discovery.get_tool(tool_name), "input_schema", None)
+                if input_schema and isinstance(input_schema, dict):
+                    arguments = canonicalize_arguments(arguments, input_schema)
+                    # Calls that differ only by explicit defaults share a cache entry
+                    cache_arguments = canonicalize_arguments(arguments, input_schema, drop_defaults=True)
+                    validation_errors = validate_arguments(arguments, input_schema)
+                    if validation_errors:
+                        self._rejected_calls += 1
+                        self.logger.warning(f"Rejected call to {tool_name}: {'; '.join(validation_errors)}")
+                        return ToolExecutionResult(
+                            success=False,
+                            error_message=f"Invalid arguments: {'; '.join(validation_errors)}",
+                            tool_name=tool_name
+                        )
+
             # Check cache first
             if self._enable_caching:
-                cached_result = self._get_cached_result(tool_name, arguments, server_name)
+                cached_result = self._get_cached_result(tool_name, cache_arguments, server_name)
                 if cached_result:
                     self._cache_stats["hits"] += 1
                     return ToolExecutionResult(
@@ -149,35 +272,73 @@ class MCPUnifiedToolRegistry:
                     )
                 self._cache_stats["misses"] += 1
 
+            # Respect the request deadline
+            deadline = deadline or current_deadline()
+            budget_limited = False
+            if deadline is not None:
+                if deadline.expired:
+                    return ToolExecutionResult(
+                        success=False,
+                        error_message="Skipped: request deadline exceeded",
+                        tool_name=tool_name
+                    )
+                budget_limited = timeout is None or deadline.remaining() < timeout
+                timeout = deadline.clamp(timeout)
+
             # Find available servers
-            available_servers = self._find_available_servers(tool_name, server_name)
-            if not available_servers:
+            candidate_servers = self._find_available_servers(tool_name, server_name)
+            if not candidate_servers:
                 return ToolExecutionResult(
                     success=False,
                     error_message=f"No available servers for tool: {tool_name}",
                     tool_name=tool_name
                 )
 
+            # Skip servers whose circuit is open
+            available_servers = [
+                name for name in candidate_servers
+                if self._is_circuit_closed(name, tool_name)
+            ]
+            if not available_servers:
+                return ToolExecutionResult(
+                    success=False,
+                    error_message=f"Circuit open for tool {tool_name} on servers: {', '.join(candidate_servers)}",
+                    tool_name=tool_name
+                )
+
             # Select server based on strategy
             selected_server = self._select_server(tool_name, available_servers)
 
-            # Execute tool
-            result = await self._execute_on_server(
-                selected_server,
-                tool_name,
-                arguments,
-                timeout
-            )
+            # Execute tool, hedging idempotent calls across replicated servers
+            if self._should_hedge(tool_name, available_servers):
+                hedge_servers = [selected_server] + [s for s in available_servers if s != selected_server]
+                result = await self._execute_hedged(hedge_servers, tool_name, arguments, timeout, budget_limited)
+                selected_server = result.server_name or selected_server
+            else:
+                result = await self._execute_on_server(
+                    selected_server,
+                    tool_name,
+                    arguments,
+                    timeout,
+                    budget_limited
+                )
 
             # Calculate execution time
             execution_time = (datetime.now() - start_time).total_seconds() * 1000
 
             # Cache result if successful
             if result.success and self._enable_caching:
-                self._cache_result(tool_name, arguments, result.result, selected_server, cache_ttl)
+                self._cache_result(tool_name, cache_arguments, result.result, selected_server, cache_ttl, server_name)
 
-            # Record usage statistics
+            # Record usage statistics and the call outcome (drives availability tracking)
             self.discovery.record_tool_usage(tool_name, execution_time)
+            self.discovery.record_tool_outcome(
+                tool_name,
+                result.success,
+                execution_time,
+                result.error_message,
+                server_name=selected_server
+            )
 
             # Update result with execution time
             result.execution_time_ms = execution_time
@@ -206,7 +367,8 @@ class MCPUnifiedToolRegistry:
         Args:
             tool_requests: List of tool requests with 'name' and 'arguments' keys
             parallel: Execute in parallel or sequentially
-            max_concurrent: Maximum concurrent executions
+            max_concurrent: Maximum concurrent executions for the whole batch;
+                each server is additionally bounded by its adaptive concurrency limit
 
         Returns:
             List of ToolExecutionResult objects
@@ -277,10 +439,11 @@ class MCPUnifiedToolRegistry:
         arguments: Dict[str, Any],
         result: Any,
         server_name: str,
-        ttl: Optional[int]
+        ttl: Optional[int],
+        requested_server: Optional[str] = None
     ):
-        """Cache tool execution result."""
-        cache_key = self._make_cache_key(tool_name, arguments, server_name)
+        """Cache tool execution result under the server the caller asked for (None = any)."""
+        cache_key = self._make_cache_key(tool_name, arguments, requested_server)
         args_hash = self._hash_arguments(arguments)
 
         cached_result = CachedResult(
@@ -417,52 +580,240 @@ class MCPUnifiedToolRegistry:
         server_name: str,
         tool_name: str,
         arguments: Dict[str, Any],
-        timeout: Optional[float]
+        timeout: Optional[float],
+        budget_limited: bool = False
     ) -> ToolExecutionResult:
-        """Execute tool on a specific server."""
+        """
+        Execute tool on a specific server.
+
+        When `budget_limited`, the timeout comes from the request deadline; running
+        out of it is not held against the server's breakers.
+        """
+        client = self.registry.get_server_by_name(server_name)
+        if not client:
+            return ToolExecutionResult(
+                success=False,
+                error_message=f"Server {server_name} not available",
+                server_name=server_name
+            )
+
+        breakers = self._acquire_breakers(server_name, tool_name)
+        if breakers is None:
+            return ToolExecutionResult(
+                success=False,
+                error_message=f"Circuit open for tool {tool_name} on server {server_name}",
+                server_name=server_name
+            )
+
+        limiter = self._get_concurrency_limiter(server_name)
         try:
-            client = self.registry.get_server_by_name(server_name)
-            if not client:
-                return ToolExecutionResult(
-                    success=False,
-                    error_message=f"Server {server_name} not available",
-                    server_name=server_name
-                )
+            acquired = await limiter.acquire() if limiter else True
+        except asyncio.CancelledError:
+            for breaker in breakers:
+                breaker.release()
+            raise
+
+        if not acquired:
+            for breaker in breakers:
+                breaker.release()
+            return ToolExecutionResult(
+                success=False,
+                error_message=(
+                    f"Server {server_name} is overloaded: concurrency limit of {limiter.limit} reached "
+                    f"and {limiter.queued} calls already queued"
+                ),
+                server_name=server_name
+            )
 
+        start = time.monotonic()
+        result: Optional[ToolExecutionResult] = None
+        timed_out = False
+        try:
             # Execute with timeout if specified
             if timeout:
-                result = await asyncio.wait_for(
+                raw_result = await asyncio.wait_for(
                     client.call_tool(tool_name, arguments),
                     timeout=timeout
                 )
             else:
-                result = await client.call_tool(tool_name, arguments)
+                raw_result = await client.call_tool(tool_name, arguments)
 
-            if result is not None:
-                return ToolExecutionResult(
+            if raw_result is not None:
+                result = ToolExecutionResult(
                     success=True,
-                    result=result,
+                    result=raw_result,
                     server_name=server_name
                 )
             else:
-                return ToolExecutionResult(
+                result = ToolExecutionResult(
                     success=False,
                     error_message="Tool returned None result",
                     server_name=server_name
                 )
 
         except asyncio.TimeoutError:
-            return ToolExecutionResult(
+            timed_out = True
+            result = ToolExecutionResult(
                 success=False,
-                error_message=f"Tool execution timed out after {timeout}s",
+                error_message=(
+                    "Cancelled: request deadline exceeded" if budget_limited
+                    else f"Tool execution timed out after {timeout}s"
+                ),
                 server_name=server_name
             )
         except Exception as e:
-            return ToolExecutionResult(
+            result = ToolExecutionResult(
                 success=False,
                 error_message=str(e),
                 server_name=server_name
             )
+        finally:
+            latency_ms = (time.monotonic() - start) * 1000
+            outcome = None if timed_out and budget_limited else result
+            self._record_call_outcome(breakers, server_name, tool_name, outcome, latency_ms)
+            if limiter:
+                limiter.release(latency_ms if outcome is not None else None, dropped=timed_out and not budget_limited)
+
+        return result
+
+    # Circuit breaker and hedging helpers
+
+    def _get_server_breaker(self, server_name: str) -> CircuitBreaker:
+        breaker = self._server_breakers.get(server_name)
+        if breaker is None:
+            breaker = CircuitBreaker(server_name, self._server_breaker_config)
+            self._server_breakers[server_name] = breaker
+        return breaker
+
+    def _get_tool_breaker(self, server_name: str, tool_name: str) -> CircuitBreaker:
+        key = f"{server_name}:{tool_name}"
+        breaker = self._tool_breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, self._tool_breaker_config)
+            self._tool_breakers[key] = breaker
+        return breaker
+
+    def _get_concurrency_limiter(self, server_name: str) -> Optional[AdaptiveConcurrencyLimiter]:
+        if not self._enable_concurrency_limits:
+            return None
+        limiter = self._concurrency_limiters.get(server_name)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(server_name, self._concurrency_config)
+            self._concurrency_limiters[server_name] = limiter
+        return limiter
+
+    def _get_latency_tracker(self, server_name: str, tool_name: str) -> LatencyTracker:
+        key = f"{server_name}:{tool_name}"
+        tracker = self._latency_trackers.get(key)
+        if tracker is None:
+            tracker = LatencyTracker()
+            self._latency_trackers[key] = tracker
+        return tracker
+
+    def _is_circuit_closed(self, server_name: str, tool_name: str) -> bool:
+        """Check whether both the server and tool breakers would permit a call."""
+        if not self._enable_circuit_breakers:
+            return True
+        return (self._get_server_breaker(server_name).is_call_permitted() and
+                self._get_tool_breaker(server_name, tool_name).is_call_permitted())
+
+    def _acquire_breakers(self, server_name: str, tool_name: str) -> Optional[List[CircuitBreaker]]:
+        """Reserve permission on the server and tool breakers, or None if rejected."""
+        if not self._enable_circuit_breakers:
+            return []
+
+        server_breaker = self._get_server_breaker(server_name)
+        tool_breaker = self._get_tool_breaker(server_name, tool_name)
+
+        if not server_breaker.allow_request():
+            return None
+        if not tool_breaker.allow_request():
+            server_breaker.release()
+            return None
+        return [server_breaker, tool_breaker]
+
+    def _record_call_outcome(
+        self,
+        breakers: List[CircuitBreaker],
+        server_name: str,
+        tool_name: str,
+        result: Optional[ToolExecutionResult],
+        latency_ms: float
+    ):
+        """Feed a call outcome into breakers and latency tracking."""
+        if result is None:
+            # Cancelled (e.g. losing hedge) - give back any reserved trial slot
+            for breaker in breakers:
+                breaker.release()
+            return
+
+        if result.success:
+            self._get_latency_tracker(server_name, tool_name).record(latency_ms)
+            for breaker in breakers:
+                breaker.record_success(latency_ms)
+        else:
+            for breaker in breakers:
+                breaker.record_failure(latency_ms)
+
+    def _is_idempotent_tool(self, tool_name: str) -> bool:
+        """Check whether a tool is safe to call more than once."""
+        if self._idempotent_tools:
+            return tool_name in self._idempotent_tools
+        return tool_name.split(".")[-1].startswith(self._idempotent_prefixes)
+
+    def _should_hedge(self, tool_name: str, available_servers: List[str]) -> bool:
+        return (self._enable_hedging and
+                len(available_servers) > 1 and
+                self._is_idempotent_tool(tool_name))
+
+    def _hedge_delay_seconds(self, server_name: str, tool_name: str) -> float:
+        """Delay before hedging: observed latency percentile, or the default until warmed up."""
+        tracker = self._get_latency_tracker(server_name, tool_name)
+        if tracker.count >= self._hedge_min_samples:
+            delay_ms = tracker.percentile(self._hedge_percentile)
+        else:
+            delay_ms = self._hedge_default_delay_ms
+        return delay_ms / 1000.0
+
+    async def _execute_hedged(
+        self,
+        servers: List[str],
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float],
+        budget_limited: bool = False
+    ) -> ToolExecutionResult:
+        """Execute on the first server and hedge to the next one if it is slow."""
+        primary = asyncio.create_task(
+            self._execute_on_server(servers[0], tool_name, arguments, timeout, budget_limited)
+        )
+        delay = self._hedge_delay_seconds(servers[0], tool_name)
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        self._hedge_stats["launched"] += 1
+        self.logger.debug(f"Hedging {tool_name} to {servers[1]} after {delay * 1000:.0f}ms")
+        hedge = asyncio.create_task(
+            self._execute_on_server(servers[1], tool_name, arguments, timeout, budget_limited)
+        )
+
+        pending = {primary, hedge}
+        result: Optional[ToolExecutionResult] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result.success:
+                        if task is hedge:
+                            self._hedge_stats["won"] += 1
+                        return result
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
 
     # Resource and Prompt methods
 
@@ -564,7 +915,24 @@ class MCPUnifiedToolRegistry:
             },
             "execution": {
                 "strategy": self._execution_strategy.value,
-                "filters_count": len(self._tool_filters)
+                "filters_count": len(self._tool_filters),
+                "argument_validation": self._enable_argument_validation,
+                "rejected_calls": self._rejected_calls
+            },
+            "circuit_breakers": {
+                "enabled": self._enable_circuit_breakers,
+                "servers": {name: b.get_stats() for name, b in self._server_breakers.items()},
+                "tools": {name: b.get_stats() for name, b in self._tool_breakers.items()}
+            },
+            "concurrency": {
+                "enabled": self._enable_concurrency_limits,
+                "servers": {name: l.get_stats() for name, l in self._concurrency_limiters.items()}
+            },
+            "hedging": {
+                "enabled": self._enable_hedging,
+                "percentile": self._hedge_percentile,
+                "launched": self._hedge_stats["launched"],
+                "won": self._hedge_stats["won"]
             }
         }
 
@@ -0,0 +1,266 @@
+"""
+SQLite-backed storage for batch jobs and their files.
+
+Batch input and output files are kept as JSONL files in the storage
+directory; batch state and per-request progress live in a SQLite database
+next to them, so jobs survive restarts and resume where they stopped.
+"""
+import asyncio
+import json
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    purpose TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    input_file_id TEXT NOT NULL,
+    completion_window TEXT NOT NULL,
+    output_file_id TEXT,
+    error_file_id TEXT,
+    errors TEXT,
+    metadata TEXT,
+    created_at INTEGER NOT NULL,
+    in_progress_at INTEGER,
+    finalizing_at INTEGER,
+    completed_at INTEGER,
+    failed_at INTEGER,
+    cancelling_at INTEGER,
+    cancelled_at INTEGER
+);
+CREATE TABLE IF NOT EXISTS batch_requests (
+    batch_id TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    custom_id TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    status_code INTEGER,
+    response TEXT,
+    error TEXT,
+    PRIMARY KEY (batch_id, line)
+);
+CREATE INDEX IF NOT EXISTS batch_requests_status ON batch_requests (batch_id, status);
+"""
+
+# Batch states that still have work to do
+ACTIVE_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+
+
+class BatchRepository:
+    """Persists batches, batch requests and files."""
+
+    def __init__(self, storage_dir: str):
+        self.storage_dir = Path(storage_dir)
+        self.files_dir = self.storage_dir / "files"
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.storage_dir / "batches.db", check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+        self._lock = asyncio.Lock()
+
+    async def _run(self, function, *args):
+        """Run a database operation in a worker thread, one at a time."""
+        async with self._lock:
+            return await asyncio.to_thread(function, *args)
+
+    def close(self):
+        self._db.close()
+
+    # Files
+
+    def file_path(self, file_id: str) -> Path:
+        return self.files_dir / f"{file_id}.jsonl"
+
+    async def create_file(self, content: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex}"
+        await asyncio.to_thread(self.file_path(file_id).write_bytes, content)
+        record = {"id": file_id, "purpose": purpose, "filename": filename, "bytes": len(content), "created_at": int(time.time())}
+
+        def insert():
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO files (id, purpose, filename, bytes, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (file_id, purpose, filename, len(content), record["created_at"])
+                )
+
+        await self._run(insert)
+        return record
+
+    async def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        def select():
+            row = self._db.execute("SELECT * FROM files WHERE id = ?", (file_id,)).fetchone()
+            return dict(row) if row else None
+
+        return await self._run(select)
+
+    async def read_file(self, file_id: str) -> bytes:
+        return await asyncio.to_thread(self.file_path(file_id).read_bytes)
+
+    # Batches
+
+    async def create_batch(
+        self,
+        input_file_id: str,
+        endpoint: str,
+        completion_window: str,
+        requests: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex}"
+
+        def insert():
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO batches (id, status, endpoint, input_file_id, completion_window, metadata, created_at) "
+                    "VALUES (?, 'validating', ?, ?, ?, ?, ?)",
+                    (batch_id, endpoint, input_file_id, completion_window, json.dumps(metadata or {}), int(time.time()))
+                )
+                self._db.executemany(
+                    "INSERT INTO batch_requests (batch_id, line, custom_id, body) VALUES (?, ?, ?, ?)",
+                    [(batch_id, i, request["custom_id"], json.dumps(request["body"])) for i, request in enumerate(requests)]
+                )
+
+        await self._run(insert)
+        return batch_id
+
+    async def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        def select():
+            row = self._db.execute("SELECT * FROM batches WHERE id = ?", (batch_id,)).fetchone()
+            if row is None:
+                return None
+            counts = self._db.execute(
+                "SELECT status, COUNT(*) AS count FROM batch_requests WHERE batch_id = ? GROUP BY status", (batch_id,)
+            ).fetchall()
+            return _batch_object(row, {count["status"]: count["count"] for count in counts})
+
+        return await self._run(select)
+
+    async def list_batches(self, limit: int = 20, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        def select():
+            query = "SELECT id FROM batches"
+            params: tuple = ()
+            if after:
+                # Row-value comparison matching the sort order, so batches created in the same second are not skipped
+                query += " WHERE (created_at, id) < (SELECT created_at, id FROM batches WHERE id = ?)"
+                params = (after,)
+            query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+            return [row["id"] for row in self._db.execute(query, params + (limit,)).fetchall()]
+
+        batch_ids = await self._run(select)
+        return [await self.get_batch(batch_id) for batch_id in batch_ids]
+
+    async def active_batch_ids(self) -> List[str]:
+        def select():
+            placeholders = ",".join("?" for _ in ACTIVE_STATUSES)
+            rows = self._db.execute(
+                f"SELECT id FROM batches WHERE status IN ({placeholders}) ORDER BY created_at", ACTIVE_STATUSES
+            ).fetchall()
+            return [row["id"] for row in rows]
+
+        return await self._run(select)
+
+    async def set_status(self, batch_id: str, status: str, **fields: Any):
+        """Update a batch's status, stamping `<status>_at` and any extra columns."""
+        columns = {"status": status, f"{status}_at": int(time.time()), **fields}
+
+        def update():
+            with self._db:
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                self._db.execute(f"UPDATE batches SET {assignments} WHERE id = ?", (*columns.values(), batch_id))
+
+        await self._run(update)
+
+    # Batch requests
+
+    async def reset_running_requests(self, batch_id: str):
+        """Return requests interrupted by a restart to the queue."""
+        def update():
+            with self._db:
+                self._db.execute(
+                    "UPDATE batch_requests SET status = 'pending' WHERE batch_id = ? AND status = 'running'", (batch_id,)
+                )
+
+        await self._run(update)
+
+    async def pending_requests(self, batch_id: str) -> List[Dict[str, Any]]:
+        def select():
+            rows = self._db.execute(
+                "SELECT line, custom_id, body FROM batch_requests WHERE batch_id = ? AND status = 'pending' ORDER BY line",
+                (batch_id,)
+            ).fetchall()
+            return [{"line": row["line"], "custom_id": row["custom_id"], "body": json.loads(row["body"])} for row in rows]
+
+        return await self._run(select)
+
+    async def mark_request(
+        self,
+        batch_id: str,
+        line: int,
+        status: str,
+        status_code: Optional[int] = None,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[Dict[str, Any]] = None
+    ):
+        def update():
+            with self._db:
+                self._db.execute(
+                    "UPDATE batch_requests SET status = ?, status_code = ?, response = ?, error = ? "
+                    "WHERE batch_id = ? AND line = ?",
+                    (
+                        status, status_code,
+                        json.dumps(response) if response is not None else None,
+                        json.dumps(error) if error is not None else None,
+                        batch_id, line
+                    )
+                )
+
+        await self._run(update)
+
+    async def finished_requests(self, batch_id: str) -> List[Dict[str, Any]]:
+        def select():
+            rows = self._db.execute(
+                "SELECT line, custom_id, status, status_code, response, error FROM batch_requests "
+                "WHERE batch_id = ? AND status IN ('completed', 'failed') ORDER BY line",
+                (batch_id,)
+            ).fetchall()
+            return [
+                {
+                    "line": row["line"],
+                    "custom_id": row["custom_id"],
+                    "status": row["status"],
+                    "status_code": row["status_code"],
+                    "response": json.loads(row["response"]) if row["response"] else None,
+                    "error": json.loads(row["error"]) if row["error"] else None
+                }
+                for row in rows
+            ]
+
+        return await self._run(select)
+
+
+def _batch_object(row: sqlite3.Row, counts: Dict[str, int]) -> Dict[str, Any]:
+    """Format a batch row as an OpenAI batch object."""
+    batch = dict(row)
+    errors = json.loads(batch.pop("errors")) if batch["errors"] else None
+    batch.update({
+        "object": "batch",
+        "errors": {"object": "list", "data": errors} if errors else None,
+        "metadata": json.loads(batch["metadata"]) if batch["metadata"] else {},
+        "request_counts": {
+            "total": sum(counts.values()),
+            "completed": counts.get("completed", 0),
+            "failed": counts.get("failed", 0)
+        }
+    })
+    return batch
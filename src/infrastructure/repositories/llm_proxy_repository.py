@@ -6,29 +6,24 @@ import httpx
 from google.adk.agents import LlmAgent
 from google.adk.tools import ToolContext
 from src.infrastructure.config.config import config
+from src.infrastructure.llm.connection_manager import provider_connections
 
 logger = logging.getLogger(__name__)
 
 class StreamingProxy:
     """Handles streaming proxy operations to OpenAI API."""
 
-    def __init__(self):
-        self.client = None
-
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(
-                timeout=httpx.Timeout(60.0),
-                headers={"Authorization": f"Bearer {config.OPENAI_API_KEY}"}
-            )
-        return self.client
+        """Get the shared upstream HTTP client."""
+        return await provider_connections.get_client()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Auth headers, read per request so key changes take effect."""
+        return {"Authorization": f"Bearer {config.OPENAI_API_KEY}"}
 
     async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
-            self.client = None
+        """Nothing to close: the shared upstream HTTP client is closed at app shutdown."""
 
 # Global proxy instance
 streaming_proxy = StreamingProxy()
@@ -55,7 +50,8 @@ async def forward_to_openai(request_data: Dict[str, Any]) -> Dict[str, Any]:
             # Non-streaming request
             response = await client.post(
                 f"{config.OPENAI_BASE_URL}/chat/completions",
-                json=request_data
+                json=request_data,
+                headers=streaming_proxy.headers
             )
 
             if response.status_code == 200:
@@ -102,7 +98,8 @@ async def stream_from_openai(request_data: Dict[str, Any]) -> AsyncGenerator[Dic
         async with client.stream(
             "POST",
             f"{config.OPENAI_BASE_URL}/chat/completions",
-            json=request_data
+            json=request_data,
+            headers=streaming_proxy.headers
         ) as response:
 
             if response.status_code != 200:
@@ -0,0 +1,79 @@
+"""
+OpenAI-compatible files and batches endpoints.
+"""
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from src.application.services.batch_service import BatchService, BatchValidationError
+
+
+class CreateBatchRequest(BaseModel):
+    input_file_id: str
+    endpoint: str
+    completion_window: str = "24h"
+    metadata: Optional[Dict[str, Any]] = None
+
+
+def create_batch_router(batch_service: BatchService) -> APIRouter:
+    """Build the /v1/files and /v1/batches routes for a batch service."""
+    router = APIRouter()
+
+    @router.post("/v1/files")
+    async def upload_file(file: UploadFile = File(...), purpose: str = Form(...)):
+        try:
+            return await batch_service.create_file(await file.read(), file.filename or "upload.jsonl", purpose)
+        except BatchValidationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @router.get("/v1/files/{file_id}")
+    async def get_file(file_id: str):
+        file = await batch_service.get_file(file_id)
+        if file is None:
+            raise HTTPException(status_code=404, detail=f"No such file: {file_id}")
+        return file
+
+    @router.get("/v1/files/{file_id}/content")
+    async def get_file_content(file_id: str):
+        content = await batch_service.get_file_content(file_id)
+        if content is None:
+            raise HTTPException(status_code=404, detail=f"No such file: {file_id}")
+        return Response(content=content, media_type="application/jsonl")
+
+    @router.post("/v1/batches")
+    async def create_batch(request: CreateBatchRequest):
+        try:
+            return await batch_service.create_batch(
+                request.input_file_id, request.endpoint, request.completion_window, request.metadata
+            )
+        except BatchValidationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @router.get("/v1/batches")
+    async def list_batches(limit: int = 20, after: Optional[str] = None):
+        batches = await batch_service.list_batches(limit, after)
+        return {
+            "object": "list",
+            "data": batches,
+            "first_id": batches[0]["id"] if batches else None,
+            "last_id": batches[-1]["id"] if batches else None,
+            "has_more": len(batches) == limit
+        }
+
+    @router.get("/v1/batches/{batch_id}")
+    async def get_batch(batch_id: str):
+        batch = await batch_service.get_batch(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail=f"No such batch: {batch_id}")
+        return batch
+
+    @router.post("/v1/batches/{batch_id}/cancel")
+    async def cancel_batch(batch_id: str):
+        batch = await batch_service.cancel_batch(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail=f"No such batch: {batch_id}")
+        return batch
+
+    return router
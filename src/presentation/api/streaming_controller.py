@@ -6,14 +6,16 @@ Pipeline: preprocessing → reasoning → LLM → postprocessing with orchestrat
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import os
 import time
-from typing import Dict, List, Any, Optional, AsyncGenerator
+import uuid
+from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple, Union
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 import uvicorn
@@ -25,38 +27,85 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.infrastructure.config.config import config
-import httpx
 from src.infrastructure.agents.adk_wrapper import execute_postprocessing_agent
 from src.infrastructure.mcp import mcp_registry
+from src.application.services.batch_service import BatchConfig, BatchService
+from src.application.services.rate_limiting import (
+    AdmissionConfig, AdmissionController, AdmissionTicket, RateLimitExceeded, RequestPriority
+)
+from src.application.services.request_coalescer import RequestCoalescer, RequestCoalescerConfig
+from src.application.services.response_cache_service import ResponseCacheConfig, ResponseCacheService
+from src.application.services.stream_pacing import pace_reasoning_steps
+from src.infrastructure.llm.connection_manager import provider_connections
+from src.infrastructure.mcp.deadline import deadline_scope
+from src.infrastructure.logging.structured_logger import (
+    LoggingConfig, StructuredLogging, bind_request_context, reset_request_context
+)
+from src.infrastructure.llm.providers import ProviderError, ProviderRegistry
+from src.infrastructure.llm.router import ModelRouter, RouterConfig
+from src.infrastructure.llm.sse import SSEPassthroughParser, extract_delta_content
 from src.domain.services.content_filter_service import filter_messages_for_llm
+from src.presentation.api.batch_controller import create_batch_router
+
+# Provider adapters sharing one upstream connection pool
+provider_registry = ProviderRegistry(config, provider_connections)
+
+# Routes requests by model to weighted provider endpoints
+model_router = ModelRouter(
+    provider_registry,
+    config.current_provider,
+    RouterConfig(
+        failure_cooldown_seconds=config.ROUTING_FAILURE_COOLDOWN,
+        max_attempts=config.ROUTING_MAX_ATTEMPTS,
+        routes=config.MODEL_ROUTES
+    )
+)
 
-# Global HTTP client
-http_client = None
+# Opt-in cache of completed responses, replayed as SSE on hits
+response_cache = ResponseCacheService(ResponseCacheConfig(
+    enabled=config.RESPONSE_CACHE_ENABLED,
+    semantic_enabled=config.RESPONSE_CACHE_SEMANTIC,
+    similarity_threshold=config.RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+    default_ttl_seconds=config.RESPONSE_CACHE_TTL_SECONDS,
+    model_ttl_seconds=config.RESPONSE_CACHE_MODEL_TTLS,
+    max_memory_bytes=int(config.RESPONSE_CACHE_MAX_MEMORY_MB * 1024 * 1024)
+))
+
+# Opt-in single-flight streaming for identical deterministic requests
+request_coalescer = RequestCoalescer(RequestCoalescerConfig(enabled=config.REQUEST_COALESCING_ENABLED))
+
+# Opt-in per-API-key rate limits and prioritized execution slots
+admission_controller = AdmissionController(AdmissionConfig(
+    enabled=config.ADMISSION_ENABLED,
+    requests_per_minute=config.ADMISSION_REQUESTS_PER_MINUTE,
+    tokens_per_minute=config.ADMISSION_TOKENS_PER_MINUTE,
+    max_concurrent_requests=config.ADMISSION_MAX_CONCURRENT,
+    max_queue_size=config.ADMISSION_MAX_QUEUE_SIZE,
+    max_queue_wait_seconds=config.ADMISSION_MAX_QUEUE_WAIT
+))
+
+# Background tasks started at startup
+_mcp_connect_task: Optional[asyncio.Task] = None
+_prewarm_task: Optional[asyncio.Task] = None
 
 async def get_http_client():
-    global http_client
-    if http_client is None:
-        headers = {}
-        if config.current_provider == "openai" and config.current_api_key:
-            headers["Authorization"] = f"Bearer {config.current_api_key}"
-
-        http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(60.0),
-            headers=headers
-        )
-    return http_client
+    """Get the shared pooled HTTP client for upstream providers."""
+    return await provider_connections.get_client()
 
 async def cleanup_http_client():
-    global http_client
-    if http_client:
-        await http_client.aclose()
-        http_client = None
+    await model_router.close()
+    await provider_registry.close_all()
+    await provider_connections.close()
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.LOG_LEVEL.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+structured_logging = StructuredLogging(LoggingConfig(
+    level=config.LOG_LEVEL,
+    format=config.LOG_FORMAT,
+    async_output=config.LOG_ASYNC,
+    access_log_sample_rate=config.LOG_ACCESS_SAMPLE_RATE
+))
+structured_logging.configure()
+atexit.register(structured_logging.stop)
 logger = logging.getLogger(__name__)
 
 # Check for DEBUG environment variable
@@ -129,11 +178,11 @@ async def initialize_mcp_servers():
 
         logger.info(f"📋 Found {len(enabled_servers)} enabled MCP server(s)")
 
-        # Register all servers
+        # Register all servers; connections are opened in parallel below
         registration_results = []
         for server_config in enabled_servers:
             try:
-                success = await mcp_registry.register_server(server_config)
+                success = await mcp_registry.register_server(server_config, connect=False)
                 registration_results.append((server_config.name, success))
                 if success:
                     logger.info(f"✅ MCP server '{server_config.name}' registered successfully")
@@ -143,6 +192,17 @@ async def initialize_mcp_servers():
                 logger.error(f"❌ Error registering MCP server '{server_config.name}': {e}")
                 registration_results.append((server_config.name, False))
 
+        # Connect in the background so the proxy serves requests while servers spawn
+        global _mcp_connect_task
+        _mcp_connect_task = asyncio.create_task(connect_mcp_servers())
+
+    except Exception as e:
+        logger.error(f"❌ Error initializing MCP servers: {e}")
+        # Don't raise - allow server to start even if MCP fails
+
+async def connect_mcp_servers():
+    """Connect registered MCP servers in parallel and log their status."""
+    try:
         # Connect to all servers
         logger.info("🔗 Connecting to MCP servers...")
         await mcp_registry.connect_all()
@@ -169,9 +229,10 @@ async def initialize_mcp_servers():
         # Test specific server access
         await test_server_access()
 
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
-        logger.error(f"❌ Error initializing MCP servers: {e}")
-        # Don't raise - allow server to start even if MCP fails
+        logger.error(f"❌ Error connecting MCP servers: {e}")
 
 async def test_server_access():
     """Test access to specific MCP servers like YouTrack and GitLab."""
@@ -220,12 +281,12 @@ async def test_server_access():
 # Add request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all requests for debugging."""
-    logger.debug("ADK log_requests")
+    """Bind the request context for log records and write a sampled access log line."""
+    started = time.perf_counter()
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex[:16]
+    context_token = bind_request_context(request_id=request_id, method=request.method, path=request.url.path)
 
     try:
-        logger.info(f"🤖 ADK {request.method} {request.url.path} from {request.client}")
-
         if DEBUG_MODE:
             logger.debug("=" * 60)
             logger.debug(f"🔍 ADK DETAILED REQUEST DEBUG:")
@@ -240,16 +301,14 @@ async def log_requests(request: Request, call_next):
             logger.debug("=" * 60)
 
         response = await call_next(request)
-
-        if DEBUG_MODE:
-            logger.debug(f"🤖 ADK Response: {response.status_code}")
-        else:
-            logger.info(f"🤖 ADK Response: {response.status_code}")
-
+        response.headers["X-Request-ID"] = request_id
+        structured_logging.log_access(logger, request.method, request.url.path, response.status_code, started)
         return response
     except Exception as e:
-        logger.error(f"❌ ADK Request failed: {e}")
+        logger.error("❌ ADK Request failed: %s", e)
         raise
+    finally:
+        reset_request_context(context_token)
 
 @app.on_event("startup")
 async def startup():
@@ -267,6 +326,14 @@ async def startup():
             logger.info(f"🔑 OpenAI API key: {config.OPENAI_API_KEY[:10]}...")
         logger.info(f"🌐 Server: {config.HOST}:{config.PORT}")
 
+        # Open upstream connections in the background so startup is not delayed
+        if provider_connections.config.prewarm:
+            global _prewarm_task
+            _prewarm_task = asyncio.create_task(provider_connections.prewarm(model_router.get_base_urls()))
+
+        # Resume queued batches and pick up new ones
+        batch_service.start()
+
         # Initialize MCP servers
         await initialize_mcp_servers()
     except ValueError as e:
@@ -277,6 +344,13 @@ async def startup():
 async def shutdown():
     logger.info("🛑 Shutting down ADK Server...")
 
+    # Stop connecting MCP servers if startup is still in progress
+    if _mcp_connect_task and not _mcp_connect_task.done():
+        _mcp_connect_task.cancel()
+    if _prewarm_task and not _prewarm_task.done():
+        _prewarm_task.cancel()
+    await batch_service.stop()
+
     # Shutdown MCP servers with timeout
     try:
         import asyncio
@@ -306,15 +380,16 @@ async def root():
         "version": "2.0.0-streaming",
         "provider": config.current_provider,
         "model": config.current_model,
-        "mode": "streaming_only",
-        "endpoints": ["/v1/chat/completions", "/health", "/v1/models"],
-        "features": ["OpenAI Compatible", "Streaming Only", "ADK Orchestrator", "Agent Pipeline", "Intelligent Processing"],
+        "mode": "streaming_and_non_streaming",
+        "endpoints": ["/v1/chat/completions", "/v1/batches", "/v1/files", "/health", "/v1/models", "/metrics"],
+        "features": ["OpenAI Compatible", "Streaming and Non-Streaming", "ADK Orchestrator", "Agent Pipeline", "Intelligent Processing"],
         "pipeline": "preprocessing_agent → streaming_provider → postprocessing_agent",
         "orchestrator": "llm_proxy_orchestrator"
     }
 
 @app.get("/health")
 async def health_check():
+    from src.domain.services.reasoning_service_impl import reasoning_fast_path
     return {
         "status": "healthy",
         "timestamp": time.time(),
@@ -327,13 +402,191 @@ async def health_check():
             "ollama_configured": config.current_provider == "ollama",
             "context_injection": config.ENABLE_CONTEXT_INJECTION,
             "analytics": config.ENABLE_RESPONSE_ANALYTICS
-        }
+        },
+        "response_cache": response_cache.get_stats(),
+        "request_coalescing": request_coalescer.get_stats(),
+        "admission": admission_controller.get_stats(),
+        "logging": structured_logging.get_stats(),
+        "reasoning_fast_path": reasoning_fast_path.get_stats(),
+        "upstream_connections": provider_connections.get_stats()
     }
 
-# Non-streaming processing removed - ADK server is streaming-focused only
+async def _postprocess_streamed_content(content_parts: List[str], metadata_result: Dict[str, Any]):
+    """Run orchestrator postprocessing on the content collected from a stream."""
+    if not content_parts:
+        return
 
-async def stream_chat_completion_adk(request_data: Dict[str, Any]) -> AsyncGenerator[str, None]:
-    """Handle streaming chat completion orchestrated by ADK orchestrator."""
+    full_content = "".join(content_parts)
+    logger.debug("🤖 Orchestrator Step 4: Postprocessing through orchestrator")
+
+    # Create postprocessing input for orchestrator
+    postprocessing_orchestrator_input = {
+        "content": full_content,
+        "request_metadata": metadata_result.get("metadata", {}),
+        "provider": config.current_provider,
+        "model": config.current_model,
+        "orchestrator_context": "streaming_postprocessing"
+    }
+
+    # Execute postprocessing through orchestrator
+    # Since orchestrator already completed full pipeline, this is additional postprocessing
+    logger.debug("🤖 Orchestrator executing postprocessing phase")
+    postprocessing_orchestrator_result = await execute_postprocessing_agent(postprocessing_orchestrator_input)
+
+    logger.debug(
+        "🤖 ADK Orchestrator postprocessing phase completed: %s", postprocessing_orchestrator_result.get("agent_name", "unknown")
+    )
+    logger.debug("🤖 ADK Orchestrator completed full streaming pipeline - Content length: %d", len(full_content))
+
+def _filter_request_for_llm(processed_request: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove reasoning and analysis content from the messages sent upstream."""
+    filtered_request = processed_request.copy()
+    if "messages" in filtered_request:
+        original_messages = filtered_request["messages"]
+        filtered_messages = filter_messages_for_llm(original_messages)
+        filtered_request["messages"] = filtered_messages
+        logger.debug("🔧 Filtered messages for LLM: %d → %d", len(original_messages), len(filtered_messages))
+    return filtered_request
+
+def _error_response(status_code: int, message: str, error_type: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"error": {"message": message, "type": error_type}})
+
+async def complete_chat_completion_adk(request_data: Dict[str, Any], cache_tenant: str = "") -> JSONResponse:
+    """
+    Handle a non-streaming chat completion.
+
+    Runs the same preprocessing, reasoning and postprocessing as the streaming
+    path, but without streaming reasoning steps, and makes a single upstream
+    request through the pooled provider clients. The completion is cached for
+    `cache_tenant` only.
+    """
+    try:
+        from src.application.services.orchestration_service import llm_proxy_orchestrator_preprocessing_only
+        orchestrator_preprocessing_result = await llm_proxy_orchestrator_preprocessing_only({
+            "request_data": request_data,
+            "provider": config.current_provider,
+            "model": config.current_model,
+            "stream": False
+        }, None)
+
+        if orchestrator_preprocessing_result.get("status") != "success":
+            return _error_response(
+                500,
+                f"ADK Orchestrator preprocessing failed: {orchestrator_preprocessing_result.get('error', 'Unknown error')}",
+                "adk_orchestrator_error"
+            )
+
+        from src.domain.services.reasoning_service_impl import apply_reasoning_to_request
+        reasoning_request = orchestrator_preprocessing_result.get("processed_request", request_data.copy())
+        reasoning_result = await apply_reasoning_to_request(reasoning_request)
+
+        if reasoning_result.get("status") != "success":
+            return _error_response(
+                500, f"ADK Reasoning failed: {reasoning_result.get('error', 'Unknown error')}", "adk_reasoning_error"
+            )
+
+        processed_request = reasoning_result.get("enhanced_request", request_data.copy())
+        processed_request["stream"] = False
+        filtered_request = _filter_request_for_llm(processed_request)
+
+        if not model_router.has_route(filtered_request.get("model")):
+            return _error_response(
+                400, f"ADK Unsupported provider: {config.current_provider}", "adk_provider_error"
+            )
+
+        try:
+            completion = await model_router.chat_completion(filtered_request)
+        except ProviderError as e:
+            return _error_response(e.status_code or 502, f"ADK {e}", "adk_api_error")
+
+        choices = completion.get("choices") or [{}]
+        content = (choices[0].get("message") or {}).get("content") or ""
+        metadata_result = {"metadata": orchestrator_preprocessing_result.get("metadata", {})}
+        await _postprocess_streamed_content([content] if content else [], metadata_result)
+        response_cache.store(request_data, content, cache_tenant)
+
+        return JSONResponse(content=completion)
+
+    except Exception as e:
+        logger.error(f"❌ Error in ADK chat completion: {e}")
+        return _error_response(500, f"ADK error: {str(e)}", "adk_server_error")
+
+def _client_key(http_request: Request) -> str:
+    """Identify the caller for rate limiting: the API key if one was sent, else the client address."""
+    authorization = http_request.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        return authorization[7:].strip()
+    return http_request.headers.get("x-api-key") or (http_request.client.host if http_request.client else "anonymous")
+
+def _request_priority(http_request: Request) -> RequestPriority:
+    if http_request.headers.get("x-priority", "").lower() == "batch":
+        return RequestPriority.BATCH
+    return RequestPriority.INTERACTIVE
+
+def _rate_limited_response(e: RateLimitExceeded) -> JSONResponse:
+    response = _error_response(429, f"ADK {e}", "adk_rate_limit_error")
+    response.headers["Retry-After"] = str(max(1, int(e.retry_after + 0.999)))
+    return response
+
+class _SlotReleasingStreamingResponse(StreamingResponse):
+    """
+    Streaming response that releases its execution slot once the response is done.
+
+    Releasing around the whole ASGI call, not in the body iterator, also frees
+    the slot when the client leaves before the body is ever iterated.
+    """
+
+    def __init__(self, content: AsyncGenerator, ticket: Optional[AdmissionTicket], **kwargs):
+        super().__init__(content, **kwargs)
+        self.ticket = ticket
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self.ticket is not None:
+                self.ticket.release()
+
+async def _execute_batch_request(request_data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Run one batch request through the non-streaming pipeline."""
+    request_data["stream"] = False
+
+    # Batch work takes execution slots behind interactive requests
+    ticket = None
+    while admission_controller.config.enabled and ticket is None:
+        try:
+            ticket = await admission_controller.acquire_slot(RequestPriority.BATCH)
+        except RateLimitExceeded as e:
+            await asyncio.sleep(e.retry_after)
+
+    try:
+        response = await complete_chat_completion_adk(request_data)
+    finally:
+        if ticket is not None:
+            ticket.release()
+    return response.status_code, json.loads(response.body)
+
+def _batch_rate_limit_key(request_data: Dict[str, Any]) -> str:
+    """Batch requests are rate limited per provider of the model's primary endpoint."""
+    endpoints = model_router.get_endpoints(request_data.get("model"))
+    return endpoints[0].adapter.name if endpoints else config.current_provider
+
+# Queued batch completions, executed in the background at a bounded rate
+batch_service = BatchService(
+    BatchConfig(
+        storage_dir=config.BATCH_STORAGE_DIR,
+        max_concurrency=config.BATCH_MAX_CONCURRENCY,
+        requests_per_minute=config.BATCH_REQUESTS_PER_MINUTE,
+        provider_requests_per_minute=config.BATCH_PROVIDER_REQUESTS_PER_MINUTE
+    ),
+    _execute_batch_request,
+    _batch_rate_limit_key
+)
+
+async def stream_chat_completion_adk(
+    request_data: Dict[str, Any], cache_tenant: str = ""
+) -> AsyncGenerator[Union[str, bytes], None]:
+    """Handle streaming chat completion orchestrated by ADK orchestrator; the completion is cached for `cache_tenant` only."""
     try:
         logger.debug("🤖 ADK Streaming with Orchestrator")
 
@@ -368,20 +621,22 @@ async def stream_chat_completion_adk(request_data: Dict[str, Any]) -> AsyncGener
             yield "data: [DONE]\n\n"
             return
 
-        logger.info("🤖 ADK Orchestrator preprocessing completed")
+        logger.debug("🤖 ADK Orchestrator preprocessing completed")
 
         # Step 2: Reasoning phase with streaming updates
         logger.debug("🤖 Orchestrator Step 2: Reasoning with streaming updates")
-        from src.domain.services.reasoning_service_impl import reasoning_pipeline
+        from src.domain.services.reasoning_service_impl import new_reasoning_deadline, reasoning_pipeline
 
-        # Stream reasoning steps to the caller
+        # Stream reasoning steps to the caller; both reasoning passes share one budget
         reasoning_request = orchestrator_preprocessing_result.get("processed_request", request_data.copy())
-        async for reasoning_step in reasoning_pipeline(reasoning_request):
+        reasoning_deadline = new_reasoning_deadline()
+        async for reasoning_step in reasoning_pipeline(reasoning_request, deadline=reasoning_deadline):
             yield reasoning_step
 
         # Apply reasoning to get the enhanced request
         from src.domain.services.reasoning_service_impl import apply_reasoning_to_request
-        reasoning_result = await apply_reasoning_to_request(reasoning_request)
+        with deadline_scope(reasoning_deadline):
+            reasoning_result = await apply_reasoning_to_request(reasoning_request)
 
         if reasoning_result.get("status") != "success":
             error_chunk = {
@@ -394,7 +649,7 @@ async def stream_chat_completion_adk(request_data: Dict[str, Any]) -> AsyncGener
             yield "data: [DONE]\n\n"
             return
 
-        logger.info("🤖 ADK Orchestrator reasoning completed - request enhanced with intelligent context")
+        logger.debug("🤖 ADK Orchestrator reasoning completed - request enhanced with intelligent context")
 
         # Extract processed data from reasoning result
         processed_request = reasoning_result.get("enhanced_request", request_data.copy())
@@ -404,86 +659,12 @@ async def stream_chat_completion_adk(request_data: Dict[str, Any]) -> AsyncGener
         metadata_result = {"metadata": orchestrator_preprocessing_result.get("metadata", {})}
         reasoning_metadata = reasoning_result.get("reasoning_metadata", {})
 
-        logger.info("🤖 ADK Orchestrator guided streaming request preparation")
+        logger.debug("🤖 ADK Orchestrator guided streaming request preparation")
 
         # Filter reasoning and analysis content from messages before sending to LLM
-        filtered_request = processed_request.copy()
-        if "messages" in filtered_request:
-            original_messages = filtered_request["messages"]
-            filtered_messages = filter_messages_for_llm(original_messages)
-            filtered_request["messages"] = filtered_messages
-            logger.debug(f"🔧 Filtered messages for LLM: {len(original_messages)} → {len(filtered_messages)}")
+        filtered_request = _filter_request_for_llm(processed_request)
 
-        client = await get_http_client()
-        full_content = ""
-
-        logger.debug("🤖 ADK Streaming to provider")
-
-        if config.current_provider == "openai":
-            # Stream from OpenAI with ADK preprocessing (filtered request)
-            async with client.stream(
-                "POST",
-                f"{config.current_base_url}/chat/completions",
-                json=filtered_request
-            ) as response:
-
-                if response.status_code != 200:
-                    error_chunk = {
-                        "error": {
-                            "message": f"ADK OpenAI API error: {response.status_code}",
-                            "type": "adk_api_error"
-                        }
-                    }
-                    yield f"data: {json.dumps(error_chunk)}\n\n"
-                    yield "data: [DONE]\n\n"
-                    return
-
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:].strip()
-
-                        if data == "[DONE]":
-                            # Step 4: ADK Orchestrator Postprocessing Phase
-                            if full_content:
-                                logger.debug("🤖 Orchestrator Step 4: Postprocessing through orchestrator")
-
-                                # Create postprocessing input for orchestrator
-                                postprocessing_orchestrator_input = {
-                                    "content": full_content,
-                                    "request_metadata": metadata_result.get("metadata", {}),
-                                    "provider": config.current_provider,
-                                    "model": config.current_model,
-                                    "orchestrator_context": "streaming_postprocessing"
-                                }
-
-                                # Execute postprocessing through orchestrator
-                                # Since orchestrator already completed full pipeline, this is additional postprocessing
-                                logger.debug("🤖 Orchestrator executing postprocessing phase")
-                                postprocessing_orchestrator_result = await execute_postprocessing_agent(postprocessing_orchestrator_input)
-
-                                logger.info(f"🤖 ADK Orchestrator postprocessing phase completed: {postprocessing_orchestrator_result.get('agent_name', 'unknown')}")
-
-                                logger.info(f"🤖 ADK Orchestrator completed full streaming pipeline - Content length: {len(full_content)}")
-
-                            yield "data: [DONE]\n\n"
-                            break
-
-                        try:
-                            chunk_data = json.loads(data)
-
-                            # Extract content from chunk
-                            if "choices" in chunk_data and len(chunk_data["choices"]) > 0:
-                                choice = chunk_data["choices"][0]
-                                if "delta" in choice and "content" in choice["delta"]:
-                                    content = choice["delta"]["content"]
-                                    full_content += content
-
-                            yield f"data: {json.dumps(chunk_data)}\n\n"
-
-                        except json.JSONDecodeError:
-                            continue
-
-        else:
+        if not model_router.has_route(filtered_request.get("model")):
             error_chunk = {
                 "error": {
                     "message": f"ADK Unsupported provider for streaming: {config.current_provider}",
@@ -492,6 +673,44 @@ async def stream_chat_completion_adk(request_data: Dict[str, Any]) -> AsyncGener
             }
             yield f"data: {json.dumps(error_chunk)}\n\n"
             yield "data: [DONE]\n\n"
+            return
+
+        content_parts: List[str] = []
+
+        logger.debug("🤖 ADK Streaming to provider for model %s", filtered_request.get("model"))
+
+        try:
+            # Adapters emit OpenAI-format SSE; forward events unchanged and only extract delta text
+            parser = SSEPassthroughParser()
+            async for chunk in model_router.stream_chat_completion(filtered_request):
+                for event in parser.feed(chunk):
+                    if event.is_done:
+                        # Step 4: ADK Orchestrator Postprocessing Phase
+                        await _postprocess_streamed_content(content_parts, metadata_result)
+                        response_cache.store(request_data, "".join(content_parts), cache_tenant)
+                        yield "data: [DONE]\n\n"
+                        return
+
+                    if event.data is not None:
+                        content = extract_delta_content(event.data)
+                        if content:
+                            content_parts.append(content)
+
+                    yield event.raw
+
+            trailing_event = parser.flush()
+            if trailing_event is not None and not trailing_event.is_done:
+                yield trailing_event.raw
+
+        except ProviderError as e:
+            error_chunk = {
+                "error": {
+                    "message": f"ADK {e}",
+                    "type": "adk_api_error"
+                }
+            }
+            yield f"data: {json.dumps(error_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
 
     except Exception as e:
         logger.error(f"❌ Error in ADK streaming: {e}")
@@ -505,24 +724,67 @@ async def stream_chat_completion_adk(request_data: Dict[str, Any]) -> AsyncGener
         yield "data: [DONE]\n\n"
 
 @app.post("/v1/chat/completions")
-async def chat_completions(request: ChatCompletionRequest):
+async def chat_completions(request: ChatCompletionRequest, http_request: Request):
     """OpenAI-compatible chat completions endpoint using ADK agents."""
     logger.debug("🤖 ADK chat_completions")
     try:
         request_dict = request.dict(exclude_none=True)
-        logger.debug("🤖 ADK request_dict {}".format(request_dict))
-
-        # ADK server is STREAMING ONLY - no non-streaming support
-        logger.info("🤖 ADK STREAMING ONLY: Orchestrated intelligent processing")
-        return StreamingResponse(
-            stream_chat_completion_adk(request_dict),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Access-Control-Allow-Origin": "*"
-            }
-        )
+        logger.debug("🤖 ADK request_dict %s", request_dict)
+
+        client_key = _client_key(http_request)
+        cached_response = response_cache.lookup(request_dict, client_key)
+
+        # Cache hits never reach the pipeline, so only misses go through admission control
+        ticket = None
+        if cached_response is None:
+            try:
+                ticket = await admission_controller.admit(
+                    client_key, request_dict, _request_priority(http_request)
+                )
+            except RateLimitExceeded as e:
+                logger.warning("🚦 ADK Request rejected: %s", e)
+                return _rate_limited_response(e)
+
+        try:
+            if not request_dict.get("stream"):
+                logger.debug("🤖 ADK non-streaming completion")
+                if cached_response is not None:
+                    logger.info("🎯 ADK Response cache hit")
+                    return JSONResponse(content=response_cache.to_completion(cached_response, request_dict.get("model")))
+                try:
+                    return await complete_chat_completion_adk(request_dict, client_key)
+                finally:
+                    if ticket is not None:
+                        ticket.release()
+
+            if cached_response is not None:
+                logger.info("🎯 ADK Response cache hit - replaying cached completion")
+                stream = response_cache.replay(cached_response, request_dict.get("model"))
+            elif request_coalescer.should_coalesce(request_dict, http_request.headers):
+                stream = request_coalescer.stream(
+                    request_dict, lambda: stream_chat_completion_adk(request_dict, client_key), client_key
+                )
+            else:
+                stream = stream_chat_completion_adk(request_dict, client_key)
+            if cached_response is None and config.REASONING_STREAM_CADENCE_MS > 0:
+                stream = pace_reasoning_steps(stream, config.REASONING_STREAM_CADENCE_MS)
+
+            logger.debug("🤖 ADK streaming: Orchestrated intelligent processing")
+            return _SlotReleasingStreamingResponse(
+                stream,
+                ticket,
+                media_type="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                    "Access-Control-Allow-Origin": "*"
+                }
+            )
+        except BaseException:
+            # The response never took the slot over
+            if ticket is not None:
+                ticket.release()
+            raise
 
     except Exception as e:
         logger.error(f"❌ Error in ADK chat completions: {e}")
@@ -531,43 +793,43 @@ async def chat_completions(request: ChatCompletionRequest):
 @app.get("/v1/models")
 async def list_models():
     """List available models for the current provider."""
-    if config.current_provider == "openai":
-        return {
-            "object": "list",
-            "data": [
-                {
-                    "id": config.current_model,
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": "openai",
-                    "permission": [],
-                    "root": config.current_model,
-                    "parent": None
-                }
-            ]
-        }
-    elif config.current_provider == "ollama":
-        return {
-            "object": "list",
-            "data": [
-                {
-                    "id": config.current_model,
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": "ollama",
-                    "permission": [],
-                    "root": config.current_model,
-                    "parent": None
-                }
-            ]
-        }
-    else:
-        return {
-            "object": "list",
-            "data": []
-        }
+    models = []
+    if provider_registry.get(config.current_provider) is not None:
+        models.append((config.current_model, config.current_provider))
+    for model in model_router.routed_models:
+        if model != config.current_model:
+            models.append((model, model_router.get_endpoints(model)[0].name))
+
+    return {
+        "object": "list",
+        "data": [
+            {
+                "id": model,
+                "object": "model",
+                "created": int(time.time()),
+                "owned_by": owner,
+                "permission": [],
+                "root": model,
+                "parent": None
+            }
+            for model, owner in models
+        ]
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Upstream connection pool, admission and reasoning metrics in the Prometheus text format."""
+    from src.domain.services.reasoning_service_impl import reasoning_fast_path
+    return (
+        provider_connections.render_prometheus()
+        + admission_controller.render_prometheus()
+        + reasoning_fast_path.render_prometheus()
+    )
 
 # CORS preflight handlers
+# OpenAI-compatible batch API (registered before the catch-all route)
+app.include_router(create_batch_router(batch_service))
+
 @app.options("/v1/chat/completions")
 async def chat_completions_options():
     """Handle CORS preflight requests for chat completions."""
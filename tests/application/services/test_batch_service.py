@@ -0,0 +1,175 @@
+"""
+Tests for batch completions and their SQLite queue.
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from src.application.services.batch_service import BatchConfig, BatchService, BatchValidationError
+from src.application.services.rate_limiting import TokenBucket
+
+
+def make_input(*texts, url="/v1/chat/completions"):
+    lines = [
+        {"custom_id": f"req-{i}", "method": "POST", "url": url,
+         "body": {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": text}]}}
+        for i, text in enumerate(texts)
+    ]
+    return "\n".join(json.dumps(line) for line in lines).encode()
+
+
+class RecordingExecutor:
+    """Executor that tracks concurrency and fails requests mentioning 'fail'."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.calls = []
+
+    async def __call__(self, body):
+        self.calls.append(body)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        text = body["messages"][0]["content"]
+        if "fail" in text:
+            return 502, {"error": {"message": "upstream failed", "type": "adk_api_error"}}
+        return 200, {"object": "chat.completion", "choices": [{"message": {"content": text.upper()}}]}
+
+
+async def read_jsonl(service, file_id):
+    content = await service.get_file_content(file_id)
+    return [json.loads(line) for line in content.decode().splitlines()]
+
+
+class TestBatchService:
+    """Test batch creation, execution, output files and cancellation."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, tmp_path):
+        self.storage_dir = str(tmp_path)
+        self.executor = RecordingExecutor()
+        self.service = BatchService(
+            BatchConfig(storage_dir=self.storage_dir, max_concurrency=2, requests_per_minute=0), self.executor
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_and_writes_output_files(self):
+        """Successes go to the output file and failures to the error file, keyed by custom_id."""
+        upload = await self.service.create_file(make_input("one", "please fail", "three"), "input.jsonl", "batch")
+        batch = await self.service.create_batch(upload["id"], "/v1/chat/completions")
+        assert batch["status"] == "validating"
+        assert batch["request_counts"]["total"] == 3
+
+        await self.service.process_batch(batch["id"])
+
+        batch = await self.service.get_batch(batch["id"])
+        output = await read_jsonl(self.service, batch["output_file_id"])
+        errors = await read_jsonl(self.service, batch["error_file_id"])
+
+        assert batch["status"] == "completed"
+        assert batch["request_counts"] == {"total": 3, "completed": 2, "failed": 1}
+        assert [line["custom_id"] for line in output] == ["req-0", "req-2"]
+        assert output[0]["response"]["body"]["choices"][0]["message"]["content"] == "ONE"
+        assert errors[0]["custom_id"] == "req-1"
+        assert errors[0]["response"]["status_code"] == 502
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency requests run at once."""
+        upload = await self.service.create_file(make_input(*[f"text {i}" for i in range(6)]), "input.jsonl", "batch")
+        batch = await self.service.create_batch(upload["id"], "/v1/chat/completions")
+
+        await self.service.process_batch(batch["id"])
+
+        assert len(self.executor.calls) == 6
+        assert self.executor.max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_input_is_rejected(self):
+        """Malformed lines, duplicate ids and unsupported endpoints are rejected."""
+        with pytest.raises(BatchValidationError):
+            await self.service.create_file(b'{"custom_id": "a", "body": {}}\nnot json', "input.jsonl", "batch")
+        with pytest.raises(BatchValidationError):
+            await self.service.create_file(make_input("a") + b"\n" + make_input("a"), "input.jsonl", "batch")
+
+        upload = await self.service.create_file(make_input("a", url="/v1/embeddings"), "input.jsonl", "batch")
+        with pytest.raises(BatchValidationError):
+            await self.service.create_batch(upload["id"], "/v1/chat/completions")
+
+    @pytest.mark.asyncio
+    async def test_worker_resumes_batches_after_restart(self):
+        """A new service on the same storage resumes queued and interrupted requests."""
+        upload = await self.service.create_file(make_input("one", "two"), "input.jsonl", "batch")
+        batch = await self.service.create_batch(upload["id"], "/v1/chat/completions")
+        # Simulate a crash after the first request started
+        await self.service.repository.set_status(batch["id"], "in_progress")
+        await self.service.repository.mark_request(batch["id"], 0, "running")
+
+        restarted = BatchService(BatchConfig(storage_dir=self.storage_dir, requests_per_minute=0), self.executor)
+        restarted.start()
+        for _ in range(100):
+            if (await restarted.get_batch(batch["id"]))["status"] == "completed":
+                break
+            await asyncio.sleep(0.01)
+        await restarted.stop()
+
+        batch = await restarted.get_batch(batch["id"])
+        assert batch["status"] == "completed"
+        assert batch["request_counts"]["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_keeps_finished_results(self):
+        """Cancelling stops queued requests and writes what already finished."""
+        upload = await self.service.create_file(make_input("one", "two"), "input.jsonl", "batch")
+        batch = await self.service.create_batch(upload["id"], "/v1/chat/completions")
+
+        cancelled = await self.service.cancel_batch(batch["id"])
+        await self.service.process_batch(batch["id"])
+
+        assert cancelled["status"] == "cancelling"
+        assert (await self.service.get_batch(batch["id"]))["status"] == "cancelled"
+        assert self.executor.calls == []
+
+
+    @pytest.mark.asyncio
+    async def test_pagination_keeps_batches_created_in_the_same_second(self):
+        """Paging with `after` returns every batch even when timestamps are equal."""
+        upload = await self.service.create_file(make_input("one"), "input.jsonl", "batch")
+        with patch("src.infrastructure.repositories.batch_repository.time.time", return_value=1700000000):
+            created = {(await self.service.create_batch(upload["id"], "/v1/chat/completions"))["id"] for _ in range(3)}
+
+        seen, after = [], None
+        while True:
+            page = await self.service.repository.list_batches(limit=1, after=after)
+            if not page:
+                break
+            seen.append(page[0]["id"])
+            after = page[0]["id"]
+
+        assert len(seen) == 3
+        assert set(seen) == created
+
+
+class TestTokenBucket:
+    """Test token bucket rate limiting."""
+
+    def test_burst_then_limited(self):
+        """The bucket allows its capacity at once, then refills at the rate."""
+        bucket = TokenBucket(rate=1.0, capacity=2)
+
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        assert 0 < bucket.time_until_available() <= 1.0
+
+    def test_zero_rate_is_unlimited(self):
+        """A rate of 0 disables limiting."""
+        bucket = TokenBucket(rate=0)
+
+        assert all(bucket.try_acquire() for _ in range(100))
@@ -0,0 +1,182 @@
+"""
+Tests for cached LLM-guided tool selection and the capability catalog.
+"""
+import dataclasses
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.application.services.mcp_tool_selector import (
+    MCPToolSelector, ProcessingPhase, ToolCapability, ToolSelectionContext, ToolSelectionStrategy
+)
+from src.infrastructure.mcp.discovery import DiscoveryResult, MCPToolDiscovery, MCPToolInfo
+
+
+def make_capability(name, description="Find issues in the tracker"):
+    return ToolCapability(
+        name=name,
+        description=description,
+        input_schema={},
+        domains={"project_management"},
+        complexity_level="simple",
+        processing_phases={ProcessingPhase.REASONING},
+        keywords={"issues"},
+        server_name="youtrack"
+    )
+
+
+def make_context(text="show my tickets", intent_type="task_management"):
+    return ToolSelectionContext(
+        request_data={"messages": [{"role": "user", "content": text}]},
+        intent_analysis={"intent_type": intent_type, "domains": ["project_management"], "complexity": "simple"},
+        processing_phase=ProcessingPhase.REASONING
+    )
+
+
+class FakeAgent:
+    """Selection agent that answers with a fixed selection and records prompts."""
+
+    def __init__(self, selected):
+        self.selected = selected
+        self.prompts = []
+
+    async def run_async(self, prompt):
+        self.prompts.append(prompt)
+        yield json.dumps({"selected_tools": self.selected, "reasoning": "matches intent", "confidence": 0.9})
+
+
+class TestLLMGuidedSelectionCache:
+    """Test decision reuse, catalog versioning and the compact tool prompt."""
+
+    def setup_method(self):
+        self.discovery = MagicMock()
+        self.discovery.catalog_version = 1
+        self.discovery.get_all_tools.return_value = []
+        self.selector = MCPToolSelector(MagicMock(), MagicMock(), self.discovery)
+        self.agent = FakeAgent(["search_issues"])
+        self.selector._selection_agent = self.agent
+        self.tools = [make_capability("search_issues"), make_capability("get_issue", "Get one issue by id")]
+
+    @pytest.mark.asyncio
+    async def test_decision_reused_for_same_features(self):
+        """Requests with the same features and candidates reuse the LLM decision."""
+        first = await self.selector._select_by_llm_guidance(make_context("show my tickets"), self.tools)
+        second = await self.selector._select_by_llm_guidance(make_context("list my tickets please"), self.tools)
+
+        assert [tool.name for tool in first] == [tool.name for tool in second] == ["search_issues"]
+        assert len(self.agent.prompts) == 1
+        assert self.selector.get_selection_stats()["llm_decisions"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_features_ask_again(self):
+        """A different intent is a different decision."""
+        await self.selector._select_by_llm_guidance(make_context(intent_type="task_management"), self.tools)
+        await self.selector._select_by_llm_guidance(make_context(intent_type="general_query"), self.tools)
+
+        assert len(self.agent.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_catalog_change_invalidates_decisions(self):
+        """Decisions are not reused once the discovered tools change."""
+        await self.selector._select_by_llm_guidance(make_context(), self.tools)
+
+        tool_info = MagicMock(server_name="youtrack", description="Find issues", input_schema={})
+        tool_info.name = "search_issues"
+        self.discovery.get_all_tools.return_value = [tool_info]
+        self.discovery.catalog_version = 2
+        self.selector._on_catalog_changed(2)
+        await self.selector._select_by_llm_guidance(make_context(), self.tools)
+
+        assert len(self.agent.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_prompt_uses_compact_tool_lines(self):
+        """Tools are described in one line each instead of a JSON dump."""
+        await self.selector._select_by_llm_guidance(make_context(), self.tools)
+
+        prompt = self.agent.prompts[0]
+        assert "- search_issues (project_management; simple): Find issues in the tracker" in prompt
+        assert '"keywords"' not in prompt
+
+
+def make_discovery_result(*tools):
+    return DiscoveryResult(
+        server_name="youtrack",
+        tools=[MCPToolInfo(name=name, server_name="youtrack", description=description, input_schema={})
+               for name, description in tools],
+        resources=[],
+        prompts=[],
+        discovery_time=datetime.now(),
+        success=True
+    )
+
+
+class TestCapabilityCatalog:
+    """Test capabilities analyzed once per discovery change and per-request scores."""
+
+    def setup_method(self):
+        self.discovery = MCPToolDiscovery(MagicMock())
+        self.selector = MCPToolSelector(MagicMock(), MagicMock(), self.discovery)
+        self.tools = [("search_issues", "Find issues for a project task"), ("get_issue", "Get one issue by id")]
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_only_when_catalog_changes(self):
+        """Rediscovering the same tools keeps the analyzed capabilities."""
+        await self.discovery._process_discovery_result(make_discovery_result(*self.tools))
+        first = await self.selector.analyze_tool_capabilities()
+        await self.discovery._process_discovery_result(make_discovery_result(*self.tools))
+        second = await self.selector.analyze_tool_capabilities()
+
+        assert first["cached"] and second["cached"]
+        assert [c.name for c in second["capabilities"]] == ["search_issues", "get_issue"]
+        assert all(a is b for a, b in zip(first["capabilities"], second["capabilities"]))
+        assert self.selector.get_selection_stats()["capability_rebuilds"] == 1
+
+    @pytest.mark.asyncio
+    async def test_catalog_change_rebuilds_derived_state(self):
+        """One discovery notification refreshes capabilities, the tool index and the prompt catalog."""
+        await self.discovery._process_discovery_result(make_discovery_result(*self.tools))
+        stats = self.selector.get_selection_stats()
+        fingerprint = stats["llm_decisions"]["catalog_fingerprint"]
+
+        assert stats["capability_rebuilds"] == 1
+        assert stats["tool_index"]["indexed_tools"] == 2
+        assert fingerprint
+
+        await self.discovery._process_discovery_result(make_discovery_result(self.tools[0]))
+        stats = self.selector.get_selection_stats()
+
+        assert stats["tool_index"]["indexed_tools"] == 1
+        assert stats["llm_decisions"]["catalog_fingerprint"] != fingerprint
+
+    @pytest.mark.asyncio
+    async def test_changed_tool_is_reanalyzed(self):
+        """A discovery change rebuilds the catalog, reusing unchanged capabilities."""
+        await self.discovery._process_discovery_result(make_discovery_result(*self.tools))
+        before = {c.name: c for c in (await self.selector.analyze_tool_capabilities())["capabilities"]}
+
+        await self.discovery._process_discovery_result(
+            make_discovery_result(self.tools[0], ("get_issue", "Get one issue with comments"))
+        )
+        after = {c.name: c for c in (await self.selector.analyze_tool_capabilities())["capabilities"]}
+
+        assert after["search_issues"] is before["search_issues"]
+        assert after["get_issue"].description == "Get one issue with comments"
+        assert self.selector.get_selection_stats()["capability_rebuilds"] == 2
+
+    @pytest.mark.asyncio
+    async def test_scores_are_per_request(self):
+        """Scoring leaves shared capabilities untouched and reports scores per request."""
+        await self.discovery._process_discovery_result(make_discovery_result(*self.tools))
+        self.selector.set_selection_strategy(ToolSelectionStrategy.CAPABILITY_MATCH)
+        context = make_context("find the issues of my project")
+        context.processing_phase = ProcessingPhase.PREPROCESSING
+
+        result = await self.selector.select_tools_for_context(context)
+
+        assert result["selected_tools"][0] == "search_issues"
+        assert result["tool_scores"]["search_issues"] > 0
+        assert context.tool_scores == result["tool_scores"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result["tool_details"][0].description = "changed"
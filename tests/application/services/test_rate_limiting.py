@@ -0,0 +1,123 @@
+"""
+Tests for admission control.
+"""
+import asyncio
+import pytest
+
+from src.application.services.rate_limiting import (
+    AdmissionConfig, AdmissionController, KeyedRateLimiter, RateLimitExceeded, RequestPriority
+)
+
+
+def make_request(text="hello", max_tokens=10):
+    return {"messages": [{"role": "user", "content": text}], "max_tokens": max_tokens}
+
+
+class TestKeyedRateLimiter:
+    """Test bucket eviction."""
+
+    def test_idle_buckets_are_evicted(self):
+        """Full buckets are dropped least recently used first; buckets still refilling are kept."""
+        limiter = KeyedRateLimiter(rate=1.0, capacity=1.0, max_buckets=3)
+        limiter.bucket("busy").try_acquire()
+        for key in ("a", "b", "c", "d"):
+            limiter.bucket(key)
+
+        assert len(limiter) == 3
+        assert "busy" in limiter._buckets
+        assert "a" not in limiter._buckets and "b" not in limiter._buckets
+
+
+class TestAdmissionController:
+    """Test per-key limits, the priority queue and queue metrics."""
+
+    def setup_method(self):
+        self.controller = AdmissionController(AdmissionConfig(
+            enabled=True, requests_per_minute=2, tokens_per_minute=0,
+            max_concurrent_requests=1, max_queue_size=2, max_queue_wait_seconds=1.0
+        ))
+
+    def test_request_budget_is_per_key(self):
+        """Each API key has its own request bucket; exhausted keys get a retry delay."""
+        self.controller.check_rate("key-a", make_request())
+        self.controller.check_rate("key-a", make_request())
+
+        with pytest.raises(RateLimitExceeded) as error:
+            self.controller.check_rate("key-a", make_request())
+        self.controller.check_rate("key-b", make_request())
+
+        assert 0 < error.value.retry_after <= 30
+        assert self.controller.get_stats()["rejected"]["requests"] == 1
+        assert "key-a" not in self.controller.request_limits._buckets
+        assert self.controller.get_stats()["tracked_keys"] == 2
+
+    def test_token_budget_uses_estimate(self):
+        """Requests whose estimated tokens exceed the remaining budget are rejected."""
+        controller = AdmissionController(AdmissionConfig(enabled=True, requests_per_minute=0, tokens_per_minute=600))
+
+        controller.check_rate("key", make_request(max_tokens=500))
+        with pytest.raises(RateLimitExceeded):
+            controller.check_rate("key", make_request(max_tokens=500))
+
+        assert controller.get_stats()["rejected"]["tokens"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_are_served_before_batch(self):
+        """Queued interactive requests get the next free slot ahead of earlier batch requests."""
+        order = []
+        holder = await self.controller.acquire_slot()
+
+        async def wait(priority, name):
+            ticket = await self.controller.acquire_slot(priority)
+            order.append(name)
+            ticket.release()
+
+        batch = asyncio.create_task(wait(RequestPriority.BATCH, "batch"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(wait(RequestPriority.INTERACTIVE, "interactive"))
+        await asyncio.sleep(0)
+        holder.release()
+        await asyncio.gather(batch, interactive)
+
+        assert order == ["interactive", "batch"]
+        assert self.controller.get_stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_and_wait_timeout_are_rejected(self):
+        """A full queue rejects at once; a queued request gives up after the maximum wait."""
+        controller = AdmissionController(AdmissionConfig(
+            enabled=True, max_concurrent_requests=1, max_queue_size=1, max_queue_wait_seconds=0.05
+        ))
+        holder = await controller.acquire_slot()
+        waiting = asyncio.create_task(controller.acquire_slot())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimitExceeded):
+            await controller.acquire_slot()
+        with pytest.raises(RateLimitExceeded):
+            await waiting
+        holder.release()
+
+        stats = controller.get_stats()
+        assert stats["rejected"]["queue_full"] == 1
+        assert stats["rejected"]["queue_timeout"] == 1
+        assert stats["active"] == 0
+        assert stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_is_exported(self):
+        """Queue wait time is recorded per priority in the Prometheus histogram."""
+        ticket = await self.controller.admit("key", make_request(), RequestPriority.INTERACTIVE)
+        ticket.release()
+        ticket.release()
+
+        text = self.controller.render_prometheus()
+
+        assert '# TYPE admission_queue_wait_seconds histogram' in text
+        assert 'admission_queue_wait_seconds_count{priority="interactive"} 1' in text
+        assert self.controller.get_stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_controller_admits_everything(self):
+        """With admission control disabled no ticket is issued."""
+        assert await AdmissionController().admit("key", make_request()) is None
@@ -0,0 +1,128 @@
+"""
+Tests for single-flight coalescing of identical streaming requests.
+"""
+import asyncio
+import pytest
+
+from src.application.services.request_coalescer import RequestCoalescer, RequestCoalescerConfig
+
+
+def make_request(text="status report", temperature=0):
+    return {"model": "gpt-4o-mini", "temperature": temperature, "messages": [{"role": "user", "content": text}]}
+
+
+class ControlledSource:
+    """Upstream stream whose chunks are released by the test."""
+
+    def __init__(self):
+        self.starts = 0
+        self.closed = False
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def stream(self):
+        self.starts += 1
+        try:
+            while True:
+                chunk = await self.queue.get()
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            self.closed = True
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestRequestCoalescer:
+    """Test eligibility, fan-out and late joiners."""
+
+    def setup_method(self):
+        self.coalescer = RequestCoalescer(RequestCoalescerConfig(enabled=True))
+
+    def test_only_deterministic_requests_are_coalesced(self):
+        """Temperature 0 or an explicit header opts a request in."""
+        assert self.coalescer.should_coalesce(make_request(temperature=0))
+        assert not self.coalescer.should_coalesce(make_request(temperature=0.7))
+        assert self.coalescer.should_coalesce(make_request(temperature=0.7), {"x-coalesce": "true"})
+        assert not self.coalescer.should_coalesce(make_request(temperature=0), {"x-coalesce": "false"})
+        assert not RequestCoalescer().should_coalesce(make_request(temperature=0))
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_stream(self):
+        """Concurrent identical requests start one upstream stream and get the same chunks."""
+        source = ControlledSource()
+        first = asyncio.create_task(collect(self.coalescer.stream(make_request(), source.stream)))
+        await source.queue.put("data: a\n\n")
+        await asyncio.sleep(0.01)
+
+        # Late joiner replays "a" from the buffer, then follows live
+        second = asyncio.create_task(collect(self.coalescer.stream(make_request(), source.stream)))
+        await source.queue.put("data: b\n\n")
+        await source.queue.put(None)
+
+        results = await asyncio.gather(first, second)
+
+        assert results[0] == results[1] == ["data: a\n\n", "data: b\n\n"]
+        assert source.starts == 1
+        assert self.coalescer.get_stats()["coalesced_requests"] == 1
+        assert self.coalescer.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_shared(self):
+        """Requests with different messages get their own streams."""
+        sources = [ControlledSource(), ControlledSource()]
+        streams = [
+            self.coalescer.stream(make_request("one"), sources[0].stream),
+            self.coalescer.stream(make_request("two"), sources[1].stream)
+        ]
+        for source in sources:
+            await source.queue.put(None)
+
+        await asyncio.gather(*(collect(stream) for stream in streams))
+
+        assert [source.starts for source in sources] == [1, 1]
+        assert self.coalescer.get_stats()["flights"] == 2
+
+    @pytest.mark.asyncio
+    async def test_source_cancelled_when_all_subscribers_leave(self):
+        """The upstream stream is closed once no subscriber is left."""
+        source = ControlledSource()
+        stream = self.coalescer.stream(make_request(), source.stream)
+        await source.queue.put("data: a\n\n")
+
+        assert await stream.__anext__() == "data: a\n\n"
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+
+        assert source.closed
+        assert self.coalescer.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_source_cancelled_when_unstarted_subscription_is_dropped(self):
+        """A subscription that is never read does not keep the upstream stream alive."""
+        source = ControlledSource()
+        stream = self.coalescer.stream(make_request(), source.stream)
+        await source.queue.put("data: a\n\n")
+        await asyncio.sleep(0.01)
+
+        await stream.aclose()
+        del stream
+        await asyncio.sleep(0.01)
+
+        assert source.closed
+        assert self.coalescer.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_finished_streams_start_a_new_flight(self):
+        """A request arriving after the stream completed starts a fresh one."""
+        source = ControlledSource()
+        await source.queue.put(None)
+        await collect(self.coalescer.stream(make_request(), source.stream))
+        await asyncio.sleep(0)
+
+        await source.queue.put(None)
+        await collect(self.coalescer.stream(make_request(), source.stream))
+
+        assert source.starts == 2
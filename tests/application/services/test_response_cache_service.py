@@ -0,0 +1,143 @@
+"""
+Tests for the chat completions response cache.
+"""
+import json
+import pytest
+from unittest.mock import patch
+
+from src.application.services.response_cache_service import ResponseCacheConfig, ResponseCacheService
+from src.application.services.text_embedding import HashingTextEmbedder, VectorIndex, cosine_similarity
+
+
+def make_request(text, model="gpt-4o-mini", **params):
+    request = {"model": model, "messages": [{"role": "system", "content": "Be brief."}, {"role": "user", "content": text}]}
+    request.update(params)
+    return request
+
+
+class TestHashingTextEmbedder:
+    """Test the local embedder and vector index."""
+
+    def test_similar_texts_score_higher(self):
+        """Near-identical phrasings are closer than unrelated text."""
+        embed = HashingTextEmbedder()
+        query = embed("show my assigned YouTrack tickets")
+
+        assert cosine_similarity(query, embed("Show my assigned YouTrack tickets!")) > 0.99
+        assert cosine_similarity(query, embed("show me my assigned youtrack tickets")) > 0.8
+        assert cosine_similarity(query, embed("what is the weather in Paris")) < 0.3
+
+    def test_index_search(self):
+        """The index returns the best matches above the threshold."""
+        embed = HashingTextEmbedder()
+        index = VectorIndex()
+        index.add("tickets", embed("list open tickets"))
+        index.add("weather", embed("weather forecast"))
+
+        results = index.search(embed("list the open tickets"), top_k=2, min_score=0.5)
+
+        assert [key for key, _ in results] == ["tickets"]
+
+
+class TestResponseCacheService:
+    """Test exact and semantic tiers, expiry and replay."""
+
+    def setup_method(self):
+        self.cache = ResponseCacheService(ResponseCacheConfig(enabled=True, semantic_enabled=True, similarity_threshold=0.9))
+
+    def test_disabled_cache_never_hits(self):
+        """The cache is opt-in."""
+        cache = ResponseCacheService()
+
+        assert cache.store(make_request("hi"), "hello") is False
+        assert cache.lookup(make_request("hi")) is None
+
+    def test_exact_hit_ignores_whitespace(self):
+        """Normalized messages hit the exact tier."""
+        self.cache.store(make_request("What is  MCP?"), "A protocol.")
+
+        entry = self.cache.lookup(make_request(" What is MCP? "))
+
+        assert entry.content == "A protocol."
+        assert self.cache.get_stats()["exact_hits"] == 1
+
+    def test_sampling_params_are_part_of_the_key(self):
+        """Different sampling parameters or models do not share entries."""
+        self.cache.config.semantic_enabled = False
+        self.cache.store(make_request("What is MCP?", temperature=0.0), "A protocol.")
+
+        assert self.cache.lookup(make_request("What is MCP?", temperature=0.9)) is None
+        assert self.cache.lookup(make_request("What is MCP?", model="llama3", temperature=0.0)) is None
+        assert self.cache.lookup(make_request("What is MCP?", temperature=0.0)) is not None
+
+    def test_semantic_hit_requires_matching_context(self):
+        """Similar last messages hit only when the rest of the conversation matches."""
+        self.cache.store(make_request("Show my assigned YouTrack tickets"), "PROJ-1, PROJ-2")
+
+        assert self.cache.lookup(make_request("show my assigned youtrack tickets!")).content == "PROJ-1, PROJ-2"
+
+        other_context = make_request("Show my assigned YouTrack tickets")
+        other_context["messages"][0]["content"] = "Answer in French."
+        assert self.cache.lookup(other_context) is None
+        assert self.cache.get_stats()["semantic_hits"] == 1
+
+    def test_semantic_hit_requires_matching_identifiers_and_negations(self):
+        """Requests differing only in an ID, a quoted string or a negation never share an answer."""
+        self.cache.store(make_request("Show the status of ticket PROJ-12"), "PROJ-12 is open.")
+        self.cache.store(make_request("Show tickets assigned to me"), "PROJ-1, PROJ-2")
+        self.cache.store(make_request('Find issues labelled "backend"'), "PROJ-3")
+
+        assert self.cache.lookup(make_request("Show the status of ticket PROJ-13")) is None
+        assert self.cache.lookup(make_request("Show tickets not assigned to me")) is None
+        assert self.cache.lookup(make_request('Find issues labelled "frontend"')) is None
+        assert self.cache.lookup(make_request("show the status of ticket proj-12!")).content == "PROJ-12 is open."
+
+    def test_entries_are_scoped_by_tenant(self):
+        """Neither tier serves one caller's completion to another."""
+        self.cache.store(make_request("Show my assigned YouTrack tickets"), "PROJ-1, PROJ-2", tenant="alice-key")
+
+        assert self.cache.lookup(make_request("Show my assigned YouTrack tickets"), tenant="bob-key") is None
+        assert self.cache.lookup(make_request("show my assigned youtrack tickets!"), tenant="bob-key") is None
+        assert self.cache.lookup(make_request("Show my assigned YouTrack tickets"), tenant="alice-key") is not None
+
+    def test_per_model_ttl(self):
+        """Entries expire after the model's TTL; a TTL of 0 disables caching."""
+        self.cache.config.model_ttl_seconds = {"gpt-4o-mini": 10, "llama3": 0}
+
+        with patch("src.application.services.response_cache_service.time.time", return_value=1000.0):
+            assert self.cache.store(make_request("hi"), "hello")
+            assert not self.cache.store(make_request("hi", model="llama3"), "hello")
+
+        with patch("src.application.services.response_cache_service.time.time", return_value=1011.0):
+            assert self.cache.lookup(make_request("hi")) is None
+            assert self.cache.get_stats()["entries"] == 0
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        """Entries beyond the memory budget are evicted oldest first."""
+        cache = ResponseCacheService(ResponseCacheConfig(enabled=True, max_memory_bytes=3100))
+        cache.store(make_request("first"), "a" * 1000)
+        cache.store(make_request("second"), "b" * 1000)
+        cache.lookup(make_request("first"))
+
+        cache.store(make_request("third"), "c" * 1000)
+
+        assert cache.lookup(make_request("second")) is None
+        assert cache.lookup(make_request("first")) is not None
+        assert cache.get_stats()["memory_bytes"] <= 3100
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_as_sse_chunks(self):
+        """Cached content is replayed as OpenAI chunks that reassemble exactly."""
+        content = "Here are  your tickets:\n- PROJ-1\n- PROJ-2\n"
+        self.cache.store(make_request("tickets"), content)
+        entry = self.cache.lookup(make_request("tickets"))
+
+        events = [event async for event in self.cache.replay(entry)]
+
+        assert events[-1] == "data: [DONE]\n\n"
+        chunks = [json.loads(event[6:]) for event in events[:-1]]
+        assert chunks[0]["choices"][0]["delta"]["role"] == "assistant"
+        assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+        assert len(chunks) > 3
+        assert "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks) == content
@@ -0,0 +1,79 @@
+"""
+Tests for opt-in pacing of streamed reasoning steps.
+"""
+import asyncio
+import json
+import time
+import pytest
+
+from src.application.services.stream_pacing import is_reasoning_chunk, pace_reasoning_steps
+
+
+def reasoning_chunk(text, model="reasoning-engine"):
+    return f"data: {json.dumps({'model': model, 'choices': [{'delta': {'content': text}}]})}\n\n"
+
+
+class TestStreamPacing:
+    """Test that pacing spaces reasoning steps without delaying the source."""
+
+    def setup_method(self):
+        self.consumed = []
+
+    async def source(self, chunks):
+        for chunk in chunks:
+            self.consumed.append(chunk)
+            yield chunk
+
+    def test_reasoning_chunks_are_recognized(self):
+        """Reasoning steps are recognized; upstream bytes and other chunks are not."""
+        assert is_reasoning_chunk(reasoning_chunk("step"))
+        assert is_reasoning_chunk(reasoning_chunk("phase", model="enhanced-reasoning-engine"))
+        assert not is_reasoning_chunk(b'data: {"model": "reasoning-engine"}\n\n')
+        assert not is_reasoning_chunk("data: [DONE]\n\n")
+
+    @pytest.mark.asyncio
+    async def test_zero_cadence_passes_through(self):
+        """Without a cadence, chunks are passed through unchanged."""
+        chunks = [reasoning_chunk("one"), reasoning_chunk("two"), b"data: upstream\n\n"]
+
+        started = time.monotonic()
+        result = [chunk async for chunk in pace_reasoning_steps(self.source(chunks), 0)]
+
+        assert result == chunks
+        assert time.monotonic() - started < 0.05
+
+    @pytest.mark.asyncio
+    async def test_reasoning_steps_are_spaced(self):
+        """Reasoning steps are delivered at least the cadence apart, in order."""
+        chunks = [reasoning_chunk("one"), reasoning_chunk("two"), reasoning_chunk("three"), b"data: upstream\n\n"]
+
+        started = time.monotonic()
+        result = [chunk async for chunk in pace_reasoning_steps(self.source(chunks), 50)]
+
+        assert result == chunks
+        assert time.monotonic() - started >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_source_is_read_ahead_of_delivery(self):
+        """The source runs ahead of paced delivery, so the upstream call is not delayed."""
+        chunks = [reasoning_chunk("one"), reasoning_chunk("two"), reasoning_chunk("three"), b"data: upstream\n\n"]
+        stream = pace_reasoning_steps(self.source(chunks), 200)
+
+        assert await stream.__anext__() == chunks[0]
+        await asyncio.sleep(0.01)
+
+        assert self.consumed == chunks
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_source_errors_are_raised(self):
+        """An error in the source reaches the consumer after the chunks before it."""
+        async def failing():
+            yield reasoning_chunk("one")
+            raise RuntimeError("upstream failed")
+
+        stream = pace_reasoning_steps(failing(), 10)
+
+        assert await stream.__anext__() == reasoning_chunk("one")
+        with pytest.raises(RuntimeError):
+            await stream.__anext__()
@@ -0,0 +1,116 @@
+"""
+Tests for schema-driven tool argument synthesis.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.services.mcp_tool_selector import MCPToolSelector, ProcessingPhase, ToolExecutionPlan, ToolSelectionContext
+from src.application.services.tool_argument_synthesizer import ToolArgumentSynthesizer
+from src.infrastructure.mcp.discovery import MCPToolInfo
+
+TICKET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "state": {"type": "string", "enum": ["Open", "Closed", "Resolved"]},
+        "project": {"type": "string"}
+    }
+}
+SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {"query": {"type": "string"}, "intent": {"type": "object"}},
+    "required": ["query"]
+}
+READ_SCHEMA = {"type": "object", "properties": {"path": {"type": "string"}}, "required": ["path"]}
+
+
+class TestToolArgumentSynthesizer:
+    """Test argument synthesis from input schemas."""
+
+    def setup_method(self):
+        self.synthesizer = ToolArgumentSynthesizer()
+        self.intent = {"intent_type": "task_management", "action_verbs": ["find"], "confidence": 0.8, "patterns": ["x"]}
+
+    def test_only_declared_properties_are_filled(self):
+        """Free text and intent go only to tools that declare them."""
+        tickets = self.synthesizer.synthesize("find_tickets", TICKET_SCHEMA, "show my tickets", self.intent)
+        search = self.synthesizer.synthesize("search", SEARCH_SCHEMA, "  show my tickets ", self.intent)
+
+        assert tickets == {"status": "success", "arguments": {"state": "Open"}}
+        assert search["arguments"] == {
+            "query": "show my tickets",
+            "intent": {"intent_type": "task_management", "action_verbs": ["find"]}
+        }
+        assert self.synthesizer.synthesize("get_user_details", {}, "who am I")["arguments"] == {}
+
+    def test_enum_value_from_request(self):
+        """An enum value named in the request is used in its declared spelling."""
+        result = self.synthesizer.synthesize("find_tickets", TICKET_SCHEMA, "list CLOSED tickets")
+
+        assert result["arguments"] == {"state": "Closed"}
+
+    def test_missing_required_argument_is_an_error(self):
+        """A required property without a source makes the call invalid."""
+        result = self.synthesizer.synthesize("read_file", READ_SCHEMA, "read the readme")
+
+        assert result["status"] == "error"
+        assert result["errors"] == ["missing required argument 'path'"]
+
+    def test_plan_cached_per_schema(self):
+        """The property mapping is computed once per tool schema."""
+        for text in ("show my tickets", "show closed tickets"):
+            self.synthesizer.synthesize("find_tickets", TICKET_SCHEMA, text)
+
+        stats = self.synthesizer.get_stats()
+        assert stats["plan_misses"] == 1
+        assert stats["plan_hits"] == 1
+
+
+class TestToolPlanArguments:
+    """Test tool plan execution in the selector."""
+
+    def setup_method(self):
+        tools = {
+            "find_tickets": MCPToolInfo(name="find_tickets", server_name="youtrack", description="", input_schema=TICKET_SCHEMA),
+            "read_file": MCPToolInfo(name="read_file", server_name="filesystem", description="", input_schema=READ_SCHEMA)
+        }
+        self.discovery = MagicMock()
+        self.discovery.get_tool.side_effect = tools.get
+        self.tool_registry = MagicMock()
+        self.tool_registry.execute_tool = AsyncMock(return_value=MagicMock(success=True, execution_time_ms=5.0))
+        self.selector = MCPToolSelector(self.tool_registry, MagicMock(), self.discovery)
+
+    @pytest.mark.asyncio
+    async def test_invalid_calls_are_not_executed(self):
+        """Calls with invalid arguments are reported as failed without reaching the registry."""
+        plan = ToolExecutionPlan(
+            tools=["find_tickets", "read_file"], execution_order=["find_tickets", "read_file"],
+            parallel_groups=[], dependencies={}, timeout_ms=1000, retry_count=0, fallback_tools={}
+        )
+        context = ToolSelectionContext(
+            request_data={"messages": [{"role": "user", "content": "show my open tickets"}]},
+            processing_phase=ProcessingPhase.REASONING
+        )
+
+        result = await self.selector.execute_tool_plan(plan, context)
+
+        self.tool_registry.execute_tool.assert_awaited_once_with(
+            tool_name="find_tickets", arguments={"state": "Open"}, timeout=1.0
+        )
+        assert result["success_count"] == 1
+        assert result["errors"] == ["read_file: Invalid arguments: missing required argument 'path'"]
+
+    @pytest.mark.asyncio
+    async def test_iteration_stops_remaining_tools(self):
+        """Tools not yet started are not executed once the consumer stops iterating."""
+        plan = ToolExecutionPlan(
+            tools=["find_tickets", "find_tickets"], execution_order=["find_tickets", "find_tickets"],
+            parallel_groups=[], dependencies={}, timeout_ms=1000, retry_count=0, fallback_tools={}
+        )
+        context = ToolSelectionContext(request_data={"messages": []}, processing_phase=ProcessingPhase.REASONING)
+
+        results = self.selector.iter_tool_plan(plan, context)
+        first = await results.__anext__()
+        await results.aclose()
+
+        assert first.success
+        assert self.tool_registry.execute_tool.await_count == 1
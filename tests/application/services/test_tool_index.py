@@ -0,0 +1,116 @@
+"""
+Tests for the tool embedding index and embedding-based capability matching.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from src.application.services.mcp_tool_selector import (
+    MCPToolSelector, ProcessingPhase, ToolCapability, ToolSelectionContext
+)
+from src.application.services.text_embedding import HashingTextEmbedder, SparseVectorIndex, cosine_similarity
+from src.application.services.tool_index import ToolEmbeddingIndex, split_identifier
+
+CATALOG = {
+    "find_assigned_tickets": ("Find YouTrack tickets assigned to the current user", {"properties": {"project": {"description": "Project key"}}}),
+    "create_ticket": ("Create a new issue in YouTrack", {"properties": {"summary": {}, "description": {}}}),
+    "get_merge_requests": ("Get merge requests for a GitLab repository", {"properties": {"project_id": {}}}),
+    "read_file": ("Read the contents of a file from the filesystem", {"properties": {"path": {"description": "File path"}}}),
+    "get_weather": ("Get the current weather forecast for a city", {"properties": {"city": {}}})
+}
+
+
+def make_tool_info(name, description, input_schema):
+    tool = MagicMock(server_name="server", description=description, input_schema=input_schema)
+    tool.name = name
+    return tool
+
+
+class TestSparseEmbeddings:
+    """Test sparse embeddings and the inverted index."""
+
+    def test_sparse_matches_dense_embedding(self):
+        """Sparse and dense embeddings of the same text agree."""
+        embedder = HashingTextEmbedder()
+        dense = embedder.embed("Find tickets assigned to me")
+        sparse = embedder.embed_sparse("Find tickets assigned to me")
+
+        assert all(dense[index] == pytest.approx(value) for index, value in sparse.items())
+        assert sum(1 for value in dense if value != 0.0) == len(sparse)
+
+    def test_inverted_index_scores_are_cosine_similarity(self):
+        """Search scores equal the cosine similarity of the dense vectors."""
+        embedder = HashingTextEmbedder()
+        index = SparseVectorIndex()
+        texts = {"a": "read a file", "b": "merge requests in gitlab", "c": "weather forecast"}
+        for key, text in texts.items():
+            index.add(key, embedder.embed_sparse(text))
+
+        results = dict(index.search(embedder.embed_sparse("read the file"), top_k=3))
+
+        for key, score in results.items():
+            expected = cosine_similarity(embedder.embed("read the file"), embedder.embed(texts[key]))
+            assert score == pytest.approx(expected)
+        index.remove("a")
+        assert "a" not in dict(index.search(embedder.embed_sparse("read the file"), top_k=3))
+
+
+class TestToolEmbeddingIndex:
+    """Test retrieval quality and incremental refresh."""
+
+    def setup_method(self):
+        self.index = ToolEmbeddingIndex()
+        self.tools = [make_tool_info(name, *spec) for name, spec in CATALOG.items()]
+        self.index.sync(self.tools)
+
+    def test_split_identifier(self):
+        assert split_identifier("find_assigned_tickets") == "find assigned tickets"
+        assert split_identifier("getMergeRequests") == "get Merge Requests"
+
+    def test_retrieves_relevant_tools(self):
+        """The best match follows the request, and unrelated requests match nothing."""
+        assert self.index.search("show my youtrack tickets", top_k=1)[0][0] == "find_assigned_tickets"
+        assert self.index.search("which merge requests are open in gitlab", top_k=1)[0][0] == "get_merge_requests"
+        assert self.index.search("read the config file", top_k=1)[0][0] == "read_file"
+        assert self.index.search("hello, how are you?", min_score=0.1) == []
+
+    def test_sync_is_incremental(self):
+        """Only changed tools are re-embedded, removed tools are dropped, and an unchanged catalog is a no-op."""
+        assert self.index.sync(self.tools) == (0, 0)
+
+        changed = [make_tool_info("read_file", "Read a file and return its lines", {})] + self.tools[:2]
+        assert self.index.sync(changed) == (1, 2)
+        assert len(self.index) == 3
+        assert "get_weather" not in self.index
+
+
+class TestCapabilityMatchWithIndex:
+    """Test that capability matching ranks tools by similarity."""
+
+    def setup_method(self):
+        self.discovery = MagicMock()
+        self.discovery.catalog_version = 1
+        self.discovery.get_all_tools.return_value = [make_tool_info(name, *spec) for name, spec in CATALOG.items()]
+        self.selector = MCPToolSelector(MagicMock(), MagicMock(), self.discovery)
+        self.selector._on_catalog_changed(1)
+        self.capabilities = [
+            ToolCapability(
+                name=name, description=description, input_schema=schema, domains=set(),
+                complexity_level="simple", processing_phases={ProcessingPhase.REASONING},
+                keywords=set(), server_name="server"
+            )
+            for name, (description, schema) in CATALOG.items()
+        ]
+
+    @pytest.mark.asyncio
+    async def test_capability_match_ranks_by_similarity(self):
+        """The tool described like the request comes first; unrelated tools are left out."""
+        context = ToolSelectionContext(
+            request_data={"messages": [{"role": "user", "content": "What's the weather forecast in Paris?"}]},
+            intent_analysis={"domains": [], "complexity": "simple"},
+            processing_phase=ProcessingPhase.REASONING
+        )
+
+        selected = await self.selector._select_by_capability_match(context, self.capabilities)
+
+        assert [tool.name for tool in selected] == ["get_weather"]
+        assert self.selector.get_selection_stats()["tool_index"]["indexed_tools"] == len(CATALOG)
@@ -0,0 +1,62 @@
+"""
+Tests for the compiled intent keyword matcher.
+"""
+from src.domain.services.intent_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test one-pass matching across keyword tables."""
+
+    def setup_method(self):
+        self.matcher = KeywordMatcher({
+            "domain": {
+                "project_management": ["ticket", "tickets", "assigned"],
+                "version_control": ["git", "gitlab", "pull request"]
+            },
+            "action": {"find_assigned": ["assigned to me"], "list": ["list"]}
+        })
+
+    def test_overlapping_keywords_are_all_found(self):
+        """Keywords inside or overlapping other keywords are reported, like substring checks."""
+        assert self.matcher.find_keywords("My Tickets on GitLab") == {"ticket", "tickets", "git", "gitlab"}
+
+    def test_labels_follow_table_order(self):
+        """Matched labels are grouped per category in table definition order."""
+        matches = self.matcher.match("list tickets assigned to me from the pull request")
+
+        assert matches.get("domain") == ["project_management", "version_control"]
+        assert matches.has("action", "find_assigned")
+        assert matches.get("action") == ["find_assigned", "list"]
+        assert matches.get("missing") == []
+
+    def test_substring_semantics_match_in_operator(self):
+        """Results equal `keyword in text.lower()` for every keyword."""
+        keywords = ["he", "she", "his", "hers", "ushers", "s"]
+        matcher = KeywordMatcher({"words": {keyword: [keyword] for keyword in keywords}})
+
+        for text in ["ushers", "SHE said his", "", "hhhersh", "xyz"]:
+            assert matcher.find_keywords(text) == {keyword for keyword in keywords if keyword in text.lower()}
+
+    def test_no_matches(self):
+        """Text without keywords yields empty results."""
+        matches = self.matcher.match("hello there")
+
+        assert matches.keywords == set()
+        assert matches.labels == {}
+
+
+class TestAnalyzeRequestIntent:
+    """Test intent analysis built on the compiled matcher."""
+
+    def test_assigned_tickets_request(self):
+        """A request for the user's tickets targets YouTrack with the find_assigned action."""
+        from src.domain.services.reasoning_service_impl import analyze_request_intent
+
+        result = analyze_request_intent({"messages": [{"role": "user", "content": "Show tickets assigned to me"}]})
+        intent = result["intent_analysis"]
+
+        assert intent["intent_type"] == "task_management"
+        assert intent["target_tools"] == ["youtrack"]
+        assert intent["action_verbs"] == ["find_assigned", "show"]
+        assert intent["entities"] == ["current_user"]
+        assert intent["domains"] == ["explanation", "project_management", "data_retrieval"]
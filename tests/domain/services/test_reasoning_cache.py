@@ -0,0 +1,146 @@
+"""
+Tests for per-conversation reasoning memoization.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.domain.services import reasoning_service_impl
+from src.domain.services.reasoning_cache import ReasoningCache, ReasoningCacheConfig, conversation_keys
+from src.infrastructure.mcp.tool_registry import ToolExecutionResult
+
+
+def conversation(*user_turns):
+    messages = [{"role": "system", "content": "You are helpful."}]
+    for index, text in enumerate(user_turns):
+        if index:
+            messages.append({"role": "assistant", "content": f"answer {index}"})
+        messages.append({"role": "user", "content": text})
+    return messages
+
+
+class TestReasoningCache:
+    """Test conversation keys, intent reuse and freshness."""
+
+    def setup_method(self):
+        self.cache = ReasoningCache(ReasoningCacheConfig(insights_ttl_seconds=60))
+
+    def test_turns_share_conversation_key(self):
+        """Later turns keep the conversation key; each turn has its own turn key."""
+        first = conversation_keys(conversation("hello"))
+        second = conversation_keys(conversation("hello", "show my tickets"))
+
+        assert first[0] == second[0]
+        assert first[1] != second[1]
+        assert conversation_keys(conversation("other"))[0] != first[0]
+        assert conversation_keys([]) == (None, None)
+
+    def test_intent_reused_only_for_identical_turn(self):
+        """A resent turn hits; a new last message misses."""
+        self.cache.store_intent(conversation("hello"), {"status": "success", "intent_analysis": {"domains": []}})
+
+        cached = self.cache.get_intent(conversation("hello"))
+        cached["intent_analysis"]["domains"].append("mutated")
+
+        assert self.cache.get_intent(conversation("hello"))["intent_analysis"]["domains"] == []
+        assert self.cache.get_intent(conversation("hello", "next")) is None
+        assert self.cache.get_stats()["hits"]["intent"] == 2
+
+    def test_insights_reused_across_turns_until_stale(self):
+        """Results stored on one turn are reused by later turns of the conversation within the TTL."""
+        self.cache.store_insights(conversation("show my tickets"), "calls", {"tools_executed": ["find_assigned_tickets"]})
+
+        with patch("src.domain.services.reasoning_cache.time.monotonic", return_value=10 ** 9):
+            stale = self.cache.get_insights(conversation("show my tickets", "and again"), "calls")
+
+        self.cache.store_insights(conversation("show my tickets"), "calls", {"tools_executed": ["find_assigned_tickets"]})
+        fresh = self.cache.get_insights(conversation("show my tickets", "and again"), "calls")
+
+        assert stale is None
+        assert fresh == {"tools_executed": ["find_assigned_tickets"]}
+        assert self.cache.get_insights(conversation("different chat"), "calls") is None
+
+    def test_disabled_cache_stores_nothing(self):
+        """With the memo disabled nothing is stored or counted."""
+        cache = ReasoningCache(ReasoningCacheConfig(enabled=False))
+        cache.store_intent(conversation("hello"), {"status": "success"})
+
+        assert cache.get_intent(conversation("hello")) is None
+        assert cache.get_stats()["conversations"] == 0
+
+
+class TestReasoningMemoization:
+    """Test memoized reasoning steps in the reasoning service."""
+
+    def setup_method(self):
+        self.cache = ReasoningCache()
+        self.selector = MagicMock()
+        self.selector.prepare_tool_calls.side_effect = lambda tools, context: [(tool, {"state": "Open"}) for tool in tools]
+        self.selector.create_execution_plan = AsyncMock(return_value={
+            "status": "success", "execution_plan": MagicMock(execution_order=["find_assigned_tickets"])
+        })
+        self.tool_runs = 0
+
+        async def iter_tool_plan(plan, context):
+            self.tool_runs += 1
+            yield ToolExecutionResult(success=True, result={"tickets": []}, tool_name="find_assigned_tickets")
+
+        self.selector.iter_tool_plan = iter_tool_plan
+        self.patches = [
+            patch.object(reasoning_service_impl, "reasoning_cache", self.cache),
+            patch.object(reasoning_service_impl, "_reasoning_mcp_tool_selector", self.selector)
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_intent_analysis_is_memoized(self):
+        """Analyzing the same turn twice computes it once."""
+        request = {"messages": conversation("Show tickets assigned to me")}
+
+        first = reasoning_service_impl.analyze_request_intent(request)
+        second = reasoning_service_impl.analyze_request_intent(request)
+
+        assert first == second
+        assert self.cache.get_stats()["hits"]["intent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_reuses_tool_results(self):
+        """A follow-up turn needing the same tool calls does not execute the tools again."""
+        first_request = {"messages": conversation("Show tickets assigned to me")}
+        follow_up = {"messages": conversation("Show tickets assigned to me", "Show tickets assigned to me again")}
+
+        results = []
+        for request in (first_request, follow_up):
+            intent = reasoning_service_impl.analyze_request_intent(request)["intent_analysis"]
+            results.append(await reasoning_service_impl.execute_reasoning_tools(request, ["find_assigned_tickets"], intent))
+
+        assert self.tool_runs == 1
+        assert results[0]["reasoning_insights"] == results[1]["reasoning_insights"]
+        assert "find_assigned_tickets_insight" in results[1]["reasoning_insights"]
+
+    @pytest.mark.asyncio
+    async def test_tool_selection_invalidated_by_catalog_change(self):
+        """A catalog change that keeps the tool count still invalidates the memoized selection."""
+        discovery = MagicMock(catalog_version=1)
+        tool_registry = MagicMock()
+        tool_registry.get_tool_info.return_value = {"description": "find tickets", "server_name": "youtrack"}
+        self.selector.select_tools_for_context = AsyncMock(return_value={
+            "status": "success", "selected_tools": ["find_assigned_tickets"]
+        })
+        request = {"messages": conversation("Show tickets assigned to me")}
+        intent = reasoning_service_impl.analyze_request_intent(request)["intent_analysis"]
+
+        with patch.object(reasoning_service_impl, "_reasoning_mcp_discovery", discovery), \
+                patch.object(reasoning_service_impl, "_reasoning_mcp_tool_registry", tool_registry), \
+                patch.object(reasoning_service_impl, "_initialize_reasoning_mcp_components"), \
+                patch.object(reasoning_service_impl, "_ensure_mcp_discovery_populated", AsyncMock()):
+            await reasoning_service_impl.discover_reasoning_tools(request, intent)
+            await reasoning_service_impl.discover_reasoning_tools(request, intent)
+            discovery.catalog_version = 2
+            result = await reasoning_service_impl.discover_reasoning_tools(request, intent)
+
+        assert result["reasoning_tools"] == ["find_assigned_tickets"]
+        assert self.selector.select_tools_for_context.await_count == 2
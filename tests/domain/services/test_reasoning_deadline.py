@@ -0,0 +1,59 @@
+"""
+Tests for the reasoning budget of the reasoning pipeline.
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from src.domain.services import reasoning_service_impl
+from src.domain.services.reasoning_service_impl import reasoning_pipeline
+from src.infrastructure.mcp.deadline import Deadline, current_deadline
+
+
+def chunk_content(chunk):
+    return json.loads(chunk[len("data: "):])["choices"][0]["delta"]["content"]
+
+
+class TestReasoningPipelineDeadline:
+    """Test that the pipeline stops at its deadline and reports it."""
+
+    def setup_method(self):
+        self.cancelled = False
+        self.seen_deadlines = []
+
+    async def slow_workflow(self, request_data, *steps):
+        self.seen_deadlines.append(current_deadline())
+        yield "data: first\n\n"
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        yield "data: second\n\n"
+
+    @pytest.mark.asyncio
+    async def test_pipeline_stops_at_deadline(self):
+        """Outstanding work is cancelled and a budget step ends the stream."""
+        deadline = Deadline(0.05)
+        with patch.object(reasoning_service_impl, "load_workflow_callback", return_value=self.slow_workflow):
+            chunks = [chunk async for chunk in reasoning_pipeline({"messages": []}, deadline=deadline)]
+
+        assert chunks[0] == "data: first\n\n"
+        assert len(chunks) == 2
+        assert "Time budget of 50ms reached" in chunk_content(chunks[1])
+        assert self.cancelled
+        assert self.seen_deadlines == [deadline]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_without_budget_runs_to_completion(self):
+        """With an unlimited budget the workflow runs to completion."""
+        async def workflow(request_data, *steps):
+            yield "data: first\n\n"
+            yield "data: second\n\n"
+
+        with patch.object(reasoning_service_impl, "load_workflow_callback", return_value=workflow), \
+                patch.object(reasoning_service_impl.config, "REASONING_BUDGET_MS", 0):
+            chunks = [chunk async for chunk in reasoning_pipeline({"messages": []})]
+
+        assert chunks == ["data: first\n\n", "data: second\n\n"]
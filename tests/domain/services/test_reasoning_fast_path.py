@@ -0,0 +1,83 @@
+"""
+Tests for the conversational fast path of the reasoning pipeline.
+"""
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.domain.services import reasoning_service_impl
+from src.domain.services.reasoning_fast_path import (
+    CONVERSATIONAL_REASONING_PROMPT, ReasoningFastPath, ReasoningFastPathConfig
+)
+from src.domain.services.reasoning_service_impl import (
+    analyze_request_intent, apply_reasoning_to_request, reasoning_pipeline
+)
+
+
+def make_request(text):
+    return {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": text}]}
+
+
+class TestReasoningFastPath:
+    """Test classification, routing and the bypass ratio."""
+
+    def setup_method(self):
+        self.fast_path = ReasoningFastPath()
+        self.workflow = MagicMock(side_effect=AssertionError("workflow should be bypassed"))
+
+    def test_classifies_conversational_requests(self):
+        """Chit-chat is bypassed; requests with tool-worthy intent are not."""
+        assert self.fast_path.should_bypass(analyze_request_intent(make_request("Hi there, nice to meet you!")))
+        assert not self.fast_path.should_bypass(analyze_request_intent(make_request("Show my tickets assigned to me")))
+        assert not self.fast_path.should_bypass(analyze_request_intent(make_request("Please find the bug")))
+        assert not self.fast_path.should_bypass({"status": "error", "error": "No user messages found"})
+        assert not ReasoningFastPath(ReasoningFastPathConfig(enabled=False)).should_bypass(
+            analyze_request_intent(make_request("Hi there"))
+        )
+
+    def test_tool_backed_domains_are_not_bypassed(self):
+        """Questions about tickets or repositories need tools even without an action verb."""
+        intent_result = analyze_request_intent(make_request("What are my open issues in project ABC?"))
+
+        assert intent_result["intent_analysis"]["domains"] == ["explanation", "project_management", "version_control"]
+        assert not intent_result["intent_analysis"]["action_verbs"]
+        assert not self.fast_path.should_bypass(intent_result)
+        assert self.fast_path.should_bypass(analyze_request_intent(make_request("What is the meaning of life?")))
+
+    def test_bypass_ratio(self):
+        """The bypass ratio counts recorded requests."""
+        for bypassed in (True, True, False, True):
+            self.fast_path.record(bypassed)
+
+        stats = self.fast_path.get_stats()
+        assert stats["requests"] == 4
+        assert stats["bypassed"] == 3
+        assert stats["bypass_ratio"] == 0.75
+        assert 'reasoning_requests_total{path="fast"} 3' in self.fast_path.render_prometheus()
+        assert "reasoning_bypass_ratio 0.75" in self.fast_path.render_prometheus()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_workflow(self):
+        """The streaming pipeline emits a single step without running the workflow."""
+        with patch.object(reasoning_service_impl, "load_workflow_callback", return_value=self.workflow):
+            chunks = [chunk async for chunk in reasoning_pipeline(make_request("Good morning!"))]
+
+        assert len(chunks) == 1
+        content = json.loads(chunks[0][len("data: "):])["choices"][0]["delta"]["content"]
+        assert "Conversational request" in content
+        self.workflow.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_apply_adds_static_prompt_only(self):
+        """Bypassed requests get the static system prompt and are counted."""
+        requests_before = reasoning_service_impl.reasoning_fast_path.get_stats()["bypassed"]
+
+        with patch.object(reasoning_service_impl, "load_workflow_callback", return_value=self.workflow):
+            result = await apply_reasoning_to_request(make_request("Thanks, that was great"))
+
+        assert result["status"] == "success"
+        assert result["reasoning_metadata"]["fast_path"] is True
+        assert result["reasoning_metadata"]["mcp_tools_used"] == 0
+        assert result["enhanced_request"]["messages"][0] == {"role": "system", "content": CONVERSATIONAL_REASONING_PROMPT}
+        assert reasoning_service_impl.reasoning_fast_path.get_stats()["bypassed"] == requests_before + 1
+        self.workflow.assert_not_called()
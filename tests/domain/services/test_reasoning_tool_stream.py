@@ -0,0 +1,137 @@
+"""
+Tests for streaming reasoning tool results as each tool completes.
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.domain.services import reasoning_service_impl
+from src.domain.services.reasoning_cache import ReasoningCache
+from src.infrastructure.mcp.tool_registry import ToolExecutionResult
+
+TOOLS = ["find_assigned_tickets", "get_user_details"]
+PLAN = {
+    "intent_type": "task_management",
+    "steps": ["Find tickets", "Get user"],
+    "tool_sequence": TOOLS,
+    "expected_output": "Tickets",
+    "reasoning": "User asked for their tickets"
+}
+
+
+def make_request(text="Show tickets assigned to me"):
+    return {"messages": [{"role": "user", "content": text}]}
+
+
+class TestStreamReasoningTools:
+    """Test per-tool events, early cut-off and memoization of streamed runs."""
+
+    def setup_method(self):
+        self.executed = []
+        self.cache = ReasoningCache()
+        self.selector = MagicMock()
+        self.selector.prepare_tool_calls.side_effect = lambda tools, context: [(tool, {}) for tool in tools]
+        self.selector.create_execution_plan = AsyncMock(return_value={
+            "status": "success", "execution_plan": MagicMock(execution_order=TOOLS)
+        })
+
+        async def iter_tool_plan(plan, context):
+            for tool_name in plan.execution_order:
+                self.executed.append(tool_name)
+                yield ToolExecutionResult(success=True, result={"tool": tool_name}, tool_name=tool_name, execution_time_ms=10.0)
+
+        self.selector.iter_tool_plan = iter_tool_plan
+        self.patches = [
+            patch.object(reasoning_service_impl, "reasoning_cache", self.cache),
+            patch.object(reasoning_service_impl, "_reasoning_mcp_tool_selector", self.selector),
+            patch.object(reasoning_service_impl, "generate_execution_plan",
+                         AsyncMock(return_value={"status": "success", "execution_plan": dict(PLAN)}))
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+
+    async def collect(self, request, **kwargs):
+        intent = reasoning_service_impl.analyze_request_intent(request)["intent_analysis"]
+        return [event async for event in reasoning_service_impl.stream_reasoning_tools(request, TOOLS, intent, **kwargs)]
+
+    @pytest.mark.asyncio
+    async def test_events_per_tool_then_summary(self):
+        """Each tool is reported with its insight before the final summary."""
+        events = await self.collect(make_request())
+
+        assert [event["event"] for event in events] == ["tool_result", "tool_result", "completed"]
+        assert [(event["tool_name"], event["completed"], event["total"]) for event in events[:2]] == [
+            ("find_assigned_tickets", 1, 2), ("get_user_details", 2, 2)
+        ]
+        assert events[0]["insight"]["result"] == {"tool": "find_assigned_tickets"}
+        summary = events[-1]
+        assert summary["tools_executed"] == TOOLS
+        assert set(summary["reasoning_insights"]) == {event["insight_key"] for event in events[:2]}
+        assert summary["execution_stats"]["cut_off"] is False
+
+    @pytest.mark.asyncio
+    async def test_enough_context_cuts_off_remaining_tools(self):
+        """Remaining tools are skipped once enough context exists, and the partial run is not memoized."""
+        events = await self.collect(make_request(), enough_context=lambda insights: len(insights) >= 1)
+
+        assert self.executed == ["find_assigned_tickets"]
+        assert events[-1]["execution_stats"]["cut_off"] is True
+        assert list(events[-1]["reasoning_insights"]) == ["find_assigned_tickets_insight"]
+
+        await self.collect(make_request())
+        assert self.executed == ["find_assigned_tickets", "find_assigned_tickets", "get_user_details"]
+
+    @pytest.mark.asyncio
+    async def test_execute_reasoning_tools_returns_summary(self):
+        """The non-streaming entry point returns the final summary."""
+        request = make_request()
+        intent = reasoning_service_impl.analyze_request_intent(request)["intent_analysis"]
+
+        result = await reasoning_service_impl.execute_reasoning_tools(request, TOOLS, intent)
+
+        assert result["status"] == "success"
+        assert "event" not in result
+        assert result["execution_stats"]["success_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_completion_step_rendering(self):
+        """Per-tool completion steps render as short progress lines."""
+        chunk = await reasoning_service_impl.stream_reasoning_step("mcp_tool_execution", {
+            "status": "tool completed", "tool_name": "get_merge_requests", "success": True, "completed": 1, "total": 3
+        })
+
+        content = json.loads(chunk[len("data: "):])["choices"][0]["delta"]["content"]
+        assert content == "🧠 **Tool**: get_merge_requests completed (1/3)\n"
+
+
+class TestWorkflowHelpers:
+    """Test how workflows receive the streaming helper and when the default workflow stops early."""
+
+    def test_seven_parameter_workflows_keep_working(self):
+        """The streaming helper is passed only to workflows that declare it."""
+        calls = []
+
+        def legacy_workflow(request_data, analyze, generate, enhance, discover, execute, step):
+            calls.append("legacy")
+
+        def streaming_workflow(request_data, analyze, generate, enhance, discover, execute, step, stream_reasoning_tools=None):
+            calls.append(stream_reasoning_tools)
+
+        reasoning_service_impl._start_workflow(legacy_workflow, make_request())
+        reasoning_service_impl._start_workflow(streaming_workflow, make_request())
+
+        assert calls == ["legacy", reasoning_service_impl.stream_reasoning_tools]
+
+    def test_default_workflow_stops_once_preferred_tools_answered(self):
+        """The default predicate holds once every preferred tool has an insight."""
+        from workflows.default.reasoning_callback import preferred_insights_gathered
+
+        enough_context = preferred_insights_gathered(["find_assigned_tickets"])
+
+        assert not enough_context({"get_user_details_insight": {}})
+        assert enough_context({"find_assigned_tickets_insight": {}})
+        assert preferred_insights_gathered([]) is None
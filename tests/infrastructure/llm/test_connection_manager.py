@@ -0,0 +1,172 @@
+"""
+Tests for the shared upstream connection pool.
+"""
+import asyncio
+import pytest
+
+import httpx
+
+from src.infrastructure.llm.connection_manager import (
+    CachingDNSBackend, ConnectionPoolConfig, ProviderConnectionManager
+)
+from src.infrastructure.llm.providers import OpenAICompatibleAdapter
+
+
+class KeepAliveServer:
+    """Minimal HTTP/1.1 keep-alive server counting accepted connections."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self.server = None
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":")[1])
+                body = await reader.readexactly(length) if length else b""
+                self.requests.append((head, body))
+                response = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n"
+                writer.write(response if head.startswith(b"HEAD ") else response + b"{}")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{self.port}"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+class TestProviderConnectionManager:
+    """Test pool configuration, reuse metrics and pre-warming."""
+
+    def test_timeouts_and_limits_are_separate(self):
+        """Connect, read, write and pool timeouts and pool limits come from config."""
+        manager = ProviderConnectionManager(ConnectionPoolConfig(
+            connect_timeout_seconds=1.0, read_timeout_seconds=30.0, write_timeout_seconds=2.0,
+            pool_timeout_seconds=0.5, max_connections=8, max_keepalive_connections=4
+        ))
+
+        assert manager.timeout == httpx.Timeout(connect=1.0, read=30.0, write=2.0, pool=0.5)
+        assert manager.limits.max_connections == 8
+        assert manager.limits.max_keepalive_connections == 4
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_and_counted(self):
+        """Sequential requests share one connection and DNS is resolved once."""
+        manager = ProviderConnectionManager()
+        async with KeepAliveServer() as server:
+            client = await manager.get_client()
+            for _ in range(3):
+                response = await client.post(f"{server.url}/chat/completions", json={})
+                assert response.status_code == 200
+
+            stats = manager.get_stats()
+            await manager.close()
+
+        origin_stats = stats["origins"][server.url]
+        assert server.connections == 1
+        assert origin_stats["requests"] == 3
+        assert origin_stats["new_connections"] == 1
+        assert origin_stats["reused_connections"] == 2
+        assert stats["dns_cache"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prewarm_opens_connection_before_first_request(self):
+        """Pre-warming pools a connection that the first real request reuses."""
+        manager = ProviderConnectionManager()
+        async with KeepAliveServer() as server:
+            await manager.prewarm([f"{server.url}/v1", f"{server.url}/api"])
+            client = await manager.get_client()
+            await client.post(f"{server.url}/v1/chat/completions", json={})
+
+            stats = manager.get_stats()
+            await manager.close()
+
+        assert server.connections == 1
+        assert server.requests[0][0].startswith(b"HEAD / ")
+        assert stats["origins"][server.url]["reused_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_adapters_share_pool_and_send_current_key(self):
+        """Adapters use the shared client and send auth headers per request."""
+        manager = ProviderConnectionManager()
+        async with KeepAliveServer() as server:
+            adapter = OpenAICompatibleAdapter("openai", f"{server.url}/v1", "sk-old", connection_manager=manager)
+            await adapter.chat_completion({"model": "gpt-4o-mini", "messages": []})
+            adapter.api_key = "sk-new"
+            await adapter.chat_completion({"model": "gpt-4o-mini", "messages": []})
+
+            assert await adapter.get_client() is await manager.get_client()
+            await adapter.close()
+            assert not (await manager.get_client()).is_closed
+            await manager.close()
+
+        assert b"Bearer sk-old" in server.requests[0][0]
+        assert b"Bearer sk-new" in server.requests[1][0]
+        assert server.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_httpx_errors(self):
+        """Connection failures through the DNS-caching pool surface as httpx errors."""
+        manager = ProviderConnectionManager()
+        async with KeepAliveServer() as server:
+            url = server.url
+        client = await manager.get_client()
+
+        with pytest.raises(httpx.ConnectError):
+            await client.get(url)
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_streamed_responses_through_pool(self):
+        """Streamed bodies are read through the pool and the connection is returned for reuse."""
+        manager = ProviderConnectionManager()
+        async with KeepAliveServer() as server:
+            client = await manager.get_client()
+            for _ in range(2):
+                async with client.stream("POST", f"{server.url}/chat/completions", json={}) as response:
+                    assert await response.aread() == b"{}"
+            await manager.close()
+
+        assert server.connections == 1
+
+    def test_prometheus_rendering(self):
+        """Metrics render in the Prometheus text format."""
+        manager = ProviderConnectionManager()
+
+        text = manager.render_prometheus()
+
+        assert "# TYPE upstream_connections_reused_total counter" in text
+        assert "upstream_dns_cache_hits_total 0" in text
+
+
+class TestCachingDNSBackend:
+    """Test DNS caching."""
+
+    @pytest.mark.asyncio
+    async def test_cached_until_ttl_expires(self):
+        """Resolutions are cached for the TTL; invalidation forces a lookup."""
+        backend = CachingDNSBackend(ttl_seconds=60)
+
+        first = await backend.resolve("localhost", 80)
+        second = await backend.resolve("localhost", 80)
+        backend.invalidate("localhost", 80)
+        await backend.resolve("localhost", 80)
+
+        assert first == second
+        assert backend.hits == 1
+        assert backend.misses == 2
@@ -0,0 +1,231 @@
+"""
+Tests for LLM provider adapters.
+"""
+import json
+import pytest
+from types import SimpleNamespace
+
+import httpx
+
+from src.infrastructure.llm.providers import (
+    OllamaAdapter, OllamaStreamTranslator, OpenAICompatibleAdapter, ProviderAdapter, ProviderError, ProviderRegistry
+)
+from src.infrastructure.llm.sse import SSEPassthroughParser, extract_delta_content
+
+
+def use_transport(adapter, handler):
+    """Point an adapter's connection pool at a mock transport."""
+    adapter._client = httpx.AsyncClient(
+        base_url=adapter.base_url,
+        headers=adapter._headers(),
+        transport=httpx.MockTransport(handler)
+    )
+
+
+async def collect_events(adapter, request_data):
+    parser = SSEPassthroughParser()
+    events = []
+    async for chunk in adapter.stream_chat_completion(request_data):
+        events.extend(parser.feed(chunk))
+    return events
+
+
+def ndjson(*messages):
+    return "".join(json.dumps(message) + "\n" for message in messages).encode()
+
+
+class TestOpenAICompatibleAdapter:
+    """Test OpenAI protocol passthrough."""
+
+    @pytest.mark.asyncio
+    async def test_stream_is_forwarded_unchanged(self):
+        """Upstream SSE bytes are passed through with the provider's auth header."""
+        body = b'data: {"choices":[{"delta":{"content":"Hi"}}]}\n\ndata: [DONE]\n\n'
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers.get("authorization")
+            seen["payload"] = json.loads(request.content)
+            return httpx.Response(200, content=body)
+
+        adapter = OpenAICompatibleAdapter("deepseek", "https://api.deepseek.com/v1/", "sk-test", "deepseek-chat")
+        use_transport(adapter, handler)
+
+        chunks = [chunk async for chunk in adapter.stream_chat_completion({"messages": []})]
+
+        assert b"".join(chunks) == body
+        assert seen["url"] == "https://api.deepseek.com/v1/chat/completions"
+        assert seen["auth"] == "Bearer sk-test"
+        assert seen["payload"] == {"messages": [], "stream": True, "model": "deepseek-chat"}
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises_before_streaming(self):
+        """Non-200 responses raise ProviderError with the status code."""
+        adapter = OpenAICompatibleAdapter("openai", "https://api.openai.com/v1", "sk-test")
+        use_transport(adapter, lambda request: httpx.Response(429, json={"error": "rate limited"}))
+
+        with pytest.raises(ProviderError) as exc_info:
+            await collect_events(adapter, {"model": "gpt-4o-mini", "messages": []})
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.provider == "openai"
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_completion(self):
+        """Non-streaming completions make one POST and return the upstream JSON."""
+        completion = {"object": "chat.completion", "choices": [{"message": {"role": "assistant", "content": "Hi"}}]}
+        payloads = []
+
+        def handler(request):
+            payloads.append(json.loads(request.content))
+            return httpx.Response(200, json=completion)
+
+        adapter = OpenAICompatibleAdapter("openai", "https://api.openai.com/v1", "sk-test", "gpt-4o-mini")
+        use_transport(adapter, handler)
+
+        result = await adapter.chat_completion({"messages": [], "stream": True})
+
+        assert result == completion
+        assert payloads == [{"messages": [], "stream": False, "model": "gpt-4o-mini"}]
+        await adapter.close()
+
+
+class TestOllamaAdapter:
+    """Test Ollama NDJSON to OpenAI SSE translation."""
+
+    def test_build_request_maps_options_and_content_parts(self):
+        """Sampling parameters and multi-part content are translated."""
+        adapter = OllamaAdapter("ollama", "http://localhost:11434", default_model="llama3")
+
+        ollama_request = adapter.build_request({
+            "messages": [{"role": "user", "content": [{"type": "text", "text": "Hello"}]}],
+            "temperature": 0.2,
+            "max_tokens": 64
+        })
+
+        assert ollama_request == {
+            "model": "llama3",
+            "messages": [{"role": "user", "content": "Hello"}],
+            "stream": True,
+            "options": {"temperature": 0.2, "num_predict": 64}
+        }
+
+    @pytest.mark.asyncio
+    async def test_ndjson_stream_is_translated(self):
+        """Ollama chat messages become OpenAI chunks terminated by [DONE]."""
+        body = ndjson(
+            {"model": "llama3", "message": {"role": "assistant", "content": "Hel"}, "done": False},
+            {"model": "llama3", "message": {"role": "assistant", "content": "lo"}, "done": False},
+            {"model": "llama3", "message": {"role": "assistant", "content": ""}, "done": True,
+             "done_reason": "stop", "prompt_eval_count": 5, "eval_count": 2}
+        )
+        seen = {}
+
+        def handler(request):
+            seen["path"] = request.url.path
+            seen["payload"] = json.loads(request.content)
+            return httpx.Response(200, content=body)
+
+        adapter = OllamaAdapter("ollama", "http://localhost:11434", default_model="llama3")
+        use_transport(adapter, handler)
+
+        events = await collect_events(adapter, {"model": "llama3", "messages": [{"role": "user", "content": "Hi"}]})
+
+        assert seen["path"] == "/api/chat"
+        assert seen["payload"]["stream"] is True
+        assert [extract_delta_content(event.data) for event in events[:2]] == ["Hel", "lo"]
+        assert json.loads(events[0].data)["choices"][0]["delta"]["role"] == "assistant"
+
+        final_chunk = json.loads(events[2].data)
+        assert final_chunk["object"] == "chat.completion.chunk"
+        assert final_chunk["choices"][0]["finish_reason"] == "stop"
+        assert final_chunk["usage"]["total_tokens"] == 7
+        assert events[-1].is_done
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_completion_is_translated(self):
+        """A non-streaming Ollama response becomes an OpenAI chat.completion."""
+        def handler(request):
+            assert json.loads(request.content)["stream"] is False
+            return httpx.Response(200, json={
+                "model": "llama3", "message": {"role": "assistant", "content": "Hello"},
+                "done": True, "done_reason": "length", "prompt_eval_count": 3, "eval_count": 4
+            })
+
+        adapter = OllamaAdapter("ollama", "http://localhost:11434", default_model="llama3")
+        use_transport(adapter, handler)
+
+        completion = await adapter.chat_completion({"messages": [{"role": "user", "content": "Hi"}]})
+
+        assert completion["object"] == "chat.completion"
+        assert completion["choices"][0]["message"] == {"role": "assistant", "content": "Hello"}
+        assert completion["choices"][0]["finish_reason"] == "length"
+        assert completion["usage"]["total_tokens"] == 7
+        await adapter.close()
+
+    def test_translator_terminates_incomplete_stream(self):
+        """Streams closed without a done message still end with [DONE]."""
+        translator = OllamaStreamTranslator("llama3")
+        translator.translate_line('{"message": {"content": "partial"}, "done": false}')
+
+        events = translator.finish()
+
+        assert events[-1] == b"data: [DONE]\n\n"
+        assert translator.finish() == []
+
+    def test_translator_reports_stream_errors(self):
+        """In-stream errors are forwarded as OpenAI error events."""
+        translator = OllamaStreamTranslator("llama3")
+
+        events = translator.translate_line('{"error": "model not found"}')
+
+        assert json.loads(events[0][6:])["error"]["message"] == "model not found"
+        assert events[1] == b"data: [DONE]\n\n"
+
+
+class TestProviderAdapter:
+    """Test the adapter base class contract."""
+
+    def test_incomplete_adapter_fails_at_construction(self):
+        """An adapter missing a completion method cannot be instantiated."""
+        class StreamingOnlyAdapter(ProviderAdapter):
+            async def stream_chat_completion(self, request_data):
+                yield b""
+
+        with pytest.raises(TypeError):
+            StreamingOnlyAdapter("partial", "http://localhost")
+
+
+class TestProviderRegistry:
+    """Test adapter creation from configuration."""
+
+    def setup_method(self):
+        self.config = SimpleNamespace(
+            OPENAI_BASE_URL="https://api.openai.com/v1", OPENAI_API_KEY="sk-openai", OPENAI_DEFAULT_MODEL="gpt-4o-mini",
+            DEEPSEEK_BASE_URL="https://api.deepseek.com/v1", DEEPSEEK_API_KEY="sk-deepseek",
+            DEEPSEEK_DEFAULT_MODEL="deepseek-chat",
+            OLLAMA_BASE_URL="http://localhost:11434", OLLAMA_DEFAULT_MODEL="llama3"
+        )
+        self.registry = ProviderRegistry(self.config)
+
+    def test_adapters_are_created_per_provider(self):
+        """Each supported provider gets its own cached adapter."""
+        assert isinstance(self.registry.get("openai"), OpenAICompatibleAdapter)
+        assert isinstance(self.registry.get("deepseek"), OpenAICompatibleAdapter)
+        assert isinstance(self.registry.get("Ollama"), OllamaAdapter)
+        assert self.registry.get("deepseek") is self.registry.get("deepseek")
+        assert self.registry.get("deepseek").api_key == "sk-deepseek"
+        assert self.registry.get("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_pools(self):
+        """close_all releases every provider connection pool."""
+        client = await self.registry.get("ollama").get_client()
+
+        await self.registry.close_all()
+
+        assert client.is_closed
@@ -0,0 +1,163 @@
+"""
+Tests for per-model routing and failover across provider endpoints.
+"""
+import pytest
+import time
+from types import SimpleNamespace
+
+import httpx
+
+from src.infrastructure.llm.providers import ProviderError, ProviderRegistry
+from src.infrastructure.llm.router import ModelRouter, RouterConfig
+
+DONE_BODY = b'data: {"choices":[{"delta":{"content":"ok"}}]}\n\ndata: [DONE]\n\n'
+
+
+def make_config():
+    return SimpleNamespace(
+        OPENAI_BASE_URL="https://api.openai.com/v1", OPENAI_API_KEY="sk-openai", OPENAI_DEFAULT_MODEL="gpt-4o-mini",
+        DEEPSEEK_BASE_URL="https://api.deepseek.com/v1", DEEPSEEK_API_KEY="", DEEPSEEK_DEFAULT_MODEL="deepseek-chat",
+        OLLAMA_BASE_URL="http://localhost:11434", OLLAMA_DEFAULT_MODEL="llama3"
+    )
+
+
+def use_transport(endpoint, handler):
+    adapter = endpoint.adapter
+    adapter._client = httpx.AsyncClient(base_url=adapter.base_url, transport=httpx.MockTransport(handler))
+
+
+async def read_stream(router, request_data):
+    return b"".join([chunk async for chunk in router.stream_chat_completion(request_data)])
+
+
+class TestModelRouter:
+    """Test endpoint selection and failover."""
+
+    def setup_method(self):
+        routes = {
+            "gpt-4o-mini": [
+                {"name": "gateway-a", "base_url": "https://a.example.com/v1", "weight": 1},
+                {"name": "gateway-b", "base_url": "https://b.example.com/v1", "weight": 3},
+                {"name": "deepseek", "provider": "deepseek", "base_url": "https://api.deepseek.com/v1",
+                 "model": "deepseek-chat"}
+            ]
+        }
+        self.router = ModelRouter(ProviderRegistry(make_config()), "openai", RouterConfig(routes=routes))
+        self.endpoints = {endpoint.name: endpoint for endpoint in self.router.get_endpoints("gpt-4o-mini")}
+
+    def test_unrouted_models_use_default_provider(self):
+        """Models without a route fall back to the default provider adapter."""
+        endpoints = self.router.get_endpoints("other-model")
+
+        assert [endpoint.name for endpoint in endpoints] == ["openai"]
+        assert self.router.routed_models == ["gpt-4o-mini"]
+
+    def test_least_in_flight_relative_to_weight(self):
+        """The endpoint with the lowest weighted load is tried first."""
+        self.endpoints["gateway-a"].in_flight = 0
+        self.endpoints["gateway-b"].in_flight = 2
+        self.endpoints["deepseek"].in_flight = 5
+
+        order = [endpoint.name for endpoint in self.router.select_endpoints("gpt-4o-mini")]
+
+        # Scores: a = 1/1, b = 3/3, deepseek = 6/1
+        assert order[-1] == "deepseek"
+
+        self.endpoints["gateway-a"].in_flight = 1
+        assert self.router.select_endpoints("gpt-4o-mini")[0].name == "gateway-b"
+
+    @pytest.mark.asyncio
+    async def test_fails_over_on_throttling(self):
+        """A 429 before any bytes moves the request to the next endpoint."""
+        seen = []
+
+        def throttled(request):
+            seen.append("throttled")
+            return httpx.Response(429, headers={"retry-after": "30"})
+
+        def healthy(request):
+            seen.append(request.read().decode())
+            return httpx.Response(200, content=DONE_BODY)
+
+        self.endpoints["gateway-b"].in_flight = 0
+        self.endpoints["gateway-a"].in_flight = 10
+        self.endpoints["deepseek"].in_flight = 10
+        use_transport(self.endpoints["gateway-b"], throttled)
+        use_transport(self.endpoints["gateway-a"], healthy)
+        use_transport(self.endpoints["deepseek"], healthy)
+
+        body = await read_stream(self.router, {"model": "gpt-4o-mini", "messages": []})
+
+        assert body == DONE_BODY
+        assert seen[0] == "throttled"
+        gateway_b = self.endpoints["gateway-b"]
+        assert gateway_b.failed_requests == 1
+        assert gateway_b.is_cooling_down(time.monotonic())
+        assert gateway_b.in_flight == 0
+        # The throttled endpoint is tried last while cooling down
+        assert self.router.select_endpoints("gpt-4o-mini")[-1].name == "gateway-b"
+
+    @pytest.mark.asyncio
+    async def test_endpoint_model_override(self):
+        """Endpoints can map the requested model to an upstream model name."""
+        payloads = []
+
+        def handler(request):
+            payloads.append(request.read())
+            return httpx.Response(200, content=DONE_BODY)
+
+        for name, endpoint in self.endpoints.items():
+            endpoint.in_flight = 0 if name == "deepseek" else 10
+            use_transport(endpoint, handler)
+
+        await read_stream(self.router, {"model": "gpt-4o-mini", "messages": []})
+
+        assert b'"model":"deepseek-chat"' in payloads[0].replace(b" ", b"")
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """A 400 is returned to the caller without trying other endpoints."""
+        calls = []
+
+        def bad_request(request):
+            calls.append(request.url.host)
+            return httpx.Response(400)
+
+        for endpoint in self.endpoints.values():
+            use_transport(endpoint, bad_request)
+
+        with pytest.raises(ProviderError) as exc_info:
+            await read_stream(self.router, {"model": "gpt-4o-mini", "messages": []})
+
+        assert exc_info.value.status_code == 400
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_all_endpoints_failing_raises_last_error(self):
+        """When every endpoint fails the last error is raised."""
+        for endpoint in self.endpoints.values():
+            use_transport(endpoint, lambda request: httpx.Response(503))
+
+        with pytest.raises(ProviderError) as exc_info:
+            await read_stream(self.router, {"model": "gpt-4o-mini", "messages": []})
+
+        assert exc_info.value.status_code == 503
+        assert all(endpoint.failed_requests == 1 for endpoint in self.endpoints.values())
+        assert all(endpoint.in_flight == 0 for endpoint in self.endpoints.values())
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_completion_fails_over(self):
+        """Non-streaming completions fail over on 5xx as well."""
+        completion = {"object": "chat.completion", "choices": []}
+        self.endpoints["gateway-b"].in_flight = 0
+        self.endpoints["gateway-a"].in_flight = 10
+        self.endpoints["deepseek"].in_flight = 20
+        use_transport(self.endpoints["gateway-b"], lambda request: httpx.Response(502))
+        use_transport(self.endpoints["gateway-a"], lambda request: httpx.Response(200, json=completion))
+
+        result = await self.router.chat_completion({"model": "gpt-4o-mini", "messages": []})
+
+        assert result == completion
+        assert self.endpoints["gateway-b"].failed_requests == 1
+        assert self.endpoints["gateway-b"].in_flight == 0
+        assert self.endpoints["gateway-a"].in_flight == 10
@@ -0,0 +1,88 @@
+"""
+Tests for SSE passthrough parsing and delta extraction.
+"""
+import json
+import pytest
+
+from src.infrastructure.llm import sse
+from src.infrastructure.llm.sse import SSEPassthroughParser, extract_delta_content
+
+
+def make_chunk(content, **delta):
+    """Build a raw OpenAI chat completion chunk event."""
+    if content is not None:
+        delta["content"] = content
+    payload = {"id": "chatcmpl-1", "object": "chat.completion.chunk", "choices": [{"index": 0, "delta": delta}]}
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
+
+class TestSSEPassthroughParser:
+    """Test incremental event splitting."""
+
+    def test_events_are_forwarded_byte_for_byte(self):
+        """Raw event bytes are yielded unchanged."""
+        stream = make_chunk("Hel") + make_chunk("lo") + b"data: [DONE]\n\n"
+        parser = SSEPassthroughParser()
+
+        events = list(parser.feed(stream))
+
+        assert b"".join(event.raw for event in events) == stream
+        assert [event.is_done for event in events] == [False, False, True]
+
+    def test_events_split_across_chunks(self):
+        """Events spanning several network chunks are reassembled."""
+        stream = make_chunk("Hello") + make_chunk(" world")
+        parser = SSEPassthroughParser()
+
+        events = []
+        for i in range(0, len(stream), 7):
+            events.extend(parser.feed(stream[i:i + 7]))
+
+        assert [extract_delta_content(event.data) for event in events] == ["Hello", " world"]
+        assert parser.flush() is None
+
+    def test_crlf_and_comment_events(self):
+        """CRLF line endings and comment events are handled."""
+        parser = SSEPassthroughParser()
+
+        events = list(parser.feed(b": keep-alive\r\n\r\ndata: [DONE]\r\n\r\n"))
+
+        assert events[0].data is None
+        assert events[1].is_done
+
+    def test_flush_returns_unterminated_event(self):
+        """A trailing event without a blank line is returned by flush."""
+        parser = SSEPassthroughParser()
+        assert list(parser.feed(b'data: {"choices": []}')) == []
+
+        event = parser.flush()
+
+        assert event.data == b'{"choices": []}'
+
+
+class TestExtractDeltaContent:
+    """Test delta content extraction with and without orjson."""
+
+    @pytest.fixture(params=["orjson", "scanner"])
+    def extractor(self, request, monkeypatch):
+        if request.param == "scanner":
+            monkeypatch.setattr(sse, "orjson", None)
+        elif sse.orjson is None:
+            pytest.skip("orjson not installed")
+        return extract_delta_content
+
+    def test_plain_and_escaped_content(self, extractor):
+        """Escapes and unicode are decoded."""
+        data = json.dumps({"choices": [{"delta": {"content": "line\n\"quoted\" é 🚀"}}]}).encode()
+
+        assert extractor(data) == "line\n\"quoted\" é 🚀"
+
+    def test_role_only_and_null_content(self, extractor):
+        """Chunks without text content yield None."""
+        assert extractor(make_chunk(None, role="assistant")[6:-2]) is None
+        assert extractor(b'{"choices":[{"delta":{"content":null},"finish_reason":"stop"}]}') is None
+        assert extractor(b'{"choices":[]}') is None
+
+    def test_invalid_payload(self, extractor):
+        """Malformed payloads are ignored."""
+        assert extractor(b'{"choices": [{"delta": {"content": "unterminated') is None
@@ -0,0 +1,102 @@
+"""
+Tests for structured, queued logging.
+"""
+import io
+import json
+import logging
+import queue
+
+from src.infrastructure.logging.structured_logger import (
+    AccessLogSampler, JSONFormatter, LoggingConfig, NonBlockingQueueHandler, RequestContextFilter,
+    StructuredLogging, TextFormatter, bind_request_context, reset_request_context
+)
+
+
+def make_record(message="hello %s", args=("world",), **extra):
+    record = logging.LogRecord("Test", logging.INFO, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    RequestContextFilter().filter(record)
+    return record
+
+
+class TestFormatters:
+    """Test JSON and text output with request context."""
+
+    def test_json_lines_include_context_and_fields(self):
+        """JSON output is one object per record with context and extra fields."""
+        token = bind_request_context(request_id="abc123", path="/v1/chat/completions")
+        try:
+            record = make_record(status_code=200)
+        finally:
+            reset_request_context(token)
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["message"] == "hello world"
+        assert entry["request_id"] == "abc123"
+        assert entry["path"] == "/v1/chat/completions"
+        assert entry["status_code"] == 200
+
+    def test_text_output_appends_request_id_and_fields(self):
+        """Text output keeps the classic format and appends structured fields compactly."""
+        token = bind_request_context(request_id="abc123")
+        try:
+            line = TextFormatter().format(make_record(interaction={"model": "gpt-4o-mini"}))
+        finally:
+            reset_request_context(token)
+
+        assert " - Test - INFO - hello world [request_id=abc123]" in line
+        assert line.endswith('{"interaction":{"model":"gpt-4o-mini"}}')
+
+
+class TestNonBlockingQueueHandler:
+    """Test deferred formatting and dropping under backpressure."""
+
+    def test_messages_are_rendered_before_queueing_and_dropped_when_full(self):
+        """Arguments mutated after the log call do not change the message, and a full queue drops instead of blocking."""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        payload = {"model": "gpt-4o-mini"}
+
+        handler.handle(make_record("request %s", (payload,)))
+        payload["messages"] = []
+        handler.handle(make_record())
+
+        queued = handler.queue.get_nowait()
+        assert queued.getMessage() == "request {'model': 'gpt-4o-mini'}"
+        assert queued.args is None
+        assert handler.dropped == 1
+
+
+class TestStructuredLogging:
+    """Test the installed pipeline and access log sampling."""
+
+    def test_sampler_spreads_successes_and_keeps_errors(self):
+        """A 25% rate logs every fourth success; errors are always logged."""
+        sampler = AccessLogSampler(0.25)
+
+        decisions = [sampler.should_log(200) for _ in range(8)]
+
+        assert decisions.count(True) == 2
+        assert sampler.should_log(500)
+
+    def test_background_writer_outputs_json(self):
+        """Records logged through the queue are written as JSON lines by the listener."""
+        output = io.StringIO()
+        structured = StructuredLogging(LoggingConfig(format="json", async_output=True))
+        root = logging.getLogger()
+        previous_handlers, previous_level = list(root.handlers), root.level
+        try:
+            structured.configure(output)
+            structured.log_access(logging.getLogger("Access"), "POST", "/v1/chat/completions", 200, 0.0)
+            structured.stop()
+        finally:
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+            for handler in previous_handlers:
+                root.addHandler(handler)
+            root.setLevel(previous_level)
+
+        entry = json.loads(output.getvalue().strip())
+        assert entry["message"] == "POST /v1/chat/completions 200"
+        assert entry["status_code"] == 200
+        assert "duration_ms" in entry
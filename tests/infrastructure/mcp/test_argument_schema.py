@@ -0,0 +1,90 @@
+"""
+Tests for tool argument canonicalisation and validation before dispatch.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.mcp.argument_schema import canonicalize_arguments, validate_arguments
+from src.infrastructure.mcp.discovery import MCPToolInfo
+from src.infrastructure.mcp.tool_registry import MCPUnifiedToolRegistry
+
+TICKET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "project": {"type": "string"},
+        "state": {"type": "string", "enum": ["Open", "Closed"]},
+        "limit": {"type": "integer", "default": 20},
+        "labels": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["project"],
+    "additionalProperties": False
+}
+
+
+class TestArgumentSchema:
+    """Test canonical forms and validation errors."""
+
+    def test_equivalent_arguments_canonicalize_identically(self):
+        """Enum spelling, numeric strings and, for cache keys, defaults do not change the canonical form."""
+        first = canonicalize_arguments({"project": "DEMO", "state": " open", "limit": "20"}, TICKET_SCHEMA, drop_defaults=True)
+        second = canonicalize_arguments({"project": "DEMO", "state": "Open"}, TICKET_SCHEMA, drop_defaults=True)
+
+        assert first == second == {"project": "DEMO", "state": "Open"}
+        assert canonicalize_arguments({"project": "DEMO", "limit": "20"}, TICKET_SCHEMA) == {"project": "DEMO", "limit": 20}
+
+    def test_valid_values_are_not_coerced(self):
+        """Values that already satisfy their declared type are sent unchanged."""
+        schema = {"properties": {"id": {"type": ["string", "integer"]}, "ratio": {"type": "number"}, "name": {"type": "string"}}}
+
+        assert canonicalize_arguments({"id": "0012", "ratio": 2.0, "name": " DEMO "}, schema) == {
+            "id": "0012", "ratio": 2.0, "name": " DEMO "
+        }
+        assert canonicalize_arguments({"id": 12.0}, {"properties": {"id": {"type": "integer"}}}) == {"id": 12}
+
+    def test_validation_errors(self):
+        """Missing, unexpected and mistyped arguments are reported."""
+        errors = validate_arguments({"state": "Pending", "limit": "many", "labels": ["a", 1], "query": "x"}, TICKET_SCHEMA)
+
+        assert "missing required argument 'project'" in errors
+        assert "unexpected argument 'query'" in errors
+        assert "argument 'state' must be one of ['Open', 'Closed']" in errors
+        assert "argument 'limit' must be of type integer" in errors
+        assert "argument 'labels[1]' must be of type string" in errors
+        assert validate_arguments({"project": "DEMO", "limit": 5}, TICKET_SCHEMA) == []
+        assert validate_arguments({"anything": 1}, {}) == []
+
+
+class TestRegistryArgumentValidation:
+    """Test that the registry validates before dispatch and caches canonical calls."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.client.call_tool = AsyncMock(return_value="tickets")
+        self.server_registry = MagicMock()
+        self.server_registry.get_server_by_name.return_value = self.client
+        self.discovery = MagicMock()
+        self.discovery.get_tool.return_value = MCPToolInfo(
+            name="find_tickets", server_name="youtrack", description="Find tickets", input_schema=TICKET_SCHEMA
+        )
+        self.discovery.get_tool_servers.return_value = ["youtrack"]
+        self.tool_registry = MCPUnifiedToolRegistry(self.server_registry, self.discovery)
+
+    @pytest.mark.asyncio
+    async def test_invalid_call_is_not_dispatched(self):
+        """Calls that fail validation never reach the server."""
+        result = await self.tool_registry.execute_tool("find_tickets", {"query": "my tickets"})
+
+        assert not result.success
+        assert result.error_message.startswith("Invalid arguments: missing required argument 'project'")
+        self.client.call_tool.assert_not_called()
+        assert self.tool_registry.get_registry_stats()["execution"]["rejected_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_equivalent_calls_share_cache_entry(self):
+        """Equivalent arguments hit the cached result of the canonical call; defaults are still dispatched."""
+        first = await self.tool_registry.execute_tool("find_tickets", {"project": "DEMO", "state": "open", "limit": "20"})
+        second = await self.tool_registry.execute_tool("find_tickets", {"project": "DEMO", "state": "Open"})
+
+        assert first.success and second.success
+        assert self.client.call_tool.await_count == 1
+        self.client.call_tool.assert_awaited_with("find_tickets", {"project": "DEMO", "state": "Open", "limit": 20})
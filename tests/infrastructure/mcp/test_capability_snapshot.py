@@ -0,0 +1,160 @@
+"""
+Tests for parallel MCP capability discovery and the persisted capability snapshot.
+"""
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.infrastructure.mcp.capability_snapshot import MCPCapabilitySnapshot, compute_schema_hash
+from src.infrastructure.mcp.client import MCPClient, MCPServerConfig, MCPTransportType
+from src.infrastructure.mcp.discovery import MCPToolDiscovery, ToolAvailabilityStatus
+from src.infrastructure.mcp.registry import MCPServerRegistry
+
+
+def make_tool(name, description="", schema=None):
+    """Create a tool object as returned by the MCP SDK."""
+    return SimpleNamespace(name=name, description=description, inputSchema=schema or {"type": "object"})
+
+
+def make_server_config(name):
+    """Create a server config with the attributes the registry expects."""
+    config = MCPServerConfig(name=name, transport=MCPTransportType.STDIO, command="python")
+    config.enabled = True
+    config.retry_attempts = 3
+    config.retry_delay = 1.0
+    return config
+
+
+class TestCapabilitySnapshot:
+    """Test snapshot persistence and schema hashing."""
+
+    def test_schema_hash_is_order_independent(self):
+        """Hash depends on tool definitions, not their order."""
+        tools = [
+            {"name": "b", "description": "B", "input_schema": {"type": "object"}},
+            {"name": "a", "description": "A", "input_schema": {}}
+        ]
+
+        assert compute_schema_hash(tools) == compute_schema_hash(list(reversed(tools)))
+
+    def test_schema_hash_changes_with_schema(self):
+        """Changing an input schema changes the hash."""
+        before = [{"name": "a", "input_schema": {"type": "object"}}]
+        after = [{"name": "a", "input_schema": {"type": "object", "required": ["id"]}}]
+
+        assert compute_schema_hash(before) != compute_schema_hash(after)
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Saved servers are loaded back with their schema hash."""
+        snapshot = MCPCapabilitySnapshot(str(tmp_path / "snapshot.json"))
+        tools = [{"name": "get_issue", "description": "Get issue", "input_schema": {}}]
+
+        snapshot.save({"youtrack": tools})
+        snapshot.save({"gitlab": []})
+
+        data = snapshot.load()
+        assert set(data) == {"youtrack", "gitlab"}
+        assert data["youtrack"]["tools"] == tools
+        assert snapshot.get_schema_hash("youtrack") == compute_schema_hash(tools)
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        """A corrupt snapshot is treated as empty."""
+        path = tmp_path / "snapshot.json"
+        path.write_text("{not json")
+
+        assert MCPCapabilitySnapshot(str(path)).load() == {}
+
+
+class TestParallelDiscovery:
+    """Test concurrent discovery and connection."""
+
+    @pytest.mark.asyncio
+    async def test_client_lists_capabilities_concurrently(self):
+        """list_tools, list_resources and list_prompts run at the same time."""
+        async def slow(result):
+            await asyncio.sleep(0.1)
+            return result
+
+        client = MCPClient(make_server_config("test"))
+        client.session = MagicMock()
+        client.session.list_tools = lambda: slow(SimpleNamespace(tools=[make_tool("a")]))
+        client.session.list_resources = lambda: slow(SimpleNamespace(resources=[]))
+        client.session.list_prompts = AsyncMock(side_effect=RuntimeError("unsupported"))
+
+        start = time.monotonic()
+        await client._discover_capabilities()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.18
+        assert [tool.name for tool in client.get_available_tools()] == ["a"]
+        assert client.get_available_prompts() == []
+
+    @pytest.mark.asyncio
+    async def test_register_servers_connects_in_parallel(self):
+        """Cold start is bounded by the slowest server, not the sum."""
+        registry = MCPServerRegistry()
+
+        async def slow_connect(self):
+            await asyncio.sleep(0.1)
+            return True
+
+        configs = [make_server_config(f"server-{i}") for i in range(5)]
+        with patch.object(MCPClient, "connect", slow_connect):
+            start = time.monotonic()
+            results = await registry.register_servers(configs)
+            elapsed = time.monotonic() - start
+
+        assert all(results.values())
+        assert len(registry.get_connected_servers()) == 5
+        assert elapsed < 0.3
+
+
+class TestDiscoverySnapshot:
+    """Test snapshot preloading in tool discovery."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.registry = MCPServerRegistry()
+        self.discovery = MCPToolDiscovery(self.registry)
+
+    def _connect_fake_server(self, name, tools):
+        server_info = MagicMock()
+        server_info.is_healthy = True
+        server_info.client.get_available_tools.return_value = tools
+        server_info.client.get_available_resources.return_value = []
+        server_info.client.get_available_prompts.return_value = []
+        self.registry.get_connected_servers = MagicMock(return_value={name: server_info})
+
+    @pytest.mark.asyncio
+    async def test_snapshot_tools_available_before_connect(self, tmp_path):
+        """Tools from the snapshot are selectable before the server connects."""
+        snapshot = MCPCapabilitySnapshot(str(tmp_path / "snapshot.json"))
+        snapshot.save({"youtrack": [{"name": "get_issue", "description": "Get issue", "input_schema": {}}]})
+
+        loaded = self.discovery.enable_capability_snapshot(snapshot)
+
+        assert loaded == 1
+        tool = self.discovery.get_tool("get_issue")
+        assert tool.server_name == "youtrack"
+        assert tool.availability_status == ToolAvailabilityStatus.UNKNOWN
+
+    @pytest.mark.asyncio
+    async def test_live_discovery_replaces_snapshot(self, tmp_path):
+        """Live discovery replaces snapshot tools and persists the new tool list."""
+        snapshot = MCPCapabilitySnapshot(str(tmp_path / "snapshot.json"))
+        snapshot.save({"youtrack": [{"name": "old_tool", "description": "", "input_schema": {}}]})
+        self.discovery.enable_capability_snapshot(snapshot)
+
+        self._connect_fake_server("youtrack", [make_tool("get_issue", "Get issue")])
+        results = await self.discovery.discover_new_servers()
+
+        assert len(results) == 1
+        assert self.discovery.get_tool("old_tool") is None
+        assert self.discovery.get_tool("get_issue").availability_status == ToolAvailabilityStatus.AVAILABLE
+        assert [t["name"] for t in snapshot.load()["youtrack"]["tools"]] == ["get_issue"]
+        assert self.discovery.get_schema_hash("youtrack") == snapshot.get_schema_hash("youtrack")
+
+        # Already discovered servers are not discovered again
+        assert await self.discovery.discover_new_servers() == []
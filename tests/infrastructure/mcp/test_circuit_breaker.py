@@ -0,0 +1,184 @@
+"""
+Tests for MCP circuit breakers and hedged tool execution.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.infrastructure.mcp.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerConfig, CircuitState, LatencyTracker
+)
+from src.infrastructure.mcp.tool_registry import MCPUnifiedToolRegistry
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = CircuitBreakerConfig(
+            window_size=4,
+            min_calls=4,
+            failure_rate_threshold=0.5,
+            slow_call_threshold_ms=100.0,
+            slow_call_rate_threshold=0.75,
+            open_duration_seconds=30.0
+        )
+        self.breaker = CircuitBreaker("test", self.config)
+
+    def test_stays_closed_below_min_calls(self):
+        """Failures below min_calls do not trip the breaker."""
+        for _ in range(3):
+            self.breaker.record_failure()
+
+        assert self.breaker.state == CircuitState.CLOSED
+        assert self.breaker.allow_request() is True
+
+    def test_opens_on_failure_rate(self):
+        """Breaker opens once failure rate reaches the threshold."""
+        self.breaker.record_success(10)
+        self.breaker.record_success(10)
+        self.breaker.record_failure(10)
+        self.breaker.record_failure(10)
+
+        assert self.breaker.state == CircuitState.OPEN
+        assert self.breaker.allow_request() is False
+        assert self.breaker.get_stats()["rejected_calls"] == 1
+
+    def test_opens_on_slow_call_rate(self):
+        """Breaker opens when most calls exceed the slow-call threshold."""
+        self.breaker.record_success(10)
+        for _ in range(3):
+            self.breaker.record_success(500)
+
+        assert self.breaker.state == CircuitState.OPEN
+
+    def test_half_open_after_cool_down(self):
+        """Breaker allows a single trial call after the cool-down."""
+        with patch("src.infrastructure.mcp.circuit_breaker.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            for _ in range(4):
+                self.breaker.record_failure()
+            assert self.breaker.state == CircuitState.OPEN
+
+            mock_time.return_value = 1031.0
+            assert self.breaker.state == CircuitState.HALF_OPEN
+            assert self.breaker.allow_request() is True
+            assert self.breaker.allow_request() is False
+
+            self.breaker.record_success(10)
+            assert self.breaker.state == CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self):
+        """A failed trial call opens the breaker again."""
+        with patch("src.infrastructure.mcp.circuit_breaker.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            for _ in range(4):
+                self.breaker.record_failure()
+
+            mock_time.return_value = 1031.0
+            assert self.breaker.allow_request() is True
+            self.breaker.record_failure()
+
+            assert self.breaker.state == CircuitState.OPEN
+            assert self.breaker.get_stats()["times_opened"] == 2
+
+    def test_latency_tracker_percentile(self):
+        """Latency tracker returns nearest-rank percentiles."""
+        tracker = LatencyTracker()
+        assert tracker.percentile(95) is None
+
+        for latency in range(1, 101):
+            tracker.record(float(latency))
+
+        assert tracker.count == 100
+        assert tracker.percentile(95) == 95.0
+        assert tracker.percentile(50) == 50.0
+
+
+class TestToolRegistryResilience:
+    """Test circuit breaker and hedging integration in the unified tool registry."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clients = {"server-a": MagicMock(), "server-b": MagicMock()}
+
+        self.server_registry = MagicMock()
+        self.server_registry.get_server_by_name.side_effect = lambda name: self.clients.get(name)
+        self.server_registry.get_server_info.return_value = MagicMock(is_healthy=True)
+
+        self.discovery = MagicMock()
+        self.discovery.get_tool.return_value = MagicMock()
+        self.discovery.get_tool_servers.return_value = ["server-a", "server-b"]
+
+        self.tool_registry = MCPUnifiedToolRegistry(self.server_registry, self.discovery)
+        self.tool_registry.enable_caching(False)
+        self.tool_registry.configure_circuit_breakers(
+            tool_config=CircuitBreakerConfig(window_size=2, min_calls=2)
+        )
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_server(self):
+        """Failing server is skipped once its circuit opens."""
+        self.clients["server-a"].call_tool = AsyncMock(side_effect=RuntimeError("boom"))
+        self.clients["server-b"].call_tool = AsyncMock(return_value={"ok": True})
+
+        for _ in range(2):
+            result = await self.tool_registry.execute_tool("search_issues", {})
+            assert result.success is False
+
+        result = await self.tool_registry.execute_tool("search_issues", {})
+
+        assert result.success is True
+        assert result.server_name == "server-b"
+        stats = self.tool_registry.get_registry_stats()["circuit_breakers"]
+        assert stats["tools"]["server-a:search_issues"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_all_circuits_open_fails_fast(self):
+        """Calls fail immediately with a clear error when every circuit is open."""
+        self.discovery.get_tool_servers.return_value = ["server-a"]
+        self.clients["server-a"].call_tool = AsyncMock(side_effect=RuntimeError("boom"))
+
+        for _ in range(2):
+            await self.tool_registry.execute_tool("search_issues", {})
+        self.clients["server-a"].call_tool.reset_mock()
+
+        result = await self.tool_registry.execute_tool("search_issues", {})
+
+        assert result.success is False
+        assert "Circuit open" in result.error_message
+        self.clients["server-a"].call_tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_uses_faster_replica(self):
+        """Slow primary is hedged to the next replica for idempotent tools."""
+        async def slow_call(tool_name, arguments):
+            await asyncio.sleep(1)
+            return {"server": "a"}
+
+        self.clients["server-a"].call_tool = AsyncMock(side_effect=slow_call)
+        self.clients["server-b"].call_tool = AsyncMock(return_value={"server": "b"})
+        self.tool_registry.enable_hedging(default_delay_ms=10)
+
+        result = await self.tool_registry.execute_tool("get_issue", {"id": "1"})
+
+        assert result.success is True
+        assert result.result == {"server": "b"}
+        assert self.tool_registry.get_registry_stats()["hedging"]["won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_tool_not_hedged(self):
+        """Tools that may have side effects are never hedged."""
+        async def slow_call(tool_name, arguments):
+            await asyncio.sleep(0.05)
+            return {"server": "a"}
+
+        self.clients["server-a"].call_tool = AsyncMock(side_effect=slow_call)
+        self.clients["server-b"].call_tool = AsyncMock(return_value={"server": "b"})
+        self.tool_registry.enable_hedging(default_delay_ms=1)
+
+        result = await self.tool_registry.execute_tool("create_issue", {"title": "x"})
+
+        assert result.result == {"server": "a"}
+        self.clients["server-b"].call_tool.assert_not_called()
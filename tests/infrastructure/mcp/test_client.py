@@ -279,13 +279,14 @@ class TestMCPClient:
         client.session = mock_session
         client.is_connected = True
 
-        # Mock successful health check (list_tools as proxy)
-        mock_session.list_tools.return_value = MagicMock(tools=[])
+        # Mock successful health check (protocol ping)
+        mock_session.send_ping.return_value = MagicMock()
 
         result = await client.health_check()
 
         assert result is True
-        mock_session.list_tools.assert_called_once()
+        mock_session.send_ping.assert_called_once()
+        mock_session.list_tools.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_health_check_not_connected(self):
@@ -307,7 +308,7 @@ class TestMCPClient:
         client.is_connected = True
 
         # Mock health check failure
-        mock_session.list_tools.side_effect = Exception("Health check failed")
+        mock_session.send_ping.side_effect = Exception("Health check failed")
 
         result = await client.health_check()
 
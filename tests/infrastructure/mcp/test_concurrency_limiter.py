@@ -0,0 +1,131 @@
+"""
+Tests for adaptive per-server concurrency limits.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.mcp.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitConfig
+from src.infrastructure.mcp.tool_registry import MCPUnifiedToolRegistry
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD limit adaptation and queueing."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = ConcurrencyLimitConfig(
+            initial_limit=2,
+            min_limit=1,
+            max_limit=4,
+            backoff_ratio=0.5,
+            latency_tolerance=2.0,
+            max_queue_size=1,
+            queue_timeout_seconds=0.05
+        )
+        self.limiter = AdaptiveConcurrencyLimiter("test", self.config)
+
+    @pytest.mark.asyncio
+    async def test_limit_grows_while_latency_is_stable(self):
+        """Utilized slots with stable latency grow the limit up to the maximum."""
+        for _ in range(10):
+            assert await self.limiter.acquire()
+            assert await self.limiter.acquire()
+            self.limiter.release(10.0)
+            self.limiter.release(10.0)
+
+        assert self.limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_limit_shrinks_on_latency_spike_and_timeout(self):
+        """High latency and dropped calls decrease the limit multiplicatively."""
+        self.limiter._limit = 4.0
+        await self.limiter.acquire()
+        self.limiter.release(10.0)  # Establish baseline
+
+        await self.limiter.acquire()
+        self.limiter.release(100.0)
+        assert self.limiter.limit == 2
+
+        await self.limiter.acquire()
+        self.limiter.release(None, dropped=True)
+        assert self.limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_excess_calls_queue_then_reject(self):
+        """Calls beyond the limit wait in the queue; a full queue rejects immediately."""
+        assert await self.limiter.acquire()
+        assert await self.limiter.acquire()
+
+        waiter = asyncio.create_task(self.limiter.acquire())
+        await asyncio.sleep(0)
+        assert self.limiter.queued == 1
+
+        # Queue is full
+        assert await self.limiter.acquire() is False
+
+        self.limiter.release(10.0)
+        assert await waiter is True
+        assert self.limiter.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects(self):
+        """Queued calls are rejected when no slot frees up in time."""
+        await self.limiter.acquire()
+        await self.limiter.acquire()
+
+        assert await self.limiter.acquire() is False
+        assert self.limiter.queued == 0
+        assert self.limiter.get_stats()["rejected_calls"] == 1
+
+
+class TestToolRegistryConcurrency:
+    """Test per-server concurrency limits in the unified tool registry."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.client = MagicMock()
+
+        server_registry = MagicMock()
+        server_registry.get_server_by_name.return_value = self.client
+        server_registry.get_server_info.return_value = MagicMock(is_healthy=True)
+
+        discovery = MagicMock()
+        discovery.get_tool.return_value = MagicMock()
+        discovery.get_tool_servers.return_value = ["stdio-server"]
+
+        self.tool_registry = MCPUnifiedToolRegistry(server_registry, discovery)
+        self.tool_registry.enable_caching(False)
+        self.tool_registry.configure_concurrency_limits(limit_config=ConcurrencyLimitConfig(
+            initial_limit=2, max_limit=2, max_queue_size=1, queue_timeout_seconds=1.0
+        ))
+
+    @pytest.mark.asyncio
+    async def test_server_calls_are_bounded_and_excess_rejected(self):
+        """Only `limit` calls reach the server at once; overflow beyond the queue is rejected."""
+        active = 0
+        peak = 0
+
+        async def call_tool(tool_name, arguments):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return {"ok": True}
+
+        self.client.call_tool = AsyncMock(side_effect=call_tool)
+
+        results = await self.tool_registry.execute_batch_tools(
+            [{"name": "search_issues", "arguments": {"q": str(i)}} for i in range(4)]
+        )
+
+        assert peak == 2
+        assert sum(1 for r in results if r.success) == 3
+        rejected = [r for r in results if not r.success]
+        assert len(rejected) == 1
+        assert "overloaded" in rejected[0].error_message
+
+        stats = self.tool_registry.get_registry_stats()["concurrency"]["servers"]["stdio-server"]
+        assert stats["rejected_calls"] == 1
+        assert stats["in_flight"] == 0
@@ -0,0 +1,110 @@
+"""
+Tests for request deadlines and their propagation into MCP tool calls.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.mcp.deadline import (
+    Deadline, budget_timeout, current_deadline, deadline_expired, deadline_scope, run_within_deadline
+)
+from src.infrastructure.mcp.tool_registry import MCPUnifiedToolRegistry
+
+
+class TestDeadline:
+    """Test deadline arithmetic and context binding."""
+
+    def test_unlimited_budget_has_no_deadline(self):
+        """A budget of zero means no deadline."""
+        assert Deadline.from_ms(0) is None
+        assert Deadline.from_ms(500).budget_seconds == 0.5
+
+    def test_clamp_to_remaining_time(self):
+        """Timeouts are clamped to the time left."""
+        deadline = Deadline(1.0)
+
+        assert deadline.clamp(30.0) <= 1.0
+        assert deadline.clamp(0.1) == 0.1
+        assert deadline.clamp(None) <= 1.0
+        assert Deadline(-1).expired
+        assert Deadline(-1).remaining() == 0.0
+
+    def test_scope_binds_tightest_deadline(self):
+        """A nested scope cannot extend an enclosing deadline."""
+        outer, inner = Deadline(1.0), Deadline(10.0)
+
+        assert current_deadline() is None
+        assert budget_timeout(5.0) == 5.0
+        with deadline_scope(outer):
+            with deadline_scope(inner) as bound:
+                assert bound is outer
+                assert budget_timeout(5.0) <= 1.0
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_run_within_deadline_cancels_work(self):
+        """Work still running at the deadline is cancelled."""
+        cancelled = asyncio.Event()
+
+        async def slow():
+            assert current_deadline() is not None
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(asyncio.TimeoutError):
+            await run_within_deadline(slow(), Deadline(0.02))
+
+        assert cancelled.is_set()
+        assert not deadline_expired()
+
+
+class TestToolRegistryDeadline:
+    """Test deadline handling in the unified tool registry."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.client = MagicMock()
+        self.server_registry = MagicMock()
+        self.server_registry.get_server_by_name.return_value = self.client
+        self.server_registry.get_server_info.return_value = MagicMock(is_healthy=True)
+
+        self.discovery = MagicMock()
+        self.discovery.get_tool.return_value = MagicMock()
+        self.discovery.get_tool_servers.return_value = ["server-a"]
+
+        self.tool_registry = MCPUnifiedToolRegistry(self.server_registry, self.discovery)
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_clamped_to_deadline(self):
+        """A slow tool is cut off at the deadline, not its own timeout, without tripping breakers."""
+        async def slow_call(tool_name, arguments):
+            await asyncio.sleep(1)
+
+        self.client.call_tool = AsyncMock(side_effect=slow_call)
+
+        result = await self.tool_registry.execute_tool("search_issues", {}, timeout=30, deadline=Deadline(0.05))
+
+        assert result.success is False
+        assert "deadline" in result.error_message
+        stats = self.tool_registry.get_registry_stats()["circuit_breakers"]
+        assert stats["tools"]["server-a:search_issues"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_serves_only_cached_results(self):
+        """Once the deadline has passed, cached results are still returned but no calls are made."""
+        self.client.call_tool = AsyncMock(return_value={"issues": []})
+        await self.tool_registry.execute_tool("search_issues", {"q": "mine"})
+        self.client.call_tool.reset_mock()
+
+        with deadline_scope(Deadline(-1)):
+            cached = await self.tool_registry.execute_tool("search_issues", {"q": "mine"})
+            skipped = await self.tool_registry.execute_tool("search_issues", {"q": "other"})
+
+        assert cached.success is True
+        assert cached.result == {"issues": []}
+        assert skipped.success is False
+        assert "deadline" in skipped.error_message
+        self.client.call_tool.assert_not_called()
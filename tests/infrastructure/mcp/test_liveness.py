@@ -0,0 +1,147 @@
+"""
+Tests for ping-based MCP liveness, list_changed refreshes and outcome-based availability.
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import mcp.types as mcp_types
+
+from src.infrastructure.mcp.client import MCPClient, MCPServerConfig, MCPTransportType
+from src.infrastructure.mcp.discovery import MCPToolDiscovery, MCPToolInfo, ToolAvailabilityStatus
+from src.infrastructure.mcp.introspection import MCPAvailabilityTracker
+from src.infrastructure.mcp.registry import MCPServerRegistry
+
+
+def make_tool(name, schema=None):
+    """Create a tool object as returned by the MCP SDK."""
+    return SimpleNamespace(name=name, description="", inputSchema=schema or {"type": "object"})
+
+
+class TestClientLiveness:
+    """Test client health checks and list_changed handling."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        config = MCPServerConfig(name="test", transport=MCPTransportType.STDIO, command="python")
+        self.client = MCPClient(config)
+        self.client.session = AsyncMock()
+        self.client.is_connected = True
+
+    @pytest.mark.asyncio
+    async def test_health_check_pings_without_listing_tools(self):
+        """Health check uses ping instead of tools/list."""
+        assert await self.client.health_check() is True
+
+        self.client.session.send_ping.assert_called_once()
+        self.client.session.list_tools.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_changed_notification_refreshes_tools(self):
+        """A tools/list_changed notification re-fetches and bumps the version."""
+        self.client._set_tools([make_tool("a")])
+        version = self.client.capabilities_version
+        changed = MagicMock()
+        self.client.on_capabilities_changed = changed
+        self.client.session.list_tools.return_value = SimpleNamespace(tools=[make_tool("a"), make_tool("b")])
+
+        notification = mcp_types.ServerNotification(mcp_types.ToolListChangedNotification())
+        await self.client._handle_server_message(notification)
+        await self.client._refresh_task
+
+        assert [tool.name for tool in self.client.get_available_tools()] == ["a", "b"]
+        assert self.client.capabilities_version == version + 1
+        changed.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_with_same_schema_keeps_version(self):
+        """Re-fetching an unchanged tool list does not bump the version."""
+        self.client._set_tools([make_tool("a")])
+        version = self.client.capabilities_version
+        self.client.session.list_tools.return_value = SimpleNamespace(tools=[make_tool("a")])
+
+        assert await self.client.refresh_tools() is False
+        assert self.client.capabilities_version == version
+
+    @pytest.mark.asyncio
+    async def test_other_notifications_do_not_list_tools(self):
+        """Unrelated notifications never trigger tools/list."""
+        notification = mcp_types.ServerNotification(
+            mcp_types.LoggingMessageNotification(params=mcp_types.LoggingMessageNotificationParams(level="info", data="x"))
+        )
+        await self.client._handle_server_message(notification)
+
+        assert self.client._refresh_task is None
+        self.client.session.list_tools.assert_not_called()
+
+
+class TestOutcomeBasedAvailability:
+    """Test availability derived from real call outcomes."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.registry = MCPServerRegistry()
+        self.discovery = MCPToolDiscovery(self.registry)
+        self.discovery._register_tool(MCPToolInfo(
+            name="get_issue",
+            server_name="youtrack",
+            description="",
+            input_schema={}
+        ))
+        self.tracker = MCPAvailabilityTracker(self.registry, self.discovery)
+
+    def test_outcomes_update_tool_status_and_history(self):
+        """Successful and failed calls update status and availability history."""
+        self.discovery.record_tool_outcome("get_issue", True, 12.0, server_name="youtrack")
+        assert self.discovery.get_tool("get_issue").availability_status == ToolAvailabilityStatus.AVAILABLE
+
+        self.discovery.record_tool_outcome("get_issue", False, 30.0, "timeout", server_name="youtrack")
+        tool = self.discovery.get_tool("get_issue")
+        assert tool.availability_status == ToolAvailabilityStatus.ERROR
+        assert tool.error_message == "timeout"
+
+        summary = self.tracker.get_availability_summary("get_issue")
+        assert summary["total_checks"] == 2
+        assert summary["availability_percentage_24h"] == 50.0
+        assert summary["performance_metrics"]["avg_response_time"] == 12.0
+
+    @pytest.mark.asyncio
+    async def test_tracking_pass_does_not_probe_tools(self):
+        """The periodic pass only records unhealthy servers, without probing tools."""
+        healthy = MagicMock(is_healthy=True)
+        self.registry.get_server_info = MagicMock(return_value=healthy)
+        self.discovery.update_tool_availability = AsyncMock()
+
+        await self.tracker._update_availability_status()
+
+        self.discovery.update_tool_availability.assert_not_called()
+        assert self.tracker.get_availability_summary("get_issue") is None
+
+        self.registry.get_server_info = MagicMock(return_value=None)
+        await self.tracker._update_availability_status()
+
+        assert self.tracker.get_availability_summary("get_issue")["last_check"]["status"] == "unavailable"
+
+
+class TestSchemaChangeDiscovery:
+    """Test that discovery re-runs only when the tool schema hash changes."""
+
+    @pytest.mark.asyncio
+    async def test_rediscover_on_schema_hash_change(self):
+        """Servers are re-discovered only after their tool list changed."""
+        registry = MCPServerRegistry()
+        discovery = MCPToolDiscovery(registry)
+
+        config = MCPServerConfig(name="youtrack", transport=MCPTransportType.STDIO, command="python")
+        client = MCPClient(config)
+        client._set_tools([make_tool("get_issue")])
+
+        server_info = MagicMock(is_healthy=True, client=client)
+        registry.get_connected_servers = MagicMock(return_value={"youtrack": server_info})
+
+        assert len(await discovery.discover_new_servers()) == 1
+        assert await discovery.discover_new_servers() == []
+
+        client._set_tools([make_tool("get_issue"), make_tool("search_issues")])
+        assert len(await discovery.discover_new_servers()) == 1
+        assert discovery.get_tool("search_issues") is not None
@@ -0,0 +1,111 @@
+"""
+Tests for the out-of-band MCP result channel.
+"""
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import mcp.types as mcp_types
+
+from src.infrastructure.mcp.client import MCPClient, MCPServerConfig, MCPTransportType
+from src.infrastructure.mcp.result_channel import (
+    OUT_OF_BAND_DIR_ENV, OUT_OF_BAND_THRESHOLD_ENV,
+    OutOfBandResult, resolve_out_of_band_content, write_result_file
+)
+from src.infrastructure.mcp.server_base import MCPServerBase, mcp_tool
+
+
+class ReportServer(MCPServerBase):
+    """Server returning results of configurable size."""
+
+    def __init__(self):
+        super().__init__("report-server")
+
+    @mcp_tool(name="get_report")
+    async def get_report(self, size: int):
+        return {"chunks": ["x" * size]}
+
+    @mcp_tool(name="get_json_text")
+    async def get_json_text(self):
+        return json.dumps({"id": "PROJ-1"})
+
+
+class TestServerResultEncoding:
+    """Test server-side result serialization."""
+
+    @pytest.mark.asyncio
+    async def test_string_results_are_not_double_encoded(self):
+        """JSON strings returned by tools are passed through as-is."""
+        server = ReportServer()
+
+        result = await server.call_tool("get_json_text", {})
+
+        assert result["content"] == [{"type": "text", "text": '{"id": "PROJ-1"}'}]
+
+    @pytest.mark.asyncio
+    async def test_large_result_goes_out_of_band(self, tmp_path, monkeypatch):
+        """Results above the threshold are written to a result file."""
+        monkeypatch.setenv(OUT_OF_BAND_THRESHOLD_ENV, "1024")
+        monkeypatch.setenv(OUT_OF_BAND_DIR_ENV, str(tmp_path))
+        server = ReportServer()
+
+        small = await server.call_tool("get_report", {"size": 10})
+        large = await server.call_tool("get_report", {"size": 4096})
+
+        assert small["content"][0]["type"] == "text"
+        link = large["content"][0]
+        assert link["type"] == "resource_link"
+        assert link["size"] > 4096
+        assert (tmp_path / link["name"]).exists()
+
+
+class TestOutOfBandResolution:
+    """Test client-side resolution of result files."""
+
+    def test_resolve_maps_and_unlinks_result_file(self, tmp_path):
+        """Result files are memory-mapped, exposed as text and removed from disk."""
+        payload = json.dumps({"diff": "+" * 10000}).encode()
+        link = mcp_types.ResourceLink(**write_result_file(payload, tmp_path))
+
+        resolved = resolve_out_of_band_content([link], tmp_path)
+
+        result = resolved[0]
+        assert isinstance(result, OutOfBandResult)
+        assert list(tmp_path.iterdir()) == []
+        assert result.size == len(payload)
+        assert result.buffer.nbytes == len(payload)
+        assert result.json()["diff"] == "+" * 10000
+        assert result.text == payload.decode()
+        assert result._mmap is None
+        assert bytes(result.buffer) == payload
+
+    def test_links_outside_result_directory_are_ignored(self, tmp_path):
+        """Links to other files are left untouched and never deleted."""
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        link = mcp_types.ResourceLink(**write_result_file(b"{}", other_dir))
+        text = mcp_types.TextContent(type="text", text="inline")
+
+        resolved = resolve_out_of_band_content([text, link], tmp_path / "results")
+
+        assert resolved == [text, link]
+        assert len(list(other_dir.iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_client_resolves_out_of_band_results(self, tmp_path):
+        """MCPClient.call_tool returns mapped results when the channel is enabled."""
+        config = MCPServerConfig(name="local", transport=MCPTransportType.STDIO, command="python")
+        config.out_of_band_threshold = 1024
+        client = MCPClient(config)
+        client._out_of_band_dir = tmp_path
+        client.session = AsyncMock()
+        client.is_connected = True
+
+        link = mcp_types.ResourceLink(**write_result_file(b'{"ok": true}', tmp_path))
+        client.session.call_tool.return_value = SimpleNamespace(content=[link])
+
+        result = await client.call_tool("get_report", {})
+
+        assert result[0].json() == {"ok": True}
+        assert hasattr(result[0], "text")
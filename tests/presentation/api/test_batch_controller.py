@@ -0,0 +1,66 @@
+"""
+Tests for the /v1/files and /v1/batches endpoints.
+"""
+import json
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.services.batch_service import BatchConfig, BatchService
+from src.presentation.api.batch_controller import create_batch_router
+
+INPUT = json.dumps({
+    "custom_id": "ticket-1",
+    "method": "POST",
+    "url": "/v1/chat/completions",
+    "body": {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "Summarise"}]}
+}).encode()
+
+
+async def executor(body):
+    return 200, {"object": "chat.completion", "choices": [{"message": {"content": "Summary"}}]}
+
+
+class TestBatchController:
+    """Test the OpenAI-compatible batch flow over HTTP."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self, tmp_path):
+        self.service = BatchService(BatchConfig(storage_dir=str(tmp_path), requests_per_minute=0), executor)
+        app = FastAPI()
+        app.include_router(create_batch_router(self.service))
+        app.add_event_handler("startup", self.service.start)
+        self.client = TestClient(app)
+
+    def test_upload_create_and_download_results(self):
+        """Uploading a JSONL file and creating a batch produces an output file."""
+        with self.client:
+            upload = self.client.post(
+                "/v1/files", files={"file": ("requests.jsonl", INPUT)}, data={"purpose": "batch"}
+            ).json()
+            batch = self.client.post(
+                "/v1/batches", json={"input_file_id": upload["id"], "endpoint": "/v1/chat/completions"}
+            ).json()
+
+            for _ in range(100):
+                batch = self.client.get(f"/v1/batches/{batch['id']}").json()
+                if batch["status"] == "completed":
+                    break
+            output = self.client.get(f"/v1/files/{batch['output_file_id']}/content").text
+            listing = self.client.get("/v1/batches").json()
+
+        assert upload["object"] == "file"
+        assert batch["status"] == "completed"
+        assert json.loads(output)["custom_id"] == "ticket-1"
+        assert listing["data"][0]["id"] == batch["id"]
+
+    def test_invalid_upload_and_unknown_ids(self):
+        """Invalid input files are rejected and unknown ids return 404."""
+        response = self.client.post(
+            "/v1/files", files={"file": ("requests.jsonl", b"not json")}, data={"purpose": "batch"}
+        )
+
+        assert response.status_code == 400
+        assert self.client.get("/v1/batches/batch_missing").status_code == 404
+        assert self.client.get("/v1/files/file-missing/content").status_code == 404
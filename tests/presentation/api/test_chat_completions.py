@@ -0,0 +1,128 @@
+"""
+Tests for the /v1/chat/completions endpoint modes.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect, Request
+
+from src.application.services.rate_limiting import AdmissionConfig, AdmissionController
+from src.infrastructure.llm.providers import ProviderError
+from src.presentation.api import streaming_controller
+
+COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "gpt-4o-mini",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hello!"}, "finish_reason": "stop"}]
+}
+
+
+class TestNonStreamingCompletions:
+    """Test the non-streaming fast path."""
+
+    def setup_method(self):
+        self.client = TestClient(streaming_controller.app)
+        self.request = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "Hi"}], "stream": False}
+
+        patches = [
+            patch(
+                "src.application.services.orchestration_service.llm_proxy_orchestrator_preprocessing_only",
+                AsyncMock(return_value={"status": "success", "processed_request": None, "metadata": {}})
+            ),
+            patch(
+                "src.domain.services.reasoning_service_impl.apply_reasoning_to_request",
+                AsyncMock(side_effect=lambda request: {"status": "success", "enhanced_request": dict(request)})
+            ),
+            patch.object(streaming_controller, "execute_postprocessing_agent", AsyncMock(return_value={})),
+            patch.object(streaming_controller.model_router, "chat_completion", AsyncMock(return_value=COMPLETION)),
+            patch.object(streaming_controller.model_router, "stream_chat_completion")
+        ]
+        self.mocks = [p.start() for p in patches]
+        self._patches = patches
+        self.preprocess, self.reasoning, _, self.chat_completion, self.stream_chat_completion = self.mocks
+        self.preprocess.return_value["processed_request"] = dict(self.request)
+
+    def teardown_method(self):
+        for p in self._patches:
+            p.stop()
+
+    def test_returns_single_json_body(self):
+        """stream: false returns one chat.completion JSON body from one upstream call."""
+        response = self.client.post("/v1/chat/completions", json=self.request)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        assert response.json() == COMPLETION
+        self.chat_completion.assert_awaited_once()
+        assert self.chat_completion.await_args.args[0]["stream"] is False
+        self.stream_chat_completion.assert_not_called()
+        self.reasoning.assert_awaited_once()
+
+    def test_provider_errors_keep_status(self):
+        """Upstream errors are returned as OpenAI error bodies with the upstream status."""
+        self.chat_completion.side_effect = ProviderError("openai", "openai API error: 429", status_code=429)
+
+        response = self.client.post("/v1/chat/completions", json=self.request)
+
+        assert response.status_code == 429
+        assert response.json()["error"]["type"] == "adk_api_error"
+
+    def test_rate_limited_requests_get_retry_after(self):
+        """Requests over the per-key budget are rejected with 429 and Retry-After."""
+        limiter = AdmissionController(AdmissionConfig(enabled=True, requests_per_minute=1))
+        headers = {"Authorization": "Bearer sk-test"}
+
+        with patch.object(streaming_controller, "admission_controller", limiter):
+            first = self.client.post("/v1/chat/completions", json=self.request, headers=headers)
+            second = self.client.post("/v1/chat/completions", json=self.request, headers=headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 429
+        assert int(second.headers["Retry-After"]) >= 1
+        assert second.json()["error"]["type"] == "adk_rate_limit_error"
+        assert limiter.get_stats()["active"] == 0
+
+
+class TestStreamingSlotRelease:
+    """Test that streaming responses give their execution slot back on every path."""
+
+    def setup_method(self):
+        self.limiter = AdmissionController(AdmissionConfig(enabled=True, requests_per_minute=0, tokens_per_minute=0))
+        self.request = streaming_controller.ChatCompletionRequest(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}], stream=True
+        )
+        self.http_request = Request({
+            "type": "http", "method": "POST", "path": "/v1/chat/completions", "headers": [], "client": ("127.0.0.1", 1)
+        })
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_body_is_never_iterated(self):
+        """A client that leaves before the response starts does not leak its slot."""
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            raise OSError("client disconnected")
+
+        with patch.object(streaming_controller, "admission_controller", self.limiter):
+            response = await streaming_controller.chat_completions(self.request, self.http_request)
+            assert self.limiter.get_stats()["active"] == 1
+
+            with pytest.raises(ClientDisconnect):
+                await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+        assert self.limiter.get_stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_response_setup_fails(self):
+        """Errors between admission and the response release the slot."""
+        with patch.object(streaming_controller, "admission_controller", self.limiter), \
+                patch.object(streaming_controller, "stream_chat_completion_adk", side_effect=RuntimeError("boom")):
+            with pytest.raises(HTTPException):
+                await streaming_controller.chat_completions(self.request, self.http_request)
+
+        assert self.limiter.get_stats()["active"] == 0
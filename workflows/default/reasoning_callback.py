@@ -5,12 +5,24 @@ This module implements the default reasoning workflow that can be customized.
 """
 
 import logging
-import asyncio
-from typing import Dict, List, Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+def preferred_insights_gathered(preferred_tools: List[str]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """Predicate that holds once every preferred tool has contributed an insight (None without preferred tools)."""
+    planned_keys = {f"{tool_name}_insight" for tool_name in preferred_tools}
+    if not planned_keys:
+        return None
+    return lambda insights: planned_keys.issubset(insights)
+
+
+async def _completed_event(execution: Awaitable[Dict[str, Any]]) -> AsyncGenerator[Dict[str, Any], None]:
+    """Present a non-streaming tool execution result as the final stream event."""
+    yield {"event": "completed", **(await execution)}
+
+
 async def reasoning_workflow(
     request_data: Dict[str, Any],
     analyze_request_intent,
@@ -18,7 +30,8 @@ async def reasoning_workflow(
     enhance_messages_with_reasoning,
     discover_reasoning_tools,
     execute_reasoning_tools,
-    stream_reasoning_step
+    stream_reasoning_step,
+    stream_reasoning_tools=None
 ) -> AsyncGenerator[str, None]:
     """
     Default reasoning workflow callback.
@@ -35,8 +48,9 @@ async def reasoning_workflow(
         generate_reasoning_context: Function to generate reasoning context
         enhance_messages_with_reasoning: Function to enhance messages
         discover_reasoning_tools: Function to discover MCP tools
-        execute_reasoning_tools: Function to execute MCP tools
+        execute_reasoning_tools: Function to execute MCP tools (used when stream_reasoning_tools is not passed)
         stream_reasoning_step: Function to stream reasoning steps
+        stream_reasoning_tools: Function to execute MCP tools, streaming each result (optional)
 
     Yields:
         Reasoning step chunks in SSE format
@@ -60,8 +74,6 @@ async def reasoning_workflow(
             "word_count": intent_result["intent_analysis"]["word_count"]
         }, None)
 
-        await asyncio.sleep(0.1)
-
         # Step 2: Discover and execute reasoning tools
         reasoning_insights = {}
         yield await stream_reasoning_step("mcp_tool_discovery", {"status": "discovering reasoning tools..."}, None)
@@ -80,13 +92,37 @@ async def reasoning_workflow(
                     "tools": reasoning_tools
                 }, None)
 
-                await asyncio.sleep(0.1)
-
                 # Execute reasoning tools
                 logger.debug("🔄 WORKFLOW Step 2.1: Executing reasoning tools")
                 yield await stream_reasoning_step("mcp_tool_execution", {"status": "executing reasoning tools..."}, None)
 
-                tool_execution_result = await execute_reasoning_tools(request_data, reasoning_tools, intent_result["intent_analysis"])
+                # Stream each tool's completion and gather insights as they arrive; once every
+                # preferred tool has answered, the general tools are skipped
+                if stream_reasoning_tools is not None:
+                    tool_events = stream_reasoning_tools(
+                        request_data, reasoning_tools, intent_result["intent_analysis"],
+                        enough_context=preferred_insights_gathered(preferred_tools)
+                    )
+                else:
+                    tool_events = _completed_event(
+                        execute_reasoning_tools(request_data, reasoning_tools, intent_result["intent_analysis"])
+                    )
+
+                tool_execution_result = {}
+                async for event in tool_events:
+                    if event["event"] == "tool_result":
+                        if "insight_key" in event:
+                            reasoning_insights[event["insight_key"]] = event["insight"]
+                        yield await stream_reasoning_step("mcp_tool_execution", {
+                            "status": "tool completed",
+                            "tool_name": event["tool_name"],
+                            "success": event["success"],
+                            "error": event["error"],
+                            "completed": event["completed"],
+                            "total": event["total"]
+                        }, None)
+                    else:
+                        tool_execution_result = event
 
                 if tool_execution_result.get("status") == "success":
                     reasoning_insights = tool_execution_result.get("reasoning_insights", {})
@@ -116,8 +152,6 @@ async def reasoning_workflow(
                 "error": tool_discovery_result.get("error")
             }, None)
 
-        await asyncio.sleep(0.1)
-
         # Step 3: Generate reasoning context
         logger.debug("🔄 WORKFLOW Step 3: Generating context")
         yield await stream_reasoning_step("context_generation", {"status": "generating reasoning context..."}, None)
@@ -134,8 +168,6 @@ async def reasoning_workflow(
             "enhanced_understanding": context_result["enhanced_understanding"]
         }, None)
 
-        await asyncio.sleep(0.1)
-
         # Step 4: Enhance messages
         logger.debug("🔄 WORKFLOW Step 4: Enhancing messages")
         yield await stream_reasoning_step("message_enhancement", {"status": "enhancing messages with reasoning..."}, None)
@@ -152,8 +184,6 @@ async def reasoning_workflow(
             "reasoning_added": enhancement_result["reasoning_added"]
         }, None)
 
-        await asyncio.sleep(0.1)
-
         # Build enhanced request for final display
         enhanced_request_for_display = request_data.copy()
         enhanced_request_for_display["messages"] = enhancement_result["enhanced_messages"]